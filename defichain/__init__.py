@@ -2,9 +2,11 @@
 
 # Node
 from defichain.node.node import Node
+from defichain.node.asyncnode import AsyncNode
 
 # Ocean
 from defichain.ocean.ocean import Ocean
+from defichain.ocean.asyncocean import AsyncOcean
 
 # Wallet
 from defichain.hdwallet import Wallet
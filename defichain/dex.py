@@ -0,0 +1,560 @@
+from decimal import Decimal, ROUND_DOWN
+
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+
+COIN = 100000000
+SLOPE_SWAP_RATE = 1000  # minimum reserve of both tokens in satoshi, otherwise the pool lacks liquidity
+MAX_POOLS_PER_PATH = 3  # the node does not search longer composite swaps either
+NODE_LIST_LIMIT = 1000
+
+
+def to_satoshi(amount: float or str or Decimal) -> int:
+    """
+    Turns an amount with eight decimal places into satoshi: 1.5 -> 150000000
+
+    Floats are converted by their shortest representation, so that 0.1 stays 10000000.
+    """
+    return int((Decimal(str(amount)) * COIN).to_integral_value(rounding=ROUND_DOWN))
+
+
+def multiply_amounts(a: int, b: int) -> int:
+    # Same as MultiplyAmounts of the node: both values are fixed point numbers with eight decimal places
+    return a * b // COIN
+
+
+class Pool:
+    """
+    One pool pair with its reserves, commission and dex fees in satoshi.
+
+    The swap reproduces the integer math of the node: the commission and the dex fee of the input token are
+    taken from the input, the rest is swapped along the constant product and rounded down, then the dex fee of
+    the output token is taken from the result.
+
+    :param id: (required) id of the pool pair
+    :type id: str
+    :param idTokenA: (required) id of token A
+    :type idTokenA: str
+    :param idTokenB: (required) id of token B
+    :type idTokenB: str
+    :param reserveA: (required) reserve of token A in satoshi
+    :type reserveA: int
+    :param reserveB: (required) reserve of token B in satoshi
+    :type reserveB: int
+    :param commission: (optional) commission in satoshi: 0.2% -> 200000
+    :type commission: int
+    :param dexFeeInA: (optional) dex fee in satoshi, if token A is swapped into the pool
+    :type dexFeeInA: int
+    :param dexFeeOutA: (optional) dex fee in satoshi, if token A is swapped out of the pool
+    :type dexFeeOutA: int
+    :param dexFeeInB: (optional) dex fee in satoshi, if token B is swapped into the pool
+    :type dexFeeInB: int
+    :param dexFeeOutB: (optional) dex fee in satoshi, if token B is swapped out of the pool
+    :type dexFeeOutB: int
+    :param status: (optional) the pool is enabled and trading is enabled
+    :type status: bool
+    :param symbol: (optional) symbol of the pool pair: BTC-DFI
+    :type symbol: str
+    :param symbolA: (optional) symbol of token A
+    :type symbolA: str
+    :param symbolB: (optional) symbol of token B
+    :type symbolB: str
+    """
+    __slots__ = ("id", "idTokenA", "idTokenB", "reserveA", "reserveB", "commission", "dexFeeInA", "dexFeeOutA",
+                 "dexFeeInB", "dexFeeOutB", "status", "symbol", "symbolA", "symbolB")
+
+    def __init__(self, id: str, idTokenA: str, idTokenB: str, reserveA: int, reserveB: int, commission: int = 0,
+                 dexFeeInA: int = 0, dexFeeOutA: int = 0, dexFeeInB: int = 0, dexFeeOutB: int = 0,
+                 status: bool = True, symbol: str = None, symbolA: str = None, symbolB: str = None):
+        self.id = str(id)
+        self.idTokenA = str(idTokenA)
+        self.idTokenB = str(idTokenB)
+        self.reserveA = reserveA
+        self.reserveB = reserveB
+        self.commission = commission
+        self.dexFeeInA = dexFeeInA
+        self.dexFeeOutA = dexFeeOutA
+        self.dexFeeInB = dexFeeInB
+        self.dexFeeOutB = dexFeeOutB
+        self.status = status
+        self.symbol = symbol
+        self.symbolA = symbolA
+        self.symbolB = symbolB
+
+    @classmethod
+    def from_node(cls, id: str, data: {}) -> "Pool":
+        """
+        Creates the pool from one entry of listpoolpairs or getpoolpair of the node
+
+        The node returns the amounts as json numbers. They are exact up to about 90 million coins per reserve.
+
+        :param id: (required) id of the pool pair
+        :type id: str
+        :param data: (required) the pool pair returned by the node
+        :type data: {}
+        :return: Pool
+        """
+        # Renamed pools, for example TSLA-DUSD/v1, do not contain the current symbols of their tokens
+        symbols = data.get("symbol", "").split("-")
+        symbolA, symbolB = symbols if len(symbols) == 2 and "/" not in symbols[1] else (None, None)
+
+        def fee(direction: str, token: str) -> int:
+            return to_satoshi(data.get(f"dexFee{direction}PctToken{token}", data.get(f"dexFeePctToken{token}", 0)))
+
+        return cls(id, data["idTokenA"], data["idTokenB"], to_satoshi(data["reserveA"]), to_satoshi(data["reserveB"]),
+                   to_satoshi(data.get("commission", 0)), fee("In", "A"), fee("Out", "A"), fee("In", "B"),
+                   fee("Out", "B"), data.get("status", True) and data.get("tradeEnabled", True), data.get("symbol"),
+                   symbolA, symbolB)
+
+    @classmethod
+    def from_ocean(cls, data: {}) -> "Pool":
+        """
+        Creates the pool from one entry of ocean.poolpairs.list or ocean.poolpairs.get
+
+        :param data: (required) the pool pair returned by ocean
+        :type data: {}
+        :return: Pool
+        """
+        tokenA, tokenB = data["tokenA"], data["tokenB"]
+
+        def fee(token: {}, direction: str) -> int:
+            fees = token.get("fee") or {}
+            return to_satoshi(fees.get(direction) or fees.get("pct") or 0)
+
+        return cls(data["id"], tokenA["id"], tokenB["id"], to_satoshi(tokenA["reserve"]), to_satoshi(tokenB["reserve"]),
+                   to_satoshi(data.get("commission") or 0), fee(tokenA, "inPct"), fee(tokenA, "outPct"),
+                   fee(tokenB, "inPct"), fee(tokenB, "outPct"),
+                   data.get("status", True) and data.get("tradeEnabled", True), data.get("symbol"),
+                   tokenA.get("symbol"), tokenB.get("symbol"))
+
+    def is_tradable(self) -> bool:
+        return bool(self.status) and self.reserveA >= SLOPE_SWAP_RATE and self.reserveB >= SLOPE_SWAP_RATE
+
+    def is_forward(self, tokenId: str) -> bool:
+        """
+        Returns True, if the token is swapped from A to B and False if it is swapped from B to A
+        """
+        if tokenId == self.idTokenA:
+            return True
+        if tokenId == self.idTokenB:
+            return False
+        raise WrongParameters(f"The token {tokenId} is not part of the pool {self.id}")
+
+    def swap(self, tokenId: str, amount: int) -> int:
+        """
+        Returns the amount in satoshi, which is received for the given amount in satoshi of the token
+
+        :param tokenId: (required) id of the token which is swapped into the pool
+        :type tokenId: str
+        :param amount: (required) amount in satoshi
+        :type amount: int
+        :return: int
+        """
+        return self.swap_many(self.is_forward(tokenId), [amount])[0]
+
+    def swap_many(self, forward: bool, amounts: [int]) -> [int]:
+        """
+        Returns the received amounts in satoshi for all given amounts in satoshi, the reserves are not changed
+
+        :param forward: (required) True: token A is swapped for token B, False: B is swapped for A
+        :type forward: bool
+        :param amounts: (required) amounts in satoshi
+        :type amounts: [int]
+        :return: [int]
+        """
+        if not self.is_tradable():
+            raise WrongParameters(f"Lack of liquidity or pool {self.id} is disabled")
+        if forward:
+            reserveFrom, reserveTo, feeIn, feeOut = self.reserveA, self.reserveB, self.dexFeeInA, self.dexFeeOutB
+        else:
+            reserveFrom, reserveTo, feeIn, feeOut = self.reserveB, self.reserveA, self.dexFeeInB, self.dexFeeOutA
+        commission = self.commission
+        product = reserveFrom * reserveTo
+
+        results = []
+        for amount in amounts:
+            if commission:
+                amount -= amount * commission // COIN
+            if feeIn:
+                amount -= amount * feeIn // COIN
+            swapped = reserveTo - product // (reserveFrom + amount)
+            if swapped:
+                swapped -= 1  # The node floors the result
+                if feeOut:
+                    swapped -= swapped * feeOut // COIN
+            results.append(swapped)
+        return results
+
+    def apply_swap(self, tokenId: str, amount: int) -> int:
+        """
+        Swaps the amount in satoshi and changes the reserves like the node does
+
+        :param tokenId: (required) id of the token which is swapped into the pool
+        :type tokenId: str
+        :param amount: (required) amount in satoshi
+        :type amount: int
+        :return: int -- the received amount in satoshi
+        """
+        forward = self.is_forward(tokenId)
+        if not self.is_tradable():
+            raise WrongParameters(f"Lack of liquidity or pool {self.id} is disabled")
+        feeIn, feeOut = (self.dexFeeInA, self.dexFeeOutB) if forward else (self.dexFeeInB, self.dexFeeOutA)
+        amount -= multiply_amounts(amount, self.commission)  # The commission is not added to the reserves
+        amount -= multiply_amounts(amount, feeIn)
+        reserveFrom, reserveTo = (self.reserveA, self.reserveB) if forward else (self.reserveB, self.reserveA)
+        swapped = reserveTo - reserveTo * reserveFrom // (reserveFrom + amount)
+        if swapped:
+            swapped -= 1
+        reserveFrom, reserveTo = reserveFrom + amount, reserveTo - swapped
+        if forward:
+            self.reserveA, self.reserveB = reserveFrom, reserveTo
+        else:
+            self.reserveB, self.reserveA = reserveFrom, reserveTo
+        return swapped - multiply_amounts(swapped, feeOut)
+
+    def other_token(self, tokenId: str) -> str:
+        return self.idTokenB if tokenId == self.idTokenA else self.idTokenA
+
+    def _key(self) -> tuple:
+        # Everything that changes the token graph
+        return self.idTokenA, self.idTokenB, self.is_tradable()
+
+    def to_json(self) -> {}:
+        return {"id": self.id, "symbol": self.symbol, "idTokenA": self.idTokenA, "idTokenB": self.idTokenB,
+                "reserveA": self.reserveA, "reserveB": self.reserveB, "commission": self.commission,
+                "dexFeeInA": self.dexFeeInA, "dexFeeOutA": self.dexFeeOutA, "dexFeeInB": self.dexFeeInB,
+                "dexFeeOutB": self.dexFeeOutB, "status": self.status}
+
+
+class SwapResult:
+    """
+    Result of a simulated swap. ``str(result)`` has the format of testpoolswap: 0.12345678@2
+    """
+    __slots__ = ("tokenFrom", "tokenTo", "amountFrom", "amountTo", "path")
+
+    def __init__(self, tokenFrom: str, tokenTo: str, amountFrom: int, amountTo: int, path: [str]):
+        self.tokenFrom = tokenFrom
+        self.tokenTo = tokenTo
+        self.amountFrom = amountFrom  # satoshi
+        self.amountTo = amountTo  # satoshi
+        self.path = path  # ids of the pool pairs
+
+    def get_amount(self) -> float:
+        return self.amountTo / COIN
+
+    def __str__(self) -> str:
+        return f"{Decimal(self.amountTo) / COIN:.8f}@{self.tokenTo}"
+
+    def __repr__(self) -> str:
+        return f"SwapResult({self.amountFrom}@{self.tokenFrom} -> {self.amountTo}@{self.tokenTo}, path={self.path})"
+
+    def to_json(self) -> {}:
+        return {"tokenFrom": self.tokenFrom, "tokenTo": self.tokenTo, "amountFrom": self.amountFrom / COIN,
+                "amountTo": self.amountTo / COIN, "path": list(self.path)}
+
+
+class DexEngine:
+    """
+    Simulates pool swaps locally instead of asking the node with testpoolswap or ocean with getBestPath.
+
+    All pools are loaded once from the node or ocean. The engine reproduces the integer math of the node
+    including commission and dex fees and searches the best composite swap over up to three pools, like the node
+    does with path="auto". Many input amounts can be evaluated in one call: every possible path is evaluated once
+    for all amounts.
+
+    When the reserves change, :meth:`refresh` reloads all pools or only the given pools. The paths between two
+    tokens are only searched again if pools were added, removed, enabled or disabled.
+
+    :param pools: (optional) pools to start with
+    :type pools: [Pool]
+
+    :example:
+
+        >>> from defichain import Node
+        >>> from defichain.dex import DexEngine
+        >>>
+        >>> node = Node("user", "password")
+        >>> dex = DexEngine.from_node(node)
+        >>> result = dex.swap("DFI", "BTC", 100)
+        >>> result.get_amount(), result.path
+        (0.00391234, ['5'])
+        >>> [str(result) for result in dex.swap_many("DFI", "DUSD", [1, 10, 100, 1000])]
+        ['0.41201234@15', ...]
+        >>> dex.refresh(["5", "17"])  # reloads only the reserves of these pools
+    """
+
+    def __init__(self, pools: [Pool] = ()):
+        self._pools = {}  # pool id -> Pool
+        self._symbols = {}  # token symbol -> token id
+        self._paths = {}  # (token id, token id) -> [[(Pool, forward)]]
+        self._graph = None  # token id -> [(Pool, forward)]
+        self._source = None
+        self.update(pools)
+
+    # Load
+    @classmethod
+    def from_node(cls, node) -> "DexEngine":
+        """
+        Loads all pools with listpoolpairs
+
+        :param node: (required) Node or NodePool
+        :type node: :ref:`Node Node`
+        :return: DexEngine
+        """
+        engine = cls()
+        engine._source = node
+        engine.refresh()
+        return engine
+
+    @classmethod
+    def from_ocean(cls, ocean) -> "DexEngine":
+        """
+        Loads all pools with ocean.poolpairs.list
+
+        :param ocean: (required) Ocean
+        :type ocean: :ref:`Ocean Ocean`
+        :return: DexEngine
+        """
+        engine = cls()
+        engine._source = ocean
+        engine.refresh()
+        return engine
+
+    def refresh(self, pool_ids: [str] = None) -> None:
+        """
+        Reloads the pools from the node or ocean, which the engine was created from
+
+        :param pool_ids: (optional) only reload these pools, for example the pools of the swaps in a new block
+            (default=None -> all pools)
+        :type pool_ids: [str]
+        """
+        if self._source is None:
+            raise WrongParameters("The engine was not created from a node or ocean")
+        if hasattr(self._source, "poolpair"):
+            if pool_ids is None:
+                pools = self._list_node_pools()
+            else:
+                pools = {}
+                for id in pool_ids:
+                    pools.update(self._source.poolpair.getpoolpair(str(id)))
+            self.update([Pool.from_node(id, data) for id, data in pools.items()])
+        else:
+            if pool_ids is None:
+                pools = list(self._source.poolpairs.iter_list())
+            else:
+                pools = [self._source.poolpairs.get(str(id))["data"] for id in pool_ids]
+            self.update([Pool.from_ocean(data) for data in pools])
+
+    def update(self, pools: [Pool]) -> None:
+        """
+        Adds new pools or replaces the reserves and fees of known pools
+
+        :param pools: (required) the changed pools
+        :type pools: [Pool]
+        """
+        for pool in pools:
+            known = self._pools.get(pool.id)
+            if known is None:
+                self._pools[pool.id] = pool
+                self._invalidate()
+            else:
+                # The known pool is changed in place, so that the found paths stay valid
+                key = known._key()
+                for name in Pool.__slots__:
+                    setattr(known, name, getattr(pool, name))
+                if known._key() != key:
+                    self._invalidate()
+            if pool.symbolA:
+                self._symbols[pool.symbolA] = pool.idTokenA
+            if pool.symbolB:
+                self._symbols[pool.symbolB] = pool.idTokenB
+
+    def remove(self, pool_id: str) -> None:
+        """
+        Removes a pool from the engine
+
+        :param pool_id: (required) id of the pool pair
+        :type pool_id: str
+        """
+        if self._pools.pop(str(pool_id), None) is not None:
+            self._invalidate()
+
+    # Get Information
+    def get_pool(self, pool_id: str) -> Pool:
+        return self._pools[str(pool_id)]
+
+    def get_pools(self) -> [Pool]:
+        return list(self._pools.values())
+
+    def get_token_id(self, token: str) -> str:
+        """
+        Returns the id of a token, which can be given as id or symbol
+
+        :param token: (required) id or symbol of the token: 0 or DFI
+        :type token: str | int
+        :return: str
+        """
+        token = str(token)
+        if token.isdigit():
+            return token
+        if token in self._symbols:
+            return self._symbols[token]
+        raise WrongParameters(f"The token {token} is not part of any pool")
+
+    def get_paths(self, tokenFrom: str, tokenTo: str) -> [[str]]:
+        """
+        Returns all paths from one token to another over up to three tradable pools
+
+        :param tokenFrom: (required) id or symbol of the token to swap from
+        :type tokenFrom: str
+        :param tokenTo: (required) id or symbol of the token to swap to
+        :type tokenTo: str
+        :return: [[str]] -- the ids of the pool pairs of every path
+        """
+        return [[pool.id for pool, forward in path] for path in
+                self._find_paths(self.get_token_id(tokenFrom), self.get_token_id(tokenTo))]
+
+    # Swap
+    def swap(self, tokenFrom: str, tokenTo: str, amount: float, path: str or [str] = "auto") -> SwapResult:
+        """
+        Simulates a swap without changing the reserves
+
+        :param tokenFrom: (required) id or symbol of the token to swap from
+        :type tokenFrom: str
+        :param tokenTo: (required) id or symbol of the token to swap to
+        :type tokenTo: str
+        :param amount: (required) amount of tokenFrom in coins
+        :type amount: float
+        :param path: (optional) auto: best path, direct: only the pool of both tokens or the ids of the pool pairs
+            (default=auto)
+        :type path: str | [str]
+        :return: SwapResult
+        """
+        return self.swap_many(tokenFrom, tokenTo, [amount], path)[0]
+
+    def swap_many(self, tokenFrom: str, tokenTo: str, amounts: [float], path: str or [str] = "auto") \
+            -> [SwapResult]:
+        """
+        Simulates swaps of many amounts at once, for example to find the best trade size. Every path is evaluated
+        once for all amounts and the best path is chosen for each amount separately.
+
+        :param tokenFrom: (required) id or symbol of the token to swap from
+        :type tokenFrom: str
+        :param tokenTo: (required) id or symbol of the token to swap to
+        :type tokenTo: str
+        :param amounts: (required) amounts of tokenFrom in coins
+        :type amounts: [float]
+        :param path: (optional) auto: best path, direct: only the pool of both tokens or the ids of the pool pairs
+            (default=auto)
+        :type path: str | [str]
+        :return: [SwapResult] -- in the same order as the amounts
+        """
+        idFrom, idTo = self.get_token_id(tokenFrom), self.get_token_id(tokenTo)
+        satoshis = [to_satoshi(amount) for amount in amounts]
+        paths = self._select_paths(idFrom, idTo, path)
+
+        best, bestPath = [-1] * len(satoshis), [None] * len(satoshis)
+        for candidate in paths:
+            results = satoshis
+            for pool, forward in candidate:
+                results = pool.swap_many(forward, results)
+            for i, result in enumerate(results):
+                if result > best[i]:
+                    best[i], bestPath[i] = result, candidate
+        return [SwapResult(idFrom, idTo, satoshi, result, [pool.id for pool, forward in candidatePath])
+                for satoshi, result, candidatePath in zip(satoshis, best, bestPath)]
+
+    def apply_swap(self, tokenFrom: str, tokenTo: str, amount: float, path: str or [str] = "auto") -> SwapResult:
+        """
+        Swaps and changes the reserves of the pools on the path, for example to simulate a swap of another
+        transaction in the mempool before the next refresh
+
+        :param tokenFrom: (required) id or symbol of the token to swap from
+        :type tokenFrom: str
+        :param tokenTo: (required) id or symbol of the token to swap to
+        :type tokenTo: str
+        :param amount: (required) amount of tokenFrom in coins
+        :type amount: float
+        :param path: (optional) auto: best path, direct: only the pool of both tokens or the ids of the pool pairs
+            (default=auto)
+        :type path: str | [str]
+        :return: SwapResult
+        """
+        result = self.swap(tokenFrom, tokenTo, amount, path)
+        swapped, token = result.amountFrom, result.tokenFrom
+        for poolId in result.path:
+            pool = self._pools[poolId]
+            key = pool._key()
+            swapped = pool.apply_swap(token, swapped)
+            token = pool.other_token(token)
+            if pool._key() != key:
+                self._invalidate()
+        result.amountTo = swapped
+        return result
+
+    # Internal
+    def _invalidate(self) -> None:
+        self._graph = None
+        self._paths.clear()
+
+    def _select_paths(self, idFrom: str, idTo: str, path: str or [str]) -> [[(Pool, bool)]]:
+        if path == "auto":
+            paths = self._find_paths(idFrom, idTo)
+        elif path == "direct":
+            paths = [candidate for candidate in self._find_paths(idFrom, idTo) if len(candidate) == 1]
+        elif isinstance(path, (list, tuple)):
+            paths = [self._build_path(idFrom, idTo, [str(id) for id in path])]
+        else:
+            raise WrongParameters("The path has to be auto, direct or a list of pool pair ids")
+        if not paths:
+            raise WrongParameters(f"There is no tradable path from token {idFrom} to token {idTo}")
+        return paths
+
+    def _build_path(self, idFrom: str, idTo: str, poolIds: [str]) -> [(Pool, bool)]:
+        path, token = [], idFrom
+        for poolId in poolIds:
+            if poolId not in self._pools:
+                raise WrongParameters(f"The pool {poolId} is not known")
+            pool = self._pools[poolId]
+            path.append((pool, pool.is_forward(token)))
+            token = pool.other_token(token)
+        if token != idTo:
+            raise WrongParameters(f"The path {poolIds} does not end with token {idTo}")
+        return path
+
+    def _find_paths(self, idFrom: str, idTo: str) -> [[(Pool, bool)]]:
+        key = (idFrom, idTo)
+        if key in self._paths:
+            return self._paths[key]
+        if self._graph is None:
+            self._graph = {}
+            for pool in self._pools.values():
+                if pool.is_tradable():
+                    self._graph.setdefault(pool.idTokenA, []).append((pool, True))
+                    self._graph.setdefault(pool.idTokenB, []).append((pool, False))
+
+        # Depth first search for all paths, which do not visit a token twice
+        paths = []
+
+        def search(token: str, path: [(Pool, bool)], visited: {str}) -> None:
+            for pool, forward in self._graph.get(token, ()):
+                nextToken = pool.idTokenB if forward else pool.idTokenA
+                if nextToken in visited:
+                    continue
+                if nextToken == idTo:
+                    paths.append(path + [(pool, forward)])
+                elif len(path) + 1 < MAX_POOLS_PER_PATH:
+                    search(nextToken, path + [(pool, forward)], visited | {nextToken})
+
+        if idFrom != idTo:
+            search(idFrom, [], {idFrom})
+        self._paths[key] = paths
+        return paths
+
+    def _list_node_pools(self) -> {}:
+        pools, start = {}, None
+        while True:
+            page = self._source.poolpair.listpoolpairs(start, False if start is not None else None, NODE_LIST_LIMIT)
+            pools.update(page)
+            if len(page) < NODE_LIST_LIMIT:
+                return pools
+            start = max(int(id) for id in page)
@@ -160,13 +160,7 @@ def is_mnemonic(mnemonic: str, language: Optional[str] = None) -> bool:
     try:
         mnemonic = unicodedata.normalize("NFKD", mnemonic)
         if language is None:
-            for _language in ["english", "french", "italian",
-                              "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"]:
-                valid = False
-                if Mnemonic(language=_language).check(mnemonic=mnemonic) is True:
-                    valid = True
-                    break
-            return valid
+            return _get_mnemonic_language(mnemonic) is not None
         else:
             return Mnemonic(language=language).check(mnemonic=mnemonic)
     except:
@@ -252,14 +246,17 @@ def get_mnemonic_language(mnemonic: str) -> str:
     if not is_mnemonic(mnemonic=mnemonic):
         raise ValueError("Invalid mnemonic words.")
 
-    language = None
-    mnemonic = unicodedata.normalize("NFKD", mnemonic)
+    return _get_mnemonic_language(unicodedata.normalize("NFKD", mnemonic))
+
+
+def _get_mnemonic_language(mnemonic: str) -> Optional[str]:
+    # Only the languages whose wordlists contain all words have to be checked
+    possible = Mnemonic.possible_languages(mnemonic)
     for _language in ["english", "french", "italian",
                       "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"]:
-        if Mnemonic(language=_language).check(mnemonic=mnemonic) is True:
-            language = _language
-            break
-    return language
+        if _language in possible and Mnemonic(language=_language).check(mnemonic=mnemonic) is True:
+            return _language
+    return None
 
 
 def entropy_to_mnemonic(entropy: str, language: str = "english") -> str:
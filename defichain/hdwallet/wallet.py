@@ -1,6 +1,5 @@
 from ecdsa.curves import SECP256k1
 from ecdsa.ellipticcurve import Point
-from ecdsa.keys import SigningKey, VerifyingKey
 
 from ecdsa.ecdsa import int_to_string, string_to_int
 
@@ -8,8 +7,10 @@ from binascii import hexlify, unhexlify
 
 from defichain.mnemonic import Mnemonic
 from hashlib import sha256
-from typing import Optional, Any, Union
+from typing import Optional, Any, Union, Iterator, Iterable
+from collections import deque
 
+import copy
 import hmac
 import ecdsa
 import struct
@@ -18,8 +19,8 @@ import hashlib
 import base58
 
 from defichain.libs.ripemd160 import ripemd160
-from defichain.libs.ecc import S256Point, G
-from defichain.libs.bech32 import encode
+from defichain.libs.secp256k1 import get_backend, secret_exponent
+from defichain.libs.bech32 import encode, bech32_encode, convertbits
 from defichain.libs.base58 import check_encode, check_decode, ensure_string
 
 from defichain.networks.networks import Network
@@ -40,6 +41,48 @@ CURVE_GEN: Any = ecdsa.ecdsa.generator_secp256k1
 CURVE_ORDER: int = CURVE_GEN.order()
 FIELD_ORDER: int = SECP256k1.curve.p()
 INFINITY: Point = ecdsa.ellipticcurve.INFINITY
+DERIVATION_CHUNK_SIZE: int = 500
+
+
+def _derive_children(chain_code: bytes, private_key: Optional[bytes], public_key: bytes, indexes: Iterable[int],
+                     public_keys: bool = True) -> Iterator[tuple]:
+    # One derivation step from a cached parent node: yields (index, private key, compressed public key).
+    # Indexes resulting in an invalid key are skipped as specified by BIP32.
+    backend = get_backend()
+    parent_int = string_to_int(private_key) if private_key else None
+    for index in indexes:
+        i = hmac.new(chain_code, public_key + struct.pack(">L", index), hashlib.sha512).digest()
+        il_int = string_to_int(i[:32])
+        if il_int >= CURVE_ORDER:
+            continue
+        if parent_int is None:
+            try:
+                yield index, None, backend.public_key_tweak_add(public_key, i[:32])
+            except ValueError:
+                continue
+        else:
+            k_int = (il_int + parent_int) % CURVE_ORDER
+            if k_int == 0:
+                continue
+            secret = k_int.to_bytes(32, "big")
+            yield index, secret, backend.public_key(secret) if public_keys else None
+
+
+def _derive_addresses(network: Any, chain_code: bytes, private_key: Optional[bytes], public_key: bytes,
+                      prefix: str, indexes: Iterable[int]) -> list:
+    # Module level, so that it can be executed in the workers of a process pool
+    addresses = []
+    for index, _, child_public_key in _derive_children(chain_code, private_key, public_key, indexes):
+        public_key_hash = ripemd160(sha256(child_public_key).digest())
+        legacy = ensure_string(base58.b58encode_check(_unhexlify(network.PUBLIC_KEY_ADDRESS) + public_key_hash))
+        bech32, default = None, None
+        if network.SEGWIT_ADDRESS.HRP is not None:
+            script_hash = ripemd160(sha256(b"\x00\x14" + public_key_hash).digest())
+            # The witness program always has 20 bytes, the decode check of encode is not needed
+            bech32 = bech32_encode(network.SEGWIT_ADDRESS.HRP, [0] + convertbits(public_key_hash, 8, 5))
+            default = ensure_string(base58.b58encode_check(_unhexlify(network.SCRIPT_ADDRESS) + script_hash))
+        addresses.append((prefix + str(index), child_public_key.hex(), bech32, default, legacy))
+    return addresses
 
 
 class Wallet:
@@ -76,8 +119,7 @@ class Wallet:
 
         self._seed: Optional[bytes] = None
         self._private_key: Optional[bytes] = None
-        self._key: Optional[SigningKey] = None
-        self._verified_key: Optional[VerifyingKey] = None
+        self._compressed_key: Optional[bytes] = None
         self._semantic: str = semantic
         self._from_class: bool = False
         self._path_class: str = "m"
@@ -190,9 +232,8 @@ class Wallet:
         if parse_il == 0 or parse_il >= SECP256k1.order:
             raise ValueError("Bad seed, resulting in invalid key!")
 
-        self._private_key, self._chain_code = il, ir
-        self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
+        self._chain_code = ir
+        self._set_private_key(il)
         if self._use_default_path:
             self.from_path(path=self._cryptocurrency.DEFAULT_PATH)
         self._public_key = self.compressed()
@@ -231,9 +272,8 @@ class Wallet:
         )
         self._i = _deserialize_xprivate_key[5] + _deserialize_xprivate_key[4]
         self._root_private_key = (_deserialize_xprivate_key[5], _deserialize_xprivate_key[4])
-        self._private_key, self._chain_code = self._i[:32], self._i[32:]
-        self._key = ecdsa.SigningKey.from_string(_deserialize_xprivate_key[5], curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
+        self._chain_code = self._i[32:]
+        self._set_private_key(self._i[:32])
         if self._use_default_path:
             self.from_path(path=self._cryptocurrency.DEFAULT_PATH)
         if self._from_class:
@@ -274,9 +314,7 @@ class Wallet:
             struct.unpack(">L", _deserialize_xpublic_key[3])[0]
         )
         self._chain_code = _deserialize_xpublic_key[4]
-        self._verified_key = ecdsa.VerifyingKey.from_string(
-            _deserialize_xpublic_key[5], curve=SECP256k1
-        )
+        self._set_public_key(_deserialize_xpublic_key[5])
         self._root_public_key = (
             _deserialize_xpublic_key[5], _deserialize_xpublic_key[4]
         )
@@ -312,9 +350,7 @@ class Wallet:
         if not raw.startswith(_unhexlify(self._cryptocurrency.WIF_SECRET_KEY)):
             raise ValueError(f"Invalid {self.cryptocurrency()} wallet important format.")
 
-        self._private_key = raw.split(_unhexlify(self._cryptocurrency.WIF_SECRET_KEY), 1).pop()
-        self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
+        self._set_private_key(raw.split(_unhexlify(self._cryptocurrency.WIF_SECRET_KEY), 1).pop())
         self._public_key = self.compressed()
         return self
 
@@ -334,9 +370,7 @@ class Wallet:
         <defichain.hdwallet.wallet.Wallet object at 0x7ff405eebe50>
         """
 
-        self._private_key = unhexlify(private_key)
-        self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
+        self._set_private_key(unhexlify(private_key))
         self._public_key = self.compressed()
         return self
 
@@ -356,9 +390,7 @@ class Wallet:
         <defichain.hdwallet.wallet.Wallet object at 0x7fb8c47ece50>
         """
 
-        self._verified_key = ecdsa.VerifyingKey.from_string(
-            unhexlify(public_key), curve=SECP256k1
-        )
+        self._set_public_key(unhexlify(public_key))
         self._public_key = self.compressed()
         return self
 
@@ -447,9 +479,9 @@ class Wallet:
 
         i_str = struct.pack(">L", index)
         if index & BIP32KEY_HARDEN:
-            if self._key is None:
+            if self._private_key is None:
                 raise DerivationError("Hardened derivation path is invalid for xpublic key.")
-            data = b"\0" + self._key.to_string() + i_str
+            data = b"\0" + self._private_key + i_str
         else:
             data = unhexlify(self.public_key()) + i_str
 
@@ -463,31 +495,35 @@ class Wallet:
         if il_int > CURVE_ORDER:
             return None
 
-        if self._key:
-            pvt_int = string_to_int(self._key.to_string())
+        if self._private_key:
+            pvt_int = string_to_int(self._private_key)
             k_int = (il_int + pvt_int) % CURVE_ORDER
             if k_int == 0:
                 return None
             secret = (b"\0" * 32 + int_to_string(k_int))[-32:]
 
-            self._private_key, self._chain_code, self._depth, self._index, self._parent_fingerprint = (
-                secret, ir, (self._depth + 1), index, unhexlify(self.finger_print())
+            self._chain_code, self._depth, self._index, self._parent_fingerprint = (
+                ir, (self._depth + 1), index, unhexlify(self.finger_print())
             )
-            self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-            self._verified_key = self._key.get_verifying_key()
+            self._set_private_key(secret)
         else:
-            key_point = S256Point.parse(unhexlify(self.public_key()))
-            left_point = il_int * G
-            total = key_point + left_point
+            total = get_backend().public_key_tweak_add(self._compressed_key, il)
 
             self._chain_code, self._depth, self._index, self._parent_fingerprint = (
                 ir, (self._depth + 1), index, unhexlify(self.finger_print())
             )
-            self._verified_key = ecdsa.VerifyingKey.from_string(
-                total.sec(), curve=SECP256k1
-            )
+            self._compressed_key = total
         return self
 
+    def _set_private_key(self, private_key: bytes) -> None:
+        # The public key is computed by the crypto backend, no ecdsa signing key is needed
+        secret_exponent(private_key)
+        self._private_key, self._compressed_key = private_key, get_backend().public_key(private_key)
+
+    def _set_public_key(self, public_key: bytes) -> None:
+        # Parsing checks that the compressed or uncompressed key is a point on the curve
+        self._compressed_key = ecdsa.VerifyingKey.from_string(public_key, curve=SECP256k1).to_string("compressed")
+
     @staticmethod
     def _deserialize_xprivate_key(xprivate_key: str, encoded: bool = True) -> tuple:
         decoded_xprivate_key = check_decode(xprivate_key) if encoded else xprivate_key
@@ -696,17 +732,14 @@ class Wallet:
             self._path, self._path_class, self._depth, self._parent_fingerprint, self._index = (
                 "m", "m", 0, b"\0\0\0\0", 0
             )
-            self._private_key, self._chain_code = self._root_private_key
-            self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-            self._verified_key = self._key.get_verifying_key()
+            self._chain_code = self._root_private_key[1]
+            self._set_private_key(self._root_private_key[0])
         elif self._root_public_key:
             self._path, self._path_class, self._depth, self._parent_fingerprint, self._index = (
                 "m", "m", 0, b"\0\0\0\0", 0
             )
             self._chain_code = self._root_public_key[1]
-            self._verified_key = ecdsa.VerifyingKey.from_string(
-                self._root_public_key[0], curve=SECP256k1
-            )
+            self._set_public_key(self._root_public_key[0])
         return self
 
     def uncompressed(self, compressed: Optional[str] = None) -> str:
@@ -755,16 +788,9 @@ class Wallet:
         "025af8506eb2b42f63842402cf4a462c0c4200797ab707acc5c215aee8a276a2c1"
         """
 
-        _verified_key = ecdsa.VerifyingKey.from_string(
-            unhexlify(uncompressed), curve=SECP256k1
-        ) if uncompressed else self._verified_key
-        padx = (b"\0" * 32 + int_to_string(
-            _verified_key.pubkey.point.x()))[-32:]
-        if _verified_key.pubkey.point.y() & 1:
-            ck = b"\3" + padx
-        else:
-            ck = b"\2" + padx
-        return hexlify(ck).decode()
+        if uncompressed:
+            return ecdsa.VerifyingKey.from_string(unhexlify(uncompressed), curve=SECP256k1).to_string("compressed").hex()
+        return hexlify(self._compressed_key).decode()
 
     def private_key(self) -> str:
         """
@@ -781,7 +807,7 @@ class Wallet:
         "56605e027fdb039e86fabdf3057b117fcd2c82ceaaa997a4a47afdf03ce9b155"
         """
 
-        return hexlify(self._key.to_string()).decode() if self._key else None
+        return hexlify(self._private_key).decode() if self._private_key else None
 
     def public_key(self, compressed: bool = True, private_key: Optional[str] = None) -> str:
         """
@@ -804,15 +830,7 @@ class Wallet:
         """
 
         if private_key:
-            key = ecdsa.SigningKey.from_string(
-                unhexlify(private_key), curve=SECP256k1)
-            verified_key = key.get_verifying_key()
-            padx = (b"\0" * 32 + int_to_string(
-                verified_key.pubkey.point.x()))[-32:]
-            if verified_key.pubkey.point.y() & 1:
-                ck = b"\3" + padx
-            else:
-                ck = b"\2" + padx
+            ck = get_backend().public_key(unhexlify(private_key), compressed=True)
             return hexlify(ck).decode() if compressed else self.uncompressed(compressed=hexlify(ck).decode())
         return self.compressed() if compressed else self.uncompressed()
 
@@ -1026,9 +1044,7 @@ class Wallet:
         "ead6524e1ee52c7750e5cb2fe3dc3ab30a49b0c3"
         """
 
-        return hexlify(ripemd160(sha256(unhexlify(self.public_key(
-            private_key=private_key if private_key else self.private_key()
-        ))).digest())).decode("utf-8")
+        return hexlify(ripemd160(sha256(unhexlify(self.public_key(private_key=private_key))).digest())).decode("utf-8")
 
     def finger_print(self) -> str:
         """
@@ -1045,7 +1061,7 @@ class Wallet:
         "ead6524e"
         """
 
-        return self.hash(self.private_key())[:8]
+        return self.hash()[:8]
 
     def default_address(self) -> str:
         """
@@ -1241,7 +1257,7 @@ class Wallet:
         """
 
         return check_encode(
-            _unhexlify(self._cryptocurrency.WIF_SECRET_KEY) + self._key.to_string() + b"\x01") if self._key else None
+            _unhexlify(self._cryptocurrency.WIF_SECRET_KEY) + self._private_key + b"\x01") if self._private_key else None
 
     def get_account(self, index: int = 0, prefix: str = "m/1129/0/0/"):
         from .account import Account
@@ -1259,6 +1275,111 @@ class Wallet:
             self.from_path(previousPath)
         return acc
 
+    def derive_range(self, prefix: str = "m/1129/0/0/", start: int = 0, count: int = 20, addresses: bool = False,
+                     processes: Optional[int] = None, chunk_size: int = DERIVATION_CHUNK_SIZE) -> Iterator:
+        """
+        Derive the accounts or addresses of a range of indexes below a common parent path.
+
+        The parent node of the prefix is derived once, each index then only needs a single derivation step.
+        This makes scanning many addresses much faster than calling ``get_account`` for every index.
+        The results are yielded lazily in the order of the indexes, the path of the wallet is not changed.
+
+        With ``addresses=True`` a tuple ``(path, public_key, bech32, default, legacy)`` is yielded instead of an
+        Account. Addresses can be derived in a process pool, which speeds up large gap limit scans.
+
+        :param prefix: Derivation path of the parent node, default to ``m/1129/0/0/``.
+        :type prefix: str
+        :param start: First index, default to ``0``.
+        :type start: int
+        :param count: Number of indexes, default to ``20``.
+        :type count: int
+        :param addresses: Yield address tuples instead of Account objects, default to ``False``.
+        :type addresses: bool
+        :param processes: Number of worker processes to derive addresses, default to ``None`` (no process pool).
+        :type processes: int
+        :param chunk_size: Number of indexes per task of the process pool, default to ``500``.
+        :type chunk_size: int
+
+        :returns: Iterator -- Account objects or address tuples.
+
+        >>> from defichain import Wallet
+        >>> from defichain.networks import DefichainMainnet
+        >>> wallet = Wallet(network=DefichainMainnet)
+        >>> wallet.from_mnemonic(mnemonic="venture fitness paper little blush april rigid where find volcano fetch crack label polar dash", passphrase="password")
+        >>> [account.get_p2wpkh() for account in wallet.derive_range(count=2)]
+        ['df1qatt9yns7u5k8w589evh78hp6kv9ynvxr2xlvpn', 'df1qrq4tcg8ea6lakvj0p3my2skuvpy9qssszh7xsa']
+        >>> for path, public_key, bech32, default, legacy in wallet.derive_range(count=10000, addresses=True, processes=4):
+        ...     pass
+        """
+
+        if not isinstance(start, int) or not isinstance(count, int) or start < 0 or count < 0:
+            raise ValueError("Bad index range, start and count have to be positive integer numbers!")
+        if start + count > BIP32KEY_HARDEN:
+            raise DerivationError("Only non hardened indexes can be derived in a range.")
+        if processes is not None and processes > 1 and not addresses:
+            raise ValueError("A process pool can only be used to derive addresses, use addresses=True.")
+        if chunk_size < 1:
+            raise ValueError("The chunk size has to be greater than zero.")
+
+        parent = self._derive_parent(prefix)
+        prefix = str(prefix).rstrip("/") + "/"
+        indexes = range(start, start + count)
+        if addresses and processes is not None and processes > 1:
+            return self._derive_addresses_in_pool(parent, prefix, indexes, processes, chunk_size)
+        if addresses:
+            return self._derive_addresses_in_chunks(parent, prefix, indexes, chunk_size)
+        return self._derive_accounts(parent, indexes)
+
+    def _derive_parent(self, prefix: Union[str, Derivation]) -> tuple:
+        if not self._root_private_key and not self._root_public_key:
+            raise ValueError("You can't drive this master key.")
+
+        # The derivation runs on a copy, the path of this wallet stays untouched
+        path = str(prefix).rstrip("/")
+        parent = copy.copy(self)
+        if path == "m":
+            parent.clean_derivation()
+        else:
+            parent.from_path(path)
+        private_key = parent._private_key if parent._private_key else None
+        return parent._chain_code, private_key, unhexlify(parent.public_key())
+
+    def _derive_accounts(self, parent: tuple, indexes: range) -> Iterator:
+        from .account import Account
+        chain_code, private_key, public_key = parent
+        for index, child_private_key, child_public_key in _derive_children(chain_code, private_key, public_key,
+                                                                           indexes, public_keys=False):
+            key = child_private_key if child_private_key else child_public_key
+            yield Account(self._cryptocurrency, key.hex())
+
+    def _derive_addresses_in_chunks(self, parent: tuple, prefix: str, indexes: range, chunk_size: int) -> Iterator:
+        for i in range(0, len(indexes), chunk_size):
+            yield from _derive_addresses(self._cryptocurrency, *parent, prefix, indexes[i:i + chunk_size])
+
+    def _derive_addresses_in_pool(self, parent: tuple, prefix: str, indexes: range, processes: int,
+                                  chunk_size: int) -> Iterator:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = iter([indexes[i:i + chunk_size] for i in range(0, len(indexes), chunk_size)])
+        executor = ProcessPoolExecutor(max_workers=processes)
+        futures = deque()
+        try:
+            # Only a few chunks are queued ahead, so that the results are produced while they are consumed
+            for chunk in chunks:
+                futures.append(executor.submit(_derive_addresses, self._cryptocurrency, *parent, prefix, chunk))
+                if len(futures) >= 2 * processes:
+                    break
+            while futures:
+                result = futures.popleft().result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    futures.append(executor.submit(_derive_addresses, self._cryptocurrency, *parent, prefix, chunk))
+                yield from result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+
     def dumps(self) -> dict:
         """
         Get All Wallet imformations.
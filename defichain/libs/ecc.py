@@ -2,6 +2,7 @@ from io import BytesIO
 
 import hashlib
 import hmac
+import sys
 
 A = 0
 B = 7
@@ -228,6 +229,184 @@ class S256Field(FieldElement):
         return self**((P + 1) // 4)
 
 
+# Jacobian coordinates: (X, Y, Z) represents the affine point (X / Z^2, Y / Z^3), Z = 0 is the point at infinity.
+# Additions and doublings work on plain integers without any modular inversion, only the conversion back
+# to affine coordinates needs one inversion.
+INFINITY = (0, 1, 0)
+G_WINDOW = 4  # bits per window of the fixed base table of G
+WNAF_WIDTH = 5  # window width of the wNAF multiplication of arbitrary points
+
+
+def _inverse(a):
+    """modular inverse in the field of secp256k1"""
+    if sys.version_info >= (3, 8):
+        return pow(a, -1, P)  # extended euclid, much faster than fermat's little theorem
+    return pow(a, P - 2, P)
+
+
+def _jacobian_double(p):
+    X, Y, Z = p
+    if not Y or not Z:
+        return INFINITY
+    YY = Y * Y % P
+    S = 4 * X * YY % P
+    M = 3 * X * X % P
+    X3 = (M * M - 2 * S) % P
+    Y3 = (M * (S - X3) - 8 * YY * YY) % P
+    Z3 = 2 * Y * Z % P
+    return X3, Y3, Z3
+
+
+def _jacobian_add(p, q):
+    X1, Y1, Z1 = p
+    X2, Y2, Z2 = q
+    if not Z1:
+        return q
+    if not Z2:
+        return p
+    Z1Z1 = Z1 * Z1 % P
+    Z2Z2 = Z2 * Z2 % P
+    U1 = X1 * Z2Z2 % P
+    U2 = X2 * Z1Z1 % P
+    S1 = Y1 * Z2 * Z2Z2 % P
+    S2 = Y2 * Z1 * Z1Z1 % P
+    H = (U2 - U1) % P
+    R = (S2 - S1) % P
+    if not H:
+        return _jacobian_double(p) if not R else INFINITY
+    HH = H * H % P
+    HHH = H * HH % P
+    V = U1 * HH % P
+    X3 = (R * R - HHH - 2 * V) % P
+    Y3 = (R * (V - X3) - S1 * HHH) % P
+    Z3 = Z1 * Z2 * H % P
+    return X3, Y3, Z3
+
+
+def _jacobian_add_affine(p, q):
+    """adds the affine point q = (x, y) to the jacobian point p"""
+    X1, Y1, Z1 = p
+    x2, y2 = q
+    if not Z1:
+        return x2, y2, 1
+    Z1Z1 = Z1 * Z1 % P
+    U2 = x2 * Z1Z1 % P
+    S2 = y2 * Z1 * Z1Z1 % P
+    H = (U2 - X1) % P
+    R = (S2 - Y1) % P
+    if not H:
+        return _jacobian_double(p) if not R else INFINITY
+    HH = H * H % P
+    HHH = H * HH % P
+    V = X1 * HH % P
+    X3 = (R * R - HHH - 2 * V) % P
+    Y3 = (R * (V - X3) - Y1 * HHH) % P
+    Z3 = Z1 * H % P
+    return X3, Y3, Z3
+
+
+def _to_affine(p):
+    X, Y, Z = p
+    if not Z:
+        return None
+    z_inv = _inverse(Z)
+    z_inv2 = z_inv * z_inv % P
+    return X * z_inv2 % P, Y * z_inv2 * z_inv % P
+
+
+def _to_affine_batch(points):
+    """converts jacobian points (not infinity) to affine with a single inversion (Montgomery's trick)"""
+    products = []
+    product = 1
+    for X, Y, Z in points:
+        product = product * Z % P
+        products.append(product)
+    inverse = _inverse(product)
+    result = [None] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        X, Y, Z = points[i]
+        z_inv = inverse * products[i - 1] % P if i else inverse
+        inverse = inverse * Z % P
+        z_inv2 = z_inv * z_inv % P
+        result[i] = (X * z_inv2 % P, Y * z_inv2 * z_inv % P)
+    return result
+
+
+def _wnaf(k, width):
+    """returns the width-w non-adjacent form of k, least significant digit first"""
+    digits = []
+    window = 1 << width
+    while k:
+        if k & 1:
+            digit = k & (window - 1)
+            if digit >= window >> 1:
+                digit -= window
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+
+def _multiply(point, k):
+    """multiplies the affine point (x, y) with k using wNAF, returns a jacobian point"""
+    # odd multiples: point, 3 * point, 5 * point, ...
+    double = _jacobian_double((point[0], point[1], 1))
+    odd = [(point[0], point[1], 1)]
+    for _ in range((1 << (WNAF_WIDTH - 2)) - 1):
+        odd.append(_jacobian_add(odd[-1], double))
+    odd = _to_affine_batch(odd)
+
+    result = INFINITY
+    for digit in reversed(_wnaf(k, WNAF_WIDTH)):
+        result = _jacobian_double(result)
+        if digit > 0:
+            result = _jacobian_add_affine(result, odd[digit >> 1])
+        elif digit < 0:
+            x, y = odd[-digit >> 1]
+            result = _jacobian_add_affine(result, (x, P - y))
+    return result
+
+
+_G_TABLE = None
+
+
+def _g_table():
+    """
+    Fixed base table of G: _G_TABLE[i][j] = (j + 1) * 2^(G_WINDOW * i) * G in affine coordinates.
+    It is built on first use (1024 points) and turns k * G into at most 64 additions without doublings.
+    """
+    global _G_TABLE
+    if _G_TABLE is None:
+        size = (1 << G_WINDOW) - 1
+        points = []
+        base = (G.x.num, G.y.num, 1)
+        for _ in range(-(-256 // G_WINDOW)):
+            row = [base]
+            for _ in range(size - 1):
+                row.append(_jacobian_add(row[-1], base))
+            points.extend(row)
+            base = _jacobian_add(row[-1], base)
+        points = _to_affine_batch(points)
+        _G_TABLE = [points[i:i + size] for i in range(0, len(points), size)]
+    return _G_TABLE
+
+
+def _multiply_g(k):
+    """multiplies G with k using the fixed base table, returns a jacobian point"""
+    mask = (1 << G_WINDOW) - 1
+    result = INFINITY
+    for row in _g_table():
+        if not k:
+            break
+        digit = k & mask
+        if digit:
+            result = _jacobian_add_affine(result, row[digit - 1])
+        k >>= G_WINDOW
+    return result
+
+
 class S256Point(Point):
 
     def __init__(self, x, y, a=None, b=None):
@@ -243,9 +422,32 @@ class S256Point(Point):
         else:
             return 'S256Point({}, {})'.format(self.x, self.y)
 
+    def __add__(self, other):
+        if not isinstance(other, S256Point):
+            return super().__add__(other)
+        if self.x is None:
+            return other
+        if other.x is None:
+            return self
+        point = _jacobian_add_affine((self.x.num, self.y.num, 1), (other.x.num, other.y.num))
+        return S256Point._from_jacobian(point)
+
     def __rmul__(self, coefficient):
         coef = coefficient % N
-        return super().__rmul__(coef)
+        if self.x is None or coef == 0:
+            return S256Point(None, None)
+        if self.x.num == G.x.num and self.y.num == G.y.num:
+            point = _multiply_g(coef)
+        else:
+            point = _multiply((self.x.num, self.y.num), coef)
+        return S256Point._from_jacobian(point)
+
+    @staticmethod
+    def _from_jacobian(point):
+        affine = _to_affine(point)
+        if affine is None:
+            return S256Point(None, None)
+        return S256Point(affine[0], affine[1])
 
     def verify(self, z, sig):
         # By Fermat's Little Theorem, 1/s = pow(s, N-2, N)
@@ -370,7 +572,14 @@ class PrivateKey:
 
     def __init__(self, secret):
         self.secret = secret
-        self.point = secret * G
+        self._point = None
+
+    @property
+    def point(self):
+        # computed on first use, signing does not need the public point
+        if self._point is None:
+            self._point = self.secret * G
+        return self._point
 
     def hex(self):
         return '{:x}'.format(self.secret).zfill(64)
@@ -383,7 +592,7 @@ class PrivateKey:
         k_inv = pow(k, N - 2, N)
         # s = (z+r*secret) / k
         s = (z + r * self.secret) * k_inv % N
-        if s > N / 2:
+        if s > N // 2:
             s = N - s
         # return an instance of Signature:
         # Signature(r, s)
@@ -0,0 +1,24 @@
+import importlib
+
+
+def import_optional(module: str, feature: str, package: str = None):
+    """
+    Imports an optional dependency on first use, so that importing the library stays fast and works without it
+
+    :param module: (required) name of the module
+    :type module: str
+    :param feature: (required) part of the library that needs the module, used in the error message
+    :type feature: str
+    :param package: (optional) name of the package to install (default=module)
+    :type package: str
+    :return: the imported module
+
+    :example:
+
+        >>> aiohttp = import_optional("aiohttp", "The async node")
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        package = module if package is None else package
+        raise ImportError(f"{feature} needs the {package} package: pip install {package}")
@@ -6,6 +6,7 @@
 # Grudgingly ported to python2 compatibility by Richard Kiss
 
 import binascii
+import hashlib
 import struct
 import unittest
 
@@ -101,8 +102,27 @@ def compress(h0, h1, h2, h3, h4, block):
     return h1 + cl + dr, h2 + dl + er, h3 + el + ar, h4 + al + br, h0 + bl + cr
 
 
+def _hashlib_available():
+    # OpenSSL 3 only provides RIPEMD-160 with the legacy provider
+    try:
+        hashlib.new("ripemd160", b"")
+        return True
+    except ValueError:
+        return False
+
+
+HASHLIB_RIPEMD160 = _hashlib_available()
+
+
 def ripemd160(data):
-    """Compute the RIPEMD-160 hash of data."""
+    """Compute the RIPEMD-160 hash of data, with hashlib if it supports RIPEMD-160."""
+    if HASHLIB_RIPEMD160:
+        return hashlib.new("ripemd160", data).digest()
+    return _ripemd160(data)
+
+
+def _ripemd160(data):
+    """Compute the RIPEMD-160 hash of data in pure python."""
     # Initialize state.
     state = (0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0)
     # Process full 64-byte blocks in the input.
@@ -139,3 +159,4 @@ class TestFrameworkKey(unittest.TestCase):
             (b"a" * 1000000, "52783243c1697bdbe16d37f97f68f08325dc1528")
         ]:
             self.assertEqual(binascii.hexlify(ripemd160(msg)).decode(), hexout)
+            self.assertEqual(binascii.hexlify(_ripemd160(msg)).decode(), hexout)
@@ -0,0 +1,180 @@
+"""
+Pluggable secp256k1 backend for public key computation, key tweaking and signing.
+
+If the optional coincurve package (bindings to libsecp256k1) is installed it is used automatically,
+otherwise the pure python implementation of defichain.libs.ecc is used.
+The backend can be chosen with the environment variable DEFICHAIN_CRYPTO_BACKEND or with set_backend.
+"""
+
+import os
+import threading
+from hashlib import sha1
+
+from ecdsa import SigningKey, VerifyingKey, SECP256k1, BadSignatureError
+from ecdsa.keys import MalformedPointError
+from ecdsa.util import sigdecode_der
+
+from .ecc import S256Point, PrivateKey, G, N
+
+BACKEND_ENVIRONMENT_VARIABLE = "DEFICHAIN_CRYPTO_BACKEND"
+
+
+class PythonBackend:
+    """
+    Pure python backend: always available, used as fallback
+    """
+    NAME = "python"
+
+    @staticmethod
+    def public_key(private_key: bytes, compressed: bool = True) -> bytes:
+        return (PythonBackend._secret(private_key) * G).sec(compressed)
+
+    @staticmethod
+    def public_key_tweak_add(public_key: bytes, tweak: bytes, compressed: bool = True) -> bytes:
+        tweak_int = int.from_bytes(tweak, "big")
+        if tweak_int >= N:
+            raise ValueError("The tweak is not a valid secp256k1 scalar")
+        total = S256Point.parse(public_key) + tweak_int * G
+        if total.x is None:
+            raise ValueError("The tweaked public key is the point at infinity")
+        return total.sec(compressed)
+
+    @staticmethod
+    def sign_digest(private_key: bytes, digest: bytes) -> bytes:
+        # RFC6979 nonce and low s value, the same signature as libsecp256k1
+        return PrivateKey(PythonBackend._secret(private_key)).sign(int.from_bytes(digest, "big")).der()
+
+    @staticmethod
+    def verify_digest(public_key: bytes, signature: bytes, digest: bytes) -> bool:
+        try:
+            return VerifyingKey.from_string(public_key, curve=SECP256k1).verify_digest(
+                signature, digest, sigdecode=sigdecode_der)
+        except BadSignatureError:
+            return False
+
+    @staticmethod
+    def _secret(private_key: bytes) -> int:
+        secret = int.from_bytes(private_key, "big")
+        if len(private_key) != 32 or not 1 <= secret < N:
+            raise ValueError("The private key is not a valid secp256k1 scalar")
+        return secret
+
+
+class CoincurveBackend:
+    """
+    Backend based on libsecp256k1 through the coincurve package: pip install coincurve
+    """
+    NAME = "coincurve"
+
+    def __init__(self):
+        import coincurve
+        self._coincurve = coincurve
+
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        return self._coincurve.PublicKey.from_secret(private_key).format(compressed)
+
+    def public_key_tweak_add(self, public_key: bytes, tweak: bytes, compressed: bool = True) -> bytes:
+        return self._coincurve.PublicKey(public_key).add(tweak).format(compressed)
+
+    def sign_digest(self, private_key: bytes, digest: bytes) -> bytes:
+        # libsecp256k1 uses RFC6979 nonces and returns low s signatures
+        return self._coincurve.PrivateKey(private_key).sign(digest, hasher=None)
+
+    def verify_digest(self, public_key: bytes, signature: bytes, digest: bytes) -> bool:
+        try:
+            return self._coincurve.PublicKey(public_key).verify(signature, digest, hasher=None)
+        except ValueError:
+            return False
+
+
+BACKENDS = {PythonBackend.NAME: PythonBackend, CoincurveBackend.NAME: CoincurveBackend}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def available_backends() -> [str]:
+    """
+    Returns the names of all backends that can be used in this environment
+
+    :return: [str] (array) -- names of the backends
+    """
+    available = []
+    for name, backend in BACKENDS.items():
+        try:
+            backend()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def get_backend():
+    """
+    Returns the active backend. On first use coincurve is selected if it is installed, otherwise the
+    pure python backend. The environment variable DEFICHAIN_CRYPTO_BACKEND forces a backend.
+
+    :return: PythonBackend | CoincurveBackend
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                name = os.environ.get(BACKEND_ENVIRONMENT_VARIABLE, "").strip().lower()
+                if name:
+                    _backend = _create_backend(name)
+                else:
+                    try:
+                        _backend = CoincurveBackend()
+                    except ImportError:
+                        _backend = PythonBackend()
+    return _backend
+
+
+def set_backend(backend: "str | object"):
+    """
+    Sets the backend for the whole process
+
+    :param backend: (required) name of the backend: "coincurve" or "python", or an object with the backend methods
+    :type backend: str | object
+    :return: the active backend
+    """
+    global _backend
+    with _backend_lock:
+        _backend = _create_backend(backend) if isinstance(backend, str) else backend
+    return _backend
+
+
+def secret_exponent(private_key: bytes) -> int:
+    """
+    Checks the private key and returns its secret exponent
+
+    :param private_key: (required) 32 bytes private key
+    :type private_key: bytes
+    :return: int -- secret exponent
+    """
+    exponent = int.from_bytes(private_key, "big")
+    if len(private_key) != SECP256k1.baselen or not 1 <= exponent < N:
+        raise MalformedPointError("The private key is not a valid secp256k1 scalar")
+    return exponent
+
+
+def signing_key(private_key: bytes) -> SigningKey:
+    """
+    Creates an ecdsa signing key for the private key. The key computes its public key in pure python,
+    use the backend if only the public key or a signature is needed.
+
+    :param private_key: (required) 32 bytes private key
+    :type private_key: bytes
+    :return: SigningKey
+    """
+    return SigningKey.from_secret_exponent(secret_exponent(private_key), curve=SECP256k1, hashfunc=sha1)
+
+
+def _create_backend(name: str):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown crypto backend: {name}. Use one of: {', '.join(BACKENDS)}")
+    try:
+        return BACKENDS[name]()
+    except ImportError:
+        raise ImportError(f"The crypto backend {name} is not installed: pip install {name}")
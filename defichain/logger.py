@@ -1,7 +1,19 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+from collections import deque
+
 import requests
 from defichain.exceptions.http import WrongParameters
+from defichain.settings import is_offline
+
+TELEGRAM_INTERVAL = 3  # seconds between two telegram messages
+TELEGRAM_MAX_LENGTH = 4096  # maximum length of a telegram message
+TELEGRAM_MAX_PENDING = 1000  # lines waiting for telegram, the oldest lines are dropped if there are more
+TELEGRAM_TIMEOUT = 10
 
 
 class Logger:
@@ -20,6 +32,9 @@ class Logger:
 
     If telegram token and telegram chatid is passed, then the logs are also sent via telegram after the respective log level.
 
+    Log lines are written to the file by a background thread, so that logging does not slow down the requests.
+    Telegram messages are collected and sent in batches of at most one message every few seconds.
+
     :param directory: (optional) directory where the logs should be stored (default: next to the script in a logs folder)
     :type directory: str
     :param log_level: (optional) input, output, error, all (default: input)
@@ -57,8 +72,15 @@ class Logger:
         self.file = None
         self.form = None
 
+        self._queue = None
+        self._queueHandler = None
+        self._listener = None
+        self._loggers = {}
+        self._telegramSender = None
+
         self.setup_logger()
         self.test_telegram()
+        atexit.register(self.close)
 
     def setup_logger(self):
         if os.path.isdir(self.directory):
@@ -71,38 +93,32 @@ class Logger:
         self.form = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s: %(message)s")
         self.file.setFormatter(self.form)
 
-    def input(self, name, msg):
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.DEBUG)
-        logger.addHandler(self.file)
+        # The calling thread only puts the log records into the queue, the listener writes them to the file
+        self._queue = queue.SimpleQueue()
+        self._queueHandler = logging.handlers.QueueHandler(self._queue)
+        self._listener = logging.handlers.QueueListener(self._queue, self.file)
+        self._listener.start()
 
+    def input(self, name, msg):
         self.telegram_send("Debug", name, msg)
-
-        logger.debug(msg)
+        self._get_logger(name).debug(msg)
 
     def output(self, name, msg):
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.DEBUG)
-        logger.addHandler(self.file)
-
         self.telegram_send("Debug", name, msg)
-
-        logger.debug(msg)
+        self._get_logger(name).debug(msg)
 
     def error(self, name, msg):
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.ERROR)
-        logger.addHandler(self.file)
-
         self.telegram_send("Error", name, msg)
-
-        logger.error(msg)
+        self._get_logger(name).error(msg)
 
     def test_telegram(self):
+        if is_offline():
+            return
         if self.telegram_token != "" and self.telegram_chatid != "":
             try:
-                requests.get(f"https://api.telegram.org/bot{self.telegram_token}/getUpdates")
+                requests.get(f"https://api.telegram.org/bot{self.telegram_token}/getUpdates", timeout=TELEGRAM_TIMEOUT)
                 self.telegram = True
+                self._telegramSender = TelegramSender(self.telegram_token, self.telegram_chatid)
             except:
                 print("Warning: The Telegram token for the logger is incorrect")
 
@@ -113,21 +129,142 @@ class Logger:
             print("Warning: You also have to submit a telegram token to get the logs via telegram")
 
     def telegram_send(self, level, name, msg):
-        if self.telegram:
-            text = f"{level} - {name}: {msg}"
-            try:
-                req = requests.get(f"https://api.telegram.org/bot{self.telegram_token}/sendMessage?chat_id={self.telegram_chatid}&text={text}")
-                if req.status_code != 200:
-                    raise Exception("Warning: You are not using the correct telegram token and chat id combo.")
-            except Exception as e:
-                print(e)
+        if self.telegram and self._telegramSender is not None:
+            self._telegramSender.add(f"{level} - {name}: {msg}")
 
     def create_folder(self):
         if not os.path.isdir(self.directory):
             os.mkdir(self.directory)
 
+    def flush(self):
+        """
+        Waits until all log lines are written to the file and sends the collected telegram messages
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener.start()
+        if self._telegramSender is not None:
+            self._telegramSender.flush()
+
+    def close(self):
+        """
+        Writes the remaining log lines, sends the remaining telegram messages and stops the background threads
+        """
+        atexit.unregister(self.close)
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            self.file.close()
+        if self._telegramSender is not None:
+            self._telegramSender.close()
+            self._telegramSender = None
+        for logger in self._loggers.values():
+            logger.removeHandler(self._queueHandler)
+        self._loggers.clear()
+
+    def _get_logger(self, name) -> logging.Logger:
+        # The handler is attached only once per name, otherwise every line would be written once per call before
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = logging.getLogger(name)
+            logger.setLevel(logging.DEBUG)
+            if self._queueHandler is not None:
+                logger.addHandler(self._queueHandler)
+            self._loggers[name] = logger
+        return logger
+
+
+class TelegramSender:
+    """
+    Sends log lines to a telegram chat in a background thread.
 
+    The lines are collected and joined into one message, at most one message is sent every few seconds to stay
+    below the rate limit of telegram. If telegram can not keep up, the oldest lines are dropped.
 
+    :param token: (required) the telegram token
+    :type token: str
+    :param chatid: (required) the telegram chatid
+    :type chatid: str
+    :param interval: (optional) seconds between two messages (default=3)
+    :type interval: float
+    """
 
-
-
+    def __init__(self, token: str, chatid: str, interval: float = TELEGRAM_INTERVAL):
+        self._url = f"https://api.telegram.org/bot{token}/sendMessage"
+        self._chatid = chatid
+        self._interval = interval
+        self._session = requests.Session()
+        self._pending = deque(maxlen=TELEGRAM_MAX_PENDING)
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._warned = False
+        self.sent, self.dropped, self.failed = 0, 0, 0
+        self._thread = threading.Thread(target=self._run, name="TelegramSender", daemon=True)
+        self._thread.start()
+
+    def add(self, text: str) -> None:
+        """
+        Adds a line to the next message, does not wait for telegram
+
+        :param text: (required) the log line
+        :type text: str
+        """
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append(text)
+
+    def flush(self) -> None:
+        """
+        Sends all collected lines at once
+        """
+        message = self._next_message()
+        while message is not None:
+            self._send(message)
+            message = self._next_message()
+
+    def close(self) -> None:
+        """
+        Stops the background thread and sends the remaining lines
+        """
+        self._closed.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+
+    # Internal
+    def _run(self) -> None:
+        while not self._closed.wait(self._interval):
+            message = self._next_message()
+            if message is not None:
+                self._send(message)
+
+    def _next_message(self) -> "str | None":
+        # Joins as many lines as fit into one message, lines that are too long on their own are shortened
+        with self._lock:
+            if not self._pending:
+                return None
+            lines = [self._pending.popleft()[:TELEGRAM_MAX_LENGTH]]
+            length = len(lines[0])
+            while self._pending and length + 1 + len(self._pending[0]) <= TELEGRAM_MAX_LENGTH:
+                lines.append(self._pending.popleft())
+                length += 1 + len(lines[-1])
+        return "\n".join(lines)
+
+    def _send(self, text: str) -> None:
+        try:
+            response = self._session.post(self._url, data={"chat_id": self._chatid, "text": text},
+                                          timeout=TELEGRAM_TIMEOUT)
+            if response.status_code == 429:  # Too many requests: wait as long as telegram asks for and try again
+                retry_after = response.json().get("parameters", {}).get("retry_after", self._interval)
+                self._closed.wait(retry_after)
+                response = self._session.post(self._url, data={"chat_id": self._chatid, "text": text},
+                                              timeout=TELEGRAM_TIMEOUT)
+            if response.status_code != 200:
+                raise Exception("Warning: You are not using the correct telegram token and chat id combo.")
+            self.sent += 1
+        except Exception as e:
+            self.failed += 1
+            if not self._warned:
+                self._warned = True
+                print(e)
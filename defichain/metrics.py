@@ -0,0 +1,259 @@
+import bisect
+import contextvars
+import threading
+import time
+from typing import Callable
+
+# Upper bounds of the latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_current = contextvars.ContextVar("defichain_measurement", default=None)
+
+
+class Measurement:
+    """
+    One request to the node or to ocean, which is passed to the hooks of :class:`Metrics`.
+
+    The attributes are filled while the request runs: sizes in bytes, the duration in seconds and the class name
+    of the exception, if the request failed.
+    """
+    __slots__ = ("source", "name", "requestSize", "responseSize", "retries", "cached", "error", "start", "duration",
+                 "_metrics", "_token")
+
+    def __init__(self, metrics: "Metrics", source: str, name: str):
+        self.source = source
+        self.name = name
+        self.requestSize = 0
+        self.responseSize = 0
+        self.retries = 0
+        self.cached = False
+        self.error = None
+        self.start = None
+        self.duration = None
+        self._metrics = metrics
+        self._token = None
+
+    def __enter__(self) -> "Measurement":
+        self._metrics._call_hooks(self._metrics._beforeHooks, self)
+        self._token = _current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.duration = time.perf_counter() - self.start
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        self._metrics._record(self)
+        self._metrics._call_hooks(self._metrics._afterHooks, self)
+        return False
+
+    def to_json(self) -> {}:
+        return {"source": self.source, "name": self.name, "requestSize": self.requestSize,
+                "responseSize": self.responseSize, "retries": self.retries, "cached": self.cached,
+                "error": self.error, "duration": self.duration}
+
+
+class _Series:
+    # Counters and latency histogram of one method or endpoint
+    __slots__ = ("calls", "cached", "retries", "errors", "requestBytes", "responseBytes", "buckets", "durationSum")
+
+    def __init__(self, buckets: int):
+        self.calls = 0
+        self.cached = 0
+        self.retries = 0
+        self.errors = {}
+        self.requestBytes = 0
+        self.responseBytes = 0
+        self.buckets = [0] * (buckets + 1)  # the last bucket counts durations above the highest bound
+        self.durationSum = 0.0
+
+
+class Metrics:
+    """
+    Counts the requests of the :ref:`Node Node` and :ref:`Ocean Ocean` per rpc method or ocean endpoint: number of
+    calls, latency histogram, request and response sizes, retries, cache hits and errors by exception class.
+
+    Hooks are called before and after every request with a :class:`Measurement`, for example to forward the
+    requests to a tracing system. Without a metrics object, the node and ocean do not measure anything.
+
+    :param buckets: (optional) upper bounds of the latency buckets in seconds
+    :type buckets: [float]
+
+    :example:
+
+        >>> from defichain import Node, Ocean
+        >>> from defichain.metrics import Metrics
+        >>>
+        >>> metrics = Metrics()
+        >>> node = Node("user", "password", metrics=metrics)
+        >>> ocean = Ocean(metrics=metrics)
+        >>> metrics.add_hook(after=lambda measurement: print(measurement.name, measurement.duration))
+        >>>
+        >>> node.blockchain.getblockcount()
+        getblockcount 0.0012
+        >>> metrics.get_snapshot()["node"]["getblockcount"]["calls"]
+        1
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: [float] = LATENCY_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._series = {}  # (source, name) -> _Series
+        self._lock = threading.Lock()
+        self._beforeHooks = []
+        self._afterHooks = []
+
+    # Hooks
+    def add_hook(self, before: Callable[[Measurement], None] = None,
+                 after: Callable[[Measurement], None] = None) -> None:
+        """
+        Adds functions, which are called with the :class:`Measurement` before and after every request
+
+        :param before: (optional) called before the request is sent
+        :type before: Callable
+        :param after: (optional) called after the result or the exception was received
+        :type after: Callable
+        """
+        if before is not None:
+            self._beforeHooks.append(before)
+        if after is not None:
+            self._afterHooks.append(after)
+
+    def remove_hook(self, hook: Callable[[Measurement], None]) -> None:
+        """
+        Removes a function, which was added as before or after hook
+
+        :param hook: (required) the function
+        :type hook: Callable
+        """
+        for hooks in (self._beforeHooks, self._afterHooks):
+            if hook in hooks:
+                hooks.remove(hook)
+
+    # Measure
+    def measure(self, source: str, name: str) -> Measurement:
+        """
+        Measures a request as context manager
+
+        :param source: (required) node or ocean
+        :type source: str
+        :param name: (required) the rpc method or the ocean endpoint
+        :type name: str
+        :return: Measurement
+        """
+        return Measurement(self, source, name)
+
+    @staticmethod
+    def retry() -> None:
+        """
+        Counts a retry of the request, which is measured in the current thread or task
+        """
+        measurement = _current.get()
+        if measurement is not None:
+            measurement.retries += 1
+
+    # Export
+    def get_snapshot(self) -> {}:
+        """
+        Returns all counters by source and name. The buckets are cumulative: the number of requests that took at
+        most the given seconds.
+
+        :return: {source: {name: {"calls": int, "cached": int, "retries": int, "errors": {str: int},
+            "requestBytes": int, "responseBytes": int, "latency": {"count": int, "sum": float,
+            "buckets": {float | "+Inf": int}}}}}
+        """
+        snapshot = {}
+        with self._lock:
+            for (source, name), series in sorted(self._series.items()):
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self._buckets + ("+Inf",), series.buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot.setdefault(source, {})[name] = {
+                    "calls": series.calls, "cached": series.cached, "retries": series.retries,
+                    "errors": dict(series.errors), "requestBytes": series.requestBytes,
+                    "responseBytes": series.responseBytes,
+                    "latency": {"count": cumulative, "sum": series.durationSum, "buckets": buckets}}
+        return snapshot
+
+    def to_prometheus(self, prefix: str = "defichain") -> str:
+        """
+        Returns the counters in the text format of prometheus
+
+        :param prefix: (optional) prefix of the metric names (default=defichain)
+        :type prefix: str
+        :return: str
+        """
+        metrics = {
+            "requests_total": ("counter", "Number of requests"),
+            "cached_total": ("counter", "Number of requests answered by the cache"),
+            "retries_total": ("counter", "Number of retries after connection failures"),
+            "errors_total": ("counter", "Number of failed requests by exception class"),
+            "request_bytes_total": ("counter", "Size of the sent payloads in bytes"),
+            "response_bytes_total": ("counter", "Size of the received responses in bytes"),
+            "request_duration_seconds": ("histogram", "Duration of the requests in seconds")}
+        lines = {name: [] for name in metrics}
+        for source, names in self.get_snapshot().items():
+            for name, values in names.items():
+                labels = f'source="{source}",name="{_escape(name)}"'
+                lines["requests_total"].append(f"{prefix}_requests_total{{{labels}}} {values['calls']}")
+                lines["cached_total"].append(f"{prefix}_cached_total{{{labels}}} {values['cached']}")
+                lines["retries_total"].append(f"{prefix}_retries_total{{{labels}}} {values['retries']}")
+                for error, count in sorted(values["errors"].items()):
+                    lines["errors_total"].append(f'{prefix}_errors_total{{{labels},error="{error}"}} {count}')
+                lines["request_bytes_total"].append(
+                    f"{prefix}_request_bytes_total{{{labels}}} {values['requestBytes']}")
+                lines["response_bytes_total"].append(
+                    f"{prefix}_response_bytes_total{{{labels}}} {values['responseBytes']}")
+                histogram = lines["request_duration_seconds"]
+                for bound, count in values["latency"]["buckets"].items():
+                    histogram.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                histogram.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {values['latency']['sum']}")
+                histogram.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {values['latency']['count']}")
+
+        text = []
+        for name, (kind, description) in metrics.items():
+            text.append(f"# HELP {prefix}_{name} {description}")
+            text.append(f"# TYPE {prefix}_{name} {kind}")
+            text.extend(lines[name])
+        return "\n".join(text) + "\n"
+
+    def reset(self) -> None:
+        """
+        Sets all counters to zero
+        """
+        with self._lock:
+            self._series.clear()
+
+    # Internal
+    def _record(self, measurement: Measurement) -> None:
+        key = (measurement.source, measurement.name)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self._buckets))
+            series.calls += 1
+            series.retries += measurement.retries
+            series.requestBytes += measurement.requestSize
+            series.responseBytes += measurement.responseSize
+            if measurement.error is not None:
+                series.errors[measurement.error] = series.errors.get(measurement.error, 0) + 1
+            if measurement.cached:
+                series.cached += 1  # Answers of the cache are not part of the latency of the requests
+                return
+            series.buckets[bisect.bisect_left(self._buckets, measurement.duration)] += 1
+            series.durationSum += measurement.duration
+
+    @staticmethod
+    def _call_hooks(hooks: [Callable], measurement: Measurement) -> None:
+        # A failing hook must not fail the request
+        for hook in hooks:
+            try:
+                hook(measurement)
+            except Exception as e:
+                print(f"The metrics hook {hook} failed: {e}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -24,8 +24,9 @@ import hashlib
 import itertools
 import os
 import secrets
+import threading
 import unicodedata
-from typing import AnyStr, List, TypeVar, Union
+from typing import AnyStr, Dict, FrozenSet, List, Set, Tuple, TypeVar, Union
 
 _T = TypeVar("_T")
 PBKDF2_ROUNDS = 2048
@@ -65,22 +66,89 @@ class Mnemonic(object):
     >>> from defichain import Mnemonic
     >>> Mnemonic(language="english")
     """
+
+    # Process wide cache of the wordlists, shared by all instances and loaded on first use
+    _languages: Tuple[str, ...] = None
+    _wordlists: Dict[str, Tuple[Tuple[str, ...], Dict[str, int]]] = {}
+    _word_languages: Dict[str, FrozenSet[str]] = None
+    _cache_lock = threading.Lock()
+
     def __init__(self, language: str = "english"):
         self.language = language
         self.radix = 2048
-        d = os.path.join(os.path.dirname(__file__), f"wordlist/{language}.txt")
-        if os.path.exists(d) and os.path.isfile(d):
-            with open(d, "r", encoding="utf-8") as f:
-                self.wordlist = [w.strip() for w in f.readlines()]
-            if len(self.wordlist) != self.radix:
-                raise ConfigurationError(
-                    f"Wordlist should contain {self.radix} words, but it's {len(self.wordlist)} words long instead."
-                )
-        else:
-            raise ConfigurationError("Language not detected")
+        self.wordlist, self._indexes = self._get_wordlist(language)
         # Japanese must be joined by ideographic space
         self.delimiter = "\u3000" if language == "japanese" else " "
 
+    @classmethod
+    def _get_wordlist(cls, language: str) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+        wordlist = cls._wordlists.get(language)
+        if wordlist is None:
+            with cls._cache_lock:
+                wordlist = cls._wordlists.get(language)
+                if wordlist is None:
+                    wordlist = cls._load_wordlist(language)
+                    cls._wordlists[language] = wordlist
+        return wordlist
+
+    @classmethod
+    def _load_wordlist(cls, language: str) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+        d = os.path.join(os.path.dirname(__file__), f"wordlist/{language}.txt")
+        if not (os.path.exists(d) and os.path.isfile(d)):
+            raise ConfigurationError("Language not detected")
+        with open(d, "r", encoding="utf-8") as f:
+            words = tuple(w.strip() for w in f.readlines())
+        if len(words) != 2048:
+            raise ConfigurationError(
+                f"Wordlist should contain 2048 words, but it's {len(words)} words long instead."
+            )
+        return words, {word: index for index, word in enumerate(words)}
+
+    @classmethod
+    def word_languages(cls, word: str) -> FrozenSet[str]:
+        """
+        Returns the languages whose wordlist contains the given word
+
+        :param word: (required) normalized word of a mnemonic seed
+        :type word: str
+        :return: (frozenset) languages
+
+        :example:
+
+        >>> from defichain import Mnemonic
+        >>> Mnemonic.word_languages("animal")
+        frozenset({'english', 'french'})
+        """
+        if cls._word_languages is None:
+            word_languages = {}
+            for language in cls.list_languages():
+                for word_ in cls._get_wordlist(language)[1]:
+                    word_languages.setdefault(word_, set()).add(language)
+            cls._word_languages = {word_: frozenset(languages) for word_, languages in word_languages.items()}
+        return cls._word_languages.get(word, frozenset())
+
+    @classmethod
+    def possible_languages(cls, mnemonic: str) -> Set[str]:
+        """
+        Returns the languages whose wordlist contains all words of the mnemonic seed
+
+        :param mnemonic: (required) the mnemonic seed
+        :type mnemonic: str
+        :return: (set) languages
+
+        :example:
+
+        >>> from defichain import Mnemonic
+        >>> Mnemonic.possible_languages("unusual onion shallow invite supply more bubble mistake over make bracket cry")
+        {'english'}
+        """
+        possible = set(cls.list_languages())
+        for word in cls.normalize_string(mnemonic).split():
+            possible &= cls.word_languages(word)
+            if not possible:
+                break
+        return possible
+
     @classmethod
     def list_languages(cls) -> List[str]:
         """
@@ -94,11 +162,13 @@ class Mnemonic(object):
         >>> Mnemonic.list_languages()
         ['korean', 'japanese', 'chinese_simplified', 'english', 'french', 'italian', 'chinese_traditional', 'spanish']
         """
-        return [
-            f.split(".")[0]
-            for f in os.listdir(os.path.join(os.path.dirname(__file__), "wordlist"))
-            if f.endswith(".txt")
-        ]
+        if cls._languages is None:
+            cls._languages = tuple(
+                f.split(".")[0]
+                for f in os.listdir(os.path.join(os.path.dirname(__file__), "wordlist"))
+                if f.endswith(".txt")
+            )
+        return list(cls._languages)
 
     @staticmethod
     def normalize_string(txt: AnyStr) -> str:
@@ -128,15 +198,15 @@ class Mnemonic(object):
         "english"
         """
         code = cls.normalize_string(mnemonic)
-        possible = set(cls(lang) for lang in cls.list_languages())
+        possible = set(cls.list_languages())
         for word in code.split():
-            possible = set(p for p in possible if word in p.wordlist)
+            possible &= cls.word_languages(word)
             if not possible:
                 raise ConfigurationError(f"Language unrecognized for {word!r}")
         if len(possible) == 1:
-            return possible.pop().language
+            return possible.pop()
         raise ConfigurationError(
-            f"Language ambiguous between {', '.join( p.language for p in possible)}"
+            f"Language ambiguous between {', '.join(possible)}"
         )
 
     def generate(self, strength: int = 256) -> str:
@@ -183,9 +253,9 @@ class Mnemonic(object):
         wordindex = 0
         for word in words:
             # Find the words index in the wordlist
-            ndx = self.wordlist.index(word)
-            if ndx < 0:
-                raise LookupError('Unable to find "%s" in word list.' % word)
+            ndx = self._indexes.get(word)
+            if ndx is None:
+                raise ValueError('Unable to find "%s" in word list.' % word)
             # Set the next 11 bits to the value of the index.
             for ii in range(11):
                 concatBits[(wordindex * 11) + ii] = (ndx & (1 << (10 - ii))) != 0
@@ -248,11 +318,8 @@ class Mnemonic(object):
         if len(mnemonic_list) not in [12, 15, 18, 21, 24]:
             return False
         try:
-            idx = map(
-                lambda x: bin(self.wordlist.index(x))[2:].zfill(11), mnemonic_list
-            )
-            b = "".join(idx)
-        except ValueError:
+            b = "".join(bin(self._indexes[x])[2:].zfill(11) for x in mnemonic_list)
+        except KeyError:
             return False
         l = len(b)  # noqa: E741
         d = b[: l // 33 * 32]
@@ -262,7 +329,7 @@ class Mnemonic(object):
         return h == nh
 
     def expand_word(self, prefix: str) -> str:
-        if prefix in self.wordlist:
+        if prefix in self._indexes:
             return prefix
         else:
             matches = [word for word in self.wordlist if word.startswith(prefix)]
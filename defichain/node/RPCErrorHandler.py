@@ -54,4 +54,34 @@ class RPCErrorHandler:
                     if self.statusCode == 500:
                         if logger:
                             self.logger.error("NodeError", f"InternalServerError: {rpc_name}: {msg}")
-                        raise InternalServerError(f"{rpc_name}: {msg}")
\ No newline at end of file
+                        raise InternalServerError(f"{rpc_name}: {msg}")
+
+
+class RPCBatchErrorHandler:
+    """
+    Checks a single response of a JSON-RPC batch request.
+
+    The node always answers a batch request with status code 200, so the HTTP status code of each call is
+    derived from its RPC error code in the same way the node does it for single requests.
+    """
+    def __init__(self, response_item: {}, logger: Logger):
+        self.logger = logger
+
+        if 'error' in response_item and response_item['error'] is not None:
+            rpc_code = response_item["error"]["code"]
+            if rpc_code == RPCErrorCode.RPC_INVALID_REQUEST.value:
+                self.statusCode = 400
+            elif rpc_code == RPCErrorCode.RPC_METHOD_NOT_FOUND.value:
+                self.statusCode = 404
+            else:
+                self.statusCode = 500
+            RPCErrorHandler(_BatchResponse(self.statusCode, response_item), logger)
+
+
+class _BatchResponse:
+    def __init__(self, status_code: int, response_item: {}):
+        self.status_code = status_code
+        self._response_item = response_item
+
+    def json(self) -> {}:
+        return self._response_item
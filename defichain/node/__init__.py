@@ -19,6 +19,21 @@ from defichain.node.modules.vault import Vault
 from defichain.node.modules.wallet import Wallet
 from defichain.node.modules.zmq import Zmq
 
+# Async Node
+from defichain.node.asyncnode import AsyncNode
+
+# Batch
+from defichain.node.batch import Batch, BatchRequest
+
+# Node Pool
+from defichain.node.pool import NodePool
+
+# Result Cache
+from defichain.node.cache import ResultCache
+
+# Zmq Subscriber
+from defichain.node.subscriber import ZmqSubscriber, ZmqNotification
+
 # Util methods
 
 from defichain.node.util import BuildAmounts, BuildAddressAmounts
@@ -0,0 +1,222 @@
+from defichain.logger import Logger
+from defichain.metrics import Metrics
+from defichain.exceptions.http.ServiceUnavailable import ServiceUnavailable
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+
+from .asyncrpc import AsyncRPC, CONCURRENCY_LIMIT
+
+from .modules.accounts import Accounts
+from .modules.blockchain import Blockchain
+from .modules.control import Control
+from .modules.evm import Evm
+from .modules.generating import Generating
+from .modules.loan import Loan
+from .modules.masternodes import Masternodes
+from .modules.mining import Mining
+from .modules.network import Network
+from .modules.oracles import Oracles
+from .modules.poolpair import Poolpair
+from .modules.proposals import Proposals
+from .modules.rawtransactions import Rawtransactions
+from .modules.spv import Spv
+from .modules.stats import Stats
+from .modules.tokens import Tokens
+from .modules.util import Util
+from .modules.vault import Vault
+from .modules.wallet import Wallet
+from .modules.zmq import Zmq
+
+
+class AsyncNode:
+    """
+    The asyncio interface to communicate with your Defichain Node.
+
+    The async node provides the same modules and methods as the :ref:`Node Node` object, but every method returns
+    an awaitable. All requests share one pooled HTTP connection, the number of requests in flight is limited by the
+    concurrency parameter. The aiohttp package has to be installed: ``pip install aiohttp``
+
+    The connection to the node is tested and the wallet is prepared when the async node is used as async context
+    manager or when :meth:`connect` is awaited.
+
+    :param user: (required) user witch is set in your defi.conf
+    :type user: str
+    :param password: (required) password witch is set in your defi.conf
+    :type password: str
+    :param url: (optional) the url or ip at which your node can be reached (default=localhost)
+    :type url: str
+    :param port: (optional) the port at which your node can be reached (default=8554)
+    :type port: int
+    :param wallet_name: (optional) if your wallet is already imported, enter the name here (default="")
+    :type wallet_name: str
+    :param wallet_path: (optional) if your wallet is not imported you can specify the path here:
+                        it will be imported and becomes usable under the same parameter
+    :type wallet_path: str
+    :param wallet_password: (optional) password for wallet if it needs to be decrypted (default="")
+    :type wallet_password: str
+    :param wallet_timeout: (optional) time to elapse after the wallet is locked again (default=60)
+    :type wallet_timeout: int
+    :param protocol: (optional) the protocol which is used for the request (default=http)
+    :type protocol: str
+    :param logger: (optional) Logger Object
+    :type logger: :ref:`Logger`
+    :param concurrency: (optional) maximum number of requests in flight (default=100)
+    :type concurrency: int
+    :param metrics: (optional) counts the calls and their latency per method: True for a new :class:`Metrics`
+        object or a Metrics object, which can be shared (default=None -> nothing is measured)
+    :type metrics: Metrics | bool
+    :return: AsyncNode (object) The object to interact asynchronously with your Defichain Node
+
+    :example:
+
+            >>> import asyncio
+            >>> from defichain import AsyncNode
+            >>>
+            >>> async def main():
+            >>>     async with AsyncNode(user="user", password="password", url="127.0.0.1", port=8554) as node:
+            >>>         blockcount = await node.blockchain.getblockcount()
+            >>>         blockhashes = await asyncio.gather(*[node.blockchain.getblockhash(i) for i in range(100)])
+            >>>
+            >>> asyncio.run(main())
+    """
+
+    def __init__(self, user: str, password: str, url: str = "127.0.0.1", port: int = 8554, wallet_name: str = "",
+                 wallet_path: str = None, wallet_password: str = "", wallet_timeout: int = 60,
+                 protocol: str = "http", logger: Logger = None, concurrency: int = CONCURRENCY_LIMIT,
+                 metrics: "Metrics | bool" = None):
+
+        # Parameter Check
+        if wallet_name != "" and wallet_path is not None:
+            raise WrongParameters(f"Only one parameter of wallet_name or wallet_path may be given at a time!")
+        elif wallet_name == "" and wallet_path is not None:
+            wallet_name = wallet_path
+
+        # Setup URL
+        self._base_url = f"{protocol}://{user}:{password}@{url}:{port}"
+        if wallet_name != "":
+            self.url = f"{self._base_url}/wallet/{wallet_name}"
+        else:
+            self.url = self._base_url
+
+        self._wallet_name = wallet_name
+        self._wallet_path = wallet_path
+        self._wallet_password = wallet_password
+        self._wallet_timeout = wallet_timeout
+
+        # Setup all different modules
+        self.metrics = Metrics() if metrics is True else metrics if isinstance(metrics, Metrics) else None
+        self._rpc = AsyncRPC(self.url, logger, concurrency, self.metrics)
+        self._logger = logger
+        self.accounts = Accounts(self)
+        self.blockchain = Blockchain(self)
+        self.control = Control(self)
+        self.generating = Generating(self)
+        self.icxorderbook = None
+        self.loan = Loan(self)
+        self.masternodes = Masternodes(self)
+        self.mining = Mining(self)
+        self.network = Network(self)
+        self.oracles = Oracles(self)
+        self.poolpair = Poolpair(self)
+        self.proposals = Proposals(self)
+        self.rawtransactions = Rawtransactions(self)
+        self.spv = Spv(self)
+        self.stats = Stats(self)
+        self.tokens = Tokens(self)
+        self.util = Util(self)
+        self.vault = Vault(self)
+        self.wallet = Wallet(self)
+        self.zmq = Zmq(self)
+        self.evm = Evm(self)
+
+    async def __aenter__(self) -> "AsyncNode":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def connect(self) -> "AsyncNode":
+        """
+        Tests the connection to the node and prepares the wallet in the same way as the :ref:`Node Node` object
+
+        :return: AsyncNode
+        """
+        # Test Connection to Node
+        await self.test_connection()
+
+        # Check if only one wallet
+        if self._wallet_name == "":
+            wallets = await self.wallet.listwallets()
+            if len(wallets) == 1:  # Only one wallet is loaded
+                self._rpc.update_url(f"{self._base_url}/wallet/{wallets[0]}")
+            elif len(wallets) > 1 and not "" in wallets:
+                msg = "Warning: You have not specified an wallet in the wallet_name parameter. If you use an method " \
+                      "where an wallet is needed an error will accrue!"
+                print(msg)
+                if self._logger:
+                    self._logger.error("NodeWarning", msg)
+
+        # Prepare Wallet
+        if self._wallet_path is not None and self._wallet_path != "":
+            await self.load_wallet(self._wallet_path)
+        await self.decrypt_wallet(self._wallet_password, self._wallet_timeout)
+        return self
+
+    async def close(self) -> None:
+        """
+        Closes the pooled connections of the async node
+        """
+        await self._rpc.close()
+
+    async def call_many(self, calls: [()], raise_errors: bool = True) -> []:
+        """
+        Sends multiple remote procedure calls in a single request to the node.
+
+        :param calls: (required) list of calls: [(rpc_method, param1, param2, ...), ...]
+        :type calls: [tuple]
+        :param raise_errors: (optional) raise the exception of the first failed call, otherwise the exception is
+            returned in place of the result (default=True)
+        :type raise_errors: bool
+        :return: [...] (array) -- the results in the same order as the given calls
+
+        :example:
+
+            >>> await node.call_many([("getblockhash", 1), ("getblockhash", 2), ("getblockcount",)])
+        """
+        return await self._rpc.call_many(calls, raise_errors)
+
+    async def decrypt_wallet(self, wallet_password: str, wallet_timeout: int):
+        """
+        Decrypts wallet for a specific time if a password is given
+
+        :param wallet_password: wallet password
+        :type wallet_password: str
+        :param wallet_timeout: time to elapse until wallet is locked again
+        :type wallet_timeout: int
+        """
+        if wallet_password != "":
+            await self.wallet.walletpassphrase(wallet_password, wallet_timeout)
+
+    async def load_wallet(self, wallet_path: str):
+        """
+        Loads wallet into the Node
+
+        :param wallet_path: Path where the wallet is located in the filesystem
+        :type wallet_path: str
+        """
+        if not wallet_path in await self.wallet.listwallets():
+            await self.wallet.loadwallet(wallet_path)
+            print(f"Wallet has bean loaded: {wallet_path}")
+
+    async def test_connection(self):
+        """
+        Tests Connection to Defichain Node and raises ServiceUnavailable exception if no connection occurred
+
+        :exception: ServiceUnavailable
+        """
+        try:
+            await self.network.ping()
+        except ServiceUnavailable as e:
+            if self._logger:
+                self._logger.error("ConnectionError", f"RPC_CLIENT_INVALID_IP_OR_SUBNET: Invalid IP/Subnet")
+            raise ServiceUnavailable(f"RPC_CLIENT_INVALID_IP_OR_SUBNET: Invalid IP/Subnet")
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import logging
+import traceback
+
+from defichain.logger import Logger
+from defichain.libs.optional import import_optional
+from defichain.metrics import Metrics
+from defichain.node.rpc import RPC, RPC_TIMEOUT, RPC_TRIES, retry_delay
+from defichain.node.RPCErrorHandler import RPCErrorHandler
+from defichain.exceptions.http.ServiceUnavailable import ServiceUnavailable
+from defichain.exceptions.http.InternalServerError import InternalServerError
+
+CONCURRENCY_LIMIT = 100
+
+
+class AsyncResponse:
+    """
+    Holds the status code and the content of an async response, so that it can be passed to the error handlers
+    """
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncRPC(RPC):
+    def __init__(self, url, logger: Logger, concurrency: int = CONCURRENCY_LIMIT, metrics: Metrics = None):
+        import_optional("aiohttp", "The async node")
+        self._session = None
+        self._url = url
+        self._headers = {'content-type': 'application/json'}
+        self._logger = logger
+        self._concurrency = concurrency
+        self._semaphore = None
+        self._metrics = metrics
+
+    async def call(self, rpc_method, *params):
+        if self._metrics is None:
+            return await self._call(rpc_method, params)
+        with self._metrics.measure("node", rpc_method) as measurement:
+            return await self._call(rpc_method, params, measurement)
+
+    async def _call(self, rpc_method, params, measurement=None):
+        payload = json.dumps(self._build_request(rpc_method, params))
+        self._log_request(rpc_method, payload)
+
+        response = await self._post(payload)
+        if measurement is not None:
+            measurement.requestSize, measurement.responseSize = len(payload), len(response.text)
+
+        RPCErrorHandler(response, self._logger)  # Check for Exceptions
+
+        try:
+            result = response.json()['result']
+        except Exception as e3:
+            raise InternalServerError(f"json error: {e3}")
+
+        # Logging of Node request result
+        if self._logger:
+            if self._logger.log_level == "output" or self._logger.log_level == "all":
+                self._logger.output("NodeOutput", f"Node requests result: {result}")
+
+        return result
+
+    async def call_at_height(self, rpc_method, index: int, offset: int, *params):
+        if params[index] is None:
+            params = self._replace_param(params, index, await self.call("getblockcount") + offset)
+        return await self.call(rpc_method, *params)
+
+    async def call_many(self, calls: [()], raise_errors: bool = True) -> []:
+        if not calls:
+            return []
+        if self._metrics is None:
+            return await self._call_many(calls, raise_errors)
+        with self._metrics.measure("node", "batch") as measurement:
+            return await self._call_many(calls, raise_errors, measurement)
+
+    async def _call_many(self, calls: [()], raise_errors: bool = True, measurement=None) -> []:
+        batch, cached = self._build_batch(calls)
+        payload = self._dump_batch(batch)
+        response = await self._post(payload)
+        if measurement is not None:
+            measurement.requestSize, measurement.responseSize = len(payload), len(response.text)
+        return self._read_batch(calls, batch, cached, response, raise_errors)
+
+    async def _post(self, payload, methods: () = ()):
+        aiohttp = import_optional("aiohttp", "The async node")
+        session = self._get_session()
+        hadConnectionFailures = False
+
+        for attempt in range(RPC_TRIES):
+            try:
+                async with self._semaphore:
+                    async with session.post(self._url, headers=self._headers, data=payload) as response:
+                        result = AsyncResponse(response.status, await response.text())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == RPC_TRIES - 1:
+                    raise ServiceUnavailable("The service you are trying to connect to is not available")
+                hadConnectionFailures = True
+                if self._metrics is not None:
+                    self._metrics.retry()
+                delay = retry_delay(attempt)
+                reason = "Read timeout" if isinstance(e, asyncio.TimeoutError) else "Couldn't connect"
+                print(f"{reason} for remote procedure call, will sleep for {delay:.1f} seconds and then try again "
+                      f"({RPC_TRIES - attempt - 1} more tries)")
+                if self._logger:
+                    self._logger.error("ConnectionError", f"Could not connect to the Node, trying again: {e}")
+                logging.debug(traceback.format_exc())
+                await asyncio.sleep(delay)
+            except Exception as e2:
+                print(f"other exception occurred: {e2}")
+                logging.debug(traceback.format_exc())
+                raise InternalServerError(e2)
+            else:
+                if hadConnectionFailures:
+                    print('Connected for remote procedure call after retry.')
+                return result
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        aiohttp = import_optional("aiohttp", "The async node")
+        # The session has to be created inside the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._concurrency)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT))
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
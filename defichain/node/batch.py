@@ -0,0 +1,170 @@
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+
+from .rpc import RPC
+
+from .modules.accounts import Accounts
+from .modules.blockchain import Blockchain
+from .modules.control import Control
+from .modules.evm import Evm
+from .modules.generating import Generating
+from .modules.loan import Loan
+from .modules.masternodes import Masternodes
+from .modules.mining import Mining
+from .modules.network import Network
+from .modules.oracles import Oracles
+from .modules.poolpair import Poolpair
+from .modules.proposals import Proposals
+from .modules.rawtransactions import Rawtransactions
+from .modules.spv import Spv
+from .modules.stats import Stats
+from .modules.tokens import Tokens
+from .modules.util import Util
+from .modules.vault import Vault
+from .modules.wallet import Wallet
+from .modules.zmq import Zmq
+
+
+class BatchRequest:
+    """
+    Placeholder for the result of a call that was added to a :ref:`Node Batch`.
+
+    The result is available after the batch was executed.
+    """
+    def __init__(self, rpc_method: str, params: tuple):
+        self.rpc_method = rpc_method
+        self.params = params
+        self._executed = False
+        self._result = None
+        self._exception = None
+
+    def _set(self, result) -> None:
+        if isinstance(result, Exception):
+            self._exception = result
+        else:
+            self._result = result
+        self._executed = True
+
+    def done(self) -> bool:
+        """
+        Returns if the batch of this request was already executed
+
+        :return: bool
+        """
+        return self._executed
+
+    def result(self):
+        """
+        Returns the result of the call or raises the exception the node returned for this call
+
+        :return: the result of the call
+        """
+        if not self._executed:
+            raise WrongParameters("The batch has not been executed yet!")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def __repr__(self) -> str:
+        return f"BatchRequest({self.rpc_method}, executed={self._executed})"
+
+
+class Batch:
+    """
+    Collects multiple remote procedure calls and sends them to the node in a single JSON-RPC batch request.
+
+    The batch object provides the same modules as the :ref:`Node Node` object. Instead of the result every method
+    returns a :ref:`Node BatchRequest`, which holds the result after the batch has been executed.
+    If the batch is used as context manager, it is executed when leaving the block.
+
+    :param node: (required) the node object to send the batch to
+    :type node: Node
+
+    :example:
+
+            >>> with node.batch() as batch:
+            >>>     hash = batch.blockchain.getblockhash(1)
+            >>>     count = batch.blockchain.getblockcount()
+            >>> print(hash.result(), count.result())
+    """
+
+    def __init__(self, node):
+        self._node = node
+        self._rpc = self
+        self._requests = []
+
+        self.accounts = Accounts(self)
+        self.blockchain = Blockchain(self)
+        self.control = Control(self)
+        self.generating = Generating(self)
+        self.icxorderbook = None
+        self.loan = Loan(self)
+        self.masternodes = Masternodes(self)
+        self.mining = Mining(self)
+        self.network = Network(self)
+        self.oracles = Oracles(self)
+        self.poolpair = Poolpair(self)
+        self.proposals = Proposals(self)
+        self.rawtransactions = Rawtransactions(self)
+        self.spv = Spv(self)
+        self.stats = Stats(self)
+        self.tokens = Tokens(self)
+        self.util = Util(self)
+        self.vault = Vault(self)
+        self.wallet = Wallet(self)
+        self.zmq = Zmq(self)
+        self.evm = Evm(self)
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def call(self, rpc_method: str, *params) -> BatchRequest:
+        """
+        Adds a raw remote procedure call to the batch
+
+        :param rpc_method: (required) name of the rpc method
+        :type rpc_method: str
+        :param params: (optional) parameters of the rpc method
+        :return: BatchRequest
+        """
+        request = BatchRequest(rpc_method, params)
+        self._requests.append(request)
+        return request
+
+    def call_at_height(self, rpc_method: str, index: int, offset: int, *params) -> BatchRequest:
+        """
+        Adds a remote procedure call to the batch. If the parameter at index is None, the current block height
+        plus offset is requested from the node before the call is added.
+
+        :param rpc_method: (required) name of the rpc method
+        :type rpc_method: str
+        :param index: (required) index of the block height in params
+        :type index: int
+        :param offset: (required) added to the current block height
+        :type offset: int
+        :param params: (optional) parameters of the rpc method
+        :return: BatchRequest
+        """
+        if params[index] is None:
+            params = RPC._replace_param(params, index, self._node._rpc.call("getblockcount") + offset)
+        return self.call(rpc_method, *params)
+
+    def execute(self) -> []:
+        """
+        Sends all collected calls in one request to the node. Errors of single calls are raised when the result
+        of the corresponding :ref:`Node BatchRequest` is requested.
+
+        :return: [...] (array) -- the results or exceptions in the order the calls were added
+        """
+        requests, self._requests = self._requests, []
+        results = self._node._rpc.call_many([(request.rpc_method, *request.params) for request in requests],
+                                            raise_errors=False)
+        for request, result in zip(requests, results):
+            request._set(result)
+        return results
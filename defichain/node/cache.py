@@ -0,0 +1,268 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from defichain.exceptions.transactions import DeserializeError
+
+DEFAULT_CACHE_SIZE = 10000
+DEFAULT_REORG_WINDOW = 100
+
+# Version, previous block hash, merkle root, time, bits, height, minted blocks, stake modifier and signature
+HEADER_MAX_SIZE = 4 + 32 + 32 + 4 + 4 + 8 + 8 + 32 + 1 + 255
+
+# Methods whose results are cached: their result never changes for the same parameters, as soon as the block
+# is deeper than the reorg window
+CACHED_METHODS = ("getblock", "getblockheader", "getrawtransaction", "decoderawtransaction")
+
+
+class ResultCache:
+    """
+    Cache for the results of node calls that never change: getblock, getblockheader, getrawtransaction and
+    decoderawtransaction.
+
+    Results are kept in memory, the least recently used result is dropped if the cache holds more than
+    ``max_size`` results. If a path is given, the results are also stored in a sqlite database, so that they
+    survive a restart and can be shared by processes.
+
+    Blocks, headers and transactions are only cached if they have more confirmations than the ``reorg_window``.
+    The tip height is observed in the results of getblockcount, getblockchaininfo and verbose blocks and headers,
+    or can be set with :meth:`set_tip_height`. If the tip height decreases, all results with a height inside the
+    reorg window of the new tip are dropped. Raw transactions are only cached if they are requested with
+    verbose=True and the tip height is known, because only then the height of their block is known.
+
+    The confirmations of verbose results are recomputed from the tip height on every hit. Without a known tip
+    height, for example after loading a result from the database, the confirmations at the time of caching are
+    returned.
+
+    Every hit returns a new object, so changing a returned result does not change the cache.
+
+    :param max_size: (optional) maximum number of results in memory (default=10000)
+    :type max_size: int
+    :param path: (optional) path of the sqlite database (default=None -> only in memory)
+    :type path: str
+    :param reorg_window: (optional) number of blocks that can be reorganized (default=100)
+    :type reorg_window: int
+
+    :example:
+
+        >>> from defichain import Node
+        >>> from defichain.node import ResultCache
+        >>>
+        >>> node = Node("user", "password", cache=ResultCache(path="node_cache.sqlite", reorg_window=50))
+        >>> node.blockchain.getblock(blockhash, 2)
+        >>> node.blockchain.getblock(blockhash, 2)  # returned from the cache
+        >>> node.cache.get_stats()
+        {'hits': 1, 'misses': 1, 'size': 1, 'evictions': 0, 'invalidations': 0, 'tipHeight': 2500100}
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, path: str = None,
+                 reorg_window: int = DEFAULT_REORG_WINDOW):
+        if max_size < 1:
+            raise ValueError("The cache size has to be at least one")
+        if reorg_window < 0:
+            raise ValueError("The reorg window can not be negative")
+        self._max_size = max_size
+        self._reorg_window = reorg_window
+        self._entries = OrderedDict()  # key -> (height, result json)
+        self._lock = threading.RLock()
+        self._tip_height = None
+        self.hits, self.misses, self.evictions, self.invalidations = 0, 0, 0, 0
+
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, height INTEGER, result TEXT)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_height ON results (height)")
+            self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def is_cached_method(method: str) -> bool:
+        return method in CACHED_METHODS
+
+    # Lookup
+    def get(self, method: str, params: []) -> (bool, object):
+        """
+        Returns the cached result of the call, counts hits and misses
+
+        :param method: (required) the rpc method
+        :type method: str
+        :param params: (required) the parameters of the call without None values
+        :type params: list
+        :return: (bool, result) -- True and the result if the call is cached, otherwise False and None
+        """
+        key = ResultCache._key(method, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute("SELECT height, result FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    entry = self._set_entry(key, row[0], row[1])
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            result = json.loads(entry[1])
+            if isinstance(result, dict) and isinstance(result.get("confirmations"), int) \
+                    and entry[0] is not None and self._tip_height is not None:
+                result["confirmations"] = self._tip_height - entry[0] + 1
+            return True, result
+
+    # Update
+    def set(self, method: str, params: [], result) -> bool:
+        """
+        Caches the result of the call, if it can not change anymore
+
+        :param method: (required) the rpc method
+        :type method: str
+        :param params: (required) the parameters of the call without None values
+        :type params: list
+        :param result: (required) the result of the call
+        :return: bool -- True if the result was cached
+        """
+        self.observe(method, result)
+        if not self.is_cached_method(method) or result is None:
+            return False
+
+        cacheable, height = self._get_height(method, params, result)
+        if not cacheable:
+            return False
+
+        key = ResultCache._key(method, params)
+        text = json.dumps(result)
+        with self._lock:
+            self._set_entry(key, height, text)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO results (key, height, result) VALUES (?, ?, ?)",
+                                 (key, height, text))
+                self._db.commit()
+        return True
+
+    def observe(self, method: str, result) -> None:
+        """
+        Updates the tip height from the result of getblockcount, getblockchaininfo or a verbose block or header
+
+        :param method: (required) the rpc method
+        :type method: str
+        :param result: (required) the result of the call
+        """
+        height = None
+        if method == "getblockcount" and isinstance(result, int):
+            height = result
+        elif method == "getblockchaininfo" and isinstance(result, dict):
+            height = result.get("blocks")
+        elif method in ("getblock", "getblockheader") and isinstance(result, dict):
+            if isinstance(result.get("height"), int) and isinstance(result.get("confirmations"), int) \
+                    and result["confirmations"] > 0:
+                height = result["height"] + result["confirmations"] - 1
+        if isinstance(height, int):
+            self.set_tip_height(height)
+
+    def get_tip_height(self) -> "int | None":
+        return self._tip_height
+
+    def set_tip_height(self, height: int) -> None:
+        """
+        Sets the tip height. If it decreases, all results inside the reorg window of the new tip are dropped.
+
+        :param height: (required) the current block height
+        :type height: int
+        """
+        with self._lock:
+            previous, self._tip_height = self._tip_height, height
+            if previous is not None and height < previous:
+                self.drop_above(height - self._reorg_window)
+
+    def drop_above(self, height: int) -> None:
+        """
+        Drops all results of blocks above the given height
+
+        :param height: (required) the highest height to keep
+        :type height: int
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[0] is not None and entry[0] > height]
+            for key in keys:
+                del self._entries[key]
+            dropped = len(keys)
+            if self._db is not None:
+                dropped = max(dropped, self._db.execute("DELETE FROM results WHERE height > ?", (height,)).rowcount)
+                self._db.commit()
+            if dropped:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drops all cached results from memory and the database, the counters are kept
+        """
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def close(self) -> None:
+        """
+        Closes the database
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get_stats(self) -> {}:
+        """
+        Returns the counters of the cache
+
+        :return: {"hits": int, "misses": int, "size": int, "evictions": int, "invalidations": int,
+            "tipHeight": int | None}
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries),
+                    "evictions": self.evictions, "invalidations": self.invalidations, "tipHeight": self._tip_height}
+
+    # Internal
+    @staticmethod
+    def _key(method: str, params: []) -> str:
+        # Parameters can be long, for example the hex of decoderawtransaction
+        return hashlib.sha256(json.dumps([method, list(params)]).encode()).hexdigest()
+
+    def _set_entry(self, key: str, height: "int | None", text: str) -> tuple:
+        entry = (height, text)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def _get_height(self, method: str, params: [], result) -> (bool, "int | None"):
+        # Returns if the result can be cached and the height of its block
+        if method == "decoderawtransaction":
+            return True, None
+
+        if isinstance(result, dict):
+            confirmations = result.get("confirmations")
+            if not isinstance(confirmations, int) or confirmations <= self._reorg_window:
+                return False, None
+            if isinstance(result.get("height"), int):
+                return True, result["height"]
+            if self._tip_height is None:
+                return False, None  # The confirmations could not be updated on a hit
+            return True, self._tip_height - confirmations + 1
+
+        # Serialized blocks and headers: the height is part of the header
+        if method in ("getblock", "getblockheader") and isinstance(result, str) and self._tip_height is not None:
+            from defichain.transactions.rawtransactions import BlockHeader
+            try:
+                height = BlockHeader.deserialize(result[:2 * HEADER_MAX_SIZE]).get_height()
+            except DeserializeError:
+                return False, None
+            return height <= self._tip_height - self._reorg_window, height
+        return False, None
@@ -41,6 +41,9 @@ class Blockchain:
 
         If verbosity is 2, returns an Object with information about block <hash> and information about each transaction.
 
+        The hex-encoded data of verbosity 0 is much smaller than the json of verbosity 2 and can be decoded locally
+        with :class:`defichain.transactions.rawtransactions.Block`.
+
         :param blockhash: (required) The block hash
         :type blockhash: str
         :param verbosity: (optional) 0 for hex-encoded data, 1 for a json object, and 2 for json object with transaction data
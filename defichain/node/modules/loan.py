@@ -41,8 +41,7 @@ class Loan:
 
             >>> node.loan.destroyloanscheme("MyScheme")
         """
-        ACTIVATE_AFTER_BLOCK = self._node.blockchain.getblockcount() + 1 if ACTIVATE_AFTER_BLOCK is None else ACTIVATE_AFTER_BLOCK
-        return self._node._rpc.call("destroyloanscheme", id, ACTIVATE_AFTER_BLOCK, inputs)
+        return self._node._rpc.call_at_height("destroyloanscheme", 1, 1, id, ACTIVATE_AFTER_BLOCK, inputs)
 
     def getcollateraltoken(self, token: str) -> {}:  # 03
         """
@@ -336,8 +335,8 @@ class Loan:
 
             >>> node.loan.updateloanscheme(150, 5, "MyScheme")
         """
-        ACTIVATE_AFTER_BLOCK = self._node.blockchain.getblockcount() + 1 if ACTIVATE_AFTER_BLOCK is None else ACTIVATE_AFTER_BLOCK
-        return self._node._rpc.call("updateloanscheme", mincolratio, interestrate, id, ACTIVATE_AFTER_BLOCK, inputs)
+        return self._node._rpc.call_at_height("updateloanscheme", 3, 1, mincolratio, interestrate, id,
+                                              ACTIVATE_AFTER_BLOCK, inputs)
 
     def updateloantoken(self, token: str, symbol: str = None, name: str = None, fixedIntervalPriceId: str = None, mintable: bool = True, interest: float = None, inputs: [{}] = None) -> str:  # 17
         """
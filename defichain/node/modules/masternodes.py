@@ -93,12 +93,11 @@ class Masternodes:
 
             >>> node.masternodes.getmasternodeblocks(id="095d2bfb5d05ba73fa96502df85aca818ee79810b9ababa71a9dc97e2c360100")
         """
-        depth = self._node.blockchain.getblockcount() if depth is None else depth
         identifier = BuildJson()
         identifier.append("id", id)
         identifier.append("ownerAddress", ownerAddress)
         identifier.append("operatorAddress", operatorAddress)
-        return self._node._rpc.call("getmasternodeblocks", identifier.build(), depth)
+        return self._node._rpc.call_at_height("getmasternodeblocks", 1, 0, identifier.build(), depth)
 
     def listanchors(self) -> []:  # 06
         """
@@ -4,6 +4,11 @@ from defichain.exceptions.http.WrongParmeters import WrongParameters
 from .modules.evm import Evm
 
 from .rpc import RPC
+from .pool import NodePool
+from .cache import ResultCache
+from defichain.metrics import Metrics
+from .batch import Batch
+from .subscriber import ZmqSubscriber
 
 from .modules.accounts import Accounts
 from .modules.blockchain import Blockchain
@@ -57,6 +62,19 @@ class Node:
     :type protocol: str
     :param logger: (optional) Logger Object
     :type logger: :ref:`Logger`
+    :param cache: (optional) caches the results of getblock, getblockheader, getrawtransaction and
+        decoderawtransaction: True for the default :class:`ResultCache` or a ResultCache object
+        (default=None -> no cache)
+    :type cache: ResultCache | bool
+    :param replicas: (optional) urls of further nodes, which answer read only calls: the node given by url and
+        port becomes the primary node of a :ref:`Node NodePool` (default=None -> single node)
+    :type replicas: [str]
+    :param strategy: (optional) how read only calls are spread over the nodes: round_robin or
+        least_outstanding (default=round_robin)
+    :type strategy: str
+    :param metrics: (optional) counts the calls and their latency per method: True for a new :class:`Metrics`
+        object or a Metrics object, which can be shared (default=None -> nothing is measured)
+    :type metrics: Metrics | bool
     :return: Node (object) The object to interact with your Defichain Node
 
     :example:
@@ -69,7 +87,8 @@ class Node:
 
     def __init__(self, user: str, password: str, url: str = "127.0.0.1", port: int = 8554, wallet_name: str = "",
                  wallet_path: str = None, wallet_password: str = "", wallet_timeout: int = 60,
-                 protocol: str = "http", logger: Logger = None):
+                 protocol: str = "http", logger: Logger = None, cache: "ResultCache | bool" = None,
+                 replicas: [str] = None, strategy: str = "round_robin", metrics: "Metrics | bool" = None):
 
         # Parameter Check
         if wallet_name != "" and wallet_path is not None:
@@ -84,7 +103,14 @@ class Node:
             self.url = f"{protocol}://{user}:{password}@{url}:{port}{wallet_path}"
 
         # Setup all different modules
-        self._rpc = RPC(self.url, logger)
+        self.cache = ResultCache() if cache is True else cache if isinstance(cache, ResultCache) else None
+        self.metrics = Metrics() if metrics is True else metrics if isinstance(metrics, Metrics) else None
+        if replicas:
+            self.pool = NodePool(self.url, replicas, logger, self.cache, strategy, metrics=self.metrics)
+            self._rpc = self.pool
+        else:
+            self.pool = None
+            self._rpc = RPC(self.url, logger, self.cache, self.metrics)
         self._logger = logger
         self.accounts = Accounts(self)
         self.blockchain = Blockchain(self)
@@ -130,6 +156,60 @@ class Node:
             self.load_wallet(wallet_path)
         self.decrypt_wallet(wallet_password, wallet_timeout)
 
+    def batch(self) -> Batch:
+        """
+        Creates a batch object, witch collects calls and sends them to the node in a single request.
+
+        The batch object provides the same modules as the node object. Every method returns a BatchRequest,
+        which holds the result after the batch has been executed.
+
+        :return: :ref:`Node Batch`
+
+        :example:
+
+            >>> with node.batch() as batch:
+            >>>     blockhash = batch.blockchain.getblockhash(1)
+            >>>     blockcount = batch.blockchain.getblockcount()
+            >>> print(blockhash.result(), blockcount.result())
+        """
+        return Batch(self)
+
+    def call_many(self, calls: [()], raise_errors: bool = True) -> []:
+        """
+        Sends multiple remote procedure calls in a single request to the node.
+
+        :param calls: (required) list of calls: [(rpc_method, param1, param2, ...), ...]
+        :type calls: [tuple]
+        :param raise_errors: (optional) raise the exception of the first failed call, otherwise the exception is
+            returned in place of the result (default=True)
+        :type raise_errors: bool
+        :return: [...] (array) -- the results in the same order as the given calls
+
+        :example:
+
+            >>> node.call_many([("getblockhash", 1), ("getblockhash", 2), ("getblockcount",)])
+        """
+        return self._rpc.call_many(calls, raise_errors)
+
+    def subscriber(self, topics: [str] = None, **kwargs) -> ZmqSubscriber:
+        """
+        Creates a subscriber for the ZeroMQ notifications of the node: new blocks and mempool transactions are
+        pushed by the node instead of polling for them. The cache of the node is updated with every new block.
+
+        :param topics: (optional) hashblock, hashtx, rawblock and / or rawtx (default=None -> all topics published
+            by the node)
+        :type topics: [str]
+        :param kwargs: (optional) further parameters of the :ref:`Node ZmqSubscriber`
+        :return: :ref:`Node ZmqSubscriber`
+
+        :example:
+
+            >>> subscriber = node.subscriber(["hashblock", "hashtx"])
+            >>> for notification in subscriber:
+            >>>     print(notification.get_topic(), notification.get_hash())
+        """
+        return ZmqSubscriber.from_node(self, topics, **kwargs)
+
     def decrypt_wallet(self, wallet_password: str, wallet_timeout: int):
         """
         Decrypts wallet for a specific time if a password is given
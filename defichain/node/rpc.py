@@ -1,68 +1,254 @@
 import json
 import logging
+import random
 import traceback
 
 import requests
 import time
 from defichain.logger import Logger
-from defichain.node.RPCErrorHandler import RPCErrorHandler
+from defichain.metrics import Metrics
+from defichain.node.RPCErrorHandler import RPCErrorHandler, RPCBatchErrorHandler
+from defichain.node.cache import ResultCache
 from defichain.exceptions.http.ServiceUnavailable import ServiceUnavailable
 from defichain.exceptions.http.InternalServerError import InternalServerError
 
 RPC_TIMEOUT = 60
+RPC_TRIES = 3
+RETRY_DELAY = 1  # seconds before the first retry, doubled with every further retry
+MAX_RETRY_DELAY = 16
+SECRET_METHODS = ("walletpassphrase", "signrawtransactionwithkey")
+
+
+def retry_delay(attempt: int, delay: float = RETRY_DELAY, max_delay: float = MAX_RETRY_DELAY) -> float:
+    """
+    Exponential backoff with jitter: the delay doubles with every attempt, a random part of up to half of the
+    delay spreads the retries of many clients
+
+    :param attempt: (required) number of failed attempts before, starting with zero
+    :type attempt: int
+    :param delay: (optional) delay of the first attempt in seconds (default=1)
+    :type delay: float
+    :param max_delay: (optional) maximum delay in seconds (default=16)
+    :type max_delay: float
+    :return: float -- seconds to wait
+    """
+    delay = min(max_delay, delay * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
 
 class RPC(object):
-    def __init__(self, url, logger: Logger):
+    _cache = None
+    _metrics = None
+
+    def __init__(self, url, logger: Logger, cache: ResultCache = None, metrics: Metrics = None):
         self._session = requests.Session()
         self._url = url
         self._headers = {'content-type': 'application/json'}
         self._logger = logger
+        self._cache = cache
+        self._metrics = metrics
 
     def call(self, rpc_method, *params):
+        if self._metrics is None:
+            return self._call(rpc_method, params)
+        with self._metrics.measure("node", rpc_method) as measurement:
+            return self._call(rpc_method, params, measurement)
+
+    def _call(self, rpc_method, params, measurement=None):
+        request = self._build_request(rpc_method, params)
+        if self._cache is not None and self._cache.is_cached_method(rpc_method):
+            cached, result = self._cache.get(rpc_method, request["params"])
+            if cached:
+                if measurement is not None:
+                    measurement.cached = True
+                return result
+
+        payload = json.dumps(request)
+        self._log_request(rpc_method, payload)
+
+        response = self._post(payload, (rpc_method,))
+        if measurement is not None:
+            measurement.requestSize, measurement.responseSize = len(payload), len(response.text)
+
+        RPCErrorHandler(response, self._logger)  # Check for Exceptions
+
+        try:
+            result = response.json()['result']
+            #logging.debug(f"got result: {result}")
+        except Exception as e3:
+            raise InternalServerError(f"json error: {e3}")
+
+        # Logging of Ocean get request result
+        if self._logger:
+            if self._logger.log_level == "output" or self._logger.log_level == "all":
+                self._logger.output("NodeOutput", f"Node requests result: {result}")
+
+        if self._cache is not None:
+            self._cache.set(rpc_method, request["params"], result)
+
+        return result
+
+    def call_at_height(self, rpc_method, index: int, offset: int, *params):
+        """
+        Calls the rpc method. If the parameter at index is None, it is replaced by the current block height plus
+        offset, so that the height is requested in the way of the transport.
+
+        :param rpc_method: (required) name of the rpc method
+        :type rpc_method: str
+        :param index: (required) index of the block height in params
+        :type index: int
+        :param offset: (required) added to the current block height
+        :type offset: int
+        :param params: (optional) parameters of the rpc method
+        :return: the result of the call
+        """
+        if params[index] is None:
+            params = self._replace_param(params, index, self.call("getblockcount") + offset)
+        return self.call(rpc_method, *params)
+
+    def call_many(self, calls: [()], raise_errors: bool = True) -> []:
+        """
+        Sends multiple remote procedure calls as one JSON-RPC batch request and maps the responses back by id.
+
+        :param calls: (required) list of calls: [(rpc_method, param1, param2, ...), ...]
+        :type calls: [tuple]
+        :param raise_errors: (optional) raise the exception of the first failed call, otherwise the exception is
+            returned in place of the result (default=True)
+        :type raise_errors: bool
+        :return: [...] (array) -- the results in the same order as the given calls
+        """
+        if not calls:
+            return []
+        if self._metrics is None:
+            return self._call_many(calls, raise_errors)
+        with self._metrics.measure("node", "batch") as measurement:
+            return self._call_many(calls, raise_errors, measurement)
+
+    def _call_many(self, calls: [()], raise_errors: bool = True, measurement=None) -> []:
+        batch, cached = self._build_batch(calls)
+        if not batch:
+            if measurement is not None:
+                measurement.cached = True
+            return [cached[id] for id in range(len(calls))]
+
+        payload = self._dump_batch(batch)
+        response = self._post(payload, tuple(request["method"] for request in batch))
+        if measurement is not None:
+            measurement.requestSize, measurement.responseSize = len(payload), len(response.text)
+        return self._read_batch(calls, batch, cached, response, raise_errors)
+
+    def _build_batch(self, calls: [()]) -> ([{}], {}):
+        # Returns the requests to send and the results of the calls which are cached, both by id
+        cached = {}
+        batch = []
+        for id, call in enumerate(calls):
+            if isinstance(call, str):
+                call = (call,)
+            request = self._build_request(call[0], call[1:], id)
+            if self._cache is not None and self._cache.is_cached_method(request["method"]):
+                hit, result = self._cache.get(request["method"], request["params"])
+                if hit:
+                    cached[id] = result
+                    continue
+            batch.append(request)
+        return batch, cached
+
+    def _dump_batch(self, batch: [{}]) -> str:
+        payload = json.dumps(batch)
+        self._log_request(", ".join(request["method"] for request in batch), payload,
+                          any(request["method"] in SECRET_METHODS for request in batch))
+        return payload
+
+    def _read_batch(self, calls: [()], batch: [{}], cached: {}, response, raise_errors: bool = True) -> []:
+        # Maps the responses of the batch back by id to the order of the calls
+        RPCErrorHandler(response, self._logger)  # Check for Exceptions of the whole batch
+
+        try:
+            responses = response.json()
+            responses = {item["id"]: item for item in responses}
+        except Exception as e3:
+            raise InternalServerError(f"json error: {e3}")
+
+        results = dict(cached)
+        for request in batch:
+            if request["id"] not in responses:
+                raise InternalServerError(f"json error: no response for batch request {request['id']} "
+                                          f"({request['method']})")
+            try:
+                RPCBatchErrorHandler(responses[request["id"]], self._logger)  # Check for Exceptions of the call
+            except Exception as e:
+                if raise_errors:
+                    raise e
+                results[request["id"]] = e
+            else:
+                results[request["id"]] = responses[request["id"]]["result"]
+                if self._cache is not None:
+                    self._cache.set(request["method"], request["params"], results[request["id"]])
+        results = [results[id] for id in range(len(calls))]
+
+        # Logging of Node batch request result
+        if self._logger:
+            if self._logger.log_level == "output" or self._logger.log_level == "all":
+                self._logger.output("NodeOutput", f"Node batch requests result: {results}")
+
+        return results
+
+    @staticmethod
+    def _replace_param(params: tuple, index: int, value) -> tuple:
+        return params[:index] + (value,) + params[index + 1:]
+
+    @staticmethod
+    def _build_request(rpc_method, params, id=None) -> {}:
         filtered_params = []
         for param in params:
             if param is not None:
                 filtered_params.append(param)
 
-        payload = json.dumps({"method": rpc_method, "params": list(filtered_params), "jsonrpc": "2.0"})
-        if rpc_method == "walletpassphrase" or rpc_method == "signrawtransactionwithkey":
-            logging.debug(json.dumps({"method": rpc_method, "params": '***', "jsonrpc": "2.0"}))
+        request = {"method": rpc_method, "params": list(filtered_params), "jsonrpc": "2.0"}
+        if id is not None:
+            request.update({"id": id})
+        return request
+
+    def _log_request(self, rpc_method, payload, secret=None):
+        if secret is None:
+            secret = rpc_method in SECRET_METHODS
+        hidden_payload = json.dumps({'method': rpc_method, 'params': '***', 'jsonrpc': '2.0'})
+        if secret:
+            logging.debug(hidden_payload)
         else:
             logging.debug(payload)
-        tries = 3
-        hadConnectionFailures = False
 
         # Logging of Node get request url
         if self._logger:
             if self._logger.log_level == "input" or self._logger.log_level == "all":
-                if rpc_method == "walletpassphrase" or rpc_method == "signrawtransactionwithkey":
+                if secret:
                     self._logger.input("NodeInput",
-                                       f"Node request URL: {self._url} | Headers: {self._headers} | Payload: {json.dumps({'method': rpc_method, 'params': '***', 'jsonrpc': '2.0'})}")
+                                       f"Node request URL: {self._url} | Headers: {self._headers} | Payload: {hidden_payload}")
                 else:
                     self._logger.input("NodeInput",
                                        f"Node request URL: {self._url} | Headers: {self._headers} | Payload: {payload}")
 
-        while True:
+    def _post(self, payload, methods: () = ()):
+        # The called methods are not needed for a single node, the NodePool routes by them
+        hadConnectionFailures = False
+
+        for attempt in range(RPC_TRIES):
             try:
                 response = self._session.post(self._url, headers=self._headers, data=payload, timeout=RPC_TIMEOUT)
-            except requests.exceptions.ConnectionError as e:
-                tries -= 1
-                if tries == 0:
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == RPC_TRIES - 1:
                     raise ServiceUnavailable("The service you are trying to connect to is not available")
                 hadConnectionFailures = True
-                print(
-                    f"Couldn't connect for remote procedure call, will sleep for five seconds and then try again ({tries} more tries)")
+                if self._metrics is not None:
+                    self._metrics.retry()
+                delay = retry_delay(attempt)
+                reason = "Read timeout" if isinstance(e, requests.exceptions.ReadTimeout) else "Couldn't connect"
+                print(f"{reason} for remote procedure call, will sleep for {delay:.1f} seconds and then try again "
+                      f"({RPC_TRIES - attempt - 1} more tries)")
                 if self._logger:
-                    self._logger.error("ConnectionError", f"Could not connect to the Node, trying again")
-                logging.debug(traceback.format_exc())
-                time.sleep(5)
-            except requests.exceptions.ReadTimeout as timeout:
-                print(
-                    f"Read timeout for remote procedure call, will sleep for five seconds and then try again ({tries} more tries)")
+                    self._logger.error("ConnectionError", f"Could not connect to the Node, trying again: {e}")
                 logging.debug(traceback.format_exc())
-                if self._logger:
-                    self._logger.error("ConnectionError", f"The connection timed out: {timeout}")
-                time.sleep(5)
+                time.sleep(delay)
             except Exception as e2:
                 print(f"other exception occurred: {e2}")
                 logging.debug(traceback.format_exc())
@@ -71,22 +257,7 @@ class RPC(object):
                 if hadConnectionFailures:
                     print('Connected for remote procedure call after retry.')
                 #logging.debug("rpc call success")
-                break
-
-        RPCErrorHandler(response, self._logger)  # Check for Exceptions
-
-        try:
-            result = response.json()['result']
-            #logging.debug(f"got result: {result}")
-        except Exception as e3:
-            raise InternalServerError(f"json error: {e3}")
-
-        # Logging of Ocean get request result
-        if self._logger:
-            if self._logger.log_level == "output" or self._logger.log_level == "all":
-                self._logger.output("NodeOutput", f"Node requests result: {result}")
-
-        return result
+                return response
 
     def update_url(self, url: str) -> None:
         self._url = url
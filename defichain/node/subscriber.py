@@ -0,0 +1,537 @@
+import asyncio
+import threading
+import time
+import traceback
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable, Iterator
+from urllib.parse import urlparse
+
+from defichain.libs.optional import import_optional
+from defichain.logger import Logger
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+
+ZMQ_TOPICS = ("hashblock", "hashtx", "rawblock", "rawtx")
+DEFAULT_TOPICS = ("hashblock", "hashtx")
+
+RECONNECT_INTERVAL = 1  # seconds until the first reconnect, doubled up to the maximum
+MAX_RECONNECT_INTERVAL = 30
+HEARTBEAT_INTERVAL = 10  # seconds between pings to detect dead connections
+POLL_INTERVAL = 0.5  # seconds between checks if the subscriber was stopped
+
+SEQUENCE_MODULO = 2 ** 32
+
+
+class ZmqNotification:
+    """
+    Notification of the node about a new block or a new transaction in the mempool
+
+    :param topic: (required) hashblock, hashtx, rawblock or rawtx
+    :type topic: str
+    :param body: (required) the hash or the serialized block or transaction
+    :type body: bytes
+    :param sequence: (optional) sequence number of the notification for this topic
+    :type sequence: int
+    :param address: (optional) address of the publisher
+    :type address: str
+    """
+
+    def __init__(self, topic: str, body: bytes, sequence: int = None, address: str = None):
+        self._topic = topic
+        self._body = body
+        self._sequence = sequence
+        self._address = address
+
+    def __repr__(self) -> str:
+        return f"ZmqNotification({self._topic}, {self.get_hash()}, sequence={self._sequence})"
+
+    # Get Information
+    def get_topic(self) -> str:
+        return self._topic
+
+    def get_body(self) -> bytes:
+        return self._body
+
+    def get_sequence(self) -> "int | None":
+        return self._sequence
+
+    def get_address(self) -> "str | None":
+        return self._address
+
+    def is_block(self) -> bool:
+        return self._topic in ("hashblock", "rawblock")
+
+    def is_transaction(self) -> bool:
+        return self._topic in ("hashtx", "rawtx")
+
+    def get_hash(self) -> str:
+        """
+        Returns the block hash or the txid, raw blocks and transactions are not decoded for this
+
+        :return: str
+        """
+        from defichain.transactions.rawtransactions import Block, BlockHeader
+        from defichain.transactions.utils import ByteReader
+        if self._topic == "rawblock":
+            return BlockHeader.from_reader(ByteReader(self._body)).get_hash()
+        if self._topic == "rawtx":
+            return Block.calculate_txid(self._body)
+        # The node sends hashes in the same byte order as they are shown by the rpc methods
+        return self._body.hex()
+
+    def get_height(self) -> "int | None":
+        """
+        Returns the height of a raw block, the height is not part of the other notifications
+
+        :return: int | None
+        """
+        if self._topic != "rawblock":
+            return None
+        from defichain.transactions.rawtransactions import BlockHeader
+        from defichain.transactions.utils import ByteReader
+        return BlockHeader.from_reader(ByteReader(self._body)).get_height()
+
+    def get_block(self, network: Any) -> "Block":
+        """
+        Decodes the block of a rawblock notification
+
+        :param network: (required) the network of the node
+        :type network: Network
+        :return: :class:`Block`
+        """
+        if self._topic != "rawblock":
+            raise WrongParameters(f"A {self._topic} notification does not contain a block")
+        from defichain.transactions.rawtransactions import Block
+        return Block.from_bytes(network, self._body)
+
+    def get_transaction(self, network: Any) -> "Transaction":
+        """
+        Decodes the transaction of a rawtx notification
+
+        :param network: (required) the network of the node
+        :type network: Network
+        :return: :class:`Transaction`
+        """
+        if self._topic != "rawtx":
+            raise WrongParameters(f"A {self._topic} notification does not contain a transaction")
+        from defichain.transactions.rawtransactions import Transaction
+        return Transaction.from_bytes(network, self._body)
+
+
+class ZmqSubscriber:
+    """
+    Receives new blocks and mempool transactions from the ZeroMQ notifications of the node, instead of polling
+    getblockcount or getbestblockhash.
+
+    The node has to publish the notifications, for example with ``zmqpubhashblock=tcp://127.0.0.1:28332`` and
+    ``zmqpubhashtx=tcp://127.0.0.1:28332`` in defi.conf.
+
+    Notifications can be received in three ways, callbacks are called for every received notification:
+
+    1. callbacks: register them with :meth:`on` and call :meth:`run` or :meth:`start` for a background thread
+
+    2. iterator: ``for notification in subscriber``
+
+    3. asyncio: ``async for notification in subscriber.stream()``
+
+    Lost connections are reestablished automatically with an increasing interval. Every notification carries a
+    sequence number per topic: if notifications were missed, the callbacks registered with :meth:`on_gap` are
+    called. If no notification arrives for ``idle_timeout`` seconds, the sockets are created again.
+
+    Caches added with :meth:`add_cache` get the height of every new block, so that they can drop outdated results.
+
+    :param addresses: (required) address of the publisher for all topics or a dict of topic and address
+    :type addresses: str | {str: str}
+    :param topics: (optional) hashblock, hashtx, rawblock and / or rawtx (default=("hashblock", "hashtx"))
+    :type topics: [str]
+    :param node: (optional) node to request the height of blocks from hashblock notifications for the caches
+    :type node: Node
+    :param reconnect_interval: (optional) seconds until the first reconnect (default=1)
+    :type reconnect_interval: float
+    :param max_reconnect_interval: (optional) maximum seconds between reconnects (default=30)
+    :type max_reconnect_interval: float
+    :param idle_timeout: (optional) seconds without notification until the sockets are created again
+        (default=None -> never)
+    :type idle_timeout: float
+    :param logger: (optional) Logger Object
+    :type logger: :ref:`Logger`
+
+    :example:
+
+        >>> from defichain import Node
+        >>>
+        >>> node = Node("user", "password")
+        >>> subscriber = node.subscriber(["hashblock"])
+        >>> subscriber.on("hashblock", lambda notification: print(notification.get_hash()))
+        >>> subscriber.start()
+    """
+
+    @staticmethod
+    def from_node(node: Any, topics: [str] = None, **kwargs) -> "ZmqSubscriber":
+        """
+        Creates a subscriber for the notifications that are published by the node. The cache of the node is added
+        to the subscriber.
+
+        :param node: (required) the node
+        :type node: Node
+        :param topics: (optional) topics to subscribe to (default=None -> all topics published by the node)
+        :type topics: [str]
+        :param kwargs: (optional) further parameters of the subscriber
+        :return: ZmqSubscriber
+        """
+        published = {}
+        for notification in node.zmq.getzmqnotifications():
+            topic = notification["type"][len("pub"):]
+            if topic in ZMQ_TOPICS:
+                published[topic] = ZmqSubscriber._replace_wildcard(notification["address"], node._rpc._url)
+
+        if topics is None:
+            topics = [topic for topic in ZMQ_TOPICS if topic in published]
+        missing = [topic for topic in topics if topic not in published]
+        if not topics or missing:
+            raise WrongParameters(f"The node does not publish the zmq notifications: {missing or list(ZMQ_TOPICS)}")
+
+        subscriber = ZmqSubscriber({topic: published[topic] for topic in topics}, topics, node=node, **kwargs)
+        if node.cache is not None:
+            subscriber.add_cache(node.cache)
+        return subscriber
+
+    def __init__(self, addresses: "str | {str: str}", topics: [str] = DEFAULT_TOPICS, node: Any = None,
+                 reconnect_interval: float = RECONNECT_INTERVAL,
+                 max_reconnect_interval: float = MAX_RECONNECT_INTERVAL, idle_timeout: float = None,
+                 logger: Logger = None):
+        unknown = [topic for topic in topics if topic not in ZMQ_TOPICS]
+        if unknown or not topics:
+            raise WrongParameters(f"Unknown zmq topics: {unknown}, possible topics are: {list(ZMQ_TOPICS)}")
+        if isinstance(addresses, str):
+            addresses = {topic: addresses for topic in topics}
+        elif any(topic not in addresses for topic in topics):
+            raise WrongParameters("An address has to be given for every topic")
+
+        # Topics are grouped by address: one socket per publisher
+        self._topics = defaultdict(list)
+        for topic in topics:
+            self._topics[addresses[topic]].append(topic)
+
+        self._node = node
+        self._reconnectInterval = reconnect_interval
+        self._maxReconnectInterval = max_reconnect_interval
+        self._idleTimeout = idle_timeout
+        self._logger = logger
+
+        self._callbacks = defaultdict(list)
+        self._gapCallbacks = []
+        self._caches = []
+        self._sequences = {}
+        self._context = None
+        self._sockets = {}  # socket -> address
+        self._poller = None
+        self._lastReceived = None
+        self._stopped = threading.Event()
+        self._thread = None
+        self.received, self.gaps, self.missed, self.reconnects = 0, 0, 0, 0
+
+    def __iter__(self) -> Iterator[ZmqNotification]:
+        return self.iter_notifications()
+
+    def __enter__(self) -> "ZmqSubscriber":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    # Register
+    def on(self, topic: str, callback: Callable[[ZmqNotification], Any]) -> None:
+        """
+        Registers a callback, which is called with every notification of the topic
+
+        :param topic: (required) one of the subscribed topics
+        :type topic: str
+        :param callback: (required) function that takes a :class:`ZmqNotification`
+        :type callback: Callable
+        """
+        if topic not in self.get_topics():
+            raise WrongParameters(f"The subscriber is not subscribed to {topic}: {self.get_topics()}")
+        self._callbacks[topic].append(callback)
+
+    def on_gap(self, callback: Callable[[str, int, int], Any]) -> None:
+        """
+        Registers a callback, which is called if notifications were missed: callback(topic, expected, received).
+        The received sequence number is lower than the expected one, if the node was restarted.
+
+        :param callback: (required) function that takes the topic and the expected and received sequence number
+        :type callback: Callable
+        """
+        self._gapCallbacks.append(callback)
+
+    def add_cache(self, cache: Any) -> None:
+        """
+        Adds a cache, which gets the height of every new block with set_tip_height: :class:`ResultCache` of the
+        node or :class:`ResponseCache` of ocean
+
+        :param cache: (required) object with a set_tip_height method
+        :type cache: ResultCache | ResponseCache
+        """
+        self._caches.append(cache)
+
+    # Connection
+    def connect(self) -> None:
+        """
+        Creates the sockets and subscribes to the topics, the connection to the node is established in the
+        background
+        """
+        if self._context is not None:
+            return
+        zmq = import_optional("zmq", "The zmq subscriber", "pyzmq")
+        self._context = zmq.Context()
+        self._sockets = self._open_sockets(self._context)
+        self._poller = zmq.Poller()
+        for socket in self._sockets:
+            self._poller.register(socket, zmq.POLLIN)
+        self._lastReceived = time.monotonic()
+
+    def reconnect(self) -> None:
+        """
+        Creates the sockets again, the sequence numbers are reset
+        """
+        self.close()
+        self.reconnects += 1
+        self._sequences.clear()
+        self.connect()
+
+    def close(self) -> None:
+        """
+        Closes the sockets
+        """
+        if self._context is None:
+            return
+        for socket in self._sockets:
+            socket.close(linger=0)
+        self._context.term()
+        self._context, self._sockets, self._poller = None, {}, None
+
+    # Receive
+    def receive(self, timeout: float = None) -> "ZmqNotification | None":
+        """
+        Waits for the next notification and calls the registered callbacks
+
+        :param timeout: (optional) seconds to wait (default=None -> wait until a notification arrives)
+        :type timeout: float
+        :return: ZmqNotification | None -- None if no notification arrived in time
+        """
+        zmq = import_optional("zmq", "The zmq subscriber", "pyzmq")
+        self.connect()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = POLL_INTERVAL if deadline is None else max(0.0, min(POLL_INTERVAL, deadline - time.monotonic()))
+            try:
+                events = dict(self._poller.poll(wait * 1000))
+                for socket, address in self._sockets.items():
+                    if events.get(socket):
+                        return self._handle(socket.recv_multipart(zmq.NOBLOCK), address)
+            except zmq.ZMQError as e:
+                self._log_error(f"The zmq connection failed and is reconnected: {e}")
+                self.reconnect()
+                continue
+            self._check_idle()
+            if self._stopped.is_set() or (deadline is not None and time.monotonic() >= deadline):
+                return None
+
+    def iter_notifications(self) -> Iterator[ZmqNotification]:
+        """
+        Returns the notifications one by one until the subscriber is stopped
+
+        :return: Iterator[ZmqNotification]
+        """
+        self._stopped.clear()
+        yield from self._iter_notifications()
+
+    async def stream(self) -> AsyncIterator[ZmqNotification]:
+        """
+        Returns the notifications one by one in an asyncio event loop until the subscriber is stopped
+
+        :return: AsyncIterator[ZmqNotification]
+
+        :example:
+
+            >>> async for notification in subscriber.stream():
+            >>>     print(notification.get_hash())
+        """
+        zmq = import_optional("zmq", "The zmq subscriber", "pyzmq")
+        import zmq.asyncio
+
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            context = zmq.asyncio.Context()
+            sockets = self._open_sockets(context)
+            poller = zmq.asyncio.Poller()
+            for socket in sockets:
+                poller.register(socket, zmq.POLLIN)
+            self._lastReceived = time.monotonic()
+            try:
+                while not self._stopped.is_set() and not self._is_idle():
+                    events = dict(await poller.poll(POLL_INTERVAL * 1000))
+                    for socket, address in sockets.items():
+                        if events.get(socket):
+                            yield self._handle(await socket.recv_multipart(), address)
+            except zmq.ZMQError as e:
+                self._log_error(f"The zmq connection failed and is reconnected: {e}")
+            finally:
+                for socket in sockets:
+                    socket.close(linger=0)
+                context.term()
+            if not self._stopped.is_set():
+                self.reconnects += 1
+                self._sequences.clear()
+                await asyncio.sleep(0)
+
+    def run(self) -> None:
+        """
+        Receives notifications and calls the registered callbacks until the subscriber is stopped
+        """
+        self._stopped.clear()
+        for _ in self._iter_notifications():
+            pass
+
+    def start(self) -> threading.Thread:
+        """
+        Runs the subscriber in a background thread
+
+        :return: threading.Thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run_thread, name="ZmqSubscriber", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """
+        Stops receiving notifications, waits for the background thread and closes the sockets
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            if self._thread is threading.current_thread():
+                return  # Called from a callback: the thread closes the sockets itself
+            self._thread.join()
+            self._thread = None
+        self.close()
+
+    # Get Information
+    def get_topics(self) -> [str]:
+        return [topic for topics in self._topics.values() for topic in topics]
+
+    def get_addresses(self) -> {str: [str]}:
+        return dict(self._topics)
+
+    def get_stats(self) -> {}:
+        """
+        Returns the counters of the subscriber
+
+        :return: {"received": int, "gaps": int, "missed": int, "reconnects": int}
+        """
+        return {"received": self.received, "gaps": self.gaps, "missed": self.missed, "reconnects": self.reconnects}
+
+    # Internal
+    def _iter_notifications(self) -> Iterator[ZmqNotification]:
+        self.connect()
+        while not self._stopped.is_set():
+            notification = self.receive(POLL_INTERVAL)
+            if notification is not None:
+                yield notification
+
+    def _run_thread(self) -> None:
+        # The sockets are used by the thread only, so they are also created there
+        self.close()
+        for _ in self._iter_notifications():
+            pass
+        self.close()
+
+    def _open_sockets(self, context: Any) -> {Any: str}:
+        zmq = import_optional("zmq", "The zmq subscriber", "pyzmq")
+        sockets = {}
+        for address, topics in self._topics.items():
+            socket = context.socket(zmq.SUB)
+            socket.setsockopt(zmq.LINGER, 0)
+            socket.setsockopt(zmq.RECONNECT_IVL, int(self._reconnectInterval * 1000))
+            socket.setsockopt(zmq.RECONNECT_IVL_MAX, int(self._maxReconnectInterval * 1000))
+            socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+            socket.setsockopt(zmq.HEARTBEAT_IVL, HEARTBEAT_INTERVAL * 1000)
+            socket.setsockopt(zmq.HEARTBEAT_TIMEOUT, 3 * HEARTBEAT_INTERVAL * 1000)
+            for topic in topics:
+                socket.setsockopt(zmq.SUBSCRIBE, topic.encode())
+            socket.connect(address)
+            sockets[socket] = address
+        return sockets
+
+    def _handle(self, parts: [bytes], address: str) -> ZmqNotification:
+        # Messages of the node: topic, body and the sequence number as little endian uint32
+        topic = parts[0].decode()
+        sequence = int.from_bytes(parts[2], "little") if len(parts) > 2 and len(parts[2]) == 4 else None
+        notification = ZmqNotification(topic, parts[1], sequence, address)
+        self.received += 1
+        self._lastReceived = time.monotonic()
+
+        if sequence is not None:
+            self._check_sequence(topic, sequence)
+        if notification.is_block() and self._caches:
+            self._update_caches(notification)
+        for callback in self._callbacks[topic]:
+            self._call(callback, notification)
+        return notification
+
+    def _check_sequence(self, topic: str, sequence: int) -> None:
+        previous = self._sequences.get(topic)
+        self._sequences[topic] = sequence
+        if previous is None:
+            return
+        expected = (previous + 1) % SEQUENCE_MODULO
+        if sequence == expected:
+            return
+        self.gaps += 1
+        if sequence > previous:  # Otherwise the node restarted and the sequence started again
+            self.missed += sequence - expected
+        for callback in self._gapCallbacks:
+            self._call(callback, topic, expected, sequence)
+
+    def _update_caches(self, notification: ZmqNotification) -> None:
+        try:
+            height = notification.get_height()
+            if height is None and self._node is not None:
+                height = self._node.blockchain.getblockheader(notification.get_hash())["height"]
+        except Exception:
+            self._log_error(f"The height of the block could not be determined:\n{traceback.format_exc()}")
+            return
+        if height is not None:
+            for cache in self._caches:
+                cache.set_tip_height(height)
+
+    def _call(self, callback: Callable, *args) -> None:
+        # A failing callback must not stop the notifications for the other callbacks
+        try:
+            callback(*args)
+        except Exception:
+            self._log_error(f"The callback {callback} failed:\n{traceback.format_exc()}")
+
+    def _is_idle(self) -> bool:
+        return self._idleTimeout is not None and time.monotonic() - self._lastReceived > self._idleTimeout
+
+    def _check_idle(self) -> None:
+        if self._is_idle():
+            self._log_error(f"No zmq notification for {self._idleTimeout} seconds, reconnecting")
+            self.reconnect()
+
+    def _log_error(self, msg: str) -> None:
+        if self._logger:
+            self._logger.error("ZmqSubscriber", msg)
+        else:
+            print(msg)
+
+    @staticmethod
+    def _replace_wildcard(address: str, url: str) -> str:
+        # A node that binds to all interfaces publishes 0.0.0.0 or *, which has to be replaced by the host of the node
+        host = urlparse(url).hostname or "127.0.0.1"
+        for wildcard in ("0.0.0.0", "*"):
+            address = address.replace(f"://{wildcard}:", f"://{host}:")
+        return address
@@ -12,3 +12,9 @@ from defichain.ocean.modules.rpc import Rpc
 from defichain.ocean.modules.stats import Stats
 from defichain.ocean.modules.tokens import Tokens
 from defichain.ocean.modules.transactions import Transactions
+
+# Async Ocean
+from defichain.ocean.asyncocean import AsyncOcean
+
+# Response Cache
+from defichain.ocean.connection import ResponseCache
@@ -0,0 +1,116 @@
+import json
+
+from defichain.logger import Logger
+from defichain.libs.optional import import_optional
+from defichain.metrics import Metrics
+from defichain.ocean.connection import Connection, ResponseCache
+from defichain.ocean.OceanErrorHandler import OceanErrorHandler
+
+CONCURRENCY_LIMIT = 100
+KEEPALIVE_TIMEOUT = 60
+
+
+class AsyncResponse:
+    """
+    Holds the status code and the content of an async response, so that it can be passed to the error handler
+    """
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncConnection(Connection):
+    def __init__(self, url, logger: Logger, concurrency: int = CONCURRENCY_LIMIT, cache: ResponseCache = None,
+                 metrics: Metrics = None):
+        import_optional("aiohttp", "The async ocean")
+        self._url = url
+        self._session = None
+        self._headers = {'content-type': 'application/json'}
+        self._logger = logger
+        self._concurrency = concurrency
+        self._cache = cache
+        self._metrics = metrics
+
+    async def get(self, data, size=None, next=None):
+        if self._metrics is None:
+            return await self._get(data, size, next)
+        with self._metrics.measure("ocean", self._endpoint_name(data)) as measurement:
+            return await self._get(data, size, next, measurement)
+
+    async def _get(self, data, size=None, next=None, measurement=None):
+        url = self._build_url(data, size, next)
+        cached = self._get_cached(url)
+        if cached is not None:
+            if measurement is not None:
+                measurement.cached = True
+            return cached
+        self._check_offline(url)
+
+        # Logging of Ocean get request url
+        if self._logger:
+            if self._logger.log_level == "input" or self._logger.log_level == "all":
+                self._logger.input("OceanInput", f"Get request url: {url}")
+
+        tipHeight = self._cache.get_tip_height() if self._cache is not None else None
+        async with self._get_session().get(url) as response:
+            response = AsyncResponse(response.status, await response.text())
+        if measurement is not None:
+            measurement.responseSize = len(response.text)
+        OceanErrorHandler(response, self._logger)  # Handle Exceptions
+
+        result = response.json()
+        self._set_cached(url, data, response.text, result, tipHeight)
+
+        # Logging of Ocean get request result
+        if self._logger:
+            if self._logger.log_level == "output" or self._logger.log_level == "all":
+                self._logger.output("OceanOutput", f"Result of get request: {result}")
+
+        return result
+
+    async def post(self, method, params):
+        if self._metrics is None:
+            return await self._post(method, params)
+        with self._metrics.measure("ocean", self._endpoint_name(method)) as measurement:
+            return await self._post(method, params, measurement)
+
+    async def _post(self, method, params, measurement=None):
+        payload = self._build_payload(method, params)
+        self._check_offline(self._url + method)
+
+        # Logging of Ocean post request
+        if self._logger:
+            if self._logger.log_level == "input" or self._logger.log_level == "all":
+                self._logger.input("OceanInput", f"Post request: {self._url + method, self._headers, payload}")
+
+        async with self._get_session().post(self._url + method, headers=self._headers, data=payload) as response:
+            response = AsyncResponse(response.status, await response.text())
+        if measurement is not None:
+            measurement.requestSize, measurement.responseSize = len(payload), len(response.text)
+        OceanErrorHandler(response, self._logger)  # Handle Exceptions
+
+        result = response.json()
+
+        # Logging of Ocean get requests result
+        if self._logger:
+            if self._logger.log_level == "output" or self._logger.log_level == "all":
+                self._logger.output("OceanOutput", f"Result of post request: {result}")
+
+        return result
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        aiohttp = import_optional("aiohttp", "The async ocean")
+        # The session has to be created inside the running event loop. The connector limits the number of open
+        # connections and keeps them alive, so that the TCP and TLS handshakes are reused between requests.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._concurrency, keepalive_timeout=KEEPALIVE_TIMEOUT)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
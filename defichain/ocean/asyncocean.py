@@ -0,0 +1,146 @@
+import asyncio
+
+from defichain.logger import Logger
+from defichain.metrics import Metrics
+from .asyncconnection import AsyncConnection, CONCURRENCY_LIMIT
+from .connection import ResponseCache
+
+from .modules.address import Address
+from .modules.blocks import Blocks
+from .modules.fee import Fee
+from .modules.loan import Loan
+from .modules.masternodes import Masternodes
+from .modules.oracles import Oracles
+from .modules.poolpairs import Poolpairs
+from .modules.prices import Prices
+from .modules.rawTx import RawTx
+from .modules.rpc import Rpc
+from .modules.stats import Stats
+from .modules.tokens import Tokens
+from .modules.transactions import Transactions
+
+
+class AsyncOcean:
+    """
+    The asyncio interface to communicate with the ocean protocol.
+
+    The async ocean provides the same modules and methods as the :ref:`Ocean Ocean` object, but every method
+    returns an awaitable. All requests share one pool of keep-alive connections, the number of open connections
+    is limited by the concurrency parameter. The aiohttp package has to be installed: ``pip install aiohttp``
+
+    :param url: (optional) The main URL where an ocean instance can be reached
+    :type url: str
+    :param version: (optional) witch version to use with this ocean connection
+    :type version: str
+    :param network: (optional) witch network to use with this ocean connection
+    :type network: str
+    :param logger: (optional) Logger Object
+    :type logger: :ref:`Logger`
+    :param concurrency: (optional) maximum number of open connections (default=100)
+    :type concurrency: int
+    :param cache: (optional) caches the responses of get requests: True for the default
+        :class:`ResponseCache` or a ResponseCache object, which can be shared (default=None -> no cache)
+    :type cache: ResponseCache | bool
+    :param metrics: (optional) counts the requests and their latency per endpoint: True for a new :class:`Metrics`
+        object or a Metrics object, which can be shared (default=None -> nothing is measured)
+    :type metrics: Metrics | bool
+    :return: AsyncOcean (object) The object to interact asynchronously with the ocean protocol
+
+    :example:
+
+            >>> import asyncio
+            >>> from defichain import AsyncOcean
+            >>>
+            >>> async def main():
+            >>>     async with AsyncOcean() as ocean:
+            >>>         poolpairs, prices = await asyncio.gather(ocean.poolpairs.list(), ocean.prices.list())
+            >>>
+            >>> asyncio.run(main())
+    """
+
+    def __init__(self, url: str = "https://ocean.defichain.com", version: str = "v0",
+                 network: str = "mainnet", logger: Logger = None, concurrency: int = CONCURRENCY_LIMIT,
+                 cache: "ResponseCache | bool" = None, metrics: "Metrics | bool" = None):
+
+        self._attachedURL = url + "/" + version + "/" + network + "/"
+
+        self.cache = ResponseCache() if cache is True else cache if isinstance(cache, ResponseCache) else None
+        self.metrics = Metrics() if metrics is True else metrics if isinstance(metrics, Metrics) else None
+        self._conn = AsyncConnection(self._attachedURL, logger, concurrency, self.cache, self.metrics)
+
+        self.address = Address(self)
+        self.blocks = Blocks(self)
+        self.fee = Fee(self)
+        self.loan = Loan(self)
+        self.masternodes = Masternodes(self)
+        self.oracles = Oracles(self)
+        self.poolpairs = Poolpairs(self)
+        self.prices = Prices(self)
+        self.rawTx = RawTx(self)
+        self.rpc = Rpc(self)
+        self.stats = Stats(self)
+        self.tokens = Tokens(self)
+        self.transactions = Transactions(self)
+
+    async def __aenter__(self) -> "AsyncOcean":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the pooled connections of the async ocean
+        """
+        await self._conn.close()
+
+    async def paginate(self, method, *args, size: int = 200, limit: int = None, prefetch: bool = True, **kwargs):
+        """
+        Iterates asynchronously over all items of a paginated list method.
+
+        If prefetch is enabled, the next page is requested in the background while the items of the current page
+        are consumed.
+
+        :param method: (required) the list method of a module, for example: ocean.poolpairs.list
+        :type method: method
+        :param args: (optional) the positional arguments of the method
+        :param size: (optional) number of items per page (default=200)
+        :type size: int
+        :param limit: (optional) maximum number of items to return (default=None -> all items)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background (default=True)
+        :type prefetch: bool
+        :param kwargs: (optional) the keyword arguments of the method
+        :return: async generator of the items
+
+        :example:
+
+        >>> async for poolswap in ocean.paginate(ocean.poolpairs.listPoolSwaps, "4", limit=1000):
+        >>>     print(poolswap)
+        """
+        count = 0
+        page = asyncio.ensure_future(method(*args, size=size, **kwargs))
+        try:
+            while page is not None:
+                result = await page
+                next = (result.get("page") or {}).get("next")
+                data = result.get("data") or []
+
+                more = next is not None and len(data) > 0 and (limit is None or count + len(data) < limit)
+
+                # Prefetch the next page while the current one is consumed
+                page = None
+                if more and prefetch:
+                    page = asyncio.ensure_future(method(*args, size=size, next=next, **kwargs))
+
+                for item in data:
+                    if limit is not None and count >= limit:
+                        return
+                    count += 1
+                    yield item
+
+                if more and not prefetch:
+                    page = asyncio.ensure_future(method(*args, size=size, next=next, **kwargs))
+        finally:
+            if page is not None and not page.done():
+                page.cancel()
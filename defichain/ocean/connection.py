@@ -1,34 +1,236 @@
 import requests
 import json
+import threading
+import time
+from collections import OrderedDict
+
 from defichain.logger import Logger
+from defichain.metrics import Metrics
 from defichain.ocean.OceanErrorHandler import OceanErrorHandler
+from defichain.exceptions.http.ServiceUnavailable import ServiceUnavailable
+from defichain.settings import is_offline
+
+# Seconds a response of an endpoint is cached, the longest matching endpoint prefix is used
+DEFAULT_CACHE_TTLS = {
+    "poolpairs": 30,
+    "prices": 30,
+    "loans/collaterals": 300,
+    "loans/tokens": 300,
+    "loans/schemes": 300,
+    "tokens": 300,
+    "stats": 15,
+}
+DEFAULT_CACHE_SIZE = 1024
+
+
+class ResponseCache:
+    """
+    Cache for the get requests of an ocean connection.
+
+    Responses are cached for the time to live of their endpoint, the longest matching endpoint prefix of ``ttls``
+    is used. Endpoints without a time to live are not cached. If the cache holds more than ``max_size`` responses,
+    the least recently used response is dropped.
+
+    All cached responses are dropped when the tip height changes. The tip height is observed in the responses of
+    the ``stats`` and ``blocks`` endpoints, or can be set with :meth:`set_tip_height`, for example by a block
+    subscriber. Without any of them, a response is at most as old as its time to live.
+
+    Every hit returns a new object, so changing a returned response does not change the cache.
+
+    :param ttls: (optional) seconds to cache the responses of an endpoint prefix, for example:
+        {"poolpairs": 30, "loans/collaterals": 300} (default=DEFAULT_CACHE_TTLS)
+    :type ttls: {str: float}
+    :param max_size: (optional) maximum number of cached responses (default=1024)
+    :type max_size: int
+
+    :example:
+
+        >>> from defichain import Ocean
+        >>> from defichain.ocean import ResponseCache
+        >>>
+        >>> ocean = Ocean(cache=ResponseCache(ttls={"poolpairs": 60, "stats": 10}))
+        >>> ocean.poolpairs.list()
+        >>> ocean.poolpairs.list()  # returned from the cache
+        >>> ocean.cache.get_stats()
+        {'hits': 1, 'misses': 1, 'size': 1, 'evictions': 0, 'invalidations': 0, 'tipHeight': None}
+    """
+
+    def __init__(self, ttls: {str: float} = None, max_size: int = DEFAULT_CACHE_SIZE):
+        ttls = DEFAULT_CACHE_TTLS if ttls is None else ttls
+        if any(ttl <= 0 for ttl in ttls.values()):
+            raise ValueError("The time to live of an endpoint has to be greater than zero")
+        if max_size < 1:
+            raise ValueError("The cache size has to be at least one")
+        self._ttls = {endpoint.strip("/"): ttl for endpoint, ttl in ttls.items()}
+        self._max_size = max_size
+        self._entries = OrderedDict()  # url -> (expires, response text)
+        self._lock = threading.Lock()
+        self._tip_height = None
+        self.hits, self.misses, self.evictions, self.invalidations = 0, 0, 0, 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, endpoint: str) -> "float | None":
+        """
+        Returns the time to live of the given endpoint or None if it is not cached
+
+        :param endpoint: (required) the endpoint, for example: poolpairs/4/swaps
+        :type endpoint: str
+        :return: float | None
+        """
+        endpoint = endpoint.split("?")[0].strip("/")
+        while True:
+            if endpoint in self._ttls:
+                return self._ttls[endpoint]
+            if "/" not in endpoint:
+                return None
+            endpoint = endpoint.rsplit("/", 1)[0]
+
+    def get(self, url: str) -> "str | None":
+        """
+        Returns the cached response text of the url or None, counts hits and misses
+
+        :param url: (required) the url of the request
+        :type url: str
+        :return: str | None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(url)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[url]
+            self.misses += 1
+            return None
+
+    def set(self, url: str, endpoint: str, text: str, tipHeight: int = None) -> None:
+        """
+        Caches the response text of the url, if the endpoint has a time to live
+
+        :param url: (required) the url of the request
+        :type url: str
+        :param endpoint: (required) the endpoint of the request
+        :type endpoint: str
+        :param text: (required) the response text
+        :type text: str
+        :param tipHeight: (optional) the tip height when the request was sent, responses that were requested before
+            the tip height changed are not cached
+        :type tipHeight: int
+        """
+        ttl = self.get_ttl(endpoint)
+        if ttl is None:
+            return
+        with self._lock:
+            if tipHeight != self._tip_height:
+                return
+            self._entries[url] = (time.monotonic() + ttl, text)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def observe(self, endpoint: str, result: {}) -> bool:
+        """
+        Updates the tip height from the response of the stats or blocks endpoint
+
+        :param endpoint: (required) the endpoint of the request
+        :type endpoint: str
+        :param result: (required) the json response
+        :type result: json
+        :return: bool -- True if the tip height was changed by the response
+        """
+        endpoint = endpoint.split("?")[0].strip("/")
+        data = result.get("data") if isinstance(result, dict) else None
+        height = None
+        if endpoint == "stats" and isinstance(data, dict):
+            height = (data.get("count") or {}).get("blocks")
+        elif endpoint == "blocks" and isinstance(data, list):
+            height = max((block.get("height") for block in data if isinstance(block, dict)
+                          and isinstance(block.get("height"), int)), default=None)
+        if isinstance(height, int) and (self._tip_height is None or height > self._tip_height):
+            self.set_tip_height(height)
+            return True
+        return False
+
+    def get_tip_height(self) -> "int | None":
+        return self._tip_height
+
+    def set_tip_height(self, height: int) -> None:
+        """
+        Sets the tip height, all cached responses are dropped if it changed
+
+        :param height: (required) the current block height
+        :type height: int
+        """
+        with self._lock:
+            if height == self._tip_height:
+                return
+            if self._tip_height is not None and self._entries:
+                self.invalidations += 1
+            self._tip_height = height
+            self._entries.clear()
+
+    def clear(self) -> None:
+        """
+        Drops all cached responses, the counters are kept
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> {}:
+        """
+        Returns the counters of the cache
+
+        :return: {"hits": int, "misses": int, "size": int, "evictions": int, "invalidations": int,
+            "tipHeight": int | None}
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries),
+                    "evictions": self.evictions, "invalidations": self.invalidations, "tipHeight": self._tip_height}
 
 
 class Connection:
-    def __init__(self, url, logger: Logger):
+    _metrics = None
+
+    def __init__(self, url, logger: Logger, cache: ResponseCache = None, metrics: Metrics = None):
         self._url = url
         self._session = requests.Session()
         self._headers = {'content-type': 'application/json'}
         self._logger = logger
+        self._cache = cache
+        self._metrics = metrics
 
     def get(self, data, size=None, next=None):
-        url = self._url + data
-        if size is not None and next is not None:
-            url += f"?size={size}&next={next}"
-        elif size is not None:
-            url += f"?size={size}"
-        elif next is not None:
-            url += f"?next={next}"
+        if self._metrics is None:
+            return self._get(data, size, next)
+        with self._metrics.measure("ocean", self._endpoint_name(data)) as measurement:
+            return self._get(data, size, next, measurement)
+
+    def _get(self, data, size=None, next=None, measurement=None):
+        url = self._build_url(data, size, next)
+        cached = self._get_cached(url)
+        if cached is not None:
+            if measurement is not None:
+                measurement.cached = True
+            return cached
+        self._check_offline(url)
 
         # Logging of Ocean get request url
         if self._logger:
             if self._logger.log_level == "input" or self._logger.log_level == "all":
                 self._logger.input("OceanInput", f"Get request url: {url}")
 
-        response = requests.get(url)
+        tipHeight = self._cache.get_tip_height() if self._cache is not None else None
+        response = self._session.get(url)
+        if measurement is not None:
+            measurement.responseSize = len(response.text)
         OceanErrorHandler(response, self._logger)  # Handle Exceptions
 
         result = json.loads(response.text)
+        self._set_cached(url, data, response.text, result, tipHeight)
 
         # Logging of Ocean get request result
         if self._logger:
@@ -38,10 +240,14 @@ class Connection:
         return result
 
     def post(self, method, params):
-        if method == "rawtx/send" or method == "rawtx/test":
-            payload = params
-        else:
-            payload = json.dumps({"params": list(params), "jsonrpc": "2.0"})
+        if self._metrics is None:
+            return self._post(method, params)
+        with self._metrics.measure("ocean", self._endpoint_name(method)) as measurement:
+            return self._post(method, params, measurement)
+
+    def _post(self, method, params, measurement=None):
+        payload = self._build_payload(method, params)
+        self._check_offline(self._url + method)
 
         # Logging of Ocean post request
         if self._logger:
@@ -49,6 +255,8 @@ class Connection:
                 self._logger.input("OceanInput", f"Post request: {self._url + method, self._headers, payload}")
 
         response = self._session.post(self._url + method, headers=self._headers, data=payload)
+        if measurement is not None:
+            measurement.requestSize, measurement.responseSize = len(payload), len(response.text)
         OceanErrorHandler(response, self._logger)  # Handle Exceptions
 
         result = response.json()
@@ -59,3 +267,51 @@ class Connection:
                 self._logger.output("OceanOutput", f"Result of post request: {result}")
 
         return result
+
+    def _get_cached(self, url) -> "{} | None":
+        if self._cache is None:
+            return None
+        text = self._cache.get(url)
+        if text is None:
+            return None
+
+        # Logging of Ocean get request result from the cache
+        if self._logger:
+            if self._logger.log_level == "input" or self._logger.log_level == "all":
+                self._logger.input("OceanInput", f"Get request url (cached): {url}")
+        return json.loads(text)
+
+    def _set_cached(self, url, data, text, result, tipHeight) -> None:
+        if self._cache is None:
+            return
+        if self._cache.observe(data, result):
+            tipHeight = self._cache.get_tip_height()  # the response is as new as the tip height it contains
+        self._cache.set(url, data, text, tipHeight)
+
+    def _build_url(self, data, size=None, next=None) -> str:
+        url = self._url + data
+        if size is not None and next is not None:
+            url += f"?size={size}&next={next}"
+        elif size is not None:
+            url += f"?size={size}"
+        elif next is not None:
+            url += f"?next={next}"
+        return url
+
+    @staticmethod
+    def _endpoint_name(data) -> str:
+        # Addresses, hashes and ids are replaced, so that the metrics are counted per endpoint and not per request
+        return "/".join(":id" if len(part) > 20 or any(char.isdigit() for char in part) else part
+                        for part in data.split("?")[0].split("/"))
+
+    @staticmethod
+    def _build_payload(method, params) -> str:
+        if method == "rawtx/send" or method == "rawtx/test":
+            return params
+        return json.dumps({"params": list(params), "jsonrpc": "2.0"})
+
+    def _check_offline(self, url) -> None:
+        if is_offline():
+            if self._logger:
+                self._logger.error("OceanError", f"ServiceUnavailable: offline mode is enabled, request refused: {url}")
+            raise ServiceUnavailable(f"Offline mode is enabled, the request was not sent: {url}")
@@ -42,6 +42,27 @@ class Address:
         """
         return self._ocean._conn.get(f"address/{address}/history", size=size, next=next)
 
+    def iter_listAccountHistory(self, address: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list account history
+
+        :param address: (required) address to list account history
+        :type address: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listAccountHistory
+
+        :example:
+
+        >>> for entry in ocean.address.iter_listAccountHistory("dEPoXJzwGia1aAbz6ZRB7FFSKSeWPn1v7A"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listAccountHistory, address, size=size, limit=limit, prefetch=prefetch)
+
     def getBalance(self, address: str) -> {}:  # 03
         """
         Get current balance of an address
@@ -91,6 +112,27 @@ class Address:
         """
         return self._ocean._conn.get(f"address/{address}/tokens", size=size, next=next)
 
+    def iter_listToken(self, address: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list all tokens balance belonging to an address
+
+        :param address: (required) address bech32/legacy/b58 formatted address
+        :type address: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listToken
+
+        :example:
+
+        >>> for entry in ocean.address.iter_listToken("dEPoXJzwGia1aAbz6ZRB7FFSKSeWPn1v7A"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listToken, address, size=size, limit=limit, prefetch=prefetch)
+
     def listVault(self, address: str, size: int = 30, next: str = None) -> {}:  # 06
         """
         List all vaults belonging to an address
@@ -109,6 +151,27 @@ class Address:
         """
         return self._ocean._conn.get(f"address/{address}/vaults", size=size, next=next)
 
+    def iter_listVault(self, address: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list all vaults belonging to an address
+
+        :param address: (required) address bech32/legacy/b58 formatted address
+        :type address: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listVault
+
+        :example:
+
+        >>> for entry in ocean.address.iter_listVault("dEPoXJzwGia1aAbz6ZRB7FFSKSeWPn1v7A"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listVault, address, size=size, limit=limit, prefetch=prefetch)
+
     def listTransaction(self, address: str, size: int = 30, next: str = None) -> {}:  # 07
         """
         List all transaction activity belonging to an address
@@ -129,6 +192,27 @@ class Address:
         """
         return self._ocean._conn.get(f"address/{address}/transactions", size=size, next=next)
 
+    def iter_listTransaction(self, address: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list all transaction activity belonging to an address
+
+        :param address: (required) address bech32/legacy/b58 formatted address
+        :type address: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listTransaction
+
+        :example:
+
+        >>> for entry in ocean.address.iter_listTransaction("dEPoXJzwGia1aAbz6ZRB7FFSKSeWPn1v7A"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listTransaction, address, size=size, limit=limit, prefetch=prefetch)
+
     def listTransactionUnspent(self, address: str, size: int = 30, next: str = None) -> {}:  # 08
         """
         List all unspent belonging to an address
@@ -148,3 +232,24 @@ class Address:
         >>> ocean.address.listTransactionUnspent("dEPoXJzwGia1aAbz6ZRB7FFSKSeWPn1v7A")
         """
         return self._ocean._conn.get(f"address/{address}/transactions/unspent", size=size, next=next)
+
+    def iter_listTransactionUnspent(self, address: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list all unspent belonging to an address
+
+        :param address: (required) address bech32/legacy/b58 formatted address
+        :type address: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listTransactionUnspent
+
+        :example:
+
+        >>> for entry in ocean.address.iter_listTransactionUnspent("dEPoXJzwGia1aAbz6ZRB7FFSKSeWPn1v7A"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listTransactionUnspent, address, size=size, limit=limit, prefetch=prefetch)
@@ -23,6 +23,25 @@ class Blocks:
         """
         return self._ocean._conn.get("blocks", size=size, next=next)
 
+    def iter_list(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: returns a list of blocks
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by list
+
+        :example:
+
+        >>> for entry in ocean.blocks.iter_list():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.list, size=size, limit=limit, prefetch=prefetch)
+
     def get(self, id: str) -> {}:  # 02
         """
         Returns the specified block
@@ -59,3 +78,24 @@ class Blocks:
         >>> ocean.blocks.getTransactions("e5b266f18db7662628ea503eb9f889197f05660981f22c07b1b3b86f14329099")
         """
         return self._ocean._conn.get(f"blocks/{hash}/transactions", size=size, next=next)
+
+    def iter_getTransactions(self, hash: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: gets all transactions within a block
+
+        :param hash: (required) hash of the block
+        :type hash: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getTransactions
+
+        :example:
+
+        >>> for entry in ocean.blocks.iter_getTransactions("e5b266f18db7662628ea503eb9f889197f05660981f22c07b1b3b86f14329099"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getTransactions, hash, size=size, limit=limit, prefetch=prefetch)
@@ -20,6 +20,25 @@ class Loan:
         """
         return self._ocean._conn.get(f"loans/schemes", size=size, next=next)
 
+    def iter_listScheme(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: paginate query loan schemes
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listScheme
+
+        :example:
+
+        >>> for entry in ocean.loan.iter_listScheme():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listScheme, size=size, limit=limit, prefetch=prefetch)
+
     def getScheme(self, id: str) -> {}:  # 02
         """
         Get information about a scheme with given scheme id
@@ -51,6 +70,25 @@ class Loan:
         """
         return self._ocean._conn.get(f"loans/collaterals", size=size, next=next)
 
+    def iter_listCollateralToken(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: paginate query loan collateral tokens
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listCollateralToken
+
+        :example:
+
+        >>> for entry in ocean.loan.iter_listCollateralToken():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listCollateralToken, size=size, limit=limit, prefetch=prefetch)
+
     def getCollateralToken(self, id: str) -> {}:  # 04
         """
         Get information about a collateral token with given collateral token id
@@ -83,6 +121,25 @@ class Loan:
         """
         return self._ocean._conn.get(f"loans/tokens", size=size, next=next)
 
+    def iter_listLoanToken(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: paginate query loan tokens
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listLoanToken
+
+        :example:
+
+        >>> for entry in ocean.loan.iter_listLoanToken():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listLoanToken, size=size, limit=limit, prefetch=prefetch)
+
     def getLoanToken(self, id: str) -> {}:  # 06
         """
         Get information about a loan token with given loan token id
@@ -114,6 +171,25 @@ class Loan:
         """
         return self._ocean._conn.get("loans/vaults", size=size, next=next)
 
+    def iter_listVault(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: paginate query loan vaults
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listVault
+
+        :example:
+
+        >>> for entry in ocean.loan.iter_listVault():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listVault, size=size, limit=limit, prefetch=prefetch)
+
     def getVault(self, id: str) -> {}:  # 08
         """
         Get information about a vault with given vault id
@@ -153,6 +229,33 @@ class Loan:
         return self._ocean._conn.get(f"loans/vaults/{id}/auctions/{height}/batches/{batchIndex}/history", size=size,
                                      next=next)
 
+    def iter_listVaultAuctionHistory(self, id: str, height: int, batchIndex: int, size: int = 200, limit: int = None,
+                                     prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list vault auction history
+
+        :param id: (required) vaultId
+        :type id: str
+        :param height: (required) liquidation height
+        :type height: int
+        :param batchIndex: (required) batch index
+        :type batchIndex: int
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listVaultAuctionHistory
+
+        :example:
+
+        >>> for entry in ocean.loan.iter_listVaultAuctionHistory("866889122ba23be0a71fc6a9e853d6b8f2b42b018393f091922be5ebcc23b600", 0, 0):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listVaultAuctionHistory, id, height, batchIndex, size=size,
+                                    limit=limit, prefetch=prefetch)
+
     def listAuction(self, size: int = 30, next: str = None) -> [{}]:  # 10
         """
         Paginate query loan auctions
@@ -170,3 +273,22 @@ class Loan:
         >>> ocean.loan.listAuction()
         """
         return self._ocean._conn.get(f"loans/auctions", size=size, next=next)
+
+    def iter_listAuction(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: paginate query loan auctions
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listAuction
+
+        :example:
+
+        >>> for entry in ocean.loan.iter_listAuction():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listAuction, size=size, limit=limit, prefetch=prefetch)
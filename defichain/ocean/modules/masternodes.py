@@ -22,6 +22,25 @@ class Masternodes:
         """
         return self._ocean._conn.get("masternodes", size=size, next=next)
 
+    def iter_list(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get list of masternodes
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by list
+
+        :example:
+
+        >>> for entry in ocean.masternodes.iter_list():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.list, size=size, limit=limit, prefetch=prefetch)
+
     def get(self, id: str) -> {}:  # 02
         """
         Get information about a masternode with given id
@@ -21,6 +21,25 @@ class Oracles:
         """
         return self._ocean._conn.get("oracles", size=size, next=next)
 
+    def iter_list(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get a list of Oracles
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by list
+
+        :example:
+
+        >>> for entry in ocean.oracles.iter_list():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.list, size=size, limit=limit, prefetch=prefetch)
+
     def getPriceFeed(self, oracleId: str, token: str, currency: str, size: int = 30, next: str = None) -> {}:  # 02
         """
         Get price feed
@@ -46,6 +65,33 @@ class Oracles:
         key = f"{token}-{currency}"
         return self._ocean._conn.get(f"oracles/{oracleId}/{key}/feed", size=size, next=next)
 
+    def iter_getPriceFeed(self, oracleId: str, token: str, currency: str, size: int = 200, limit: int = None,
+                          prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get price feed
+
+        :param oracleId: (required) oracleId identifier for an Oracle
+        :type oracleId: str
+        :param token: (required) token symbol as part of the price feed pair
+        :type token: str
+        :param currency: (required) currency fiat currency part of the price feed pair
+        :type currency: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getPriceFeed
+
+        :example:
+
+        >>> for entry in ocean.oracles.iter_getPriceFeed('f95b8a0ef321bcd310a9cc57b90d74fa4423895448678fbf8487807a125a08ef', "GOLD", "USD"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getPriceFeed, oracleId, token, currency, size=size, limit=limit,
+                                    prefetch=prefetch)
+
     def getOracleByAddress(self, address: str) -> {}:  # 03
         """
         Get oracle by address
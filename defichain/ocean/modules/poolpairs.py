@@ -28,6 +28,25 @@ class Poolpairs:
         """
         return self._ocean._conn.get(f"poolpairs", size=size, next=next)
 
+    def iter_list(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list pool pairs
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by list
+
+        :example:
+
+        >>> for entry in ocean.poolpairs.iter_list():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.list, size=size, limit=limit, prefetch=prefetch)
+
     def get(self, id: str) -> {}:  # 02
         """
         Get pool pair
@@ -70,6 +89,27 @@ class Poolpairs:
         """
         return self._ocean._conn.get(f"poolpairs/{id}/swaps", size=size, next=next)
 
+    def iter_listPoolSwaps(self, id: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list pool swaps
+
+        :param id: (required) id of the pool pair
+        :type id: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listPoolSwaps
+
+        :example:
+
+        >>> for entry in ocean.poolpairs.iter_listPoolSwaps("4"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listPoolSwaps, id, size=size, limit=limit, prefetch=prefetch)
+
     def listPoolSwapsVerbose(self, id: str, size: int = 10, next: str = None) -> [{}]:  # 04
         """
         List pool swaps with from/to
@@ -90,6 +130,27 @@ class Poolpairs:
         """
         return self._ocean._conn.get(f"poolpairs/{id}/swaps/verbose", size=size, next=next)
 
+    def iter_listPoolSwapsVerbose(self, id: str, size: int = 20, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list pool swaps with from/to
+
+        :param id: (required) id of the pool pair
+        :type id: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listPoolSwapsVerbose
+
+        :example:
+
+        >>> for entry in ocean.poolpairs.iter_listPoolSwapsVerbose("4"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listPoolSwapsVerbose, id, size=size, limit=limit, prefetch=prefetch)
+
     def listPoolSwapAggregates(self, id: str, interval: int,  size: int = 30, next: str = None) -> [{}]:  # 05
         """
         List pool swap aggregates
@@ -111,6 +172,31 @@ class Poolpairs:
         """
         return self._ocean._conn.get(f"poolpairs/{id}/swaps/aggregate/{interval}", size=size, next=next)
 
+    def iter_listPoolSwapAggregates(self, id: str, interval: int, size: int = 200, limit: int = None,
+                                    prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: list pool swap aggregates
+
+        :param id: (required) id of the pool pair
+        :type id: str
+        :param interval: (required) aggregated interval: 60 * 60, 60 * 60 * 24
+        :type interval: int
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by listPoolSwapAggregates
+
+        :example:
+
+        >>> for entry in ocean.poolpairs.iter_listPoolSwapAggregates("4", 3600):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.listPoolSwapAggregates, id, interval, size=size, limit=limit,
+                                    prefetch=prefetch)
+
     def getSwappableTokens(self, tokenId: str) -> {}:  # 06
         """
         Get all swappable tokens for a given token
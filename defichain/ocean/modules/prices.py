@@ -20,6 +20,25 @@ class Prices:
         """
         return self._ocean._conn.get("prices", size=size, next=next)
 
+    def iter_list(self, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get a list of PriceTicker
+
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by list
+
+        :example:
+
+        >>> for entry in ocean.prices.iter_list():
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.list, size=size, limit=limit, prefetch=prefetch)
+
     def get(self, token: str, currency: str) -> {}:  # 02
         """
         Get a PriceTicker
@@ -61,6 +80,29 @@ class Prices:
         key = f"{token}-{currency}"
         return self._ocean._conn.get(f"prices/{key}/feed/active", size=size, next=next)
 
+    def iter_getFeedActive(self, token: str, currency: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get active price feed
+
+        :param token: (required) token symbol for the PriceTicker
+        :type token: str
+        :param currency: (required) currency fiat currency for the PriceTicker
+        :type currency: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getFeedActive
+
+        :example:
+
+        >>> for entry in ocean.prices.iter_getFeedActive("DFI", "USD"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getFeedActive, token, currency, size=size, limit=limit, prefetch=prefetch)
+
     def getFeed(self, token: str, currency: str, size: int = 30, next: str = None) -> [{}]:  # 04
         """
         Get a list of price feed
@@ -85,6 +127,29 @@ class Prices:
         key = f"{token}-{currency}"
         return self._ocean._conn.get(f"prices/{key}/feed", size=size, next=next)
 
+    def iter_getFeed(self, token: str, currency: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get a list of price feed
+
+        :param token: (required) token symbol for the PriceTicker
+        :type token: str
+        :param currency: (required) currency fiat for the PriceTicker
+        :type currency: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getFeed
+
+        :example:
+
+        >>> for entry in ocean.prices.iter_getFeed("DFI", "USD"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getFeed, token, currency, size=size, limit=limit, prefetch=prefetch)
+
     def getFeedWithInterval(self, token: str, currency: str, interval: int, size: int = 30, next: str = None) -> [{}]:  # 05
         """
         Get a list of price feed wit interval
@@ -111,6 +176,33 @@ class Prices:
         key = f"{token}-{currency}"
         return self._ocean._conn.get(f"prices/{key}/feed/interval/{interval}", size=size, next=next)
 
+    def iter_getFeedWithInterval(self, token: str, currency: str, interval: int, size: int = 200, limit: int = None,
+                                 prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get a list of price feed wit interval
+
+        :param token: (required) token symbol for the PriceTicker
+        :type token: str
+        :param currency: (required) currency fiat for the PriceTicker
+        :type currency: str
+        :param interval: (required) Time interval for graphing: 15 * 60, 60 * 60, 24 * 60 * 60
+        :type interval: int
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getFeedWithInterval
+
+        :example:
+
+        >>> for entry in ocean.prices.iter_getFeedWithInterval("DFI", "USD", 900):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getFeedWithInterval, token, currency, interval, size=size,
+                                    limit=limit, prefetch=prefetch)
+
     def getOracles(self, token: str, currency: str, size: int = 30, next: str = None) -> [{}]:  # 06
         """
 
@@ -131,3 +223,26 @@ class Prices:
         """
         key = f"{token}-{currency}"
         return self._ocean._conn.get(f"prices/{key}/oracles", size=size, next=next)
+
+    def iter_getOracles(self, token: str, currency: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: :param token: (required) token symbol for the PriceOracle
+
+        :param token: (required) token symbol for the PriceOracle
+        :type token: str
+        :param currency: (required) currency fiat currency for the PriceOracle
+        :type currency: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getOracles
+
+        :example:
+
+        >>> for entry in ocean.prices.iter_getOracles("DFI", "USD"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getOracles, token, currency, size=size, limit=limit, prefetch=prefetch)
@@ -40,6 +40,27 @@ class Transactions:
         """
         return self._ocean._conn.get(f"transactions/{txid}/vins", size=size, next=next)
 
+    def iter_getVins(self, txid: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get a list of vins of a Transaction
+
+        :param txid: (required) txid of the transaction
+        :type txid: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getVins
+
+        :example:
+
+        >>> for entry in ocean.transactions.iter_getVins("8d654cdaeba4633aa08e46f1aa258aae7234e89945145f61bc1bd5b342df1069"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getVins, txid, size=size, limit=limit, prefetch=prefetch)
+
     def getVouts(self, txid: str, size: int = 30, next: str = None) -> {}:
         """
         Get a list of vouts of a Transaction
@@ -58,3 +79,24 @@ class Transactions:
         >>> ocean.transactions.getVouts("8d654cdaeba4633aa08e46f1aa258aae7234e89945145f61bc1bd5b342df1069")
         """
         return self._ocean._conn.get(f"transactions/{txid}/vouts", size=size, next=next)
+
+    def iter_getVouts(self, txid: str, size: int = 200, limit: int = None, prefetch: bool = False):
+        """
+        Lazily iterates page by page over all results of: get a list of vouts of a Transaction
+
+        :param txid: (required) txid of the transaction
+        :type txid: str
+        :param size: (optional) number of entries per page
+        :type size: int
+        :param limit: (optional) maximum number of entries to return (default=None -> all entries)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background while the current page is consumed
+        :type prefetch: bool
+        :return: generator of the entries returned by getVouts
+
+        :example:
+
+        >>> for entry in ocean.transactions.iter_getVouts("8d654cdaeba4633aa08e46f1aa258aae7234e89945145f61bc1bd5b342df1069"):
+        >>>     print(entry)
+        """
+        return self._ocean.paginate(self.getVouts, txid, size=size, limit=limit, prefetch=prefetch)
@@ -1,6 +1,10 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
+
 from defichain.logger import Logger
-from .connection import Connection
+from defichain.metrics import Metrics
+from defichain.settings import is_offline
+from .connection import Connection, ResponseCache
 
 from .modules.address import Address
 from .modules.blocks import Blocks
@@ -16,6 +20,8 @@ from .modules.stats import Stats
 from .modules.tokens import Tokens
 from .modules.transactions import Transactions
 
+CONNECTION_TEST_TIMEOUT = 10
+
 
 class Ocean:
     """
@@ -24,6 +30,9 @@ class Ocean:
     If you want to communicate with the standard Ocean, which is also used to operate the Lightwallet,
     then do not change anything in the parameters and create only the Ocean object as in the example.
 
+    If the environment variable DEFICHAIN_OFFLINE is set to 1, the connection is not tested on creation and every
+    request is refused with ServiceUnavailable.
+
     :param url: (optional) The main URL where an ocean instance can be reached
     :type url: str
     :param version: (optional) witch version to use with this ocean connection
@@ -32,6 +41,12 @@ class Ocean:
     :type network: str
     :param logger: (optional) Logger Object
     :type logger: :ref:`Logger`
+    :param cache: (optional) caches the responses of get requests: True for the default
+        :class:`ResponseCache` or a ResponseCache object, which can be shared (default=None -> no cache)
+    :type cache: ResponseCache | bool
+    :param metrics: (optional) counts the requests and their latency per endpoint: True for a new :class:`Metrics`
+        object or a Metrics object, which can be shared (default=None -> nothing is measured)
+    :type metrics: Metrics | bool
     :return: Ocean (object) The object to interact with the ocean protocol
 
     :example:
@@ -43,12 +58,15 @@ class Ocean:
     """
 
     def __init__(self, url: str = "https://ocean.defichain.com", version: str = "v0",
-                 network: str = "mainnet", logger: Logger = None) -> "Ocean":
+                 network: str = "mainnet", logger: Logger = None, cache: "ResponseCache | bool" = None,
+                 metrics: "Metrics | bool" = None) -> "Ocean":
 
         self._attachedURL = url + "/" + version + "/" + network + "/"
         self._test_connection()
 
-        self._conn = Connection(self._attachedURL, logger)
+        self.cache = ResponseCache() if cache is True else cache if isinstance(cache, ResponseCache) else None
+        self.metrics = Metrics() if metrics is True else metrics if isinstance(metrics, Metrics) else None
+        self._conn = Connection(self._attachedURL, logger, self.cache, self.metrics)
 
         self.address = Address(self)
         self.blocks = Blocks(self)
@@ -64,9 +82,66 @@ class Ocean:
         self.tokens = Tokens(self)
         self.transactions = Transactions(self)
 
+    def paginate(self, method, *args, size: int = 200, limit: int = None, prefetch: bool = False, **kwargs):
+        """
+        Lazily iterates page by page over all items of a paginated list method.
+
+        Only one page is held in memory at a time. If prefetch is enabled, the next page is requested in the
+        background while the items of the current page are consumed.
+
+        :param method: (required) the list method of a module, for example: ocean.poolpairs.list
+        :type method: method
+        :param args: (optional) the positional arguments of the method
+        :param size: (optional) number of items per page (default=200)
+        :type size: int
+        :param limit: (optional) maximum number of items to return (default=None -> all items)
+        :type limit: int
+        :param prefetch: (optional) request the next page in the background (default=False)
+        :type prefetch: bool
+        :param kwargs: (optional) the keyword arguments of the method
+        :return: generator of the items
+
+        :example:
+
+        >>> for poolswap in ocean.paginate(ocean.poolpairs.listPoolSwaps, "4", limit=1000, prefetch=True):
+        >>>     print(poolswap)
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        count = 0
+        next = None
+        page = None
+        try:
+            result = method(*args, size=size, **kwargs)
+            while True:
+                next = (result.get("page") or {}).get("next")
+                data = result.get("data") or []
+                more = next is not None and len(data) > 0 and (limit is None or count + len(data) < limit)
+
+                # Prefetch the next page while the current one is consumed
+                if more and executor is not None:
+                    page = executor.submit(method, *args, size=size, next=next, **kwargs)
+
+                for item in data:
+                    if limit is not None and count >= limit:
+                        return
+                    count += 1
+                    yield item
+
+                if not more:
+                    return
+                result = page.result() if page is not None else method(*args, size=size, next=next, **kwargs)
+                page = None
+        finally:
+            if executor is not None:
+                if page is not None:
+                    page.cancel()
+                executor.shutdown(wait=False)
+
     def _test_connection(self):
+        if is_offline():
+            return False
         try:
-            requests.get(self._attachedURL + "stats")
+            requests.get(self._attachedURL + "stats", timeout=CONNECTION_TEST_TIMEOUT)
             return True
         except Exception as e:
             print(f"No connection could be established to: {self._attachedURL}")
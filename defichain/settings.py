@@ -0,0 +1,17 @@
+import os
+
+OFFLINE_ENVIRONMENT_VARIABLE = "DEFICHAIN_OFFLINE"
+
+
+def is_offline() -> bool:
+    """
+    Returns if the library runs in offline mode.
+
+    The offline mode is enabled by setting the environment variable DEFICHAIN_OFFLINE to 1, true or yes.
+    In offline mode the library does not contact any remote service on its own: Ocean and the Logger skip their
+    connection tests and every Ocean request is refused. This is useful for air-gapped signing hosts, which build
+    and sign transactions without a data source.
+
+    :return: bool
+    """
+    return os.environ.get(OFFLINE_ENVIRONMENT_VARIABLE, "").strip().lower() in ("1", "true", "yes")
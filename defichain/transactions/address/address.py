@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 from defichain.exceptions.transactions import AddressError
 from defichain.libs import bech32
@@ -13,6 +14,11 @@ from .p2sh import P2SH
 from .p2wpkh import P2WPKH
 
 
+@lru_cache(maxsize=4096)
+def _scriptPublicKey_to_address(network: Any, scriptPublicKey: str) -> str:
+    return Address.from_scriptPublicKey(network, scriptPublicKey).get_address()
+
+
 class Address:
 
     @staticmethod
@@ -101,6 +107,19 @@ class Address:
         raise AddressError("This script public key is not supported. Could be a multi signature transaction, witch is "
                            "currently not supported")
 
+    @staticmethod
+    def scriptPublicKey_to_address(network: Any, scriptPublicKey: str) -> str:
+        """
+        Returns the address of the given script public key.
+
+        The result is cached, because the same addresses appear in many transactions.
+
+        :param network: (required) Network
+        :param scriptPublicKey: (required) script public key
+        :return: str - address
+        """
+        return _scriptPublicKey_to_address(network, scriptPublicKey)
+
     @staticmethod
     def verify_address(address: str) -> bool:
         """
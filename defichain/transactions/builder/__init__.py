@@ -1 +1,2 @@
 from .txbuilder import TxBuilder
+from .txbatch import TxBatch
@@ -0,0 +1,246 @@
+import bisect
+import random
+
+from defichain.exceptions.transactions import TxBuilderError
+from defichain.transactions.constants import CoinSelection, BNB_TRIES, KNAPSACK_ITERATIONS, \
+    CONSOLIDATE_FEE_PER_BYTE, CONSOLIDATE_MAX_INPUTS
+
+"""
+Selection of the unspent outputs which are used as inputs of a transaction.
+
+All strategies work with the effective value of an unspent output: its value without the fee for spending it.
+The target is the value of the outputs plus the fee of the transaction without inputs. The strategies return
+the selected unspent outputs or None if the unspent outputs are not enough.
+"""
+
+
+def _effective(unspent: [{}], feePerInput: "int | callable") -> [(int, {})]:
+    # Outputs which cost more to spend than they are worth are never selected
+    fees = [feePerInput(entry) for entry in unspent] if callable(feePerInput) else [feePerInput] * len(unspent)
+    return [(entry["value"] - fee, entry) for entry, fee in zip(unspent, fees) if entry["value"] > fee]
+
+
+def select_all(unspent: [{}], target: int, feePerInput: "int | callable", **kwargs) -> "[{}] | None":
+    """
+    Selects all unspent outputs
+
+    :param unspent: (required) unspent outputs with value in satoshi
+    :type unspent: [{}]
+    :param target: (required) value of the outputs plus the fee of the transaction without inputs
+    :type target: int
+    :param feePerInput: (required) fee for spending one unspent output or a function returning it for an entry
+    :type feePerInput: int | callable
+    :return: [{}] | None
+    """
+    return list(unspent) if sum(value for value, _ in _effective(unspent, feePerInput)) >= target else None
+
+
+def select_largest_first(unspent: [{}], target: int, feePerInput: "int | callable", **kwargs) -> "[{}] | None":
+    """
+    Selects the largest unspent outputs until the target is reached
+
+    :param unspent: (required) unspent outputs with value in satoshi
+    :type unspent: [{}]
+    :param target: (required) value of the outputs plus the fee of the transaction without inputs
+    :type target: int
+    :param feePerInput: (required) fee for spending one unspent output or a function returning it for an entry
+    :type feePerInput: int | callable
+    :return: [{}] | None
+    """
+    selected, total = [], 0
+    for value, entry in sorted(_effective(unspent, feePerInput), key=lambda candidate: -candidate[0]):
+        selected.append(entry)
+        total += value
+        if total >= target:
+            return selected
+    return None
+
+
+def select_branch_and_bound(unspent: [{}], target: int, feePerInput: "int | callable", costOfChange: int = 0,
+                            tries: int = BNB_TRIES, **kwargs) -> "[{}] | None":
+    """
+    Searches depth first for the unspent outputs whose effective value matches the target exactly or exceeds it
+    by at most the cost of the change. Of all matches, the one with the smallest excess is selected.
+
+    :param unspent: (required) unspent outputs with value in satoshi
+    :type unspent: [{}]
+    :param target: (required) value of the outputs plus the fee of the transaction without inputs
+    :type target: int
+    :param feePerInput: (required) fee for spending one unspent output or a function returning it for an entry
+    :type feePerInput: int | callable
+    :param costOfChange: (optional) excess which is accepted as exact match
+    :type costOfChange: int
+    :param tries: (optional) maximum number of steps of the search
+    :type tries: int
+    :return: [{}] | None
+    """
+    candidates = sorted(_effective(unspent, feePerInput), key=lambda candidate: -candidate[0])
+    values = [value for value, _ in candidates]
+    negated = [-value for value in values]  # Ascending for bisect
+    suffix = [0] * (len(values) + 1)  # Sum of the values from the index on
+    for i in range(len(values) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + values[i]
+    if suffix[0] < target:
+        return None
+
+    best, bestExcess = None, None
+    selection, current, index = [], 0, 0
+    for _ in range(tries):
+        if current >= target:
+            excess = current - target
+            if best is None or excess < bestExcess or (excess == bestExcess and len(selection) < len(best)):
+                best, bestExcess = list(selection), excess
+                if excess == 0:
+                    break
+        else:
+            # Outputs which would exceed the target by more than the cost of the change are skipped at once
+            index = bisect.bisect_left(negated, current - target - costOfChange, index)
+            if index < len(values) and current + suffix[index] >= target:
+                selection.append(index)
+                current += values[index]
+                index += 1
+                continue
+
+        # Continue without the last selected output. Outputs with the same value would repeat a searched branch.
+        if not selection:
+            break
+        last = selection.pop()
+        current -= values[last]
+        index = bisect.bisect_right(negated, -values[last], last)
+
+    return None if best is None else [candidates[index][1] for index in best]
+
+
+def select_knapsack(unspent: [{}], target: int, feePerInput: "int | callable",
+                    iterations: int = KNAPSACK_ITERATIONS, rng: random.Random = None, **kwargs) -> "[{}] | None":
+    """
+    Approximates the subset of the unspent outputs smaller than the target with the smallest sum that reaches the
+    target. The smallest single unspent output larger than the target is selected instead, if it is closer.
+
+    :param unspent: (required) unspent outputs with value in satoshi
+    :type unspent: [{}]
+    :param target: (required) value of the outputs plus the fee of the transaction without inputs
+    :type target: int
+    :param feePerInput: (required) fee for spending one unspent output or a function returning it for an entry
+    :type feePerInput: int | callable
+    :param iterations: (optional) number of random subsets which are improved
+    :type iterations: int
+    :param rng: (optional) random number generator
+    :type rng: random.Random
+    :return: [{}] | None
+    """
+    rng = random.Random() if rng is None else rng
+    candidates = _effective(unspent, feePerInput)
+    for value, entry in candidates:
+        if value == target:
+            return [entry]
+
+    smaller = sorted((candidate for candidate in candidates if candidate[0] < target), key=lambda c: -c[0])
+    larger = [candidate for candidate in candidates if candidate[0] > target]
+    lowestLarger = min(larger, key=lambda candidate: candidate[0]) if larger else None
+    total = sum(value for value, _ in smaller)
+    if total == target:
+        return [entry for _, entry in smaller]
+    if total < target:
+        return None if lowestLarger is None else [lowestLarger[1]]
+
+    values = [value for value, _ in smaller]
+    best, bestTotal = [True] * len(values), total
+    for _ in range(iterations):
+        if bestTotal == target:
+            break
+        included, current, reached = [False] * len(values), 0, False
+        # The first pass adds random outputs, the second pass all remaining outputs until the target is reached
+        for firstPass in (True, False):
+            if reached:
+                break
+            for i, value in enumerate(values):
+                if rng.random() < 0.5 if firstPass else not included[i]:
+                    current += value
+                    included[i] = True
+                    if current >= target:
+                        reached = True
+                        if current < bestTotal:
+                            best, bestTotal = list(included), current
+                        current -= value
+                        included[i] = False
+
+    if lowestLarger is not None and lowestLarger[0] <= bestTotal:
+        return [lowestLarger[1]]
+    return [entry for (_, entry), selected in zip(smaller, best) if selected]
+
+
+def select_consolidate(unspent: [{}], target: int, feePerInput: "int | callable", feePerByte: float = None,
+                       consolidateFeePerByte: float = CONSOLIDATE_FEE_PER_BYTE,
+                       maxInputs: int = CONSOLIDATE_MAX_INPUTS, **kwargs) -> "[{}] | None":
+    """
+    While the fee per byte is not above the consolidation fee, the smallest unspent outputs are spent in addition
+    to the largest ones needed for the target, up to the maximum number of inputs. This merges many small outputs
+    into the change while it is cheap. With higher fees, branch and bound is used.
+
+    :param unspent: (required) unspent outputs with value in satoshi
+    :type unspent: [{}]
+    :param target: (required) value of the outputs plus the fee of the transaction without inputs
+    :type target: int
+    :param feePerInput: (required) fee for spending one unspent output or a function returning it for an entry
+    :type feePerInput: int | callable
+    :param feePerByte: (optional) fee per byte of the transaction
+    :type feePerByte: float
+    :param consolidateFeePerByte: (optional) highest fee per byte at which outputs are consolidated
+    :type consolidateFeePerByte: float
+    :param maxInputs: (optional) maximum number of inputs of a consolidating transaction
+    :type maxInputs: int
+    :return: [{}] | None
+    """
+    if feePerByte is not None and feePerByte > consolidateFeePerByte:
+        return select_coins(CoinSelection.BRANCH_AND_BOUND, unspent, target, feePerInput, **kwargs)
+    selected = select_largest_first(unspent, target, feePerInput)
+    if selected is None:
+        return None
+    chosen = set(id(entry) for entry in selected)
+    for _, entry in sorted(_effective(unspent, feePerInput), key=lambda candidate: candidate[0]):
+        if len(selected) >= maxInputs:
+            break
+        if id(entry) not in chosen:
+            selected.append(entry)
+    return selected
+
+
+def select_coins(strategy: "str | callable", unspent: [{}], target: int, feePerInput: "int | callable",
+                 **kwargs) -> "[{}] | None":
+    """
+    Selects the unspent outputs with the given strategy. A callable strategy gets the same arguments as the
+    strategies of this module.
+
+    :param strategy: (required) a strategy of CoinSelection or a callable
+    :type strategy: str | callable
+    :param unspent: (required) unspent outputs with value in satoshi
+    :type unspent: [{}]
+    :param target: (required) value of the outputs plus the fee of the transaction without inputs
+    :type target: int
+    :param feePerInput: (required) fee for spending one unspent output or a function returning it for an entry
+    :type feePerInput: int | callable
+    :return: [{}] | None
+
+    :example:
+
+        >>> select_coins(CoinSelection.LARGEST_FIRST, unspent, 100000000, 100)
+    """
+    if callable(strategy):
+        return strategy(unspent, target, feePerInput, **kwargs)
+    if strategy not in STRATEGIES:
+        raise TxBuilderError(f"The coin selection strategy {strategy} does not exist")
+    return STRATEGIES[strategy](unspent, target, feePerInput, **kwargs)
+
+
+def _select_exact_or_largest_first(unspent: [{}], target: int, feePerInput: "int | callable",
+                                   **kwargs) -> "[{}] | None":
+    selected = select_branch_and_bound(unspent, target, feePerInput, **kwargs)
+    return selected if selected is not None else select_largest_first(unspent, target, feePerInput)
+
+
+STRATEGIES = {CoinSelection.ALL: select_all,
+              CoinSelection.LARGEST_FIRST: select_largest_first,
+              CoinSelection.BRANCH_AND_BOUND: _select_exact_or_largest_first,
+              CoinSelection.KNAPSACK: select_knapsack,
+              CoinSelection.CONSOLIDATE: select_consolidate}
@@ -35,11 +35,11 @@ class UTXO:
             return self.sendall(addressTo)
 
         # If to_address is different from account address
-        tx = self._builder.build_transactionInputs(inputs)
-        input_value = tx.get_inputsValue()
-        changeOutputValue = input_value - value
         sendingOutput = TxAddressOutput(value, addressTo)
-        changeOutput = TxAddressOutput(changeOutputValue, changeAddress)
+        changeOutput = TxAddressOutput(0, changeAddress)
+        tx = self._builder.build_transactionInputs(inputs, value, [sendingOutput, changeOutput])
+        input_value = tx.get_inputsValue()
+        changeOutput.set_value(input_value - value)
         tx.add_output(sendingOutput)
         tx.add_output(changeOutput)
 
@@ -50,7 +50,7 @@ class UTXO:
         value = tx.get_outputs()[1].get_value() - fee
         if value < 0:
             raise TxBuilderError("The used address has not enough UTXO to pay the transaction fee")
-        tx.get_outputs()[1].set_value(value)
+        self._builder.set_change(tx, 1, value)
 
         self._builder.sign(tx)
         return tx
@@ -1,13 +1,18 @@
+import math
+
 from defichain import Account
 from defichain.exceptions.transactions import TxBuilderError, NotYetSupportedError
 
 from defichain.transactions.address import Address
-from defichain.transactions.constants import AddressTypes
+from defichain.transactions.constants import AddressTypes, CoinSelection, DUST_LIMIT
 from defichain.networks import Network
 from defichain.transactions.remotedata.remotedata import RemoteData
+from defichain.transactions.remotedata.tracker import RemoteDataTracker
 from defichain.transactions.rawtransactions import Transaction, TxP2WPKHInput, TxP2SHInput, TxAddressOutput, \
     TxDefiOutput, estimate_fee
+from defichain.transactions.rawtransactions.txoutput import TxBaseOutput
 from defichain.transactions.defitx.modules.basedefitx import BaseDefiTx
+from .coinselection import select_coins, STRATEGIES
 
 
 class RawTransactionBuilder:
@@ -16,40 +21,53 @@ class RawTransactionBuilder:
     def new_transaction() -> Transaction:
         return Transaction([], [])
 
-    def __init__(self, address: str, account: Account, dataSource: RemoteData, feePerByte: float):
+    def __init__(self, address: str, account: Account, dataSource: RemoteData, feePerByte: float,
+                 coinSelection: "str | callable" = CoinSelection.BRANCH_AND_BOUND):
         self._address, self._account, self._dataSource, self._feePerByte = None, None, None, None
+        self._coinSelection = None
         self.set_address(address)
         self.set_account(account)
         self.set_dataSource(dataSource)
         self.set_feePerByte(feePerByte)
+        self.set_coinSelection(coinSelection)
 
     # Build Transaction
-    def build_transactionInputs(self, inputs=[]) -> Transaction:
+    def build_transactionInputs(self, inputs=[], value: int = None, outputs: [TxBaseOutput] = None) -> Transaction:
+        """
+        Builds a transaction with the given inputs or the unspent outputs of the address. If the value is given,
+        only the unspent outputs selected by the coin selection to pay the value and the fee are used.
+
+        :param inputs: (optional) inputs to use instead of the unspent outputs of the address
+        :type inputs: [TxInput]
+        :param value: (optional) value of the outputs in satoshi (default=None -> all unspent outputs)
+        :type value: int
+        :param outputs: (optional) the outputs of the transaction to estimate the fee, including the change
+        :type outputs: [TxOutput]
+        :return: Transaction - just with inputs
+        """
         tx = self.new_transaction()
         if inputs or self.get_dataSource() is None:
             tx.set_inputs(inputs)
         else:
-            for input in self.get_dataSource().get_unspent(self.get_address()):
-                address = Address.from_scriptPublicKey(self.get_account().get_network(), input["scriptPubKey"])
-                # Build P2PKH Input
-                if address.get_addressType() == AddressTypes.P2PKH:
-                    raise NotYetSupportedError()
-                # Build P2SH Input
-                elif address.get_addressType() == AddressTypes.P2SH:
-                    tx.add_input(TxP2SHInput(input["txid"], input["vout"], self.get_account().get_p2wpkh(),
-                                             input["value"]))
-                # build P2WPKH Input
-                elif address.get_addressType() == AddressTypes.P2WPKH:
-                    tx.add_input(TxP2WPKHInput(input["txid"], input["vout"], self.get_address(), input["value"]))
+            unspent = self.get_dataSource().get_unspent(self.get_address())
+            addressTypes = {}
+            if value is not None and unspent:
+                unspent = self._select_unspent(unspent, value, outputs or [], addressTypes)
+            # The inputs are set at once, adding them one by one analyses the transaction for every input
+            txInputs = [self._build_input(input, addressTypes) for input in unspent]
+            for txInput in txInputs:
+                txInput.verify()
+            tx.set_inputs(txInputs)
         return tx
 
     def build_defiTx(self, value: int, defiTx: BaseDefiTx, inputs=[]) -> Transaction:
-        tx = self.build_transactionInputs(inputs)
         defitx_output = TxDefiOutput(value, defiTx)
+        change_output = TxAddressOutput(0, self.get_address())
+        tx = self.build_transactionInputs(inputs, value, [defitx_output, change_output])
         if tx.get_inputsValue() - value < 0:
             raise TxBuilderError("The value of the output is bigger then the value of the input")
 
-        change_output = TxAddressOutput(tx.get_inputsValue() - value, self.get_address())
+        change_output.set_value(tx.get_inputsValue() - value)
         tx.add_output(defitx_output)
         tx.add_output(change_output)
 
@@ -60,14 +78,81 @@ class RawTransactionBuilder:
         value = tx.get_outputs()[1].get_value() - fee
         if value < 0:
             raise TxBuilderError("The used address has not enough UTXO to pay the transaction fee")
-        tx.get_outputs()[1].set_value(value)
+        self.set_change(tx, 1, value)
 
         # Sign and Return
         self.sign(tx)
         return tx
 
+    def set_change(self, tx: Transaction, index: int, value: int) -> None:
+        """
+        Sets the value of the change output. A change output below the dust limit is removed and its value is
+        added to the fee.
+
+        :param tx: (required) the transaction
+        :type tx: Transaction
+        :param index: (required) index of the change output
+        :type index: int
+        :param value: (required) value of the change after the fee
+        :type value: int
+        """
+        if value < DUST_LIMIT:
+            tx.set_outputs(tx.get_outputs()[:index] + tx.get_outputs()[index + 1:])
+        else:
+            tx.get_outputs()[index].set_value(value)
+
     def sign(self, tx: Transaction) -> None:
         tx.sign(self.get_account().get_network(), [self.get_account().get_privateKey()])
+        # Inputs of a signed transaction are not handed out again by the tracker until it is sent or times out
+        if isinstance(self.get_dataSource(), RemoteDataTracker):
+            self.get_dataSource().reserve([(input.get_txid(), input.get_vout()) for input in tx.get_inputs()])
+
+    def _build_input(self, input: {}, addressTypes: {} = None) -> "TxP2SHInput | TxP2WPKHInput":
+        addressType = self._get_inputAddressType(input, addressTypes)
+        return self._create_input(addressType, input["txid"], input["vout"], input["value"])
+
+    def _get_inputAddressType(self, input: {}, addressTypes: {} = None) -> str:
+        # Address types of already decoded scripts can be passed in addressTypes
+        addressTypes = {} if addressTypes is None else addressTypes
+        if input["scriptPubKey"] not in addressTypes:
+            addressTypes[input["scriptPubKey"]] = Address.from_scriptPublicKey(self.get_account().get_network(),
+                                                                               input["scriptPubKey"]).get_addressType()
+        return addressTypes[input["scriptPubKey"]]
+
+    def _create_input(self, addressType: str, txid: str, vout: int, value: int) -> "TxP2SHInput | TxP2WPKHInput":
+        # Build P2PKH Input
+        if addressType == AddressTypes.P2PKH:
+            raise NotYetSupportedError()
+        # Build P2SH Input
+        elif addressType == AddressTypes.P2SH:
+            return TxP2SHInput(txid, vout, self.get_account().get_p2wpkh(), value)
+        # build P2WPKH Input
+        elif addressType == AddressTypes.P2WPKH:
+            return TxP2WPKHInput(txid, vout, self.get_address(), value)
+
+    def _select_unspent(self, unspent: [{}], value: int, outputs: [TxBaseOutput], addressTypes: {} = None) -> [{}]:
+        # Sizes are estimated with one satoshi per byte. Two bytes are added in case the number of inputs needs
+        # three bytes. The fee for spending an unspent output depends on its address type.
+        addressTypes = {} if addressTypes is None else addressTypes
+        feePerByte = self.get_feePerByte()
+        baseSize = estimate_fee(Transaction([], outputs), 1) + 2
+        fees = {}
+        for entry in unspent:
+            addressType = self._get_inputAddressType(entry, addressTypes)
+            if addressType not in fees:
+                fees[addressType] = math.ceil(self._estimate_inputSize(addressType) * feePerByte)
+        changeSize = len(bytes(TxAddressOutput(0, self.get_address()))) + \
+            self._estimate_inputSize(self.get_addressType())
+
+        selected = select_coins(self.get_coinSelection(), unspent, value + math.ceil(baseSize * feePerByte),
+                                lambda entry: fees[addressTypes[entry["scriptPubKey"]]],
+                                costOfChange=int(changeSize * feePerByte), feePerByte=feePerByte)
+        # Without enough unspent outputs, all are used and the missing value is reported when building
+        return unspent if selected is None else selected
+
+    def _estimate_inputSize(self, addressType: str) -> int:
+        input = self._create_input(addressType, "00" * 32, 0, 0)
+        return estimate_fee(Transaction([input], []), 1) - estimate_fee(Transaction([], []), 1)
 
     # Get Information
     def get_address(self) -> str:
@@ -85,6 +170,9 @@ class RawTransactionBuilder:
     def get_feePerByte(self) -> float:
         return self._feePerByte
 
+    def get_coinSelection(self) -> "str | callable":
+        return self._coinSelection
+
     def get_network(self) -> Network:
         return self.get_account().get_network()
 
@@ -100,3 +188,8 @@ class RawTransactionBuilder:
 
     def set_feePerByte(self, feePerByte: float) -> None:
         self._feePerByte = feePerByte
+
+    def set_coinSelection(self, coinSelection: "str | callable") -> None:
+        if not callable(coinSelection) and coinSelection not in STRATEGIES:
+            raise TxBuilderError(f"The coin selection strategy {coinSelection} does not exist")
+        self._coinSelection = coinSelection
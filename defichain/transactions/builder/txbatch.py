@@ -0,0 +1,124 @@
+from defichain.exceptions.transactions import TxBuilderError
+from defichain.transactions.rawtransactions import Transaction
+from defichain.transactions.remotedata.tracker import RemoteDataTracker
+
+from .rawtransactionbuilder import RawTransactionBuilder
+from .modules import *
+
+
+class _BatchTransactionBuilder(RawTransactionBuilder):
+    # Applies every signed transaction to the tracker, so that the next transaction can spend its change
+
+    def __init__(self, batch: "TxBatch", *args):
+        super().__init__(*args)
+        self._batch = batch
+
+    def sign(self, tx: Transaction) -> None:
+        super().sign(tx)
+        self._batch._add(tx)
+
+
+class TxBatch:
+    """
+    Builds and signs a sequence of transactions for the address of the builder, which can be sent in the same
+    block. Every transaction spends the unconfirmed change of the previous ones or other unspent outputs of the
+    address, but never the same outputs twice.
+
+    The unspent outputs are kept in a RemoteDataTracker: the one of the builder if it has one, otherwise a new one
+    for the data source of the builder. When a chain of unconfirmed transactions reaches the ancestor limit of the
+    mempool, the next transaction is built with other unspent outputs.
+
+    The modules are the same as the ones of the TxBuilder. The transactions are built when the methods are called
+    and sent in the same order with :meth:`send`. Transactions which are not sent stay in the tracker until
+    :meth:`discard` is called, which happens automatically if the batch is used as a context manager.
+
+    :param builder: (required) the builder with the address, account, data source and fee
+    :type builder: TxBuilder
+
+    :example:
+
+        >>> batch = builder.batch()
+        >>> for address in addresses:
+        >>>     batch.accounts.accounttoaccount(builder.get_address(), {address: "1@DUSD"})
+        >>> batch.pool.poolswap(builder.get_address(), "DFI", 1, builder.get_address(), "DUSD", 999999999)
+        >>> txids = batch.send()
+
+        >>> with builder.batch() as batch:
+        >>>     batch.utxo.send(1, address)
+        >>>     batch.send()
+    """
+
+    def __init__(self, builder: "TxBuilder"):
+        dataSource = builder.get_dataSource()
+        if dataSource is None:
+            raise TxBuilderError("A batch of transactions can not be built because no data source is given")
+        self._tracker = dataSource if isinstance(dataSource, RemoteDataTracker) else RemoteDataTracker(dataSource)
+        self._transactions, self._txids, self._sent = [], [], 0
+
+        self._builder = _BatchTransactionBuilder(self, builder.get_address(), builder.get_account(), self._tracker,
+                                                 builder.get_feePerByte(), builder.get_coinSelection())
+        self.utxo = UTXO(self._builder)
+        self.accounts = Accounts(self._builder)
+        self.pool = Pool(self._builder)
+
+    def __enter__(self) -> "TxBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.discard()
+
+    def send(self, maxFeeRate: float = None) -> [str]:
+        """
+        Sends all transactions of the batch which are not sent yet in the order they were built. If a transaction
+        can not be sent, it and all following transactions are removed from the batch and the error is raised.
+
+        :param maxFeeRate: (optional) maximum fee rate
+        :type maxFeeRate: float
+        :return: [str] - the txids of all sent transactions of the batch
+        """
+        while self._sent < len(self._transactions):
+            try:
+                self._tracker.source.send_tx(self._transactions[self._sent].serialize(), maxFeeRate)
+            except Exception:
+                self.discard()
+                raise
+            self._sent += 1
+        return self._txids[:self._sent]
+
+    def discard(self) -> None:
+        """
+        Removes all transactions of the batch which are not sent yet from the batch and the tracker. Their outputs
+        can not be spent anymore and their inputs can be used again.
+        """
+        for txid in reversed(self._txids[self._sent:]):
+            self._tracker.remove_transaction(txid)
+        del self._transactions[self._sent:], self._txids[self._sent:]
+
+    # Get Information
+    def get_transactions(self) -> [Transaction]:
+        """
+        Returns all transactions of the batch in the order they were built
+
+        :return: [Transaction]
+        """
+        return list(self._transactions)
+
+    def get_txids(self) -> [str]:
+        """
+        Returns the txids of all transactions of the batch in the order they were built
+
+        :return: [str]
+        """
+        return list(self._txids)
+
+    def get_tracker(self) -> RemoteDataTracker:
+        """
+        Returns the tracker with the unspent outputs of the batch
+
+        :return: RemoteDataTracker
+        """
+        return self._tracker
+
+    def _add(self, tx: Transaction) -> None:
+        self._txids.append(self._tracker.add_transaction(tx.serialize()))
+        self._transactions.append(tx)
@@ -1,11 +1,13 @@
 from defichain import Account, Ocean, Node
 
 from defichain.exceptions.transactions import TxBuilderError
+from defichain.transactions.constants import CoinSelection
 
 from defichain.transactions.remotedata.remotedata import RemoteData
 from defichain.transactions.remotedata import RemoteDataOcean, RemoteDataNode
 
 from .rawtransactionbuilder import RawTransactionBuilder
+from .txbatch import TxBatch
 from .modules import *
 
 from defichain.transactions.rawtransactions import Transaction
@@ -22,23 +24,29 @@ class TxBuilder:
     Through the given data source, all the necessary information is pulled from the blockchain which is
     required to create the transaction. The standard data source is the ocean infrastructure.
     However, this can also be replaced by a Defichain node connection.
+    A RemoteDataTracker keeps the unspent outputs locally, so that the change of sent transactions can be spent
+    before they are confirmed.
     If no data source is specified, the appropriate inputs must be passed to the individual methods.
 
     By default, a fee of one satoshi per byte is used.
 
     Input Handling:
-        All inputs of an address are always combined to one output.
+        Only the unspent outputs needed for the value and the fee are spent. They are chosen by the coin selection
+        strategy, by default branch and bound with a fallback to largest first. Sending all UTXO spends all of them.
 
     :param address: (required) address for which the transaction is created
     :type address: str
     :param account: (required) account object belonging to the given address
     :type account: Account
     :param dataSource: (required) data source for creating the transaction
-    :type dataSource: Ocean | Node | None
+    :type dataSource: Ocean | Node | RemoteData | None
     :param feePerByte: (optional) approximate fee paid per byte
     :type feePerByte: float
+    :param coinSelection: (optional) strategy of CoinSelection or callable to select the inputs
+    :type coinSelection: str | callable
     """
-    def __init__(self, address: str, account: Account, dataSource: "Ocean | Node | None", feePerByte=1.0):
+    def __init__(self, address: str, account: Account, dataSource: "Ocean | Node | RemoteData | None", feePerByte=1.0,
+                 coinSelection: "str | callable" = CoinSelection.BRANCH_AND_BOUND):
         self._address, self._account, self._dataSource, self._feePerByte = None, None, None, None
         self._set_address(address)
         self._set_account(account)
@@ -46,7 +54,7 @@ class TxBuilder:
         self._set_feePerByte(feePerByte)
 
         self._builder = RawTransactionBuilder(self.get_address(), self.get_account(), self.get_dataSource(),
-                                              self.get_feePerByte())
+                                              self.get_feePerByte(), coinSelection)
 
         self.utxo = UTXO(self._builder)
         self.accounts = Accounts(self._builder)
@@ -108,6 +116,22 @@ class TxBuilder:
                 self.get_address() != self.get_account().get_p2wpkh()):
             raise TxBuilderError("The given address does not match the given account!")
 
+    def batch(self) -> TxBatch:
+        """
+        Returns a batch to build several transactions one after another without waiting for their confirmation.
+        Each transaction spends the unconfirmed change of the previous ones or other unspent outputs.
+
+        :return: TxBatch
+
+        :example:
+
+            >>> batch = builder.batch()
+            >>> batch.accounts.accounttoaccount(builder.get_address(), {addressTo: "1@DUSD"})
+            >>> batch.pool.poolswap(builder.get_address(), "DFI", 1, builder.get_address(), "DUSD", 999999999)
+            >>> txids = batch.send()
+        """
+        return TxBatch(self)
+
     def get_inputs_tx(self) -> Transaction:
         """
         Builds a transaction just with the inputs of the address.
@@ -150,6 +174,14 @@ class TxBuilder:
         """
         return self._feePerByte
 
+    def get_coinSelection(self) -> "str | callable":
+        """
+        Returns the coin selection strategy specified in the builder
+
+        :return: str | callable
+        """
+        return self._builder.get_coinSelection()
+
     # Set Information
     def _set_address(self, address: str) -> None:
         self._address = address
@@ -157,11 +189,13 @@ class TxBuilder:
     def _set_account(self, account: Account) -> None:
         self._account = account
 
-    def _set_dataSource(self, dataSource: "Ocean | Node | None") -> None:
+    def _set_dataSource(self, dataSource: "Ocean | Node | RemoteData | None") -> None:
         if isinstance(dataSource, Ocean):
             self._dataSource = RemoteDataOcean(dataSource)
         elif isinstance(dataSource, Node):
             self._dataSource = RemoteDataNode(dataSource)
+        elif isinstance(dataSource, RemoteData):
+            self._dataSource = dataSource
         elif dataSource is None:
             self._dataSource = None
         else:
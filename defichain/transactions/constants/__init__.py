@@ -2,17 +2,21 @@
 # Address
 from .address import AddressTypes, CHARSET, CHARSET_BASE, MAX_OP_LENGTH
 
+# Coin Selection
+from .coinselection import CoinSelection, BNB_TRIES, KNAPSACK_ITERATIONS, CONSOLIDATE_FEE_PER_BYTE, \
+    CONSOLIDATE_MAX_INPUTS
+
 # Defi Transaction
 from .defitx import DefiTxType, DefiTx_SIGNATURE
 
 # Fee
-from .fees import FEE_PER_BYTE, TxSize
+from .fees import FEE_PER_BYTE, DUST_LIMIT, TxSize
 
 # OP Codes
 from .opcodes import OPCodes
 
 # Raw Transactions
-from .rawtransactions import ORDER, SCRIPTSIG, SEQUENCE, SIGHASH
+from .rawtransactions import ORDER, SCRIPTSIG, SEQUENCE, SIGHASH, MEMPOOL_ANCESTOR_LIMIT
 
 # Tokens
 from .tokens import TokenTypes, Tokens
@@ -0,0 +1,18 @@
+# Coin Selection Strategies
+class CoinSelection:
+    ALL: str = "all"  # Spends all unspent outputs of the address
+    LARGEST_FIRST: str = "largestfirst"
+    BRANCH_AND_BOUND: str = "branchandbound"  # Falls back to largest first if there is no exact match
+    KNAPSACK: str = "knapsack"
+    CONSOLIDATE: str = "consolidate"  # Spends small outputs too while the fee is low
+
+
+# Branch and Bound
+BNB_TRIES: int = 100000
+
+# Knapsack
+KNAPSACK_ITERATIONS: int = 1000
+
+# Consolidate
+CONSOLIDATE_FEE_PER_BYTE: float = 1
+CONSOLIDATE_MAX_INPUTS: int = 100
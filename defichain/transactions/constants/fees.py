@@ -1,4 +1,5 @@
 FEE_PER_BYTE: int = 1
+DUST_LIMIT: int = 546  # Smaller outputs are not relayed by the nodes
 
 
 class TxSize:
@@ -9,3 +9,6 @@ SIGHASH = 1
 
 # Signing Order
 ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# Mempool
+MEMPOOL_ANCESTOR_LIMIT: int = 25  # Maximum number of unconfirmed transactions in a chain, including the last one
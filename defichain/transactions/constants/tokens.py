@@ -2,7 +2,6 @@ from typing import Any
 
 import json
 import os
-from defichain import Ocean
 from defichain.networks import DefichainMainnet, DefichainTestnet
 
 
@@ -36,11 +35,17 @@ class Tokens:
         with open(f"{Tokens.PATH}/{network.NETWORK}/{TokenTypes.CUSTOM}_tokens.json", "r") as f:
             return json.loads(f.read())
 
+    @staticmethod
+    def get_tokens(network: Any, TYPE: str) -> [{}]:
+        with open(f"{Tokens.PATH}/{network.NETWORK}/{TYPE}_tokens.json", "r") as f:
+            return json.loads(f.read())
+
     @staticmethod
     def _build_tokenJson() -> None:
         """
         Asks the ocean API for the newest tokens and prints the results in json files into the current folder
         """
+        from defichain import Ocean
 
         networks = (DefichainMainnet.NETWORK, DefichainTestnet.NETWORK)
 
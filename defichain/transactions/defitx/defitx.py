@@ -2,43 +2,38 @@ from typing import Any
 
 from defichain.exceptions.transactions import NotYetSupportedError
 from defichain.transactions.constants import DefiTx_SIGNATURE
+from defichain.transactions.utils import ByteReader
 from .modules.accounts import *
 from .modules.pool import *
 
+DEFITX_SIGNATURE = bytes.fromhex(DefiTx_SIGNATURE)
+
 
 class DefiTx:
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "BaseDefiTx":
-        position = 0
-
-        opReturn = hex[position: position + 2]
-        position += 2
+        return DefiTx.from_reader(network, ByteReader.from_hex(hex))
 
-        lengthStandard = hex[position: position + 2]
-        position += 2
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "BaseDefiTx":
+        opReturn = reader.read_uint8()
+        lengthStandard = reader.read_uint8()
 
-        if hex[position: position + 8] == DefiTx_SIGNATURE:
-            signature = hex[position: position + 8]
-            position += 8
-        else:
-            lengthExtra = hex[position: position + 2]
-            position += 2
-            signature = hex[position: position + 8]
-            position += 8
+        if reader.peek(4) != DEFITX_SIGNATURE:
+            lengthExtra = reader.read_uint8()
+        signature = reader.read(4)
 
-        defiTxType = hex[position: position + 2]
-        position += 2
+        defiTxType = reader.read_hex(1)
 
         # Account
         if DefiTxType.OP_DEFI_TX_UTXOS_TO_ACCOUNT == defiTxType:
-            return UtxosToAccount.deserialize(network, hex[position:])
+            return UtxosToAccount.from_reader(network, reader)
         elif DefiTxType.OP_DEFI_TX_ACCOUNT_TO_ACCOUNT == defiTxType:
-            return AccountToAccount.deserialize(network, hex[position:])
+            return AccountToAccount.from_reader(network, reader)
 
         # Pool
         elif DefiTxType.OP_DEFI_TX_POOL_SWAP == defiTxType:
-            return Poolswap.deserialize(network, hex[position:])
+            return Poolswap.from_reader(network, reader)
 
         raise NotYetSupportedError()
-
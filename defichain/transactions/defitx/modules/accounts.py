@@ -2,7 +2,7 @@ from typing import Any
 
 from defichain.transactions.constants import DefiTxType
 from defichain.transactions.address import Address
-from defichain.transactions.utils import Converter, Token, Verify
+from defichain.transactions.utils import Converter, Token, Verify, ByteReader
 from .basedefitx import BaseDefiTx
 from .baseinput import ScriptBalances, TokenBalanceInt32
 from ..builddefitx import BuildDefiTx
@@ -22,12 +22,13 @@ class UtxosToAccount(BaseDefiTx):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "BaseDefiTx":
-        position = 0
+        return UtxosToAccount.from_reader(network, ByteReader.from_hex(hex))
 
-        numberOfElements = Converter.hex_to_int(hex[position: position + 2])
-        position += 2
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "BaseDefiTx":
+        numberOfElements = reader.read_uint8()
 
-        scriptBalances = ScriptBalances.deserialize(network, hex[position:])
+        scriptBalances = ScriptBalances.from_reader(network, reader)
 
         return UtxosToAccount(scriptBalances.get_address(), scriptBalances.get_tokenBalanceInt32()[0].get_amount(),
                               scriptBalances.get_tokenBalanceInt32()[0].get_tokenId())
@@ -111,17 +112,15 @@ class AccountToAccount(BaseDefiTx):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "AccountToAccount":
-        position = 0
-
-        length_addressFrom = Converter.hex_to_int(hex[position: position + 2]) * 2
-        position += 2
+        return AccountToAccount.from_reader(network, ByteReader.from_hex(hex))
 
-        addressFrom = Address.from_scriptPublicKey(network, hex[position: position + length_addressFrom])
-        position += length_addressFrom
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "AccountToAccount":
+        addressFrom = Address.scriptPublicKey_to_address(network, reader.read_varBytes().hex())
 
-        scriptBalances = ScriptBalances.deserialize_array(network, hex[position:])
+        scriptBalances = ScriptBalances.from_reader_array(network, reader)
 
-        return AccountToAccount(addressFrom.get_address(), ScriptBalances.to_json(scriptBalances))
+        return AccountToAccount(addressFrom, ScriptBalances.to_json(scriptBalances))
 
     def __init__(self, addressFrom: str, addressAmountTo: {}):
         self._addressFrom, self._addressAmountTo = None, None
@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 from typing import Any
 import json
 
+from defichain.exceptions.transactions import NotYetSupportedError
+from defichain.transactions.utils import ByteReader
+
 
 class BaseDefiTx(ABC):
     @staticmethod
@@ -9,6 +12,10 @@ class BaseDefiTx(ABC):
     def deserialize(network: Any, hex: str) -> "BaseDefiTx":
         pass
 
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "BaseDefiTx":
+        raise NotYetSupportedError()
+
     @abstractmethod
     def __bytes__(self) -> bytes:
         pass
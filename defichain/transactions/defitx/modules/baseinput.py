@@ -4,7 +4,7 @@ from typing import Any
 from defichain.exceptions.transactions import AddressError
 from defichain.transactions.utils import Token, Verify, BuildAddressAmounts
 from defichain.transactions.address import Address
-from defichain.transactions.utils import Converter
+from defichain.transactions.utils import Converter, ByteReader
 
 
 class BaseInput(ABC):
@@ -14,6 +14,11 @@ class BaseInput(ABC):
     def deserialize(network: Any, hex: str) -> "BaseInput":
         pass
 
+    @staticmethod
+    @abstractmethod
+    def from_reader(network: Any, reader: ByteReader) -> "BaseInput":
+        pass
+
     @abstractmethod
     def __bytes__(self) -> bytes:
         pass
@@ -35,8 +40,12 @@ class TokenBalanceInt32(BaseInput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TokenBalanceInt32":
-        tokenId = Converter.hex_to_int(hex[0:8])
-        amount = Converter.hex_to_int(hex[8: 24])
+        return TokenBalanceInt32.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TokenBalanceInt32":
+        tokenId = reader.read_uint32()
+        amount = reader.read_uint64()
         return TokenBalanceInt32(tokenId, amount)
 
     def __init__(self, tokenId: int, amount: int):
@@ -113,44 +122,25 @@ class ScriptBalances(BaseInput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "ScriptBalances":
-        position = 0
-
-        scriptSize = Converter.hex_to_int(hex[position: position + 2]) * 2
-        position += 2
-
-        address = Address.from_scriptPublicKey(network, hex[position: position + scriptSize])
-        position += scriptSize
+        return ScriptBalances.from_reader(network, ByteReader.from_hex(hex))
 
-        numberOfTokenBalanceInt32 = Converter.hex_to_int(hex[position: position + 2])
-        position += 2
-
-        tokenBalanceInt32 = []
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "ScriptBalances":
+        address = Address.scriptPublicKey_to_address(network, reader.read_varBytes().hex())
 
-        for _ in range(numberOfTokenBalanceInt32):
-            balance = TokenBalanceInt32.deserialize(network, hex[position: position +
-                                                                           TokenBalanceInt32.estimated_size()])
-            tokenBalanceInt32.append(balance)
-            position += TokenBalanceInt32.estimated_size()
+        numberOfTokenBalanceInt32 = reader.read_uint8()
+        tokenBalanceInt32 = [TokenBalanceInt32.from_reader(network, reader) for _ in range(numberOfTokenBalanceInt32)]
 
-        return ScriptBalances(address.get_address(), tokenBalanceInt32)
+        return ScriptBalances(address, tokenBalanceInt32)
 
     @staticmethod
     def deserialize_array(network: Any, hex: str) -> ["ScriptBalances"]:
-        position = 0
-        numberOfReceivers = Converter.hex_to_int(hex[position: position + 2])
-        position += 2
-
-        scriptBalances = []
+        return ScriptBalances.from_reader_array(network, ByteReader.from_hex(hex))
 
-        for _ in range(numberOfReceivers):
-            length_addressTo = Converter.hex_to_int(hex[position: position + 2]) * 2
-            numberOfAmounts = Converter.hex_to_int(hex[position + 2 + length_addressTo: position + 2 + length_addressTo + 2])
-
-            scriptBalance = ScriptBalances.deserialize(network, hex[position: position + 2 + length_addressTo + 2 + numberOfAmounts * TokenBalanceInt32.estimated_size()])
-            scriptBalances.append(scriptBalance)
-
-            position += 2 + length_addressTo + 2 + numberOfAmounts * TokenBalanceInt32.estimated_size()
-        return scriptBalances
+    @staticmethod
+    def from_reader_array(network: Any, reader: ByteReader) -> ["ScriptBalances"]:
+        numberOfReceivers = reader.read_uint8()
+        return [ScriptBalances.from_reader(network, reader) for _ in range(numberOfReceivers)]
 
     @staticmethod
     def to_json(scriptBalances: []) -> {}:
@@ -3,7 +3,7 @@ from typing import Any
 from defichain.exceptions.transactions import AddressError
 from defichain.transactions.constants import DefiTxType
 from defichain.transactions.address import Address
-from defichain.transactions.utils import Converter, Token, Verify
+from defichain.transactions.utils import Converter, Token, Verify, ByteReader
 from .basedefitx import BaseDefiTx
 from ..builddefitx import BuildDefiTx
 
@@ -23,41 +23,26 @@ class Poolswap(BaseDefiTx):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "Poolswap":
-        position = 0
+        return Poolswap.from_reader(network, ByteReader.from_hex(hex))
 
-        lengthAddressFrom = Converter.hex_to_int(hex[position: position + 2]) * 2
-        position += 2
-
-        addressFrom = Address.from_scriptPublicKey(network, hex[position: position + lengthAddressFrom])
-        position += lengthAddressFrom
-
-        tokenFrom = Converter.hex_to_int(hex[position: position + 2])
-        position += 2
-
-        amountFrom = Converter.hex_to_int(hex[position: position + 16])
-        position += 16
-
-        lengthAddressTo = Converter.hex_to_int(hex[position: position + 2]) * 2
-        position += 2
-
-        addressTo = Address.from_scriptPublicKey(network, hex[position: position + lengthAddressTo])
-        position += lengthAddressTo
-
-        tokenTo = Converter.hex_to_int(hex[position: position + 2])
-        position += 2
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "Poolswap":
+        addressFrom = Address.scriptPublicKey_to_address(network, reader.read_varBytes().hex())
+        tokenFrom = reader.read_uint8()
+        amountFrom = reader.read_uint64()
 
-        maxPriceInteger = Converter.hex_to_int(hex[position: position + 16])
-        position += 16
+        addressTo = Address.scriptPublicKey_to_address(network, reader.read_varBytes().hex())
+        tokenTo = reader.read_uint8()
 
-        maxPriceFraction = str(Converter.hex_to_int(hex[position: position + 16]))
-        position += 16
+        maxPriceInteger = reader.read_uint64()
+        maxPriceFraction = str(reader.read_uint64())
 
         while len(maxPriceFraction) < 8:
             maxPriceFraction += "0"
 
         maxPrice = int(str(maxPriceInteger) + maxPriceFraction)
 
-        return Poolswap(addressFrom.get_address(), tokenFrom, amountFrom, addressTo.get_address(), tokenTo, maxPrice)
+        return Poolswap(addressFrom, tokenFrom, amountFrom, addressTo, tokenTo, maxPrice)
 
     def __init__(self, addressFrom: str, tokenFrom: int, amountFrom: int, addressTo: str, tokenTo: int,
                  maxPrice: int):
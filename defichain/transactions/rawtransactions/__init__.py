@@ -1,6 +1,9 @@
 # Transaction
 from .tx import Transaction
 
+# Block
+from .block import BlockHeader, Block
+
 # Transaction Input
 from .txinput import TxInput, TxP2PKHInput, TxP2SHInput, TxP2WPKHInput, TxCoinbaseInput
 
@@ -0,0 +1,375 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator
+
+from defichain.exceptions.transactions import DeserializeError
+from defichain.transactions.utils import Calculate, ByteReader
+
+from .tx import Transaction
+
+TRANSACTION_CHUNK_SIZE = 50
+
+
+def _decode_transaction(network: Any, raw: "bytes | memoryview", ignore_errors: bool = False) -> "Transaction | None":
+    # Module level, so that it can be sent to the processes of a worker pool
+    try:
+        reader = ByteReader(raw)
+        tx = Transaction.from_reader(network, reader)
+        if not reader.is_at_end():
+            raise DeserializeError(f"The transaction was decoded, but {reader.remaining()} bytes are left")
+        return tx
+    except Exception as e:
+        if ignore_errors:
+            return None
+        txid = Block.calculate_txid(raw)
+        raise DeserializeError(f"The transaction {txid} of the block can not be decoded: {e}")
+
+
+class BlockHeader:
+    """
+    Header of a defichain block
+
+    :param version: (required) block version
+    :type version: int
+    :param previousBlockHash: (required) hash of the previous block
+    :type previousBlockHash: str
+    :param merkleRoot: (required) merkle root of the transactions
+    :type merkleRoot: str
+    :param time: (required) block time in seconds since epoch
+    :type time: int
+    :param bits: (required) difficulty target
+    :type bits: int
+    :param height: (required) block height
+    :type height: int
+    :param mintedBlocks: (required) number of blocks minted by the masternode
+    :type mintedBlocks: int
+    :param stakeModifier: (required) stake modifier
+    :type stakeModifier: str
+    :param signature: (required) signature of the masternode
+    :type signature: str
+    :param hash: (optional) hash of the block, calculated from the header if not given
+    :type hash: str
+    """
+
+    @staticmethod
+    def deserialize(hex: str) -> "BlockHeader":
+        """
+        Deserializes a block header
+
+        :param hex: (required) the serialized block header
+        :type hex: str
+        :return: "BlockHeader"
+        """
+        return BlockHeader.from_reader(ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(reader: ByteReader) -> "BlockHeader":
+        start = reader.get_position()
+        version = reader.read_uint32()
+        previousBlockHash = reader.read_reversed_hex(32)
+        merkleRoot = reader.read_reversed_hex(32)
+        time = reader.read_uint32()
+        bits = reader.read_uint32()
+        height = reader.read_uint64()
+        mintedBlocks = reader.read_uint64()
+        stakeModifier = reader.read_reversed_hex(32)
+        signature = reader.read_varBytes().hex()
+        end = reader.get_position()
+
+        reader.set_position(start)
+        hash = bytes(reversed(Calculate.dHash256(reader.read(end - start)))).hex()
+        return BlockHeader(version, previousBlockHash, merkleRoot, time, bits, height, mintedBlocks, stakeModifier,
+                           signature, hash)
+
+    def __init__(self, version: int, previousBlockHash: str, merkleRoot: str, time: int, bits: int, height: int,
+                 mintedBlocks: int, stakeModifier: str, signature: str, hash: str = None):
+        self._version = version
+        self._previousBlockHash = previousBlockHash
+        self._merkleRoot = merkleRoot
+        self._time = time
+        self._bits = bits
+        self._height = height
+        self._mintedBlocks = mintedBlocks
+        self._stakeModifier = stakeModifier
+        self._signature = signature
+        self._hash = hash if hash is not None else bytes(reversed(Calculate.dHash256(self.bytes()))).hex()
+
+    def __bytes__(self) -> bytes:
+        result = self._version.to_bytes(4, "little")
+        result += bytes.fromhex(self._previousBlockHash)[::-1]
+        result += bytes.fromhex(self._merkleRoot)[::-1]
+        result += self._time.to_bytes(4, "little")
+        result += self._bits.to_bytes(4, "little")
+        result += self._height.to_bytes(8, "little")
+        result += self._mintedBlocks.to_bytes(8, "little")
+        result += bytes.fromhex(self._stakeModifier)[::-1]
+        signature = bytes.fromhex(self._signature)
+        result += Calculate.write_compactSize(len(signature), "bytes") + signature
+        return result
+
+    def bytes(self) -> bytes:
+        return self.__bytes__()
+
+    def serialize(self) -> str:
+        return self.bytes().hex()
+
+    def to_json(self) -> {}:
+        json = {}
+        json.update({"hash": self.get_hash()})
+        json.update({"version": self.get_version()})
+        json.update({"previousblockhash": self.get_previousBlockHash()})
+        json.update({"merkleroot": self.get_merkleRoot()})
+        json.update({"time": self.get_time()})
+        json.update({"bits": self.get_bits()})
+        json.update({"height": self.get_height()})
+        json.update({"mintedBlocks": self.get_mintedBlocks()})
+        json.update({"stakeModifier": self.get_stakeModifier()})
+        return json
+
+    # Get Information
+    def get_hash(self) -> str:
+        return self._hash
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get_previousBlockHash(self) -> str:
+        return self._previousBlockHash
+
+    def get_merkleRoot(self) -> str:
+        return self._merkleRoot
+
+    def get_time(self) -> int:
+        return self._time
+
+    def get_bits(self) -> int:
+        return self._bits
+
+    def get_height(self) -> int:
+        return self._height
+
+    def get_mintedBlocks(self) -> int:
+        return self._mintedBlocks
+
+    def get_stakeModifier(self) -> str:
+        return self._stakeModifier
+
+    def get_signature(self) -> str:
+        return self._signature
+
+
+class Block:
+    """
+    Decodes a serialized block, as it is returned by getblock with verbosity 0.
+
+    Only the header and the number of transactions are decoded when the block is created. The transactions are
+    split from the raw block and decoded while iterating over them, so that a block does not have to be decoded
+    at once and the decoding can be distributed to a worker pool.
+
+    :param network: (required) the network of the block
+    :type network: Network
+    :param data: (required) the serialized block
+    :type data: bytes
+
+    :example:
+
+        >>> from defichain import Node
+        >>> from defichain.networks import DefichainMainnet
+        >>> from defichain.transactions.rawtransactions import Block
+        >>>
+        >>> node = Node(...)
+        >>> blockhash = node.blockchain.getblockhash(2500000)
+        >>> block = Block.deserialize(DefichainMainnet, node.blockchain.getblock(blockhash, verbosity=0))
+        >>> block.get_header().get_height()
+        2500000
+        >>> for tx in block.iter_transactions():
+        ...     print(tx.get_txid())
+    """
+
+    @staticmethod
+    def deserialize(network: Any, hex: str) -> "Block":
+        """
+        Deserializes a block from hex
+
+        :param network: (required) the network of the block
+        :type network: Network
+        :param hex: (required) the serialized block
+        :type hex: str
+        :return: "Block"
+        """
+        try:
+            data = bytes.fromhex(hex)
+        except (ValueError, TypeError):
+            raise DeserializeError("The given block is not an hexadecimal string")
+        return Block(network, data)
+
+    @staticmethod
+    def from_bytes(network: Any, data: bytes) -> "Block":
+        """
+        Deserializes a block from bytes
+
+        :param network: (required) the network of the block
+        :type network: Network
+        :param data: (required) the serialized block
+        :type data: bytes
+        :return: "Block"
+        """
+        return Block(network, data)
+
+    @staticmethod
+    def calculate_txid(raw: "bytes | memoryview") -> str:
+        """
+        Calculates the txid of a serialized transaction without decoding it: the hash of the transaction without
+        marker, flag and witness
+
+        :param raw: (required) the serialized transaction
+        :type raw: bytes | memoryview
+        :return: str
+        """
+        reader = ByteReader(raw)
+        return Block._split_transaction(reader)[1]
+
+    def __init__(self, network: Any, data: "bytes | memoryview"):
+        self._network = network
+        self._data = memoryview(data)
+        reader = ByteReader(self._data)
+        self._header = BlockHeader.from_reader(reader)
+        self._transactionCount = reader.read_compactSize()
+        self._transactionsPosition = reader.get_position()
+
+    def __len__(self) -> int:
+        return self._transactionCount
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return self.iter_transactions()
+
+    # Transactions
+    def iter_raw_transactions(self) -> Iterator[memoryview]:
+        """
+        Splits the serialized transactions from the block without decoding them
+
+        :return: Iterator[memoryview] -- the serialized transactions in the order of the block
+        """
+        for raw, txid in self._iter_split_transactions():
+            yield raw
+
+    def iter_transactions(self, processes: int = None, chunk_size: int = TRANSACTION_CHUNK_SIZE,
+                          ignore_errors: bool = False) -> Iterator[Transaction]:
+        """
+        Decodes the transactions of the block one by one
+
+        If processes is greater than one, the transactions are decoded in a process pool and returned in the
+        order of the block.
+
+        :param processes: (optional) number of processes to decode the transactions (default=None -> no pool)
+        :type processes: int
+        :param chunk_size: (optional) number of transactions sent to a process at once (default=50)
+        :type chunk_size: int
+        :param ignore_errors: (optional) returns None for transactions that can not be decoded instead of raising
+            a DeserializeError (default=False)
+        :type ignore_errors: bool
+        :return: Iterator[Transaction] -- the transactions in the order of the block
+        """
+        if processes is not None and processes < 1:
+            raise ValueError("The number of processes has to be at least one")
+        if chunk_size < 1:
+            raise ValueError("The chunk size has to be at least one")
+
+        if processes is None or processes == 1:
+            for raw in self.iter_raw_transactions():
+                yield _decode_transaction(self._network, raw, ignore_errors)
+            return
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            raws = [bytes(raw) for raw in self.iter_raw_transactions()]
+            yield from executor.map(_decode_transaction, [self._network] * len(raws), raws,
+                                    [ignore_errors] * len(raws), chunksize=chunk_size)
+
+    def get_transactions(self, processes: int = None, ignore_errors: bool = False) -> [Transaction]:
+        """
+        Decodes all transactions of the block
+
+        :param processes: (optional) number of processes to decode the transactions (default=None -> no pool)
+        :type processes: int
+        :param ignore_errors: (optional) returns None for transactions that can not be decoded instead of raising
+            a DeserializeError (default=False)
+        :type ignore_errors: bool
+        :return: [Transaction]
+        """
+        return list(self.iter_transactions(processes=processes, ignore_errors=ignore_errors))
+
+    def get_txids(self) -> [str]:
+        """
+        Returns the txids of all transactions in the block without decoding the transactions
+
+        :return: [str]
+        """
+        return [txid for raw, txid in self._iter_split_transactions()]
+
+    # Get Information
+    def get_network(self) -> Any:
+        return self._network
+
+    def get_header(self) -> BlockHeader:
+        return self._header
+
+    def get_hash(self) -> str:
+        return self._header.get_hash()
+
+    def get_height(self) -> int:
+        return self._header.get_height()
+
+    def get_transactionCount(self) -> int:
+        return self._transactionCount
+
+    def size(self) -> int:
+        return len(self._data)
+
+    def bytes(self) -> bytes:
+        return bytes(self._data)
+
+    def serialize(self) -> str:
+        return self._data.hex()
+
+    # Internal
+    def _iter_split_transactions(self) -> Iterator[tuple]:
+        reader = ByteReader(self._data, self._transactionsPosition)
+        for _ in range(self._transactionCount):
+            yield Block._split_transaction(reader)
+        if not reader.is_at_end():
+            raise DeserializeError(f"The block was decoded, but {reader.remaining()} bytes are left")
+
+    @staticmethod
+    def _split_transaction(reader: ByteReader) -> (memoryview, str):
+        # Walks over the fields of the transaction without decoding them and hashes the parts without witness
+        start = reader.get_position()
+        version = reader.read_uint32()
+        segwit = reader.remaining() >= 2 and reader.peek(2) == b"\x00\x01"
+        if segwit:
+            reader.skip(2)
+
+        bodyStart = reader.get_position()
+        inputCount = reader.read_compactSize()
+        for _ in range(inputCount):
+            reader.skip(36)  # txid and vout
+            reader.skip(reader.read_compactSize())  # script signature
+            reader.skip(4)  # sequence
+        tokenId = not (version == 1 or version == 2)
+        for _ in range(reader.read_compactSize()):
+            reader.skip(8)  # value
+            reader.skip(reader.read_compactSize())  # script
+            if tokenId:
+                reader.skip(1)
+        bodyEnd = reader.get_position()
+
+        if segwit:
+            for _ in range(inputCount):
+                for _ in range(reader.read_compactSize()):
+                    reader.skip(reader.read_compactSize())
+        reader.skip(4)  # lockTime
+        end = reader.get_position()
+
+        reader.set_position(start)
+        raw = reader.read(end - start)
+        unsigned = raw[:4].tobytes() + raw[bodyStart - start: bodyEnd - start].tobytes() + raw[-4:].tobytes()
+        txid = bytes(reversed(Calculate.dHash256(unsigned))).hex()
+        return raw, txid
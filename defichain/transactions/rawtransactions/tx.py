@@ -5,7 +5,7 @@ from defichain.exceptions.transactions import RawTransactionError, NotYetSupport
 from defichain.networks import Network
 from defichain.transactions.address import Address
 from defichain.transactions.keys import PrivateKey, KeyError, PublicKey
-from defichain.transactions.utils import Converter, Calculate
+from defichain.transactions.utils import Converter, Calculate, ByteReader, ByteWriter
 from defichain.transactions.constants import SIGHASH
 
 from .txbase import TxBase
@@ -19,6 +19,7 @@ class BaseTransaction(TxBase, ABC):
 
     def __init__(self, inputs: [], outputs: [], lockTime: int = 0):
         self._version, self._marker, self._flag, self._sigHash, self._inputs, self._outputs, self._lockTime = None, None, None, None, [], [], None
+        self._cachedRevision, self._cached, self._cachedCalculating = None, {}, False
         self._signed = False
         self._coinbase = False
         self._segwit = False
@@ -36,28 +37,63 @@ class BaseTransaction(TxBase, ABC):
         pass
 
     def bytes_unsigned(self) -> bytes:
+        return self._get_cached("bytes_unsigned", self._bytes_unsigned)
+
+    def _bytes_unsigned(self) -> bytes:
+        writer = ByteWriter()
+
         # Version
-        result = self.get_bytes_version()
+        writer.write_uint32(self.get_version())
 
         # Inputs
-        result += Calculate.write_compactSize(len(self.get_inputs()), "bytes")
+        writer.write_compactSize(len(self.get_inputs()))
         for input in self.get_inputs():
-            result += input.get_bytes_unsignedInput()
+            writer.write(input.get_bytes_unsignedInput())
 
         # Outputs
-        result += Calculate.write_compactSize(len(self.get_outputs()), "bytes")
+        writer.write_compactSize(len(self.get_outputs()))
         for output in self.get_outputs():
-            result += output.bytes()
+            writer.write(output.bytes())
 
         # Coinbase Add On
         if self.is_coinbase():
-            result += Converter.int_to_bytes(1, 1)  # Number of Elements
-            result += Converter.int_to_bytes(32, 1)  # Length of Zeros
-            result += Converter.int_to_bytes(0, 32)  # Zeros
+            writer.write_uint8(1)  # Number of Elements
+            writer.write_varBytes(bytes(32))  # Zeros
 
         # LockTime
-        result += self.get_bytes_lockTime()
-        return result
+        writer.write_uint32(self.get_lockTime())
+        return writer.getvalue()
+
+    # Cached Serialization
+    # The serialized transaction, txid and hash are calculated once and reused until the transaction, one of its
+    # inputs, witnesses or outputs is changed.
+    def bytes(self) -> bytes:
+        return self._get_cached("bytes", super().bytes)
+
+    def serialize(self) -> str:
+        return self.bytes().hex()
+
+    def size(self) -> int:
+        return len(self.bytes())
+
+    def _get_cached(self, name: str, calculate) -> Any:
+        # A calculation only reads the transaction: cached values used inside of it do not check the revision again
+        if not self._cachedCalculating:
+            revision = self._get_revision()
+            if revision != self._cachedRevision:
+                self._cachedRevision, self._cached = revision, {}
+        if name not in self._cached:
+            calculating, self._cachedCalculating = self._cachedCalculating, True
+            try:
+                self._cached[name] = calculate()
+            finally:
+                self._cachedCalculating = calculating
+        return self._cached[name]
+
+    def _get_revision(self) -> tuple:
+        return (self._revision,
+                tuple(input._get_revision() for input in self.get_inputs()),
+                tuple(output._get_revision() for output in self.get_outputs()))
 
     # Calculated Information
     def get_inputsValue(self) -> "int | None":
@@ -109,11 +145,12 @@ class BaseTransaction(TxBase, ABC):
         return self._lockTime
 
     def get_txid(self) -> str:
-        return Converter.bytes_to_hex(bytes(reversed(Calculate.dHash256(self.bytes_unsigned()))))
+        return self._get_cached("txid", lambda: Converter.bytes_to_hex(bytes(reversed(
+            Calculate.dHash256(self.bytes_unsigned())))))
 
-    def get_hash(self):
-        hash = Calculate.dHash256(self.bytes())
-        return Converter.bytes_to_hex(bytes(reversed(hash)))
+    def get_hash(self) -> str:
+        return self._get_cached("hash", lambda: Converter.bytes_to_hex(bytes(reversed(
+            Calculate.dHash256(self.bytes())))))
 
     def get_bytes_version(self) -> bytes:
         return Converter.int_to_bytes(self.get_version(), 4)
@@ -125,16 +162,10 @@ class BaseTransaction(TxBase, ABC):
         return Converter.int_to_bytes(self.get_flag(), 1)
 
     def get_bytes_inputs(self) -> bytes:
-        result = b''
-        for input in self._inputs:
-            result += input.bytes()
-        return result
+        return b''.join(input.bytes() for input in self._inputs)
 
     def get_bytes_outputs(self) -> bytes:
-        result = b''
-        for output in self._outputs:
-            result += output.bytes()
-        return result
+        return b''.join(output.bytes() for output in self._outputs)
 
     def get_bytes_sigHash(self) -> bytes:
         return Converter.int_to_bytes(self.get_sigHash(), 4)
@@ -142,6 +173,20 @@ class BaseTransaction(TxBase, ABC):
     def get_bytes_lockTime(self) -> bytes:
         return Converter.int_to_bytes(self.get_lockTime(), 4)
 
+    # BIP143 midstates: the same for the witness hash of every input, so they are cached like the serialization
+    # until the transaction, one of its inputs or outputs is changed.
+    def get_bytes_hashPrevOuts(self) -> bytes:
+        return self._get_cached("hashPrevOuts", lambda: Calculate.dHash256(b''.join(
+            input.get_bytes_txid() + input.get_bytes_vout() for input in self.get_inputs())))
+
+    def get_bytes_hashSequences(self) -> bytes:
+        return self._get_cached("hashSequences", lambda: Calculate.dHash256(b''.join(
+            input.get_bytes_sequence() for input in self.get_inputs())))
+
+    def get_bytes_hashOutputs(self) -> bytes:
+        return self._get_cached("hashOutputs", lambda: Calculate.dHash256(b''.join(
+            bytes(output) for output in self.get_outputs())))
+
     def is_signed(self) -> bool:
         return self._signed
 
@@ -235,122 +280,99 @@ class Transaction(BaseTransaction):
         :return: "Transaction"
         """
         try:
-            tx = Transaction([], [])
-            position = 0
-
-            # Set Version
-            version = Converter.hex_to_int(hex[position: position + 8])
-            tx.set_version(version)
-            position += 8
-
-            # Set Marker and Flag if exists
-            if hex[position: position + 4] == "0001":
-                marker = Converter.hex_to_int(hex[position: position + 2])
-                tx.set_marker(marker)
-                position += 2
-                flag = Converter.hex_to_int(hex[position: position + 2])
-                tx.set_flag(flag)
-                position += 2
-                tx._segwit = True
-
-            # Find number of inputs
-            length_numberOfInputs = Calculate.get_lengthCompactSize(hex[position: position + 2])
-            numberOfInputs = Calculate.read_compactSize(hex[position: position + length_numberOfInputs * 2])
-            position += length_numberOfInputs * 2
-
-            # Iterate through all inputs
-            inputs = []
-            for _ in range(numberOfInputs):
-                length_scriptSig = Converter.hex_to_int(hex[position + 72: position + 72 + 2]) * 2
-                input = TxInput.deserialize(network, hex[position: position + 82 + length_scriptSig])
-                inputs.append(input)
-                position += 82 + length_scriptSig
-
-            # Find number of outputs
-            length_numberOfOutputs = Calculate.get_lengthCompactSize(hex[position: position + 2])
-            numberOfOutputs = Calculate.read_compactSize(hex[position: position + length_numberOfOutputs * 2])
-            position += length_numberOfOutputs * 2
-
-            # Iterate through all outputs
-            outputs = []
-            for _ in range(numberOfOutputs):
-                scriptLengthSize = Calculate.get_lengthCompactSize(hex[position + 16: position + 18])
-                length_script = Calculate.read_compactSize(hex[position + 16: position + 16 + scriptLengthSize * 2]) * 2
-
-                # If transaction version is 1 or 2 there is no token id at the back of an output
-                if tx.get_version() == 1 or tx.get_version() == 2:
-                    length_script -= 2
-
-                output = TxOutput.deserialize(network, hex[position: position + 20 + length_script])
-                outputs.append(output)
-                position += 20 + length_script
-
-            # If transaction is a segwit transaction: Iterate through all witnisses
-            witnesses = []
-            if tx.is_segwit:
-                while hex[position: position + 2] == "02" or hex[position: position + 2] == "00":
-                    if hex[position: position + 2] == "00":
-                        if len(hex) - position <= 8:
-                            break
-                        position += 2
-                    elif hex[position: position + 2] == "02":
-                        position += 2
-                        length_signature = Converter.hex_to_int(hex[position: position + 2]) * 2
-                        length_publicKey = Converter.hex_to_int(hex[position + 2 + length_signature: position + 2 + length_signature + 2]) * 2
-                        length_witness = 2 + length_signature + 2 + length_publicKey
-                        witness = Witness.deserialize(network, hex[position: position + length_witness])
-                        witnesses.append(witness)
-                        position += length_witness
-                        tx._signed = True
-
-            # Match all witnisses with the corresponding input
-            if tx.is_signed():
-                count_witness = 0
-                count_inputs = 0
-                for input in inputs:
-                    if isinstance(input, TxP2SHInput):
-                        publicKey_address = PublicKey(network, witnesses[count_witness].get_publicKey()).p2wpkh_address()
-                        script_address = Address.from_scriptPublicKey(network, input.get_scriptSig()[2:]).get_address()
-                        if publicKey_address == script_address:
-                            input.set_witness(witnesses[count_witness])
-                            count_witness += 1
-                        else:
-                            raise DeserializeError("The given p2sh input script signature does not correspond with the "
-                                                   "given witness")
-                    elif isinstance(input, TxInput) and not input.get_scriptSig():
-                        newInput = input.to_p2wpkhInput()
-                        newInput.set_witness(witnesses[count_witness])
-                        inputs[count_inputs] = newInput
-                        count_witness += 1
-                    count_inputs += 1
+            return Transaction.from_reader(network, ByteReader.from_hex(hex))
+        except NotYetSupportedError as e:
+            print("This transaction can not be decoded, because the DefiTx is not yet implemented")
+        except Exception as e:
+            print("This transaction can not be decoded, either this transaction is not supported or there is an error "
+                  "in the code.")
 
-            tx.set_inputs(inputs)
-            tx.set_outputs(outputs)
-            tx.set_witness(witnesses)
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "Transaction":
+        """
+        Deserializes the transaction at the current position of the reader.
 
-            # Coinbase Transaction
-            if tx.is_coinbase():
+        The transaction is read directly from the raw bytes, without converting them to hex. Other than
+        :meth:`deserialize`, the errors of transactions that can not be decoded are raised.
 
-                numberOfCoinbaseElements = Converter.hex_to_int(hex[position: position + 2])
-                position += 2
+        :param network: (required) the corresponding network from the raw transaction
+        :type network: Network
+        :param reader: (required) reader over the raw bytes
+        :type reader: ByteReader
+        :return: "Transaction"
 
-                length_coinbase = Converter.hex_to_int(hex[position: position + 2]) * 2
-                position += 2
+        :example:
 
-                coinbaseElement = Converter.hex_to_int(hex[position: position + length_coinbase])
-                position += length_coinbase
+            >>> from defichain.networks import DefichainMainnet
+            >>> from defichain.transactions.rawtransactions import Transaction
+            >>>
+            >>> tx = Transaction.from_bytes(DefichainMainnet, raw)  # raw bytes of the transaction
+        """
+        tx = Transaction([], [])
+
+        # Set Version
+        tx.set_version(reader.read_uint32())
+
+        # Set Marker and Flag if exists
+        segwit = reader.remaining() >= 2 and reader.peek(2) == b"\x00\x01"
+        if segwit:
+            tx.set_marker(reader.read_uint8())
+            tx.set_flag(reader.read_uint8())
+            tx._segwit = True
+
+        # Iterate through all inputs
+        inputs = [TxInput.from_reader(network, reader) for _ in range(reader.read_compactSize())]
+
+        # If transaction version is 1 or 2 there is no token id at the back of an output
+        tokenId = not (tx.get_version() == 1 or tx.get_version() == 2)
+
+        # Iterate through all outputs
+        outputs = [TxOutput.from_reader(network, reader, tokenId) for _ in range(reader.read_compactSize())]
+
+        # If transaction is a segwit transaction: one witness stack for every input
+        witnesses = []
+        if segwit:
+            for input in inputs:
+                numberOfElements = reader.read_compactSize()
+                if numberOfElements == 0:
+                    continue
+                # Coinbase Transaction: witness reserved value
+                if isinstance(input, TxCoinbaseInput):
+                    for _ in range(numberOfElements):
+                        reader.read_varBytes()
+                elif numberOfElements == 2:
+                    witnesses.append(Witness.from_reader(network, reader))
+                    tx._signed = True
+                else:
+                    raise DeserializeError(f"A witness with {numberOfElements} elements is not supported")
+
+        # Match all witnisses with the corresponding input
+        if tx.is_signed():
+            count_witness = 0
+            for count_inputs, input in enumerate(inputs):
+                if isinstance(input, TxP2SHInput):
+                    publicKey_address = PublicKey(network, witnesses[count_witness].get_publicKey()).p2wpkh_address()
+                    script_address = Address.scriptPublicKey_to_address(network, input.get_scriptSig()[2:])
+                    if publicKey_address == script_address:
+                        input.set_witness(witnesses[count_witness])
+                        count_witness += 1
+                    else:
+                        raise DeserializeError("The given p2sh input script signature does not correspond with the "
+                                               "given witness")
+                elif isinstance(input, TxInput) and not input.get_scriptSig():
+                    newInput = input.to_p2wpkhInput()
+                    newInput.set_witness(witnesses[count_witness])
+                    inputs[count_inputs] = newInput
+                    count_witness += 1
+
+        tx.set_inputs(inputs)
+        tx.set_outputs(outputs)
+        tx.set_witness(witnesses)
 
-            # LockTime
-            lockTime = Converter.hex_to_int(hex[position: position + 8])
-            tx.set_lockTime(lockTime)
-            position += 8
+        # LockTime
+        tx.set_lockTime(reader.read_uint32())
 
-            return tx
-        except NotYetSupportedError as e:
-            print("This transaction can not be decoded, because the DefiTx is not yet implemented")
-        except Exception as e:
-            print("This transaction can not be decoded, either this transaction is not supported or there is an error "
-                  "in the code.")
+        return tx
 
     def __init__(self, inputs: [], outputs: [], lockTime: int = 0):
         """
@@ -367,23 +389,25 @@ class Transaction(BaseTransaction):
         self._analyse()
 
     def __bytes__(self):
+        writer = ByteWriter()
+
         # Version
-        result = self.get_bytes_version()
+        writer.write_uint32(self.get_version())
 
         # Marker and Flag (Only when Segwit Tx and Signed)
         if self.is_segwit() and self.is_signed():
-            result += self.get_bytes_marker()
-            result += self.get_bytes_flag()
+            writer.write_uint8(self.get_marker())
+            writer.write_uint8(self.get_flag())
 
         # Inputs
-        result += Calculate.write_compactSize(len(self.get_inputs()), "bytes")
+        writer.write_compactSize(len(self.get_inputs()))
         for input in self.get_inputs():
-            result += input.bytes()
+            writer.write(input.bytes())
 
         # Outputs
-        result += Calculate.write_compactSize(len(self.get_outputs()), "bytes")
+        writer.write_compactSize(len(self.get_outputs()))
         for output in self.get_outputs():
-            result += output.bytes()
+            writer.write(output.bytes())
 
         # Witness
         if self.is_signed():
@@ -394,30 +418,27 @@ class Transaction(BaseTransaction):
 
             # Append 00 if not a segwit input -> if there are more than one non segwit inputs at the end, just append
             # the double zeros one time
-            stack = []
+            stack = 0
             if numberOfWitnessInputs > 0:
                 for input in self.get_inputs():
                     if isinstance(input, TxP2SHInput) or isinstance(input, TxP2WPKHInput):
-                        for byte in stack:
-                            result += byte
-                        stack = []
-                        result += Converter.int_to_bytes(2, 1)
-                        result += input.get_witness().bytes()
+                        writer.write(bytes(stack))
+                        stack = 0
+                        writer.write_uint8(2)
+                        writer.write(input.get_witness().bytes())
                     elif isinstance(input, TxP2PKHInput):
-                        stack.append(Converter.int_to_bytes(0, 1))
-                for byte in stack:
-                    result += byte
+                        stack += 1
+                writer.write(bytes(stack))
 
         # Coinbase Add On
         if self.is_coinbase():
-            result += Converter.int_to_bytes(1, 1)  # Number of Elements
-            result += Converter.int_to_bytes(32, 1)  # Length of Zeros
-            result += Converter.int_to_bytes(0, 32)  # Zeros
+            writer.write_uint8(1)  # Number of Elements
+            writer.write_varBytes(bytes(32))  # Zeros
 
         # LockTime
-        result += self.get_bytes_lockTime()
+        writer.write_uint32(self.get_lockTime())
 
-        return result
+        return writer.getvalue()
 
     def sign(self, network: Any, private_keys: [str]) -> "Transaction":
         """
@@ -438,7 +459,8 @@ class Transaction(BaseTransaction):
                 key = PrivateKey(network, wif=key)
             else:
                 raise KeyError("Given private key is not valid")
-            keys.append({"private": key.get_privateKey(), "public": key.get_publicKey()})
+            keys.append({"private": key.get_privateKey(), "public": key.get_publicKey(),
+                         "addresses": (key.p2sh_address(), key.p2wpkh_address())})
 
         # Assign private and public keys to the correct input
         for input in self.get_inputs():
@@ -446,15 +468,16 @@ class Transaction(BaseTransaction):
                 raise NotYetSupportedError()
             if not input._private_key:
                 for key in keys:
-                    priv = PrivateKey(network, key["private"])
-                    if input.get_address() in [priv.p2sh_address(), priv.p2wpkh_address(), priv.p2sh_address()]:
+                    if input.get_address() in key["addresses"]:
                         input._private_key = key["private"]
                         input._publicKey = key["public"]
 
-        # Sign the inputs with the given keys
-        for input in self.get_inputs():
-            witness_hash = WitnessHash(self, input)
-            signature = sign_input(input._private_key, witness_hash.bytes_hash())
+        # Sign the inputs with the given keys. All witness hashes are calculated before the first witness is set,
+        # which changes the transaction, so the midstates are only calculated once.
+        witness_hashes = self._get_cached("witnessHashes", lambda: [WitnessHash(self, input).bytes_hash()
+                                                                    for input in self.get_inputs()])
+        for input, witness_hash in zip(self.get_inputs(), witness_hashes):
+            signature = sign_input(input._private_key, witness_hash)
             witness = Witness(signature, input._publicKey)
             input.set_witness(witness)
         self._signed = True
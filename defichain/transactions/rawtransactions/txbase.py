@@ -1,15 +1,31 @@
 from abc import ABC, abstractmethod
 from typing import Any
+import itertools
 import json
 
 from defichain.exceptions.transactions import RawTransactionError
 from defichain.networks import Network
 from defichain.transactions.address import Address
-from defichain.transactions.utils import Verify
+from defichain.transactions.utils import Verify, ByteReader
+
+_revisions = itertools.count(1)
 
 
 class TxBase(ABC):
 
+    # Every change of an attribute gives the object a new, process wide unique revision. Objects that cache their
+    # serialization compare the revisions of themselves and their parts to find out if the cache is still valid.
+    # Attributes starting with _cached do not change the revision.
+    _revision = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_cached"):
+            object.__setattr__(self, "_revision", next(_revisions))
+
+    def _get_revision(self) -> "int | tuple":
+        return self._revision
+
     @staticmethod
     def _is_txid(txid: str) -> bool:
         if txid:
@@ -79,6 +95,34 @@ class TxBase(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TxBase":
+        """
+        Deserializes the object that was used to call this method at the current position of the reader and moves
+        the reader to the end of the object
+
+        :param network: (required) network from defichain.networks
+        :type network: Network
+        :param reader: (required) reader over the raw bytes
+        :type reader: ByteReader
+        :return: "TxBase" - the object that was used to call the method
+        """
+        pass
+
+    @classmethod
+    def from_bytes(cls, network: Any, data: "bytes | memoryview") -> "TxBase":
+        """
+        Deserializes the given raw bytes into the object that was used to call this method
+
+        :param network: (required) network from defichain.networks
+        :type network: Network
+        :param data: (required) the raw bytes that should be deserialized
+        :type data: bytes | memoryview
+        :return: "TxBase" - the object that was used to call the method
+        """
+        return cls.from_reader(network, ByteReader(data))
+
     @abstractmethod
     def __bytes__(self) -> bytes:
         pass
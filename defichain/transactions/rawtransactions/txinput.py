@@ -4,7 +4,7 @@ from typing import Any
 from .txbase import TxBase
 from defichain.exceptions.transactions import AddressError, DeserializeError
 from defichain.transactions.constants import SEQUENCE
-from defichain.transactions.utils import Converter
+from defichain.transactions.utils import Converter, ByteReader
 from defichain.networks import Network
 from defichain.transactions.address import Address
 from defichain.transactions.constants import AddressTypes
@@ -13,24 +13,19 @@ from defichain.transactions.constants import AddressTypes
 class TxBaseInput(TxBase, ABC):
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxBaseInput":
-        position = 0
+        return TxBaseInput.from_reader(network, ByteReader.from_hex(hex))
 
-        txid = Converter.bytes_to_hex(bytes(reversed(Converter.hex_to_bytes(hex[position: position + 64]))))
-        position += 64
-
-        vout = Converter.hex_to_int(hex[position: position + 8])
-        position += 8
-
-        length_scriptSig = Converter.hex_to_int(hex[position: position + 2]) * 2
-        position += 2
-
-        scriptSig = hex[position: position + length_scriptSig]
-        position += length_scriptSig
-
-        sequence = hex[position: position + 8]
-        position += 8
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TxBaseInput":
+        return TxInput(*TxBaseInput._read_fields(reader))
 
-        return TxInput(txid=txid, vout=vout, scriptSig=scriptSig, sequence=sequence)
+    @staticmethod
+    def _read_fields(reader: ByteReader) -> (str, int, str, str):
+        txid = reader.read_reversed_hex(32)
+        vout = reader.read_uint32()
+        scriptSig = reader.read_varBytes().hex()
+        sequence = reader.read_hex(4)
+        return txid, vout, scriptSig, sequence
 
     def __init__(self, txid: str, vout: int, scriptSig: str = "", sequence: str = SEQUENCE):
         self._txid, self.vout, self._scriptSig, self._address, self._value, self._sequence = None, None, None, None, None, None
@@ -53,6 +48,11 @@ class TxBaseInput(TxBase, ABC):
         self._is_sequence(self.get_sequence())
         return True
 
+    def _get_revision(self) -> "int | tuple":
+        # The witness of a segwit input is part of the serialized transaction
+        witness = getattr(self, "_witness", None)
+        return (self._revision, witness._get_revision()) if isinstance(witness, TxBase) else self._revision
+
     # Get Information
     def get_txid(self) -> str:
         return self._txid
@@ -162,21 +162,25 @@ class TxInput(TxBaseInput):
         :type hex: str
         :return: "TxInput"
         """
-        input = TxBaseInput.deserialize(network, hex)
+        return TxInput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TxInput":
+        txid, vout, scriptSig, sequence = TxBaseInput._read_fields(reader)
 
         # Unsigned and Signed Coinbase Input
-        if input.get_txid() == "0" * 64:
-            return TxCoinbaseInput.deserialize(network, hex)
+        if txid == "0" * 64:
+            return TxCoinbaseInput._from_fields(network, txid, vout, scriptSig, sequence)
 
         # Signed P2SH Input
-        if Converter.int_to_hex(int(len(input.get_scriptSig()) / 2), 1) == "17":
-            return TxP2SHInput.deserialize(network, hex)
+        if len(scriptSig) == 46:
+            return TxP2SHInput._from_fields(network, txid, vout, scriptSig, sequence)
 
         # Signed P2PKH Input
-        if int(len(input.get_scriptSig()) / 2) > 23:
-            return TxP2PKHInput.deserialize(network, hex)
+        if len(scriptSig) > 46:
+            return TxP2PKHInput._from_fields(network, txid, vout, scriptSig, sequence)
 
-        return TxInput(input.get_txid(), input.get_vout(), input.get_scriptSig(), input.get_sequence())
+        return TxInput(txid, vout, scriptSig, sequence)
 
     def __init__(self, txid: str, vout: int, scriptSig: str = "", sequence: str = SEQUENCE):
         super().__init__(txid, vout, scriptSig, sequence)
@@ -217,12 +221,19 @@ class TxP2PKHInput(TxInput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxP2PKHInput":
-        input = TxBaseInput.deserialize(network, hex)
-        if input.get_scriptSig() != "":
-            if len(input.get_scriptSig()) < 23:
+        return TxP2PKHInput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TxP2PKHInput":
+        return TxP2PKHInput._from_fields(network, *TxBaseInput._read_fields(reader))
+
+    @staticmethod
+    def _from_fields(network: Any, txid: str, vout: int, scriptSig: str, sequence: str) -> "TxP2PKHInput":
+        if scriptSig != "":
+            if len(scriptSig) < 23:
                 raise DeserializeError("The given input to decode is not an p2pkh input")
 
-        return TxP2PKHInput(input.get_txid(), input.get_vout(), input.get_scriptSig(), input.get_sequence())
+        return TxP2PKHInput(txid, vout, scriptSig, sequence)
 
     def __init__(self, txid: str, vout: int, scriptSig: str = "", sequence: str = SEQUENCE):
         super().__init__(txid, vout, scriptSig, sequence)
@@ -255,15 +266,22 @@ class TxP2SHInput(TxInput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxP2SHInput":
-        input = TxBaseInput.deserialize(network, hex)
+        return TxP2SHInput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TxP2SHInput":
+        return TxP2SHInput._from_fields(network, *TxBaseInput._read_fields(reader))
+
+    @staticmethod
+    def _from_fields(network: Any, txid: str, vout: int, scriptSig: str, sequence: str) -> "TxP2SHInput":
         address = ""
-        if input.get_scriptSig() != "":
-            address = Address.from_scriptPublicKey(network, input.get_scriptSig()[2:])
+        if scriptSig != "":
+            address = Address.from_scriptPublicKey(network, scriptSig[2:])
             if address.get_addressType() != AddressTypes.P2WPKH:
                 raise DeserializeError("The given input to decode is not an p2sh input")
             address = address.get_address()
 
-        return TxP2SHInput(txid=input.get_txid(), vout=input.get_vout(), address=address, sequence=input.get_sequence())
+        return TxP2SHInput(txid=txid, vout=vout, address=address, sequence=sequence)
 
     def __init__(self, txid: str, vout: int, address: str = "", value: int = None, sequence: str = SEQUENCE):
         self._witness = None
@@ -330,8 +348,12 @@ class TxP2WPKHInput(TxInput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxP2WPKHInput":
-        input = TxBaseInput.deserialize(network, hex)
-        return TxP2WPKHInput(txid=input.get_txid(), vout=input.get_vout(), sequence=input.get_sequence())
+        return TxP2WPKHInput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TxP2WPKHInput":
+        txid, vout, scriptSig, sequence = TxBaseInput._read_fields(reader)
+        return TxP2WPKHInput(txid=txid, vout=vout, sequence=sequence)
 
     def __init__(self, txid: str, vout: int, address: str = "", value: int = None, sequence: str = SEQUENCE):
         self._witness = None
@@ -376,10 +398,17 @@ class TxCoinbaseInput(TxInput):
     """
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxCoinbaseInput":
-        input = TxBaseInput.deserialize(network, hex)
-        if input.get_txid() != "0" * 64:
+        return TxCoinbaseInput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "TxCoinbaseInput":
+        return TxCoinbaseInput._from_fields(network, *TxBaseInput._read_fields(reader))
+
+    @staticmethod
+    def _from_fields(network: Any, txid: str, vout: int, scriptSig: str, sequence: str) -> "TxCoinbaseInput":
+        if txid != "0" * 64:
             raise DeserializeError("The given input to decode is not an coinbase input")
-        return TxCoinbaseInput(input.get_scriptSig())
+        return TxCoinbaseInput(scriptSig)
 
     def __init__(self, scriptSig: str = ""):
         txid = "0" * 64
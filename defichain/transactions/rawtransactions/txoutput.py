@@ -3,33 +3,38 @@ from typing import Any
 
 from .txbase import TxBase
 from defichain.exceptions.transactions import DeserializeError
-from defichain.transactions.constants import OPCodes, DefiTx_SIGNATURE
-from defichain.transactions.utils import Converter, Calculate
+from defichain.transactions.constants import OPCodes
+from defichain.transactions.utils import Converter, Calculate, ByteReader
 from defichain.transactions.defitx.modules.basedefitx import BaseDefiTx
 from defichain.transactions.address import Address, Script
 from defichain.transactions.defitx import DefiTx
+from defichain.transactions.defitx.defitx import DEFITX_SIGNATURE
 from defichain.networks import Network
 
+OP_RETURN = int(OPCodes.OP_RETURN, 16)
+WITNESS_COMMITMENT = bytes.fromhex("aa21a9ed")
+
 
 class TxBaseOutput(TxBase, ABC):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxOutput":
-        position = 0
-
-        value = Converter.hex_to_int(hex[position: position + 16])
-        position += 16
-
-        scriptSize = Calculate.get_lengthCompactSize(hex[position: position + 2])
-        length_script = Calculate.read_compactSize(hex[position: position + scriptSize * 2]) * 2
-        position += scriptSize * 2
-
-        script = hex[position: position + length_script]
-        position += length_script
+        return TxBaseOutput.from_reader(network, ByteReader.from_hex(hex))
 
-        tokenId = Converter.hex_to_int(hex[position: position + 2]) if hex[position: position + 2] != "" else None
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader, tokenId: bool = None) -> "TxOutput":
+        value, script, tokenId = TxBaseOutput._read_fields(reader, tokenId)
+        return TxOutput(value=value, script=script.hex(), tokenId=tokenId)
 
-        return TxOutput(value=value, script=script, tokenId=tokenId)
+    @staticmethod
+    def _read_fields(reader: ByteReader, tokenId: bool = None) -> (int, memoryview, int):
+        # Outputs of transactions with version 1 or 2 have no token id. If it is not specified, a single output
+        # has a token id when there is data left after the script.
+        value = reader.read_uint64()
+        script = reader.read_varBytes()
+        if tokenId is None:
+            tokenId = not reader.is_at_end()
+        return value, script, reader.read_uint8() if tokenId else None
 
     def __init__(self, value: int, script: str, tokenId: int = 0):
         self._value, self._script, self._tokenId = None, None, None
@@ -104,17 +109,33 @@ class TxOutput(TxBaseOutput):
         :type hex: str
         :return: "TxInput"
         """
-        output = TxBaseOutput.deserialize(network, hex)
-        if output.get_script()[0: 2] == OPCodes.OP_RETURN:
-            if DefiTx_SIGNATURE in output.get_script()[4: 16]:
-                return TxDefiOutput.deserialize(network, hex)
-            elif output.get_script()[4: 12] == "aa21a9ed":
-                return TxCoinbaseOutput.deserialize(network, hex)
+        return TxOutput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader, tokenId: bool = None) -> "TxOutput":
+        """
+        Deserializes the transaction output at the current position of the reader into an output object:
+        TxAddressOutput | TxMsgOutput | TxDefiOutput | TxCoinbaseOutput.
+
+        :param network: (required) the corresponding network from the raw transaction
+        :type network: Network
+        :param reader: (required) reader over the raw transaction
+        :type reader: ByteReader
+        :param tokenId: (optional) if the output has a token id (default=None -> if data is left after the script)
+        :type tokenId: bool
+        :return: "TxOutput"
+        """
+        value, script, tokenId = TxBaseOutput._read_fields(reader, tokenId)
+        if len(script) > 0 and script[0] == OP_RETURN:
+            if DEFITX_SIGNATURE in bytes(script[2: 8]):
+                return TxDefiOutput._from_fields(network, value, script, tokenId)
+            elif script[2: 6] == WITNESS_COMMITMENT:
+                return TxCoinbaseOutput._from_fields(network, value, script, tokenId)
             else:
-                return TxMsgOutput.deserialize(network, hex)
-        if len(output.get_script()) > 0:
-            return TxAddressOutput.deserialize(network, hex)
-        return output
+                return TxMsgOutput._from_fields(network, value, script, tokenId)
+        if len(script) > 0:
+            return TxAddressOutput._from_fields(network, value, script, tokenId)
+        return TxOutput(value=value, script=script.hex(), tokenId=tokenId)
 
     def __init__(self, value: int, script: str, tokenId: int):
         """
@@ -152,9 +173,20 @@ class TxAddressOutput(TxOutput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxAddressOutput":
-        output = TxBaseOutput.deserialize(network, hex)
-        address = Address.from_scriptPublicKey(network, output.get_script()).get_address()
-        return TxAddressOutput(value=output.get_value(), address=address, tokenId=output.get_tokenId())
+        return TxAddressOutput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader, tokenId: bool = None) -> "TxAddressOutput":
+        return TxAddressOutput._from_fields(network, *TxBaseOutput._read_fields(reader, tokenId))
+
+    @staticmethod
+    def _from_fields(network: Any, value: int, script: memoryview, tokenId: int) -> "TxAddressOutput":
+        # The address is created from the script, so it does not have to be verified and encoded again
+        script = script.hex()
+        output = TxAddressOutput.__new__(TxAddressOutput)
+        output._address = Address.scriptPublicKey_to_address(network, script)
+        TxOutput.__init__(output, value, script, tokenId)
+        return output
 
     def __init__(self, value: int, address: str, tokenId: int = 0):
         self._address = None
@@ -191,14 +223,20 @@ class TxMsgOutput(TxOutput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxMsgOutput":
-        output = TxBaseOutput.deserialize(network, hex)
-        OP_Code = output.get_script()[0: 2]
-        if OP_Code != OPCodes.OP_RETURN:
+        return TxMsgOutput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader, tokenId: bool = None) -> "TxMsgOutput":
+        return TxMsgOutput._from_fields(network, *TxBaseOutput._read_fields(reader, tokenId))
+
+    @staticmethod
+    def _from_fields(network: Any, value: int, script: memoryview, tokenId: int) -> "TxMsgOutput":
+        if len(script) == 0 or script[0] != OP_RETURN:
             raise DeserializeError("The given output to decode is not an message output (there is not OP_RETURN)")
-        length_script = Converter.hex_to_int(output.get_script()[2: 4]) * 2
-        msg = Converter.hex_to_str(output.get_script()[4: 4 + length_script])
-        txMsgOutput = TxMsgOutput(msg=msg, tokenId=output.get_tokenId())
-        txMsgOutput.set_value(output.get_value())
+        length_script = script[1] if len(script) > 1 else 0
+        msg = bytes(script[2: 2 + length_script]).decode("ascii")
+        txMsgOutput = TxMsgOutput(msg=msg, tokenId=tokenId)
+        txMsgOutput.set_value(value)
         return txMsgOutput
 
     def __init__(self, msg: str, tokenId: int = 0):
@@ -265,9 +303,19 @@ class TxDefiOutput(TxOutput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxDefiOutput":
-        output = TxBaseOutput.deserialize(network, hex)
-        defiTx = DefiTx.deserialize(network, output.get_script())
-        return TxDefiOutput(value=output.get_value(), defiTx=defiTx, tokenId=output.get_tokenId())
+        return TxDefiOutput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader, tokenId: bool = None) -> "TxDefiOutput":
+        return TxDefiOutput._from_fields(network, *TxBaseOutput._read_fields(reader, tokenId))
+
+    @staticmethod
+    def _from_fields(network: Any, value: int, script: memoryview, tokenId: int) -> "TxDefiOutput":
+        # The script is kept as it is, the defi transaction does not have to be serialized again
+        output = TxDefiOutput.__new__(TxDefiOutput)
+        output._defiTx = DefiTx.from_reader(network, ByteReader(script))
+        TxOutput.__init__(output, value, script.hex(), tokenId)
+        return output
 
     def __init__(self, value, defiTx: BaseDefiTx, tokenId: int = 0):
         self._defiTx: BaseDefiTx = None
@@ -306,10 +354,17 @@ class TxCoinbaseOutput(TxOutput):
 
     @staticmethod
     def deserialize(network: Any, hex: str) -> "TxCoinbaseOutput":
-        output = TxBaseOutput.deserialize(network, hex)
-        txCoinbaseOutput = TxCoinbaseOutput(output.get_script())
-        txCoinbaseOutput.set_value(output.get_value())
-        txCoinbaseOutput.set_tokenId(output.get_tokenId())
+        return TxCoinbaseOutput.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader, tokenId: bool = None) -> "TxCoinbaseOutput":
+        return TxCoinbaseOutput._from_fields(network, *TxBaseOutput._read_fields(reader, tokenId))
+
+    @staticmethod
+    def _from_fields(network: Any, value: int, script: memoryview, tokenId: int) -> "TxCoinbaseOutput":
+        txCoinbaseOutput = TxCoinbaseOutput(script.hex())
+        txCoinbaseOutput.set_value(value)
+        txCoinbaseOutput.set_tokenId(tokenId)
         return txCoinbaseOutput
 
     def __init__(self, script: str):
@@ -2,7 +2,7 @@ from abc import ABC
 from typing import Any
 
 from defichain.exceptions.transactions import RawTransactionError
-from defichain.transactions.utils import Converter, Calculate
+from defichain.transactions.utils import Converter, Calculate, ByteReader
 from defichain.transactions.address.address import Address
 from defichain.transactions.rawtransactions.txbase import TxBase
 from defichain.transactions.rawtransactions.txinput import TxP2WPKHInput
@@ -128,22 +128,13 @@ class WitnessHashBase(TxBase, ABC):
         return self.get_bytes_txid_from_input(input) + self.get_bytes_index_from_input(input)
 
     def hash_prevOuts(self) -> bytes:
-        outpoint = b''
-        for input in self.get_inputs():
-            outpoint += self.outpoint(input)
-        return Calculate.dHash256(outpoint)
+        return self._tx.get_bytes_hashPrevOuts()
 
     def hash_sequences(self) -> bytes:
-        sequences = b''
-        for input in self.get_inputs():
-            sequences += self.get_bytes_sequence_from_input(input)
-        return Calculate.dHash256(sequences)
+        return self._tx.get_bytes_hashSequences()
 
     def hash_outputs(self) -> bytes:
-        outputs = b''
-        for output in self.get_outputs():
-            outputs += bytes(output)
-        return Calculate.dHash256(outputs)
+        return self._tx.get_bytes_hashOutputs()
 
 
 class WitnessBase(TxBase, ABC):
@@ -196,6 +187,10 @@ class WitnessHash(WitnessHashBase):
     def deserialize(network: Any, hex: str) -> "WitnessHash":
         raise RawTransactionError("The witness hash cannot be deserialized")
 
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "WitnessHash":
+        raise RawTransactionError("The witness hash cannot be deserialized")
+
     def __init__(self, tx, input: TxP2WPKHInput):
         super().__init__(tx, input)
 
@@ -204,8 +199,9 @@ class WitnessHash(WitnessHashBase):
         result += self.hash_prevOuts()
         result += self.hash_sequences()
         result += self.outpoint(self.get_input())
-        result += Converter.int_to_bytes(len(self.get_bytes_redeemScript()), 1)
-        result += self.get_bytes_redeemScript()  # Length is no longer part of redeem script
+        redeemScript = self.get_bytes_redeemScript()
+        result += Converter.int_to_bytes(len(redeemScript), 1)
+        result += redeemScript  # Length is no longer part of redeem script
         result += self.get_bytes_value_from_input(self.get_input())
         result += self.get_bytes_sequence_from_input(self.get_input())
         result += self.hash_outputs()
@@ -220,10 +216,12 @@ class WitnessHash(WitnessHashBase):
 class Witness(WitnessBase):
     @staticmethod
     def deserialize(network: Any, hex: str) -> "Witness":
-        length_signature = Converter.hex_to_int(hex[:2]) * 2
-        length_publicKey = Converter.hex_to_int(hex[2 + length_signature: 2 + length_signature + 2]) * 2
-        signature = hex[2:length_signature + 2]
-        publicKey = hex[2 + length_signature + 2: 2 + length_signature + 2 + length_publicKey]
+        return Witness.from_reader(network, ByteReader.from_hex(hex))
+
+    @staticmethod
+    def from_reader(network: Any, reader: ByteReader) -> "Witness":
+        signature = reader.read_varBytes().hex()
+        publicKey = reader.read_varBytes().hex()
         return Witness(signature=signature, publicKey=publicKey)
 
     def __init__(self, signature: str, publicKey: str):
@@ -1,3 +1,4 @@
 # Remote Data Source
 from .ocean import RemoteDataOcean
 from .node import RemoteDataNode
+from .tracker import RemoteDataTracker
@@ -8,9 +8,8 @@ class RemoteDataOcean(RemoteData):
         self.ocean = source
 
     def get_unspent(self, address: str) -> [{}]:
-        data = self.ocean.address.listTransactionUnspent(address, 200)["data"]
         unspent = []
-        for u in data:
+        for u in self.ocean.address.iter_listTransactionUnspent(address, 200):
             txid = u["vout"]["txid"]
             index = u["vout"]["n"]
             value = int(round(float(u["vout"]["value"]) * 100000000))
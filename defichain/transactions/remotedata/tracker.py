@@ -0,0 +1,351 @@
+import json
+import os
+import threading
+import time
+
+from defichain import Node, Ocean
+from defichain.exceptions.transactions import TxBuilderError
+from defichain.transactions.address import Address
+from defichain.transactions.constants import MEMPOOL_ANCESTOR_LIMIT
+from defichain.transactions.rawtransactions.block import Block
+from defichain.transactions.rawtransactions.txinput import TxBaseInput
+from defichain.transactions.rawtransactions.txoutput import TxBaseOutput
+from defichain.transactions.utils import ByteReader
+from .remotedata import RemoteData
+from .node import RemoteDataNode
+from .ocean import RemoteDataOcean
+
+RESERVATION_TIMEOUT = 60  # seconds until outpoints of a transaction that was not sent can be spent again
+
+
+def _outpoint(txid: str, vout: int) -> str:
+    return f"{txid}:{vout}"
+
+
+def _read_transaction(raw: "bytes | memoryview") -> (str, [(str, int)], [(int, str, int)]):
+    # Reads only the outpoints and outputs of a serialized transaction, the custom transaction is not decoded
+    txid = Block.calculate_txid(raw)
+    reader = ByteReader(raw)
+    version = reader.read_uint32()
+    if reader.remaining() >= 2 and reader.peek(2) == b"\x00\x01":
+        reader.skip(2)
+    inputs = [TxBaseInput._read_fields(reader)[:2] for _ in range(reader.read_compactSize())]
+    tokenId = not (version == 1 or version == 2)
+    outputs = []
+    for _ in range(reader.read_compactSize()):
+        value, script, outputTokenId = TxBaseOutput._read_fields(reader, tokenId)
+        outputs.append((value, script.hex(), outputTokenId))
+    return txid, inputs, outputs
+
+
+class RemoteDataTracker(RemoteData):
+    """
+    Keeps the unspent outputs of addresses in memory, so that transactions can be built one after another
+    without asking the node or ocean for the unspent outputs every time.
+
+    The unspent outputs of an address are loaded once from the wrapped data source with all pages. After that,
+    they are updated from the transactions sent through the tracker and from the confirmed blocks given to
+    :meth:`apply_block`. The change of a sent transaction can be spent at once, before it is confirmed.
+
+    The inputs of a signed transaction are reserved: they are not returned by :meth:`get_unspent` until the
+    transaction is sent, the reservation is released or it times out. Unconfirmed outputs are not returned either,
+    if a transaction spending them would exceed the limit of unconfirmed ancestors of the mempool.
+
+    If a path is given, the state is saved as json file after every change and loaded on start.
+
+    :param source: (required) the data source to load the unspent outputs from
+    :type source: Ocean | Node | RemoteData
+    :param path: (optional) json file to save the state to
+    :type path: str
+    :param reservationTimeout: (optional) seconds until reserved outputs can be spent again (default=60)
+    :type reservationTimeout: float
+    :param maxAncestors: (optional) maximum number of unconfirmed transactions in a chain (default=25)
+    :type maxAncestors: int
+
+    :example:
+
+        >>> from defichain import Ocean, TxBuilder
+        >>> from defichain.transactions.remotedata import RemoteDataTracker
+        >>>
+        >>> tracker = RemoteDataTracker(Ocean(), "utxo.json")
+        >>> builder = TxBuilder(address, account, tracker)
+        >>>
+        >>> # The second transaction spends the change of the first one, without waiting for a block
+        >>> builder.send_tx(builder.utxo.send(1, addressTo))
+        >>> builder.send_tx(builder.utxo.send(1, addressTo))
+        >>>
+        >>> # For every new block, for example from the zmq subscriber
+        >>> tracker.apply_block(Block.deserialize(DefichainMainnet, node.blockchain.getblock(blockhash, 0)))
+    """
+
+    def __init__(self, source: "Ocean | Node | RemoteData", path: str = None,
+                 reservationTimeout: float = RESERVATION_TIMEOUT, maxAncestors: int = MEMPOOL_ANCESTOR_LIMIT):
+        if isinstance(source, Ocean):
+            source = RemoteDataOcean(source)
+        elif isinstance(source, Node):
+            source = RemoteDataNode(source)
+        elif not isinstance(source, RemoteData):
+            raise TxBuilderError("The given source is currently not usable")
+        self.source = source
+        self._path = path
+        self._reservationTimeout = reservationTimeout
+        self._maxAncestors = maxAncestors
+        self._lock = threading.RLock()
+
+        self._addresses = {}  # address -> {outpoint: unspent}
+        self._scripts = {}  # script public key -> address
+        self._spent = {}  # outpoint -> {txid: unconfirmed transaction which spends it, address, unspent}
+        self._mempool = {}  # txid of an unconfirmed transaction -> set of its unconfirmed ancestors
+        self._reserved = {}  # outpoint -> time until it is reserved
+
+        if path is not None and os.path.exists(path):
+            self._load_file()
+
+    # Remote Data
+    def get_unspent(self, address: str) -> [{}]:
+        """
+        Returns the unspent outputs of the address without the reserved ones and without unconfirmed ones at the
+        ancestor limit. The unspent outputs are loaded from the data source on first use.
+
+        :param address: (required) the address
+        :type address: str
+        :return: [{txid: str, vout: int, value: int, scriptPubKey: str, confirmed: bool}, ...]
+        """
+        with self._lock:
+            if address not in self._addresses:
+                self.sync(address)
+            now = time.monotonic()
+            return [dict(unspent) for outpoint, unspent in self._addresses[address].items()
+                    if self._reserved.get(outpoint, 0) <= now and
+                    self.get_ancestor_count(unspent["txid"]) < self._maxAncestors]
+
+    def test_tx(self, hex: str, maxFeeRate: float = None) -> bool:
+        return self.source.test_tx(hex, maxFeeRate)
+
+    def send_tx(self, hex: str, maxFeeRate: float = None) -> str:
+        """
+        Sends the transaction with the data source and applies it to the tracked addresses
+
+        :param hex: (required) the signed transaction
+        :type hex: str
+        :param maxFeeRate: (optional) maximum fee rate
+        :type maxFeeRate: float
+        :return: txid
+        """
+        txid = self.source.send_tx(hex, maxFeeRate)
+        self.add_transaction(hex)
+        return txid
+
+    # Tracking
+    def sync(self, address: str = None) -> None:
+        """
+        Loads the unspent outputs of the address from the data source again. Outputs that are spent by
+        unconfirmed transactions are left out and the unconfirmed outputs of these transactions are kept.
+        Unconfirmed transactions whose outputs are returned by the data source are confirmed, together with
+        their ancestors.
+
+        :param address: (optional) the address (default=None -> all tracked addresses)
+        :type address: str
+        """
+        with self._lock:
+            for address in [address] if address is not None else list(self._addresses):
+                entries = self.source.get_unspent(address)
+                confirmed = set()
+                for entry in entries:
+                    if entry["txid"] in self._mempool:
+                        confirmed |= self._mempool[entry["txid"]] | {entry["txid"]}
+                for txid in confirmed:
+                    self._confirm_transaction(txid)
+
+                unspent = {}
+                for entry in entries:
+                    outpoint = _outpoint(entry["txid"], entry["vout"])
+                    if outpoint not in self._spent:
+                        unspent[outpoint] = dict(entry, confirmed=True)
+                for outpoint, entry in self._addresses.get(address, {}).items():
+                    if entry["txid"] in self._mempool:
+                        unspent[outpoint] = entry
+                self._addresses[address] = unspent
+                self._scripts[Address.from_address(address).get_scriptPublicKey()] = address
+            self._save()
+
+    def add_transaction(self, tx: "str | bytes") -> str:
+        """
+        Applies an unconfirmed transaction: its inputs are spent and its outputs to tracked addresses can be used.
+        Transactions sent through the tracker are added automatically.
+
+        :param tx: (required) the serialized transaction as hex or bytes
+        :type tx: str | bytes
+        :return: txid
+        """
+        raw = bytes.fromhex(tx) if isinstance(tx, str) else tx
+        with self._lock:
+            txid = self._apply_transaction(*_read_transaction(raw), confirmed=False)
+            self._save()
+        return txid
+
+    def remove_transaction(self, txid: str) -> None:
+        """
+        Removes an unconfirmed transaction and its descendants, for example if it could not be sent. The outputs
+        spent by it can be used again.
+
+        :param txid: (required) the transaction
+        :type txid: str
+        """
+        with self._lock:
+            self._drop_transaction(txid, restore=True)
+            self._save()
+
+    def apply_block(self, block: Block) -> None:
+        """
+        Applies all transactions of a confirmed block to the tracked addresses. Unconfirmed transactions, which
+        spend the same outputs as a transaction of the block, are dropped with their descendants.
+
+        :param block: (required) the block
+        :type block: Block
+        """
+        with self._lock:
+            for raw in block.iter_raw_transactions():
+                self._apply_transaction(*_read_transaction(raw), confirmed=True)
+            self._save()
+
+    def reserve(self, outpoints: [(str, int)], timeout: float = None) -> None:
+        """
+        Reserves outputs, so that they are not returned by :meth:`get_unspent`. The inputs of transactions signed
+        by the builder are reserved automatically.
+
+        :param outpoints: (required) [(txid, vout), ...]
+        :type outpoints: [(str, int)]
+        :param timeout: (optional) seconds until the reservation expires (default=reservationTimeout)
+        :type timeout: float
+        """
+        until = time.monotonic() + (self._reservationTimeout if timeout is None else timeout)
+        with self._lock:
+            for txid, vout in outpoints:
+                self._reserved[_outpoint(txid, vout)] = until
+
+    def release(self, outpoints: [(str, int)]) -> None:
+        """
+        Releases reserved outputs, for example of a transaction that will not be sent
+
+        :param outpoints: (required) [(txid, vout), ...]
+        :type outpoints: [(str, int)]
+        """
+        with self._lock:
+            for txid, vout in outpoints:
+                self._reserved.pop(_outpoint(txid, vout), None)
+
+    # Get Information
+    def get_addresses(self) -> [str]:
+        return list(self._addresses)
+
+    def get_balance(self, address: str) -> int:
+        """
+        Returns the value of all unspent outputs of the address in satoshi, including the reserved ones
+
+        :param address: (required) the address
+        :type address: str
+        :return: int
+        """
+        with self._lock:
+            if address not in self._addresses:
+                self.sync(address)
+            return sum(unspent["value"] for unspent in self._addresses[address].values())
+
+    def get_ancestor_count(self, txid: str) -> int:
+        """
+        Returns the number of unconfirmed transactions a new transaction would have as ancestors if it spends an
+        output of the given transaction. Confirmed transactions return zero.
+
+        :param txid: (required) the transaction
+        :type txid: str
+        :return: int
+        """
+        with self._lock:
+            ancestors = self._mempool.get(txid)
+            return 0 if ancestors is None else len(ancestors) + 1
+
+    # Internal
+    def _apply_transaction(self, txid: str, inputs: [(str, int)], outputs: [(int, str, int)],
+                           confirmed: bool) -> str:
+        ancestors = set()
+        for inputTxid, vout in inputs:
+            outpoint = _outpoint(inputTxid, vout)
+            spent = {"txid": txid, "address": None, "unspent": None}
+            for address, unspent in self._addresses.items():
+                if outpoint in unspent:
+                    spent.update(address=address, unspent=unspent.pop(outpoint))
+            self._reserved.pop(outpoint, None)
+            if confirmed:
+                spender = self._spent.pop(outpoint, None)
+                if spender is not None and spender["txid"] != txid:
+                    self._drop_transaction(spender["txid"])  # The output was spent by a different transaction
+            else:
+                self._spent.setdefault(outpoint, spent)
+                if inputTxid in self._mempool:
+                    ancestors |= self._mempool[inputTxid] | {inputTxid}
+
+        for vout, (value, script, tokenId) in enumerate(outputs):
+            address = self._scripts.get(script)
+            outpoint = _outpoint(txid, vout)
+            if address is None or tokenId not in (0, None) or outpoint in self._spent:
+                continue
+            self._addresses[address][outpoint] = {"txid": txid, "vout": vout, "value": value, "scriptPubKey": script,
+                                                  "confirmed": confirmed}
+
+        if confirmed:
+            if self._mempool.pop(txid, None) is not None:
+                for others in self._mempool.values():
+                    others.discard(txid)
+        else:
+            self._mempool[txid] = ancestors
+        return txid
+
+    def _confirm_transaction(self, txid: str) -> None:
+        # An unconfirmed transaction was included in a block: the outputs spent by it are gone for good and its
+        # outputs no longer count as ancestors
+        if self._mempool.pop(txid, None) is None:
+            return
+        for others in self._mempool.values():
+            others.discard(txid)
+        for outpoint in [outpoint for outpoint, spent in self._spent.items() if spent["txid"] == txid]:
+            del self._spent[outpoint]
+        for unspent in self._addresses.values():
+            for entry in unspent.values():
+                if entry["txid"] == txid:
+                    entry["confirmed"] = True
+
+    def _drop_transaction(self, txid: str, restore: bool = False) -> None:
+        # Removes an unconfirmed transaction and all of its descendants. With restore, the outputs they spent are
+        # unspent again, unless they belong to a removed transaction.
+        if self._mempool.pop(txid, None) is None:
+            return
+        for unspent in self._addresses.values():
+            for outpoint in [outpoint for outpoint, entry in unspent.items() if entry["txid"] == txid]:
+                del unspent[outpoint]
+        for outpoint in [outpoint for outpoint, spent in self._spent.items() if spent["txid"] == txid]:
+            spent = self._spent.pop(outpoint)
+            entry = spent["unspent"]
+            if restore and entry is not None and (entry["confirmed"] or entry["txid"] in self._mempool):
+                self._addresses[spent["address"]][outpoint] = entry
+        for descendant in [other for other, ancestors in self._mempool.items() if txid in ancestors]:
+            self._drop_transaction(descendant, restore)
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        state = {"addresses": self._addresses, "spent": self._spent,
+                 "mempool": {txid: sorted(ancestors) for txid, ancestors in self._mempool.items()}}
+        temporary = f"{self._path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(state, file)
+        os.replace(temporary, self._path)  # The file is never left half written
+
+    def _load_file(self) -> None:
+        with open(self._path) as file:
+            state = json.load(file)
+        self._addresses = state["addresses"]
+        self._spent = state["spent"]
+        self._mempool = {txid: set(ancestors) for txid, ancestors in state["mempool"].items()}
+        for address in self._addresses:
+            self._scripts[Address.from_address(address).get_scriptPublicKey()] = address
@@ -4,11 +4,16 @@ from .converter import Converter
 # Calculate
 from .calculate import Calculate
 
+# Read and Write
+from .bytereader import ByteReader
+from .bytewriter import ByteWriter
+
 # Verify
 from .verify import Verify
 
 # Tokens
 from .token import Token
+from .tokenregistry import TokenRegistry
 
 # Build
 from defichain.node.util import BuildAmounts, BuildAddressAmounts
@@ -0,0 +1,166 @@
+import struct
+
+from defichain.exceptions.transactions import DeserializeError
+
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+
+
+class ByteReader:
+    """
+    Cursor over raw bytes, used to deserialize transactions without converting them to hex first.
+
+    The reader keeps a memoryview of the given data: integers are read in place and slices are returned as
+    memoryview without copying the underlying buffer.
+
+    :param data: (required) raw bytes to read
+    :type data: bytes | bytearray | memoryview
+    :param position: (optional) position to start reading from (default=0)
+    :type position: int
+
+    :example:
+
+        >>> from defichain.transactions.utils import ByteReader
+        >>>
+        >>> reader = ByteReader.from_hex("04000000")
+        >>> reader.read_uint32()
+        4
+    """
+
+    @staticmethod
+    def from_hex(hex: str) -> "ByteReader":
+        """
+        Creates a reader over the bytes of the given hexadecimal string
+
+        :param hex: (required) hexadecimal string
+        :type hex: str
+        :return: ByteReader
+        """
+        try:
+            return ByteReader(bytes.fromhex(hex))
+        except (ValueError, TypeError):
+            raise DeserializeError("The given data is not an hexadecimal string")
+
+    def __init__(self, data: "bytes | bytearray | memoryview", position: int = 0):
+        self._data = data if isinstance(data, memoryview) else memoryview(data)
+        self._position = position
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # Position
+    def get_position(self) -> int:
+        return self._position
+
+    def set_position(self, position: int) -> None:
+        if not 0 <= position <= len(self._data):
+            raise DeserializeError(f"The position {position} is outside of the data")
+        self._position = position
+
+    def remaining(self) -> int:
+        return len(self._data) - self._position
+
+    def is_at_end(self) -> bool:
+        return self._position >= len(self._data)
+
+    def skip(self, length: int) -> None:
+        self._check(length)
+        self._position += length
+
+    # Read
+    def read(self, length: int) -> memoryview:
+        """
+        Reads the given number of bytes without copying them
+
+        :param length: (required) number of bytes
+        :type length: int
+        :return: memoryview
+        """
+        self._check(length)
+        start = self._position
+        self._position += length
+        return self._data[start: self._position]
+
+    def read_bytes(self, length: int) -> bytes:
+        return bytes(self.read(length))
+
+    def read_hex(self, length: int) -> str:
+        return self.read(length).hex()
+
+    def read_reversed_hex(self, length: int) -> str:
+        """
+        Reads the given number of bytes as hexadecimal string in reversed byte order, for example txids
+
+        :param length: (required) number of bytes
+        :type length: int
+        :return: str
+        """
+        return self.read(length)[::-1].hex()
+
+    def peek(self, length: int = 1) -> memoryview:
+        self._check(length)
+        return self._data[self._position: self._position + length]
+
+    def peek_uint8(self) -> int:
+        self._check(1)
+        return self._data[self._position]
+
+    def read_uint8(self) -> int:
+        self._check(1)
+        self._position += 1
+        return self._data[self._position - 1]
+
+    def read_uint16(self) -> int:
+        return self._unpack(_UINT16)
+
+    def read_uint32(self) -> int:
+        return self._unpack(_UINT32)
+
+    def read_uint64(self) -> int:
+        return self._unpack(_UINT64)
+
+    def read_compactSize(self) -> int:
+        """
+        Reads a compact size integer: one byte or a marker fd, fe, ff followed by two, four or eight bytes
+
+        :return: int
+        """
+        size = self.read_uint8()
+        if size == 0xfd:
+            return self.read_uint16()
+        elif size == 0xfe:
+            return self.read_uint32()
+        elif size == 0xff:
+            return self.read_uint64()
+        return size
+
+    def read_varBytes(self) -> memoryview:
+        """
+        Reads bytes prefixed with their length as compact size
+
+        :return: memoryview
+        """
+        return self.read(self.read_compactSize())
+
+    def sub_reader(self, length: int) -> "ByteReader":
+        """
+        Reads the given number of bytes into a new reader, which shares the underlying buffer
+
+        :param length: (required) number of bytes
+        :type length: int
+        :return: ByteReader
+        """
+        return ByteReader(self.read(length))
+
+    # Internal
+    def _check(self, length: int) -> None:
+        if length < 0 or self._position + length > len(self._data):
+            raise DeserializeError(f"Unexpected end of data: {length} bytes requested at position {self._position}, "
+                                   f"but only {len(self._data) - self._position} bytes remain")
+
+    def _unpack(self, format: struct.Struct) -> int:
+        self._check(format.size)
+        value = format.unpack_from(self._data, self._position)[0]
+        self._position += format.size
+        return value
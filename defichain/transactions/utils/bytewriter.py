@@ -0,0 +1,79 @@
+import struct
+
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+
+
+class ByteWriter:
+    """
+    Buffer to serialize transactions in a single pass, the counterpart of ByteReader.
+
+    All parts are appended to one growing bytearray, instead of concatenating bytes objects, which copies the
+    whole result for every part.
+
+    :example:
+
+        >>> from defichain.transactions.utils import ByteWriter
+        >>>
+        >>> writer = ByteWriter()
+        >>> writer.write_uint32(4)
+        >>> writer.write_varBytes(b"abc")
+        >>> writer.getvalue().hex()
+        '0400000003616263'
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    # Write
+    def write(self, data: "bytes | bytearray | memoryview") -> None:
+        self._buffer += data
+
+    def write_uint8(self, value: int) -> None:
+        self._buffer.append(value)
+
+    def write_uint16(self, value: int) -> None:
+        self._buffer += _UINT16.pack(value)
+
+    def write_uint32(self, value: int) -> None:
+        self._buffer += _UINT32.pack(value)
+
+    def write_uint64(self, value: int) -> None:
+        self._buffer += _UINT64.pack(value)
+
+    def write_compactSize(self, size: int) -> None:
+        """
+        Writes a compact size integer: one byte or a marker fd, fe, ff followed by two, four or eight bytes
+
+        :param size: (required) the integer to write
+        :type size: int
+        """
+        if size < 0xfd:
+            self._buffer.append(size)
+        elif size <= 0xffff:
+            self._buffer.append(0xfd)
+            self.write_uint16(size)
+        elif size <= 0xffffffff:
+            self._buffer.append(0xfe)
+            self.write_uint32(size)
+        else:
+            self._buffer.append(0xff)
+            self.write_uint64(size)
+
+    def write_varBytes(self, data: "bytes | bytearray | memoryview") -> None:
+        """
+        Writes bytes prefixed with their length as compact size
+
+        :param data: (required) the bytes to write
+        :type data: bytes | bytearray | memoryview
+        """
+        self.write_compactSize(len(data))
+        self._buffer += data
+
+    # Result
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
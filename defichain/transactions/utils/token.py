@@ -1,11 +1,9 @@
 from typing import Any
 
-from defichain import Ocean
 from .verify import Verify
+from .tokenregistry import TokenRegistry
 from defichain.exceptions.transactions import TokenError
-from defichain.transactions.constants.tokens import Tokens, TokenTypes
-
-ocean = Ocean()
+from defichain.transactions.constants.tokens import TokenTypes
 
 
 class Token:
@@ -13,44 +11,28 @@ class Token:
 
     @staticmethod
     def _get_tokens(network: Any, TYPE: str) -> [{}]:
-        if TYPE == TokenTypes.STANDARD:
-            return Tokens.get_standardTokens(network)
-        elif TYPE == TokenTypes.LIQUIDITY:
-            return Tokens.get_liquidityTokens(network)
-        elif TYPE == TokenTypes.LOAN:
-            return Tokens.get_loanTokens(network)
-        elif TYPE == TokenTypes.CUSTOM:
-            return Tokens.get_customTokens(network)
-        else:
-            raise TokenError("The given tokens type is not valid.\n"
-                             "Use the token types in defichain.transaction.constance.tokens.")
+        return TokenRegistry.get_registry(network).get_tokens(TYPE)
 
     @staticmethod
     def get_symbol_from_id(network: Any, tokenId: int) -> str:
-        for _type in Token.TOKEN_TYPES:
-            tokens = Token._get_tokens(network, _type)
-            for token in tokens:
-                if token["id"] == str(tokenId):
-                    return token["symbol"]
-        raise TokenError(f"The given id: {tokenId} does not exist. Check your token id input.")
+        token = TokenRegistry.get_registry(network).get_token_by_id(tokenId)
+        if token is None:
+            raise TokenError(f"The given id: {tokenId} does not exist. Check your token id input.")
+        return token["symbol"]
 
     @staticmethod
     def get_id_from_symbol(network: Any, symbol: str) -> int:
-        for _type in Token.TOKEN_TYPES:
-            tokens = Token._get_tokens(network, _type)
-            for token in tokens:
-                if token["symbol"] == str(symbol):
-                    return int(token["id"])
-        raise TokenError(f"The given symbol: {symbol} does not exist. Check your input.")
+        token = TokenRegistry.get_registry(network).get_token_by_symbol(symbol)
+        if token is None:
+            raise TokenError(f"The given symbol: {symbol} does not exist. Check your input.")
+        return int(token["id"])
 
     @staticmethod
     def get_name_from_id(network: Any, tokenId: int) -> str:
-        for _type in Token.TOKEN_TYPES:
-            tokens = Token._get_tokens(network, _type)
-            for token in tokens:
-                if token["id"] == str(tokenId):
-                    return token["name"]
-        raise TokenError(f"The given id: {tokenId} does not exist. Check your token id input.")
+        token = TokenRegistry.get_registry(network).get_token_by_id(tokenId)
+        if token is None:
+            raise TokenError(f"The given id: {tokenId} does not exist. Check your token id input.")
+        return token["name"]
 
     @staticmethod
     def verify_tokenId(network: Any, tokenId: int) -> bool:
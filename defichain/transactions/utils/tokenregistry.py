@@ -0,0 +1,267 @@
+from typing import Any
+
+import logging
+import os
+import threading
+import time
+import traceback
+
+from defichain.exceptions.transactions import TokenError
+from defichain.transactions.constants.tokens import Tokens, TokenTypes
+
+NODE_PAGE_SIZE = 1000
+OCEAN_PAGE_SIZE = 200
+
+
+class TokenRegistry:
+    """
+    Process wide, in memory index of all tokens of a network.
+
+    The registry of a network is created on first use and loads the token files shipped with the package once
+    into an id and a symbol index. It can be refreshed from an ocean or node instance at runtime, so that new
+    tokens are known without rewriting the package files. If a source with a ttl is set, the registry refreshes
+    itself on the next lookup after the ttl has expired.
+
+    :example:
+
+        >>> from defichain import Ocean
+        >>> from defichain.networks import DefichainMainnet
+        >>> from defichain.transactions.utils import TokenRegistry
+        >>>
+        >>> registry = TokenRegistry.get_registry(DefichainMainnet)
+        >>> registry.get_token_by_symbol("DUSD")
+        >>> registry.set_source(Ocean(), ttl=3600)  # refresh once an hour
+    """
+
+    _registries = {}
+    _registries_lock = threading.Lock()
+
+    @staticmethod
+    def get_registry(network: Any) -> "TokenRegistry":
+        """
+        Returns the registry of the given network. The registry is created once per process.
+
+        :param network: (required) the network of the registry
+        :type network: Network
+        :return: TokenRegistry
+        """
+        registry = TokenRegistry._registries.get(network.NETWORK)
+        if registry is None:
+            with TokenRegistry._registries_lock:
+                registry = TokenRegistry._registries.get(network.NETWORK)
+                if registry is None:
+                    registry = TokenRegistry(network)
+                    TokenRegistry._registries[network.NETWORK] = registry
+        return registry
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Drops the registries of all networks, they are loaded again on next use
+        """
+        with TokenRegistry._registries_lock:
+            TokenRegistry._registries = {}
+
+    def __init__(self, network: Any):
+        self._network = network
+        self._lock = threading.RLock()
+        self._tokens_by_id = {}
+        self._tokens_by_symbol = {}
+        self._source = None
+        self._ttl = None
+        self._last_refresh = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._tokens_by_id)
+
+    def __contains__(self, token: "int | str") -> bool:
+        return self.get_token_by_id(token) is not None or self.get_token_by_symbol(token) is not None
+
+    # Lookup
+    def get_token_by_id(self, tokenId: "int | str") -> "{} | None":
+        """
+        Returns the token with the given id or None if the id is not known
+
+        :param tokenId: (required) id of the token
+        :type tokenId: int | str
+        :return: {"id": ..., "symbol": ..., "name": ..., "isDAT": ..., "isLPS": ..., "isLoanToken": ...} | None
+        """
+        self._refresh_if_expired()
+        return self._tokens_by_id.get(str(tokenId))
+
+    def get_token_by_symbol(self, symbol: str) -> "{} | None":
+        """
+        Returns the token with the given symbol or None if the symbol is not known.
+
+        If a custom token uses the same symbol as a DAT token, the DAT token is returned.
+
+        :param symbol: (required) symbol of the token
+        :type symbol: str
+        :return: {"id": ..., "symbol": ..., "name": ..., "isDAT": ..., "isLPS": ..., "isLoanToken": ...} | None
+        """
+        self._refresh_if_expired()
+        return self._tokens_by_symbol.get(str(symbol))
+
+    def get_tokens(self, TYPE: str = None) -> [{}]:
+        """
+        Returns all tokens or all tokens of the given type ordered by id
+
+        :param TYPE: (optional) token type of defichain.transactions.constants.TokenTypes
+        :type TYPE: str
+        :return: [{...}] (array) -- list of tokens
+        """
+        if TYPE is not None and TYPE not in (TokenTypes.STANDARD, TokenTypes.LOAN, TokenTypes.LIQUIDITY,
+                                             TokenTypes.CUSTOM):
+            raise TokenError("The given tokens type is not valid.\n"
+                             "Use the token types in defichain.transaction.constance.tokens.")
+        self._refresh_if_expired()
+        tokens = sorted(self._tokens_by_id.values(), key=lambda token: int(token["id"]))
+        if TYPE is None:
+            return tokens
+        return [token for token in tokens if TYPE in TokenRegistry._get_types(token)]
+
+    # Update
+    def add(self, token: {}) -> None:
+        """
+        Adds a token to the registry or replaces the token with the same id
+
+        :param token: (required) token with the keys id, symbol, name, isDAT, isLPS and isLoanToken
+        :type token: json object
+        """
+        self.add_tokens([token])
+
+    def add_tokens(self, tokens: [{}]) -> None:
+        """
+        Adds multiple tokens to the registry and replaces tokens with the same id
+
+        :param tokens: (required) list of tokens with the keys id, symbol, name, isDAT, isLPS and isLoanToken
+        :type tokens: [json object]
+        """
+        tokens = [TokenRegistry._normalize(token) for token in tokens]
+        with self._lock:
+            tokens_by_id = dict(self._tokens_by_id)
+            for token in tokens:
+                tokens_by_id[token["id"]] = token
+            self._set_index(tokens_by_id)
+
+    def set_source(self, source: Any, ttl: float = None, refresh: bool = True) -> None:
+        """
+        Sets the ocean or node instance the registry is refreshed from
+
+        :param source: (required) Ocean or Node instance, None removes the source
+        :type source: Ocean | Node
+        :param ttl: (optional) seconds after which the registry refreshes itself on the next lookup
+            (default=None -> only refreshed by calling refresh)
+        :type ttl: float
+        :param refresh: (optional) refresh the registry immediately (default=True)
+        :type refresh: bool
+        """
+        if ttl is not None and ttl <= 0:
+            raise TokenError("The ttl of the token registry has to be greater than zero")
+        if source is not None:
+            TokenRegistry._check_source(source)
+        with self._lock:
+            self._source = source
+            self._ttl = ttl
+        if source is not None and refresh:
+            self.refresh()
+
+    def refresh(self, source: Any = None) -> None:
+        """
+        Loads all tokens from the given source or the source of the registry and adds them to the registry
+
+        :param source: (optional) Ocean or Node instance (default=None -> source of the registry)
+        :type source: Ocean | Node
+        """
+        source = source if source is not None else self._source
+        if source is None:
+            raise TokenError("The token registry has no source to refresh from. Use set_source or pass a source.")
+
+        with self._lock:
+            tokens = TokenRegistry._fetch_tokens(source)
+            self.add_tokens(tokens)
+            self._last_refresh = time.monotonic()
+
+    # Internal
+    def _load(self) -> None:
+        tokens_by_id = {}
+        for _type in (TokenTypes.STANDARD, TokenTypes.LOAN, TokenTypes.LIQUIDITY, TokenTypes.CUSTOM):
+            path = f"{Tokens.PATH}/{self._network.NETWORK}/{_type}_tokens.json"
+            if not os.path.exists(path):  # no token files are shipped for regtest
+                continue
+            for token in Tokens.get_tokens(self._network, _type):
+                tokens_by_id.setdefault(str(token["id"]), TokenRegistry._normalize(token))
+        self._set_index(tokens_by_id)
+
+    def _set_index(self, tokens_by_id: {}) -> None:
+        # DAT tokens take precedence over custom tokens with the same symbol
+        tokens_by_symbol = {}
+        for token in sorted(tokens_by_id.values(), key=lambda token: (not token["isDAT"], int(token["id"]))):
+            tokens_by_symbol.setdefault(token["symbol"], token)
+
+        # Both indexes are replaced at once, so that lookups never see a half updated registry
+        self._tokens_by_id, self._tokens_by_symbol = tokens_by_id, tokens_by_symbol
+
+    def _refresh_if_expired(self) -> None:
+        if self._source is None or self._ttl is None:
+            return
+        if self._last_refresh is not None and time.monotonic() - self._last_refresh < self._ttl:
+            return
+        with self._lock:
+            if self._last_refresh is not None and time.monotonic() - self._last_refresh < self._ttl:
+                return  # refreshed by another thread in the meantime
+            try:
+                self.refresh()
+            except Exception as e:
+                # The known tokens stay usable, the next refresh is tried after another ttl
+                self._last_refresh = time.monotonic()
+                logging.warning(f"The token registry could not be refreshed: {e}")
+                logging.debug(traceback.format_exc())
+
+    @staticmethod
+    def _check_source(source: Any) -> None:
+        from defichain import Ocean, Node
+
+        if not isinstance(source, (Ocean, Node)):
+            raise TokenError("The source of the token registry has to be an Ocean or Node instance")
+
+    @staticmethod
+    def _fetch_tokens(source: Any) -> [{}]:
+        from defichain import Ocean
+
+        TokenRegistry._check_source(source)
+        if isinstance(source, Ocean):
+            return list(source.tokens.iter_list(size=OCEAN_PAGE_SIZE))
+        else:
+            tokens = []
+            start = None
+            while True:
+                page = source.tokens.listtokens(start=start, including_start=False if start is not None else None,
+                                                limit=NODE_PAGE_SIZE)
+                for id, token in page.items():
+                    tokens.append(dict(token, id=id))
+                if len(page) < NODE_PAGE_SIZE:
+                    return tokens
+                start = max(int(id) for id in page)
+
+    @staticmethod
+    def _normalize(token: {}) -> {}:
+        try:
+            return {"id": str(token["id"]), "symbol": token["symbol"], "name": token["name"],
+                    "isDAT": token["isDAT"], "isLPS": token["isLPS"], "isLoanToken": token["isLoanToken"]}
+        except KeyError as e:
+            raise TokenError(f"The given token is missing the key: {e}")
+
+    @staticmethod
+    def _get_types(token: {}) -> [str]:
+        types = []
+        if token["isDAT"] and not token["isLPS"]:
+            types.append(TokenTypes.STANDARD)
+        if token["isDAT"] and token["isLPS"]:
+            types.append(TokenTypes.LIQUIDITY)
+        if token["isDAT"] and token["isLoanToken"]:
+            types.append(TokenTypes.LOAN)
+        if not token["isDAT"] and not token["isLPS"]:
+            types.append(TokenTypes.CUSTOM)
+        return types
@@ -0,0 +1,514 @@
+from defichain.libs.optional import import_optional
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+
+BLOCKS_PER_YEAR = 1051200  # 2880 blocks per day with a block time of 30 seconds
+DUSD_PRICE_FEED = "DUSD/USD"  # the node values DUSD at exactly one dollar
+NODE_LIST_LIMIT = 1000
+INITIAL_CAPACITY = 1024
+
+# States of vaults whose collateral is auctioned: they do not have a collateral ratio anymore
+LIQUIDATION_STATES = ("inLiquidation", "IN_LIQUIDATION")
+
+
+def _parse_amounts(amounts: []) -> {}:
+    # Node: ["1.5@DFI", ...], ocean: [{"symbol": "DFI", "amount": "1.5", ...}, ...]
+    result = {}
+    for amount in amounts or ():
+        if isinstance(amount, str):
+            value, symbol = amount.split("@")
+        else:
+            value, symbol = amount["amount"], amount["symbol"]
+        result[symbol] = result.get(symbol, 0.0) + float(value)
+    return result
+
+
+def _ocean_price(activePrice: {}) -> (float, float, bool):
+    if not activePrice:
+        return None
+    active, next = activePrice.get("active") or {}, activePrice.get("next") or {}
+    return float(active.get("amount") or 0), float(next.get("amount") or 0), bool(activePrice.get("isLive", True))
+
+
+class VaultRiskEngine:
+    """
+    Keeps all vaults in columns of numpy arrays and recomputes the collateral ratio of every vault at once.
+
+    The collateral amounts, loan amounts and interest amounts are stored as one matrix each with a row per vault
+    and a column per token. With the oracle prices and collateral factors, :meth:`scan` computes the collateral
+    value, loan value, collateral ratio and the ratio at the next price of all vaults with a few matrix products.
+    :meth:`accrue_interest` adds the interest of the loan scheme and loan token for a number of blocks.
+
+    The engine needs numpy: pip install numpy
+
+    :example:
+
+        >>> from defichain import Node
+        >>> from defichain.vaults import VaultRiskEngine
+        >>>
+        >>> node = Node("user", "password")
+        >>> engine = VaultRiskEngine.from_node(node)
+        >>> engine.scan()
+        >>> engine.get_vaults_below(160)  # collateral ratio below 160%
+        >>> engine.get_liquidation_candidates(margin=5)  # next ratio less than 5% above the minimum of the scheme
+        >>>
+        >>> # Every block: new prices, interest for one block and a new scan
+        >>> engine.refresh_prices()
+        >>> engine.accrue_interest(1)
+        >>> engine.scan()
+    """
+
+    def __init__(self):
+        self._np = import_optional("numpy", "The vault risk engine")
+        self._source = None
+
+        # Rows: one per vault
+        self._rows = {}  # vault id -> row
+        self._vaultIds = []  # row -> vault id
+        self._vaultSchemes = []  # row -> loan scheme id
+        self._count = 0
+
+        # Columns: one per collateral token and one per loan token
+        self._collateralTokens = {}  # symbol -> column
+        self._loanTokens = {}  # symbol -> column
+        self._factors = self._np.zeros(0)
+        self._tokenInterest = self._np.zeros(0)
+
+        self._schemes = {}  # loan scheme id -> (minimal collateral ratio, interest rate)
+        self._prices = {}  # symbol -> (active price, next price, is live)
+        self._priceFeeds = {}  # symbol -> fixed interval price id of the node
+
+        self._collateral = self._np.zeros((0, 0))
+        self._loans = self._np.zeros((0, 0))  # including the interest
+        self._interest = self._np.zeros((0, 0))
+        self._minColRatio = self._np.zeros(0)
+        self._interestRate = self._np.zeros(0)
+        self._results = None
+
+    # Load
+    @classmethod
+    def from_node(cls, node) -> "VaultRiskEngine":
+        """
+        Loads the collateral tokens, loan tokens, loan schemes, fixed interval prices and all vaults from the node
+
+        :param node: (required) Node
+        :type node: :ref:`Node Node`
+        :return: VaultRiskEngine
+        """
+        engine = cls()
+        engine._source = node
+        engine.refresh()
+        return engine
+
+    @classmethod
+    def from_ocean(cls, ocean) -> "VaultRiskEngine":
+        """
+        Loads the collateral tokens, loan tokens with their active and next prices and all vaults from ocean
+
+        :param ocean: (required) Ocean
+        :type ocean: :ref:`Ocean Ocean`
+        :return: VaultRiskEngine
+        """
+        engine = cls()
+        engine._source = ocean
+        engine.refresh()
+        return engine
+
+    def refresh(self) -> None:
+        """
+        Reloads the tokens, prices and all vaults from the node or ocean, which the engine was created from
+        """
+        if self._source is None:
+            raise WrongParameters("The engine was not created from a node or ocean")
+        if hasattr(self._source, "loan") and hasattr(self._source, "vault"):
+            self._load_node_tokens()
+            self._prices.clear()
+            self.set_prices(self._load_node_prices())
+            vaults, start = [], None
+            while True:
+                page = self._source.vault.listvaults(verbose=True, start=start,
+                                                     including_start=False if start is not None else None,
+                                                     limit=NODE_LIST_LIMIT)
+                vaults.extend(page)
+                if len(page) < NODE_LIST_LIMIT:
+                    break
+                start = page[-1]["vaultId"]
+        else:
+            self._load_ocean_tokens()
+            vaults = list(self._source.loan.iter_listVault())
+        self._clear_vaults()
+        self.update_vaults(vaults)
+
+    def refresh_prices(self) -> None:
+        """
+        Reloads only the prices, which change every block, with one request to the node or a few requests to ocean
+        """
+        if self._source is None:
+            raise WrongParameters("The engine was not created from a node or ocean")
+        if hasattr(self._source, "loan") and hasattr(self._source, "vault"):
+            self.set_prices(self._load_node_prices())
+        else:
+            self._load_ocean_tokens()
+
+    def refresh_vaults(self, vaultIds: [str]) -> None:
+        """
+        Reloads only the given vaults, for example the vaults of the loan transactions in a new block
+
+        :param vaultIds: (required) ids of the vaults
+        :type vaultIds: [str]
+        """
+        if self._source is None:
+            raise WrongParameters("The engine was not created from a node or ocean")
+        if hasattr(self._source, "loan") and hasattr(self._source, "vault"):
+            # getvault of the node does not contain the id of the vault
+            vaults = [dict(self._source.vault.getvault(vaultId, True), vaultId=vaultId) for vaultId in vaultIds]
+        else:
+            vaults = [self._source.loan.getVault(vaultId)["data"] for vaultId in vaultIds]
+        self.update_vaults(vaults)
+
+    # Update
+    def set_collateral_tokens(self, factors: {}) -> None:
+        """
+        Sets the collateral factors of the collateral tokens
+
+        :param factors: (required) {symbol: factor}, for example {"DFI": 1, "BTC": 1, "DUSD": 0.99}
+        :type factors: {str: float}
+        """
+        for symbol, factor in factors.items():
+            column = self._collateral_column(symbol)
+            self._factors[column] = float(factor)
+        self._results = None
+
+    def set_loan_tokens(self, interest: {}) -> None:
+        """
+        Sets the interest rates of the loan tokens in percent per year
+
+        :param interest: (required) {symbol: interest}, for example {"DUSD": 0, "TSLA": 2}
+        :type interest: {str: float}
+        """
+        for symbol, rate in interest.items():
+            column = self._loan_column(symbol)
+            self._tokenInterest[column] = float(rate)
+        self._results = None
+
+    def set_loan_schemes(self, schemes: {}) -> None:
+        """
+        Sets the minimal collateral ratio and interest rate of the loan schemes
+
+        :param schemes: (required) {id: (minimal collateral ratio in percent, interest rate in percent per year)}
+        :type schemes: {str: (float, float)}
+        """
+        self._schemes.update({id: (float(ratio), float(rate)) for id, (ratio, rate) in schemes.items()})
+        for row in range(self._count):
+            self._minColRatio[row], self._interestRate[row] = self._schemes.get(self._vaultSchemes[row],
+                                                                                (self._np.nan, 0.0))
+        self._results = None
+
+    def set_prices(self, prices: {}) -> None:
+        """
+        Sets the active and next prices of tokens in USD
+
+        :param prices: (required) {symbol: (active price, next price)} or {symbol: (active, next, is live)}
+        :type prices: {str: tuple}
+        """
+        for symbol, price in prices.items():
+            active, next = float(price[0]), float(price[1])
+            self._prices[symbol] = (active, next, bool(price[2]) if len(price) > 2 else True)
+        self._results = None
+
+    def update_vaults(self, vaults: [{}]) -> None:
+        """
+        Adds or replaces vaults in the format of listvaults/getvault of the node or listVault/getVault of ocean.
+        Vaults in liquidation are removed.
+
+        :param vaults: (required) the vaults
+        :type vaults: [{}]
+        """
+        np = self._np
+        for vault in vaults:
+            vaultId = vault["vaultId"]
+            if vault.get("state") in LIQUIDATION_STATES:
+                self.remove_vault(vaultId)
+                continue
+
+            if "loanScheme" in vault:  # ocean contains the loan scheme
+                scheme = vault["loanScheme"]
+                schemeId = scheme["id"]
+                self._schemes[schemeId] = (float(scheme["minColRatio"]), float(scheme["interestRate"]))
+            else:
+                schemeId = vault.get("loanSchemeId")
+            collateral = _parse_amounts(vault.get("collateralAmounts"))
+            loans = _parse_amounts(vault.get("loanAmounts"))
+            interest = _parse_amounts(vault.get("interestAmounts"))
+            for symbol in collateral:
+                self._collateral_column(symbol)
+            for symbol in list(loans) + list(interest):
+                self._loan_column(symbol)
+
+            row = self._rows.get(vaultId)
+            if row is None:
+                row = self._count
+                self._ensure_capacity(row + 1)
+                self._rows[vaultId] = row
+                self._vaultIds.append(vaultId)
+                self._vaultSchemes.append(schemeId)
+                self._count += 1
+            else:
+                self._vaultSchemes[row] = schemeId
+
+            self._collateral[row] = 0
+            self._loans[row] = 0
+            self._interest[row] = 0
+            for symbol, amount in collateral.items():
+                self._collateral[row, self._collateralTokens[symbol]] = amount
+            for symbol, amount in loans.items():
+                self._loans[row, self._loanTokens[symbol]] = amount
+            for symbol, amount in interest.items():
+                self._interest[row, self._loanTokens[symbol]] = amount
+            self._minColRatio[row], self._interestRate[row] = self._schemes.get(schemeId, (np.nan, 0.0))
+        self._results = None
+
+    def remove_vault(self, vaultId: str) -> None:
+        """
+        Removes a vault, for example after it was closed or liquidated
+
+        :param vaultId: (required) id of the vault
+        :type vaultId: str
+        """
+        row = self._rows.pop(vaultId, None)
+        if row is None:
+            return
+        # The last row is moved into the gap, so that the rows stay contiguous
+        last = self._count - 1
+        if row != last:
+            lastId = self._vaultIds[last]
+            for array in (self._collateral, self._loans, self._interest, self._minColRatio, self._interestRate):
+                array[row] = array[last]
+            self._vaultIds[row], self._vaultSchemes[row] = lastId, self._vaultSchemes[last]
+            self._rows[lastId] = row
+        self._vaultIds.pop()
+        self._vaultSchemes.pop()
+        self._count -= 1
+        self._results = None
+
+    def accrue_interest(self, blocks: int = 1) -> None:
+        """
+        Adds the interest of the given number of blocks to the loans of all vaults. The interest per block is the
+        loan without interest times the interest rate of the loan scheme plus the interest rate of the loan token.
+
+        :param blocks: (optional) number of blocks (default=1)
+        :type blocks: int
+        """
+        n = self._count
+        loans, interest = self._loans[:n], self._interest[:n]
+        rate = (self._interestRate[:n, None] + self._tokenInterest[None, :]) / 100 / BLOCKS_PER_YEAR
+        accrued = self._np.nan_to_num((loans - interest) * rate * blocks)
+        loans += accrued
+        interest += accrued
+        self._results = None
+
+    # Scan
+    def scan(self) -> None:
+        """
+        Recomputes the collateral value, loan value and collateral ratio of all vaults at the active and next price
+        """
+        np = self._np
+        n = self._count
+        collateral, loans = self._collateral[:n], self._loans[:n]
+        activeC, nextC, liveC = self._price_columns(self._collateralTokens)
+        activeL, nextL, liveL = self._price_columns(self._loanTokens)
+
+        collateralValue = collateral @ (activeC * self._factors)
+        nextCollateralValue = collateral @ (nextC * self._factors)
+        loanValue = loans @ activeL
+        nextLoanValue = loans @ nextL
+
+        def ratio(collateralValue, loanValue):
+            return np.divide(collateralValue * 100, loanValue, out=np.full(n, np.inf), where=loanValue > 0)
+
+        # A vault with a token without valid price is frozen by the node
+        frozen = (collateral[:, ~liveC] > 0).any(axis=1) | (loans[:, ~liveL] > 0).any(axis=1)
+        self._results = {"collateralValue": collateralValue, "loanValue": loanValue,
+                         "nextCollateralValue": nextCollateralValue, "nextLoanValue": nextLoanValue,
+                         "collateralRatio": ratio(collateralValue, loanValue),
+                         "nextCollateralRatio": ratio(nextCollateralValue, nextLoanValue), "frozen": frozen}
+
+    # Get Information
+    def get_vaults_below(self, ratio: float, next: bool = False) -> [str]:
+        """
+        Returns the vaults with a collateral ratio below the given ratio, the lowest ratio first
+
+        :param ratio: (required) collateral ratio in percent, for example 150
+        :type ratio: float
+        :param next: (optional) use the ratio at the next price (default=False)
+        :type next: bool
+        :return: [str] -- ids of the vaults
+        """
+        ratios = self._get_results()["nextCollateralRatio" if next else "collateralRatio"]
+        return self._sorted_ids(ratios, ratios < ratio)
+
+    def get_liquidation_candidates(self, margin: float = 0, next: bool = True) -> [str]:
+        """
+        Returns the vaults with a collateral ratio less than the margin above the minimal collateral ratio of their
+        loan scheme, the lowest ratio first. With a margin of zero these are the vaults that will be liquidated.
+
+        :param margin: (optional) percentage points above the minimal collateral ratio (default=0)
+        :type margin: float
+        :param next: (optional) use the ratio at the next price (default=True)
+        :type next: bool
+        :return: [str] -- ids of the vaults
+        """
+        ratios = self._get_results()["nextCollateralRatio" if next else "collateralRatio"]
+        return self._sorted_ids(ratios, ratios < self._minColRatio[:self._count] + margin)
+
+    def get_vault(self, vaultId: str) -> {}:
+        """
+        Returns the computed values of one vault
+
+        :param vaultId: (required) id of the vault
+        :type vaultId: str
+        :return: {"vaultId": str, "loanSchemeId": str, "minColRatio": float, "collateralValue": float,
+            "loanValue": float, "collateralRatio": float, "nextCollateralValue": float, "nextLoanValue": float,
+            "nextCollateralRatio": float, "frozen": bool}
+        """
+        if vaultId not in self._rows:
+            raise WrongParameters(f"The vault {vaultId} is not known")
+        row = self._rows[vaultId]
+        vault = {"vaultId": vaultId, "loanSchemeId": self._vaultSchemes[row],
+                 "minColRatio": float(self._minColRatio[row])}
+        for name, values in self._get_results().items():
+            vault[name] = bool(values[row]) if name == "frozen" else float(values[row])
+        return vault
+
+    def get_results(self) -> {}:
+        """
+        Returns the computed columns of all vaults as numpy arrays in the order of :meth:`get_vault_ids`
+
+        :return: {"collateralValue": ndarray, "loanValue": ndarray, "collateralRatio": ndarray,
+            "nextCollateralValue": ndarray, "nextLoanValue": ndarray, "nextCollateralRatio": ndarray,
+            "frozen": ndarray}
+        """
+        return dict(self._get_results())
+
+    def get_vault_ids(self) -> [str]:
+        return list(self._vaultIds)
+
+    def get_count(self) -> int:
+        return self._count
+
+    # Internal
+    def _get_results(self) -> {}:
+        if self._results is None:
+            self.scan()
+        return self._results
+
+    def _sorted_ids(self, ratios, mask) -> [str]:
+        rows = self._np.flatnonzero(mask)
+        rows = rows[self._np.argsort(ratios[rows], kind="stable")]
+        return [self._vaultIds[row] for row in rows]
+
+    def _price_columns(self, tokens: {}):
+        np = self._np
+        active, next, live = np.zeros(len(tokens)), np.zeros(len(tokens)), np.zeros(len(tokens), dtype=bool)
+        for symbol, column in tokens.items():
+            price = self._prices.get(symbol)
+            if price is not None:
+                active[column], next[column], live[column] = price
+        return active, next, live
+
+    def _collateral_column(self, symbol: str) -> int:
+        if symbol not in self._collateralTokens:
+            self._collateralTokens[symbol] = len(self._collateralTokens)
+            self._factors = self._np.append(self._factors, 0.0)  # Unknown collateral has no value until it is set
+            self._collateral = self._np.pad(self._collateral, ((0, 0), (0, 1)))
+        return self._collateralTokens[symbol]
+
+    def _loan_column(self, symbol: str) -> int:
+        if symbol not in self._loanTokens:
+            self._loanTokens[symbol] = len(self._loanTokens)
+            self._tokenInterest = self._np.append(self._tokenInterest, 0.0)
+            self._loans = self._np.pad(self._loans, ((0, 0), (0, 1)))
+            self._interest = self._np.pad(self._interest, ((0, 0), (0, 1)))
+        return self._loanTokens[symbol]
+
+    def _ensure_capacity(self, rows: int) -> None:
+        # The arrays grow by doubling, so that adding single vaults does not copy all rows every time
+        capacity = len(self._minColRatio)
+        if rows <= capacity:
+            return
+        capacity = max(INITIAL_CAPACITY, capacity * 2, rows)
+        grow = capacity - len(self._minColRatio)
+        self._collateral = self._np.pad(self._collateral, ((0, grow), (0, 0)))
+        self._loans = self._np.pad(self._loans, ((0, grow), (0, 0)))
+        self._interest = self._np.pad(self._interest, ((0, grow), (0, 0)))
+        self._minColRatio = self._np.pad(self._minColRatio, (0, grow))
+        self._interestRate = self._np.pad(self._interestRate, (0, grow))
+
+    def _clear_vaults(self) -> None:
+        self._rows.clear()
+        self._vaultIds.clear()
+        self._vaultSchemes.clear()
+        self._count = 0
+        self._results = None
+
+    def _load_node_tokens(self) -> None:
+        node = self._source
+        self._priceFeeds.clear()
+
+        collateralTokens = node.loan.listcollateraltokens()
+        if isinstance(collateralTokens, dict):  # Older nodes return the tokens by the id of their transaction
+            collateralTokens = collateralTokens.values()
+        factors = {}
+        for token in collateralTokens:
+            factors[token["token"]] = token["factor"]
+            self._priceFeeds[token["token"]] = token["fixedIntervalPriceId"]
+        self.set_collateral_tokens(factors)
+
+        loanTokens = node.loan.listloantokens()
+        if isinstance(loanTokens, dict):
+            loanTokens = loanTokens.values()
+        interest = {}
+        for token in loanTokens:
+            symbol = list(token["token"].values())[0]["symbol"]
+            interest[symbol] = token["interest"]
+            self._priceFeeds[symbol] = token["fixedIntervalPriceId"]
+        self.set_loan_tokens(interest)
+
+        self.set_loan_schemes({scheme["id"]: (scheme["mincolratio"], scheme["interestrate"])
+                               for scheme in node.loan.listloanschemes()})
+
+    def _load_node_prices(self) -> {}:
+        feeds, start = {}, None
+        while True:
+            page = self._source.oracles.listfixedintervalprices(start, NODE_LIST_LIMIT)
+            feeds.update({feed["priceFeedId"]: feed for feed in page})
+            if len(page) < NODE_LIST_LIMIT:
+                break
+            start = page[-1]["priceFeedId"]
+
+        prices = {}
+        for symbol, feedId in self._priceFeeds.items():
+            if feedId == DUSD_PRICE_FEED:
+                prices[symbol] = (1, 1, True)
+            elif feedId in feeds:
+                feed = feeds[feedId]
+                prices[symbol] = (feed["activePrice"], feed["nextPrice"], feed["isLive"])
+        return prices
+
+    def _load_ocean_tokens(self) -> None:
+        ocean = self._source
+        factors, interest, prices = {}, {}, {}
+        for token in ocean.loan.iter_listCollateralToken():
+            symbol = token["token"]["symbol"]
+            factors[symbol] = token["factor"]
+            prices[symbol] = _ocean_price(token.get("activePrice"))
+            if token.get("fixedIntervalPriceId") == DUSD_PRICE_FEED:
+                prices[symbol] = (1, 1, True)
+        for token in ocean.loan.iter_listLoanToken():
+            symbol = token["token"]["symbol"]
+            interest[symbol] = token["interest"]
+            prices[symbol] = _ocean_price(token.get("activePrice"))
+            if token.get("fixedIntervalPriceId") == DUSD_PRICE_FEED:
+                prices[symbol] = (1, 1, True)
+        self.set_collateral_tokens(factors)
+        self.set_loan_tokens(interest)
+        self.set_prices({symbol: price for symbol, price in prices.items() if price is not None})
@@ -58,6 +58,8 @@ setup(
               ],
     package_data={'': ['*.txt', '*.json']},
     install_requires=requirements,
+    extras_require={'async': ['aiohttp>=3.8'], 'fast': ['coincurve>=18.0.0'], 'zmq': ['pyzmq>=22.0'],
+                    'numpy': ['numpy>=1.20']},
     keywords=['python', 'defichain', 'node', 'ocean', 'mnemonic', 'wallet', 'privateKey', 'transactions',
               'raw transactions', 'P2PKH', 'P2SH', 'P2WPKH', 'DefiTx', 'custom transaction'],
     classifiers=[
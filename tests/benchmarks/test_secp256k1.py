@@ -0,0 +1,42 @@
+import time
+import pytest
+
+from defichain import Wallet
+from defichain.networks import DefichainMainnet
+from defichain.transactions.rawtransactions.sign import sign_input
+from tests.test_secp256k1 import MNEMONIC, PRIVATE_KEY, BACKENDS, backend, digests
+
+"""
+Benchmark of the available secp256k1 backends, which is only run on request: pytest tests/benchmarks
+"""
+
+BENCHMARK_TIME = 0.5  # seconds per measurement
+
+
+def per_second(function) -> float:
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < BENCHMARK_TIME:
+        function(count)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+def test_backend_benchmark(backend, record_property):  # 01
+    """
+    Measures signatures/s and derivations/s of the backend
+    """
+    wallet = Wallet(DefichainMainnet).from_mnemonic(MNEMONIC)
+    xprivate_key, xpublic_key = wallet.root_xprivate_key(), wallet.root_xpublic_key()
+    private_key = PRIVATE_KEY.hex()
+    data = digests(256)
+
+    signatures = per_second(lambda i: sign_input(private_key, data[i % 256]))
+    private_derivations = per_second(lambda i: Wallet(DefichainMainnet).from_xprivate_key(xprivate_key).from_index(i))
+    public_derivations = per_second(lambda i: Wallet(DefichainMainnet).from_xpublic_key(xpublic_key).from_index(i))
+
+    record_property("signatures_per_second", round(signatures))
+    record_property("xprv_derivations_per_second", round(private_derivations))
+    record_property("xpub_derivations_per_second", round(public_derivations, 1))
+    assert signatures > 0 and private_derivations > 0 and public_derivations > 0
@@ -50,3 +50,15 @@ def test_mnemonic_to_entropy():  # 09
     assert mnemonic_to_entropy(mnemonic=MNEMONIC, language="english") == ENTROPY
 
 
+@pytest.mark.hdwallet
+def test_mnemonic_wordlist_cache():  # 10
+    from defichain import Mnemonic
+    assert Mnemonic("french").wordlist is Mnemonic("french").wordlist
+    assert Mnemonic.word_languages("animal") == {"english", "french"}
+    assert Mnemonic.possible_languages(MNEMONIC) == {"english"}
+    assert Mnemonic.detect_language(MNEMONIC) == "english"
+    for language in Mnemonic.list_languages():
+        mnemonic = entropy_to_mnemonic(ENTROPY, language=language)
+        assert is_mnemonic(mnemonic=mnemonic, language=language)
+        assert mnemonic_to_entropy(mnemonic=mnemonic, language=language) == ENTROPY
+    assert not is_mnemonic(mnemonic=MNEMONIC.replace("cry", "bracket"))
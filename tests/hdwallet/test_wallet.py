@@ -570,3 +570,32 @@ def test_query_all_correct_data():  # 13
     assert Vectors.DEFAULT_1_ADDRESS == wallet.default_address()
     assert Vectors.BECH32_1_ADDRESS == wallet.bech32_address()
     assert Vectors.LEGACY_1_ADDRESS == wallet.legacy_address()
+
+
+@pytest.mark.hdwallet
+def test_derive_range():  # 14
+    wallet = Wallet(network=DefichainMainnet)
+    wallet.from_entropy(entropy=Vectors.ENTROPY)
+    wallet.from_path(path=Vectors.PATH_1)
+    accounts = [wallet.get_account(index) for index in range(5, 15)]
+
+    assert [account.get_privateKey() for account in wallet.derive_range(start=5, count=10)] == \
+           [account.get_privateKey() for account in accounts]
+    assert Vectors.PATH_1 == wallet.path()
+
+    addresses = list(wallet.derive_range(start=5, count=10, addresses=True))
+    assert addresses == list(wallet.derive_range(start=5, count=10, addresses=True, processes=2, chunk_size=3))
+    for (path, public_key, bech32, default, legacy), account in zip(addresses, accounts):
+        assert (public_key, bech32, default, legacy) == \
+               (account.get_publicKey(), account.get_p2wpkh(), account.get_p2sh(), account.get_p2pkh())
+    assert "m/1129/0/0/5" == addresses[0][0]
+
+    # Derivation of the addresses from the xpublic key of the parent
+    xpublic_key = Wallet(network=DefichainMainnet).from_entropy(entropy=Vectors.ENTROPY) \
+        .from_path(path="m/1129/0/0")._xpublic_key()
+    public_wallet = Wallet(network=DefichainMainnet).from_xpublic_key(xpublic_key)
+    assert [address[1:] for address in public_wallet.derive_range("m/", start=5, count=10, addresses=True)] == \
+           [address[1:] for address in addresses]
+
+    with pytest.raises(ValueError):
+        wallet.derive_range(count=10, processes=2)
@@ -2,9 +2,16 @@ from defichain import Node
 from defichain.logger import Logger
 from ..util import load_secrets_conf
 
-secrets = load_secrets_conf()
 logger = Logger(log_level="all")
 
-node = Node(user=secrets["user"], password=secrets["password"], url=secrets["url"], port=secrets["port"],
-            wallet_name=secrets["wallet_name"], wallet_password=secrets["wallet_password"], wallet_timeout=3600,
-            logger=logger)
+
+def __getattr__(name):
+    # The node is only created for the tests that use it, the offline tests run without a secrets_conf.py
+    if name not in ("secrets", "node"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    global secrets, node
+    secrets = load_secrets_conf()
+    node = Node(user=secrets["user"], password=secrets["password"], url=secrets["url"], port=secrets["port"],
+                wallet_name=secrets["wallet_name"], wallet_password=secrets["wallet_password"], wallet_timeout=3600,
+                logger=logger)
+    return globals()[name]
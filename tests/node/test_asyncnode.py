@@ -0,0 +1,41 @@
+import asyncio
+import pytest
+from defichain import AsyncNode
+from tests.util import load_secrets_conf
+
+from . import node
+
+secrets = load_secrets_conf()
+
+
+def createAsyncNode() -> AsyncNode:
+    return AsyncNode(user=secrets["user"], password=secrets["password"], url=secrets["url"], port=secrets["port"],
+                     wallet_name=secrets["wallet_name"], concurrency=10)
+
+
+@pytest.mark.mandatory
+def test_createAsyncNode():
+    async def run():
+        async with createAsyncNode() as asyncNode:
+            assert asyncNode
+    asyncio.run(run())
+
+
+@pytest.mark.query
+def test_modules():
+    async def run():
+        async with createAsyncNode() as asyncNode:
+            assert await asyncNode.blockchain.getblockcount() >= node.blockchain.getblockcount()
+            hashes = await asyncio.gather(*[asyncNode.blockchain.getblockhash(i) for i in range(1, 21)])
+            assert hashes[0] == node.blockchain.getblockhash(1)
+            assert len(hashes) == 20
+    asyncio.run(run())
+
+
+@pytest.mark.query
+def test_call_many():
+    async def run():
+        async with createAsyncNode() as asyncNode:
+            results = await asyncNode.call_many([("getblockhash", 1), ("getblockhash", 2)])
+            assert results == [node.blockchain.getblockhash(1), node.blockchain.getblockhash(2)]
+    asyncio.run(run())
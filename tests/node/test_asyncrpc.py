@@ -0,0 +1,46 @@
+import asyncio
+import json
+
+import pytest
+from defichain import AsyncNode
+from tests.util import FakeResponse, FakeAsyncSession
+
+"""
+Async node against a fake aiohttp session, which answers like the node
+"""
+
+
+def result(value) -> FakeResponse:
+    return FakeResponse({"result": value, "error": None})
+
+
+def fake_async_node(responses: [FakeResponse]) -> (AsyncNode, FakeAsyncSession):
+    node = AsyncNode(user="user", password="password")
+    node._rpc._session = session = FakeAsyncSession(responses)
+    node._rpc._semaphore = asyncio.Semaphore(1)
+    return node, session
+
+
+def posted(session: FakeAsyncSession) -> [()]:
+    return [(request["method"], request["params"]) for request in map(json.loads, session.data)]
+
+
+@pytest.mark.mandatory
+def test_defaultHeight():  # 01
+    """
+    Checking if methods with the current block height as default await the block count
+    """
+    async def run():
+        node, session = fake_async_node([result(100), result("hash"), result(100), result("hash"),
+                                         result("hash"), result(100), result({})])
+        assert await node.loan.destroyloanscheme("X") == "hash"
+        assert await node.loan.updateloanscheme(150, 5, "X") == "hash"
+        assert await node.loan.updateloanscheme(150, 5, "X", 200) == "hash"
+        assert await node.masternodes.getmasternodeblocks(id="1") == {}
+        return session
+
+    session = asyncio.run(run())
+    assert posted(session) == [("getblockcount", []), ("destroyloanscheme", ["X", 101]),
+                               ("getblockcount", []), ("updateloanscheme", [150, 5, "X", 101]),
+                               ("updateloanscheme", [150, 5, "X", 200]),
+                               ("getblockcount", []), ("getmasternodeblocks", [{"id": "1"}, 100])]
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+from defichain import Node
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+from tests.util import FakeResponse, FakeSession
+
+"""
+Batch requests of the node against a fake requests session, which answers like the node
+"""
+
+
+def answer(id: int, result=None, error: {} = None) -> {}:
+    return {"id": id, "result": result, "error": error}
+
+
+ERROR = {"code": -8, "message": "Block height out of range"}
+
+
+@pytest.fixture
+def session(monkeypatch) -> FakeSession:
+    # The node answers the connection test and the wallet check, then the responses of the test follow
+    session = FakeSession([FakeResponse({"result": None, "error": None}), FakeResponse({"result": [], "error": None})])
+    monkeypatch.setattr("defichain.node.rpc.requests.Session", lambda: session)
+    return session
+
+
+def posted(session: FakeSession) -> []:
+    return [json.loads(data) for data in session.data[2:]]
+
+
+@pytest.mark.mandatory
+def test_call_many(session):  # 01
+    """
+    Checking if the responses of a batch request are mapped back by id
+    """
+    node = Node(user="user", password="password")
+    session.responses = [FakeResponse([answer(2, 100), answer(0, "hash1"), answer(1, "hash2")]),
+                         FakeResponse([answer(1, error=ERROR), answer(0, "hash1")]),
+                         FakeResponse([answer(1, error=ERROR), answer(0, "hash1")])]
+
+    assert node.call_many([("getblockhash", 1), ("getblockhash", 2), "getblockcount"]) == ["hash1", "hash2", 100]
+    assert posted(session)[0] == [{"method": "getblockhash", "params": [1], "jsonrpc": "2.0", "id": 0},
+                                  {"method": "getblockhash", "params": [2], "jsonrpc": "2.0", "id": 1},
+                                  {"method": "getblockcount", "params": [], "jsonrpc": "2.0", "id": 2}]
+
+    results = node.call_many([("getblockhash", 1), ("getblockhash", -1)], raise_errors=False)
+    assert results[0] == "hash1" and isinstance(results[1], Exception)
+    with pytest.raises(Exception, match="Block height out of range"):
+        node.call_many([("getblockhash", 1), ("getblockhash", -1)])
+    assert node.call_many([]) == [] and len(session.data) == 5
+
+
+@pytest.mark.mandatory
+def test_batch(session):  # 02
+    """
+    Checking if the results of a batch are available after leaving the block
+    """
+    node = Node(user="user", password="password")
+    session.responses = [FakeResponse([answer(2, error=ERROR), answer(1, "hash2"), answer(0, "hash1")])]
+
+    with node.batch() as batch:
+        blockhash = batch.blockchain.getblockhash(1)
+        block = batch.call("getblockhash", 2)
+        error = batch.blockchain.getblockhash(-1)
+        assert len(batch) == 3 and not blockhash.done() and session.data[2:] == []
+        with pytest.raises(WrongParameters):
+            blockhash.result()
+
+    assert len(batch) == 0 and blockhash.done() and block.done() and error.done()
+    assert (blockhash.result(), block.result()) == ("hash1", "hash2")
+    with pytest.raises(Exception, match="Block height out of range"):
+        error.result()
+
+
+@pytest.mark.mandatory
+def test_defaultHeight(session):  # 03
+    """
+    Checking if the current block height is requested before a call which needs it is added to a batch
+    """
+    node = Node(user="user", password="password")
+    session.responses = [FakeResponse({"result": 100, "error": None}), FakeResponse({"result": 100, "error": None}),
+                         FakeResponse([answer(0, "hash"), answer(1, "hash"), answer(2, {})])]
+
+    with node.batch() as batch:
+        destroy = batch.loan.destroyloanscheme("X")
+        update = batch.loan.updateloanscheme(150, 5, "X", 200)
+        blocks = batch.masternodes.getmasternodeblocks(id="1")
+        assert [request["method"] for request in posted(session)] == ["getblockcount", "getblockcount"]
+
+    assert posted(session)[2] == [{"method": "destroyloanscheme", "params": ["X", 101], "jsonrpc": "2.0", "id": 0},
+                                  {"method": "updateloanscheme", "params": [150, 5, "X", 200], "jsonrpc": "2.0",
+                                   "id": 1},
+                                  {"method": "getmasternodeblocks", "params": [{"id": "1"}, 100], "jsonrpc": "2.0",
+                                   "id": 2}]
+    assert (destroy.result(), update.result(), blocks.result()) == ("hash", "hash", {})
@@ -4,6 +4,9 @@ import pytest
 from defichain.exceptions.http.InternalServerError import InternalServerError
 from defichain.exceptions.http.BadRequest import BadRequest
 
+from defichain.networks import DefichainMainnet
+from defichain.transactions.rawtransactions import Block, TxDefiOutput
+
 from . import node
 
 
@@ -269,3 +272,23 @@ def test_verifytxoutproof():  # 33
     proof = node.blockchain.gettxoutproof([txid], blockhash=blockhash)
     assert node.blockchain.verifytxoutproof(proof)
     assert node.blockchain.verifytxoutproof(proof=proof)
+
+
+@pytest.mark.query
+def test_decodeblock():  # 34
+    """
+    Decoding real blocks of verbosity 0 and comparing them to the block of verbosity 1
+    """
+    for height in (1, 1000000, 2500000):
+        blockhash = node.blockchain.getblockhash(height)
+        expected = node.blockchain.getblock(blockhash, 1)
+        block = Block.deserialize(DefichainMainnet, node.blockchain.getblock(blockhash, 0))
+
+        assert block.get_hash() == blockhash and block.get_height() == height
+        assert block.get_header().get_merkleRoot() == expected["merkleroot"]
+        assert block.get_header().get_previousBlockHash() == expected["previousblockhash"]
+        assert block.get_header().get_time() == expected["time"]
+        assert block.get_txids() == expected["tx"]
+        for raw, tx in zip(block.iter_raw_transactions(), block.get_transactions()):
+            if not any(isinstance(output, TxDefiOutput) for output in tx.get_outputs()):
+                assert tx.serialize() == bytes(raw).hex()
@@ -1,6 +1,6 @@
 import re
 import pytest
-from defichain.node.RPCErrorHandler import RPCErrorHandler
+from defichain.node.RPCErrorHandler import RPCErrorHandler, RPCBatchErrorHandler
 from requests.models import Response
 from . import logger
 
@@ -63,3 +63,16 @@ def test_Unauthorized():  # 07
     string = "Unauthorized(401): Authorization failed: Incorrect rpcuser or rpcpassword"
     with pytest.raises(Exception, match=re.escape(string)):
         assert RPCErrorHandler(response, logger)
+
+
+@pytest.mark.query
+def test_BatchError():  # 08
+    string = "NotFound(404): RPC_METHOD_NOT_FOUND: Das ist ein Test"
+    with pytest.raises(Exception, match=re.escape(string)):
+        assert RPCBatchErrorHandler({"result": None, "error": {"code": -32601, "message": "Das ist ein Test"},
+                                     "id": 0}, logger)
+    string = "InternalServerError(500): RPC_INVALID_PARAMETER: Das ist ein Test"
+    with pytest.raises(Exception, match=re.escape(string)):
+        assert RPCBatchErrorHandler({"result": None, "error": {"code": -8, "message": "Das ist ein Test"},
+                                     "id": 0}, logger)
+    assert RPCBatchErrorHandler({"result": 1, "error": None, "id": 0}, logger)
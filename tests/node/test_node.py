@@ -1,5 +1,6 @@
 import pytest
 from defichain import Node
+from defichain.node import ResultCache
 from tests.util import load_secrets_conf
 
 
@@ -25,3 +26,65 @@ def test_createNode():
         else:
             assert Node(user=secrets["user"], password=secrets["password"], url=secrets["url"], port=secrets["port"],
                         wallet_password=secrets["wallet_password"], wallet_timeout=3600)
+
+
+@pytest.mark.query
+def test_call_many():
+    """
+    Checking if multiple calls are sent in one batch request
+    """
+    node = Node(user=secrets["user"], password=secrets["password"], url=secrets["url"], port=secrets["port"])
+    blockcount = node.blockchain.getblockcount()
+    results = node.call_many([("getblockhash", 1), ("getblockcount",)])
+    assert results[0] == node.blockchain.getblockhash(1)
+    assert results[1] >= blockcount
+    assert node.call_many([]) == []
+
+    with pytest.raises(Exception):
+        node.call_many([("getblockhash", -1)])
+    assert isinstance(node.call_many([("getblockhash", -1)], raise_errors=False)[0], Exception)
+
+
+@pytest.mark.query
+def test_batch():
+    """
+    Checking if the batch object collects calls of all modules and executes them in one request
+    """
+    node = Node(user=secrets["user"], password=secrets["password"], url=secrets["url"], port=secrets["port"])
+    with node.batch() as batch:
+        blockhash = batch.blockchain.getblockhash(1)
+        block = batch.call("getblockhash", 2)
+        error = batch.blockchain.getblockhash(-1)
+        assert len(batch) == 3
+    assert blockhash.result() == node.blockchain.getblockhash(1)
+    assert block.result() == node.blockchain.getblockhash(2)
+    with pytest.raises(Exception):
+        error.result()
+
+
+@pytest.mark.query
+def test_resultCache(tmp_path):
+    """
+    Checking if blocks and transactions deeper than the reorg window are cached
+    """
+    cache = ResultCache(path=str(tmp_path / "cache.sqlite"), reorg_window=10)
+    node = Node(user=secrets["user"], password=secrets["password"], url=secrets["url"], port=secrets["port"],
+                cache=cache)
+    blockcount = node.blockchain.getblockcount()
+    assert cache.get_tip_height() == blockcount
+
+    blockhash = node.blockchain.getblockhash(blockcount - 20)
+    block = node.blockchain.getblock(blockhash, 1)
+    assert node.blockchain.getblock(blockhash, 1) == block
+    assert node.call_many([("getblock", blockhash, 1)]) == [block]
+    assert cache.get_stats()["hits"] == 2
+
+    # Blocks inside the reorg window are not cached
+    tip = node.blockchain.getblockhash(blockcount)
+    node.blockchain.getblock(tip, 1), node.blockchain.getblock(tip, 1)
+    assert cache.get_stats()["hits"] == 2
+
+    # The database keeps the results, results inside the reorg window of a lower tip are dropped
+    assert ResultCache(path=str(tmp_path / "cache.sqlite")).get("getblock", [blockhash, 1]) == (True, block)
+    cache.set_tip_height(blockcount - 25)
+    assert cache.get("getblock", [blockhash, 1]) == (False, None)
@@ -6,6 +6,8 @@ from tests.util import load_secrets_conf
 from defichain.exceptions.http.InternalServerError import InternalServerError
 from defichain.exceptions.http.BadRequest import BadRequest
 
+from defichain.dex import DexEngine
+
 from . import node
 address = load_secrets_conf()["wallet_address"]
 vault = load_secrets_conf()["vault_address"]
@@ -103,6 +105,15 @@ def test_testpoolswap():  # 09
                                       maxPrice=2, path="direct", verbose=True)
 
 
+@pytest.mark.query
+def test_dexengine():
+    dex = DexEngine.from_node(node)
+    for amount in (0.00000001, 1, 1000):
+        for path in ("direct", "auto"):
+            assert str(dex.swap("DFI", "DUSD", amount, path)) == \
+                   node.poolpair.testpoolswap(address, "DFI", amount, address, "DUSD", path=path)
+
+
 @pytest.mark.query
 def test_updatepoolpair():  # 10
     string = ".* RPC_INVALID_REQUEST: Test UpdatePoolPairTx execution failed:\ntx not from foundation member"
@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import pytest
+
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+from defichain.node import ZmqSubscriber, ResultCache
+from defichain.transactions.rawtransactions import BlockHeader
+
+zmq = pytest.importorskip("zmq")
+
+"""
+Zmq subscriber against a local publisher, which sends the notifications like the node
+"""
+
+BLOCKHASH = "ab" * 32
+
+
+class Publisher:
+    def __init__(self, port: int = None):
+        self.context = zmq.Context()
+        self.socket = self.context.socket(zmq.PUB)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        if port is None:
+            port = self.socket.bind_to_random_port("tcp://127.0.0.1")
+        else:
+            self.socket.bind(f"tcp://127.0.0.1:{port}")
+        self.port, self.address = port, f"tcp://127.0.0.1:{port}"
+        self.sequences = {}
+
+    def send(self, topic: str, body: bytes, skip: int = 0) -> None:
+        sequence = self.sequences.get(topic, -1) + 1 + skip
+        self.sequences[topic] = sequence
+        self.socket.send_multipart([topic.encode(), body, sequence.to_bytes(4, "little")])
+
+    def warm_up(self, subscriber: ZmqSubscriber, topic: str = "hashtx") -> None:
+        # Subscriptions need some time to reach the publisher, messages before are dropped
+        for _ in range(100):
+            self.send(topic, bytes(32))
+            if subscriber.receive(0.05) is not None:
+                return
+        raise TimeoutError("The subscriber did not connect")
+
+    def close(self) -> None:
+        self.socket.close()
+        self.context.term()
+
+
+def rawblock(height: int) -> bytes:
+    header = BlockHeader(536870912, "aa" * 32, "bb" * 32, 1700000000, 486604799, height, 1, "cc" * 32, "30" * 65)
+    return header.bytes() + b"\x00"
+
+
+@pytest.mark.mandatory
+def test_notifications():  # 01
+    publisher = Publisher()
+    subscriber = ZmqSubscriber(publisher.address, ["hashblock", "hashtx", "rawblock"])
+    gaps, blocks = [], []
+    subscriber.on_gap(lambda topic, expected, received: gaps.append((topic, expected, received)))
+    subscriber.on("hashblock", lambda notification: 1 / 0)  # Failing callbacks do not stop the others
+    subscriber.on("hashblock", blocks.append)
+    cache = ResultCache(reorg_window=10)
+    subscriber.add_cache(cache)
+    try:
+        publisher.warm_up(subscriber)
+        publisher.send("hashblock", bytes.fromhex(BLOCKHASH))
+        notification = subscriber.receive(2)
+        assert notification.get_topic() == "hashblock" and notification.get_hash() == BLOCKHASH
+        assert blocks == [notification]
+
+        publisher.send("rawblock", rawblock(2500000))
+        notification = subscriber.receive(2)
+        assert notification.get_height() == 2500000 and notification.is_block()
+        assert cache.get_tip_height() == 2500000
+
+        publisher.send("hashblock", bytes(32), skip=3)
+        subscriber.receive(2)
+        assert gaps == [("hashblock", 1, 4)]
+        assert subscriber.get_stats()["gaps"] == 1 and subscriber.get_stats()["missed"] == 3
+    finally:
+        subscriber.stop()
+        publisher.close()
+
+    with pytest.raises(WrongParameters):
+        ZmqSubscriber(publisher.address, ["sequence"])
+    with pytest.raises(WrongParameters):
+        subscriber.on("rawtx", print)
+
+
+@pytest.mark.mandatory
+def test_background_thread_and_restart():  # 02
+    publisher = Publisher()
+    subscriber = ZmqSubscriber(publisher.address, ["hashtx"], reconnect_interval=0.05)
+    received, gaps = [], []
+    subscriber.on("hashtx", received.append)
+    subscriber.on_gap(lambda topic, expected, sequence: gaps.append(sequence))
+    subscriber.start()
+    try:
+        for _ in range(100):
+            publisher.send("hashtx", bytes(32))
+            time.sleep(0.05)
+            if len(received) >= 5:
+                break
+        assert len(received) >= 5
+
+        # The node restarts: the subscriber reconnects and the sequence starts again
+        port = publisher.port
+        publisher.close()
+        publisher = Publisher(port)
+        count, sequence = len(received), received[-1].get_sequence()
+        for _ in range(100):
+            publisher.send("hashtx", bytes(32))
+            time.sleep(0.05)
+            if len(received) > count:
+                break
+        assert len(received) > count
+        assert len(gaps) == 1 and gaps[0] < sequence
+        assert subscriber.get_stats()["missed"] == 0
+    finally:
+        subscriber.stop()
+        publisher.close()
+    assert not subscriber._thread
+
+
+@pytest.mark.mandatory
+def test_stream():  # 03
+    publisher = Publisher()
+    subscriber = ZmqSubscriber(publisher.address, ["hashblock"])
+
+    async def receive():
+        async def publish():
+            while True:
+                publisher.send("hashblock", bytes.fromhex(BLOCKHASH))
+                await asyncio.sleep(0.05)
+
+        task = asyncio.ensure_future(publish())
+        try:
+            async for notification in subscriber.stream():
+                subscriber.stop()
+                return notification
+        finally:
+            task.cancel()
+
+    try:
+        notification = asyncio.run(asyncio.wait_for(receive(), 5))
+        assert notification.get_hash() == BLOCKHASH
+    finally:
+        publisher.close()
@@ -19,6 +19,12 @@ def test_listAccountHistory():  # 02
     assert ocean.address.listAccountHistory(address=ADDRESS, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listAccountHistory():
+    entries = list(ocean.address.iter_listAccountHistory(ADDRESS, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getBalance():  # 03
     assert ocean.address.getBalance(ADDRESS)
@@ -38,6 +44,12 @@ def test_listToken():  # 05
     assert ocean.address.listToken(address=ADDRESS, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listToken():
+    entries = list(ocean.address.iter_listToken(ADDRESS, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_listVault():  # 06
     assert ocean.address.listVault(ADDRESS)
@@ -45,6 +57,12 @@ def test_listVault():  # 06
     assert ocean.address.listVault(address=ADDRESS, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listVault():
+    entries = list(ocean.address.iter_listVault(ADDRESS, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_listTransaction():  # 07
     assert ocean.address.listTransaction(ADDRESS)
@@ -52,8 +70,20 @@ def test_listTransaction():  # 07
     assert ocean.address.listTransaction(address=ADDRESS, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listTransaction():
+    entries = list(ocean.address.iter_listTransaction(ADDRESS, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_listTransactionUnspent():  # 08
     assert ocean.address.listTransactionUnspent(ADDRESS)
     assert ocean.address.listTransactionUnspent(ADDRESS, SIZE, NEXT)
     assert ocean.address.listTransactionUnspent(address=ADDRESS, size=SIZE, next=NEXT)
+
+
+@pytest.mark.query
+def test_iter_listTransactionUnspent():
+    entries = list(ocean.address.iter_listTransactionUnspent(ADDRESS, limit=SIZE))
+    assert len(entries) <= SIZE
@@ -0,0 +1,32 @@
+import asyncio
+import pytest
+from defichain import AsyncOcean
+
+from . import logger
+
+
+@pytest.mark.mandatory
+def test_createAsyncOcean():
+    assert AsyncOcean()
+    assert AsyncOcean(logger=logger, concurrency=10)
+
+
+@pytest.mark.query
+def test_modules():
+    async def run():
+        async with AsyncOcean(logger=logger) as ocean:
+            poolpairs, stats = await asyncio.gather(ocean.poolpairs.list(), ocean.stats.get())
+            assert poolpairs["data"]
+            assert stats["data"]
+            assert await ocean.poolpairs.get(4)
+    asyncio.run(run())
+
+
+@pytest.mark.query
+def test_paginate():
+    async def run():
+        async with AsyncOcean(logger=logger) as ocean:
+            blocks = [block async for block in ocean.paginate(ocean.blocks.list, size=30, limit=70)]
+            assert len(blocks) == 70
+            assert len(set(block["hash"] for block in blocks)) == 70
+    asyncio.run(run())
@@ -12,6 +12,12 @@ def test_list():  # 01
     assert ocean.blocks.list(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_list():
+    entries = list(ocean.blocks.iter_list(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_get():  # 02
     blockheight = 100
@@ -29,3 +35,10 @@ def test_getTransactions():  # 03
     assert ocean.blocks.getTransactions(blockhash, SIZE, NEXT)
     assert ocean.blocks.getTransactions(hash=blockhash, size=SIZE, next=NEXT)
 
+
+@pytest.mark.query
+def test_iter_getTransactions():
+    blockhash = "b6e0ee6da7e61f6b672b72b9a8a68413cdf0344102acecccf9cf2a6d338630c6"
+    entries = list(ocean.blocks.iter_getTransactions(blockhash, limit=SIZE))
+    assert len(entries) <= SIZE
+
@@ -12,6 +12,12 @@ def test_listScheme():  # 01
     assert ocean.loan.listScheme(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listScheme():
+    entries = list(ocean.loan.iter_listScheme(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getScheme():  # 02
     scheme = "MIN150"
@@ -26,6 +32,12 @@ def test_listCollateralToken():  # 03
     assert ocean.loan.listCollateralToken(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listCollateralToken():
+    entries = list(ocean.loan.iter_listCollateralToken(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getCollateralToken():  # 04
     token = 1  # ETH
@@ -40,6 +52,12 @@ def test_listLoanToken():  # 05
     assert ocean.loan.listLoanToken(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listLoanToken():
+    entries = list(ocean.loan.iter_listLoanToken(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getLoanToken():  # 06
     token = 26  # SPY
@@ -54,6 +72,12 @@ def test_listVault():  # 07
     assert ocean.loan.listVault(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listVault():
+    entries = list(ocean.loan.iter_listVault(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getVault():  # 08
     vault = "fb2dd56658bc2b13fc129539aca8a9ff1f86f8a966a02dbb91c365fc59c1898b"  # SPY
@@ -71,6 +95,15 @@ def test_listVaultAuctionHistory():  # 09
     assert ocean.loan.listVaultAuctionHistory(id=id, height=height, batchIndex=batchIndex, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listVaultAuctionHistory():
+    id = "00d1f13efe448980dea15824fd3df82d311a9daeba31428929f827e8c9764e2f"
+    height = 1865100
+    batchIndex = 0
+    entries = list(ocean.loan.iter_listVaultAuctionHistory(id, height, batchIndex, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_listAction():  # 10
     assert ocean.loan.listAuction()
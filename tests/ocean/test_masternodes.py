@@ -12,6 +12,12 @@ def test_list():  # 01
     assert ocean.masternodes.list(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_list():
+    entries = list(ocean.masternodes.iter_list(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_get():  # 02
     id = "6be52cb3ce612b6949b7652e35aa42e3ad7174d284c9d5685ee42a9f230a1fe6"
@@ -1,5 +1,9 @@
+import time
 import pytest
 from defichain import Ocean
+from defichain.ocean import ResponseCache
+from defichain.ocean.connection import Connection
+from tests.util import FakeResponse, FakeSession
 
 
 @pytest.mark.mandatory
@@ -10,3 +14,45 @@ def test_createOcean():
     assert Ocean()
     assert Ocean("https://ocean.defichain.com", "v0", "mainnet")
     assert Ocean(url="https://ocean.defichain.com", version="v0", network="mainnet")
+
+
+@pytest.mark.query
+def test_paginate():
+    """
+    Checking if the pages of a list method are iterated lazily
+    """
+    ocean = Ocean()
+    blocks = list(ocean.paginate(ocean.blocks.list, size=30, limit=70))
+    assert len(blocks) == 70
+    assert len(set(block["hash"] for block in blocks)) == 70
+    blocks = list(ocean.paginate(ocean.blocks.list, size=30, limit=70, prefetch=True))
+    assert len(blocks) == 70
+
+
+@pytest.mark.mandatory
+def test_responseCache():
+    """
+    Checking if get requests are cached until their ttl expires or the tip height changes
+    """
+    cache = ResponseCache(ttls={"poolpairs": 60, "stats": 60, "loans/collaterals": 0.05}, max_size=2)
+    connection = Connection("https://ocean.defichain.com/v0/mainnet/", None, cache)
+    connection._session = session = FakeSession(handler=lambda url: FakeResponse(
+        {"data": {"count": {"blocks": 100}}} if url.endswith("stats") else
+        {"data": [{"id": "4", "height": len(session.urls)}]}))
+
+    assert cache.get_ttl("poolpairs/4/swaps?size=30") == 60 and cache.get_ttl("blocks") is None
+    assert connection.get("stats") and cache.get_tip_height() == 100
+    poolpairs = connection.get("poolpairs", size=30)
+    poolpairs["data"].clear()  # changing a response does not change the cache
+    assert connection.get("poolpairs", size=30)["data"] and len(session.urls) == 2
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 2
+
+    # Endpoints without ttl are not cached, expired responses are requested again
+    connection.get("blocks"), connection.get("blocks")
+    connection.get("loans/collaterals"), time.sleep(0.06), connection.get("loans/collaterals")
+    assert len(session.urls) == 6 and cache.get_stats()["evictions"] == 1
+
+    # A new tip height drops all cached responses
+    cache.set_tip_height(101)
+    connection.get("poolpairs", size=30)
+    assert len(session.urls) == 7 and cache.get_stats()["invalidations"] == 1
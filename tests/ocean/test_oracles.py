@@ -12,6 +12,12 @@ def test_list():  # 01
     assert ocean.oracles.list(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_list():
+    entries = list(ocean.oracles.iter_list(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getPriceFeed():  # 02
     oracleId = "d6c72ef84c9246b0800a9fb1f76a3c1ec071ff566a2aefc1faa20a4bd204ac14"
@@ -22,6 +28,15 @@ def test_getPriceFeed():  # 02
     assert ocean.oracles.getPriceFeed(oracleId=oracleId, token=token, currency=currency, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_getPriceFeed():
+    oracleId = "d6c72ef84c9246b0800a9fb1f76a3c1ec071ff566a2aefc1faa20a4bd204ac14"
+    token = "BTC"
+    currency = "USD"
+    entries = list(ocean.oracles.iter_getPriceFeed(oracleId, token, currency, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getOracleByAddress():  # 03
     address = "df1quc4qephru0a2m58ctusw2qx4cmksdqrvayeklg"
@@ -12,6 +12,12 @@ def test_list():  # 01
     assert ocean.poolpairs.list(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_list():
+    entries = list(ocean.poolpairs.iter_list(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_get():  # 02
     id = 4  # ETH-DFI
@@ -27,6 +33,13 @@ def test_listPoolSwaps():  # 03
     assert ocean.poolpairs.listPoolSwaps(id=id, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listPoolSwaps():
+    id = 4
+    entries = list(ocean.poolpairs.iter_listPoolSwaps(id, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_listPoolSwapsVerbose():  # 04
     id = 4  # ETH-DFI
@@ -35,6 +48,13 @@ def test_listPoolSwapsVerbose():  # 04
     assert ocean.poolpairs.listPoolSwapsVerbose(id=id, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listPoolSwapsVerbose():
+    id = 4
+    entries = list(ocean.poolpairs.iter_listPoolSwapsVerbose(id, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_listPoolSwapAggregates():  # 05
     id = 4  # ETH-DFI
@@ -44,6 +64,14 @@ def test_listPoolSwapAggregates():  # 05
     assert ocean.poolpairs.listPoolSwapAggregates(id=id, interval=interval, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_listPoolSwapAggregates():
+    id = 4
+    interval = 3600
+    entries = list(ocean.poolpairs.iter_listPoolSwapAggregates(id, interval, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getSwappableTokens():  # 06
     tokenId = 0  # DFI
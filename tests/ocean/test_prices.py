@@ -12,6 +12,12 @@ def test_list():  # 01
     assert ocean.prices.list(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_list():
+    entries = list(ocean.prices.iter_list(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_get():  # 02
     token = "DFI"
@@ -29,6 +35,14 @@ def test_getFeedActive():  # 03
     assert ocean.prices.getFeedActive(token=token, currency=currency, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_getFeedActive():
+    token = "DFI"
+    currency = "USD"
+    entries = list(ocean.prices.iter_getFeedActive(token, currency, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getFeed():  # 04
     token = "DFI"
@@ -38,6 +52,14 @@ def test_getFeed():  # 04
     assert ocean.prices.getFeed(token=token, currency=currency, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_getFeed():
+    token = "DFI"
+    currency = "USD"
+    entries = list(ocean.prices.iter_getFeed(token, currency, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getFeedWithInterval():  # 05
     token = "DFI"
@@ -48,6 +70,15 @@ def test_getFeedWithInterval():  # 05
     assert ocean.prices.getFeedWithInterval(token=token, currency=currency, interval=interval, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_getFeedWithInterval():
+    token = "DFI"
+    currency = "USD"
+    interval = 3600
+    entries = list(ocean.prices.iter_getFeedWithInterval(token, currency, interval, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getOracles():  # 06
     token = "DFI"
@@ -55,3 +86,11 @@ def test_getOracles():  # 06
     assert ocean.prices.getOracles(token, currency)
     assert ocean.prices.getOracles(token, currency, SIZE, NEXT)
     assert ocean.prices.getOracles(token=token, currency=currency, size=SIZE, next=NEXT)
+
+
+@pytest.mark.query
+def test_iter_getOracles():
+    token = "DFI"
+    currency = "USD"
+    entries = list(ocean.prices.iter_getOracles(token, currency, limit=SIZE))
+    assert len(entries) <= SIZE
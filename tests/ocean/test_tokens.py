@@ -12,6 +12,12 @@ def test_list():  # 01
     assert ocean.tokens.list(size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_list():
+    entries = list(ocean.tokens.iter_list(limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_get():  # 02
     id = 0  # DFI
@@ -19,8 +19,20 @@ def test_getVins():  # 02
     assert ocean.transactions.getVins(txid=TXID, size=SIZE, next=NEXT)
 
 
+@pytest.mark.query
+def test_iter_getVins():
+    entries = list(ocean.transactions.iter_getVins(TXID, limit=SIZE))
+    assert len(entries) <= SIZE
+
+
 @pytest.mark.query
 def test_getVouts():  # 03
     assert ocean.transactions.getVouts(TXID)
     assert ocean.transactions.getVouts(TXID, SIZE, NEXT)
     assert ocean.transactions.getVouts(txid=TXID, size=SIZE, next=NEXT)
+
+
+@pytest.mark.query
+def test_iter_getVouts():
+    entries = list(ocean.transactions.iter_getVouts(TXID, limit=SIZE))
+    assert len(entries) <= SIZE
@@ -0,0 +1,117 @@
+import pytest
+
+from defichain.dex import DexEngine, Pool, to_satoshi
+from defichain.exceptions.http.WrongParmeters import WrongParameters
+
+"""
+Local swap simulation with pools built like the answers of the node and ocean
+"""
+
+COIN = 100000000
+
+
+def node_pool(idTokenA: str, idTokenB: str, reserveA: float, reserveB: float, symbol: str, **kwargs) -> {}:
+    pool = {"symbol": symbol, "idTokenA": idTokenA, "idTokenB": idTokenB, "reserveA": reserveA,
+            "reserveB": reserveB, "commission": 0.002, "status": True, "tradeEnabled": True}
+    pool.update(kwargs)
+    return pool
+
+
+class FakeNode:
+    class Poolpair:
+        def __init__(self, pools: {}):
+            self.pools = pools
+            self.calls = []
+
+        def listpoolpairs(self, start=None, including_start=None, limit=100):
+            self.calls.append("listpoolpairs")
+            return {id: pool for id, pool in self.pools.items() if start is None or int(id) > start}
+
+        def getpoolpair(self, key):
+            self.calls.append(f"getpoolpair {key}")
+            return {key: self.pools[key]}
+
+    def __init__(self, pools: {}):
+        self.poolpair = self.Poolpair(pools)
+
+
+@pytest.mark.mandatory
+def test_pool():  # 01
+    pool = Pool.from_node("4", node_pool("0", "15", 1000, 2000, "DFI-DUSD", dexFeeInPctTokenB=0.05,
+                                         dexFeePctTokenA=0.01))
+    assert pool.commission == 200000 and pool.dexFeeInB == 5000000 and pool.dexFeeOutA == 1000000
+
+    # DFI -> DUSD: commission and 1% dex fee into the pool, no dex fee for DUSD out of the pool
+    amount = 10 * COIN - 10 * COIN * 200000 // COIN
+    amount -= amount * 1000000 // COIN
+    assert pool.swap("0", 10 * COIN) == 2000 * COIN - 2000 * COIN * 1000 * COIN // (1000 * COIN + amount) - 1
+
+    # DUSD -> DFI: commission, 5% dex fee into the pool and 1% dex fee out of the pool
+    amount = 10 * COIN - 10 * COIN * 200000 // COIN
+    amount -= amount * 5000000 // COIN
+    swapped = 1000 * COIN - 1000 * COIN * 2000 * COIN // (2000 * COIN + amount) - 1
+    assert pool.swap("15", 10 * COIN) == swapped - swapped * 1000000 // COIN
+
+    # The reserves change by the swapped amount without the commission and the dex fee
+    received = pool.apply_swap("0", 10 * COIN)
+    assert pool.reserveA == 1000 * COIN + 10 * COIN - 2000000 - 9980000
+    assert pool.reserveB == 2000 * COIN - received
+
+    with pytest.raises(WrongParameters):
+        pool.swap("2", COIN)
+    with pytest.raises(WrongParameters, match="Lack of liquidity"):
+        Pool("5", "0", "2", 999, COIN).swap("0", COIN)
+    assert to_satoshi(0.1) == 10000000 and to_satoshi("1.23456789") == 123456789
+
+
+@pytest.mark.mandatory
+def test_routes():  # 02
+    engine = DexEngine([
+        Pool.from_node("4", node_pool("1", "0", 100, 10000, "ETH-DFI")),
+        Pool.from_node("5", node_pool("2", "0", 0.01, 10, "BTC-DFI")),
+        Pool.from_node("6", node_pool("3", "0", 10000, 10000, "USDT-DFI")),
+        Pool.from_node("7", node_pool("2", "3", 100, 200000, "BTC-USDT")),
+        Pool.from_ocean({"id": "8", "symbol": "USDC-USDT", "status": True, "tradeEnabled": False, "commission": "0",
+                         "tokenA": {"id": "13", "symbol": "USDC", "reserve": "100"},
+                         "tokenB": {"id": "3", "symbol": "USDT", "reserve": "100"}}),
+    ])
+    assert sorted(engine.get_paths("ETH", "BTC")) == [["4", "5"], ["4", "6", "7"]]
+    assert engine.get_paths("ETH", "USDC") == []  # Trading is disabled
+
+    # Small amounts go through the direct pool, large amounts through the deeper pools of BTC-USDT
+    small, large = engine.swap_many("DFI", "BTC", [1, 500])
+    assert small.path == ["5"] and large.path == ["6", "7"]
+    assert small.amountTo == engine.swap("0", "2", 1, path=["5"]).amountTo
+    assert large.amountTo > engine.swap("0", "2", 500, path="direct").amountTo
+    assert str(engine.swap("DFI", "BTC", 0.00000001)) == "0.00000000@2"
+
+    with pytest.raises(WrongParameters):
+        engine.swap("DFI", "USDC", 1)
+    with pytest.raises(WrongParameters):
+        engine.swap("DFI", "BTC", 1, path=["4"])
+
+    # A swap changes the reserves and therefore the next result
+    before = engine.swap("DFI", "BTC", 1)
+    assert engine.apply_swap("DFI", "BTC", 1).amountTo == before.amountTo
+    assert engine.swap("DFI", "BTC", 1).amountTo < before.amountTo
+
+
+@pytest.mark.mandatory
+def test_refresh():  # 03
+    node = FakeNode({"4": node_pool("1", "0", 100, 10000, "ETH-DFI"),
+                     "5": node_pool("2", "0", 1, 1000, "BTC-DFI")})
+    engine = DexEngine.from_node(node)
+    paths = engine._find_paths("1", "2")
+    before = engine.swap("ETH", "BTC", 1).amountTo
+
+    # Changed reserves keep the found paths
+    node.poolpair.pools["5"] = node_pool("2", "0", 2, 1000, "BTC-DFI")
+    engine.refresh(["5"])
+    assert node.poolpair.calls == ["listpoolpairs", "getpoolpair 5"]
+    assert engine._find_paths("1", "2") is paths
+    assert engine.swap("ETH", "BTC", 1).amountTo > before
+
+    # A disabled pool removes its paths
+    node.poolpair.pools["4"] = node_pool("1", "0", 100, 10000, "ETH-DFI", status=False)
+    engine.refresh()
+    assert engine.get_paths("ETH", "BTC") == []
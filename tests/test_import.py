@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+
+"""
+Regression benchmark for the cold start of the library: importing defichain must not do any network I/O
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+IMPORT_TIME_LIMIT = 3  # seconds
+
+IMPORT_WITHOUT_NETWORK = """
+import socket
+import sys
+
+attempts = []
+
+
+def blocked(*args, **kwargs):
+    attempts.append(args)
+    raise OSError("Network access during import")
+
+
+socket.socket.connect = blocked
+socket.socket.connect_ex = blocked
+socket.create_connection = blocked
+socket.getaddrinfo = blocked
+
+import defichain
+
+print(attempts)
+sys.exit(1 if attempts else 0)
+"""
+
+
+def run_import(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+
+
+@pytest.mark.mandatory
+def test_import_without_network():
+    """
+    Checking that importing the library does not open any network connection
+    """
+    result = run_import(IMPORT_WITHOUT_NETWORK)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+@pytest.mark.mandatory
+def test_import_time():
+    """
+    Measures the wall time of: python -c "import defichain"
+    """
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = run_import("import defichain")
+        times.append(time.perf_counter() - start)
+        assert result.returncode == 0, result.stderr
+    times.sort()
+    median = times[len(times) // 2]
+    print(f"import defichain: median {median * 1000:.0f} ms, min {times[0] * 1000:.0f} ms, "
+          f"max {times[-1] * 1000:.0f} ms ({RUNS} runs)")
+    assert median < IMPORT_TIME_LIMIT
@@ -0,0 +1,54 @@
+import os
+import time
+
+import pytest
+
+from defichain.logger import Logger, TelegramSender, TELEGRAM_MAX_LENGTH
+from tests.util import FakeResponse, FakeSession
+
+"""
+Logger with a background thread for the file and batched telegram messages
+"""
+
+
+@pytest.mark.mandatory
+def test_file(tmp_path):  # 01
+    logger = Logger(str(tmp_path), log_level="all")
+    for i in range(5):
+        logger.input("NodeInput", f"request {i}")
+        logger.output("NodeOutput", f"result {i}")
+    logger.error("NodeError", "error")
+    logger.flush()
+
+    with open(os.path.join(str(tmp_path), os.listdir(str(tmp_path))[0])) as file:
+        lines = file.read().splitlines()
+    assert len(lines) == 11  # Every line is written once
+    assert lines[0].endswith("DEBUG - NodeInput: request 0") and lines[-1].endswith("ERROR - NodeError: error")
+    logger.close()
+
+
+@pytest.mark.mandatory
+def test_telegram(tmp_path):  # 02
+    sender = TelegramSender("token", "chatid", interval=60)
+    sender._session = session = FakeSession([FakeResponse({"parameters": {"retry_after": 0}}, 429)], delay=0.2)
+
+    logger = Logger(str(tmp_path), log_level="all")
+    logger.telegram, logger._telegramSender = True, sender
+    start = time.monotonic()
+    for i in range(3):
+        logger.error("NodeError", f"error {i}")
+    assert time.monotonic() - start < 0.2  # Telegram is not waited for
+
+    # The lines are sent in one message, which is repeated after the rate limit
+    sender.flush()
+    assert [data["text"] for data in session.data] == ["Error - NodeError: error 0\nError - NodeError: error 1\nError - NodeError: error 2"] * 2
+    assert sender.sent == 1
+
+    session.data, session.delay = [], 0
+    for i in range(3):
+        sender.add(str(i) * 3000)
+    logger.close()
+    assert [len(data["text"]) for data in session.data] == [3000, 3000, 3000]
+    sender.add("x" * 5000)
+    sender.flush()
+    assert len(session.data[-1]["text"]) == TELEGRAM_MAX_LENGTH
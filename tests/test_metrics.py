@@ -0,0 +1,65 @@
+import json
+
+import pytest
+import requests
+
+from defichain.exceptions.http.InternalServerError import InternalServerError
+from defichain.metrics import Metrics
+from defichain.node.rpc import RPC
+from defichain.ocean.connection import Connection
+from tests.util import FakeResponse, FakeSession
+
+"""
+Metrics of node and ocean requests with stub sessions instead of a node and ocean
+"""
+
+
+@pytest.mark.mandatory
+def test_node_metrics(monkeypatch):  # 01
+    monkeypatch.setattr("defichain.node.rpc.time.sleep", lambda seconds: None)
+    metrics = Metrics(buckets=(0.1, 1))
+    before, after = [], []
+    metrics.add_hook(before=lambda measurement: before.append(measurement.name), after=after.append)
+    metrics.add_hook(after=lambda measurement: 1 / 0)  # Failing hooks do not fail the request
+
+    rpc = RPC("http://127.0.0.1:8554", None, metrics=metrics)
+    rpc._session = FakeSession([requests.exceptions.ConnectionError(), FakeResponse({"result": 100}),
+                                FakeResponse({"result": None, "error": {"code": -8, "message": "wrong"}}, 500),
+                                FakeResponse([{"id": 0, "result": 1, "error": None}])])
+    assert rpc.call("getblockcount") == 100
+    with pytest.raises(InternalServerError):
+        rpc.call("getblockhash", -1)
+    assert rpc.call_many([("getblockhash", 1)]) == [1]
+
+    assert before == ["getblockcount", "getblockhash", "batch"]
+    assert after[0].retries == 1 and after[0].responseSize == len('{"result": 100}') and after[0].duration >= 0
+    assert after[1].error == "InternalServerError"
+
+    snapshot = metrics.get_snapshot()["node"]
+    assert snapshot["getblockcount"]["calls"] == 1 and snapshot["getblockcount"]["retries"] == 1
+    assert snapshot["getblockhash"]["errors"] == {"InternalServerError": 1}
+    assert snapshot["batch"]["latency"]["count"] == 1 and snapshot["batch"]["latency"]["buckets"]["+Inf"] == 1
+    assert snapshot["getblockcount"]["requestBytes"] == len(json.dumps(rpc._build_request("getblockcount", ())))
+
+    text = metrics.to_prometheus()
+    assert 'defichain_requests_total{source="node",name="getblockcount"} 1' in text
+    assert 'defichain_errors_total{source="node",name="getblockhash",error="InternalServerError"} 1' in text
+    assert 'defichain_request_duration_seconds_bucket{source="node",name="batch",le="+Inf"} 1' in text
+    assert "# TYPE defichain_request_duration_seconds histogram" in text
+
+    metrics.reset()
+    assert metrics.get_snapshot() == {}
+
+
+@pytest.mark.mandatory
+def test_ocean_metrics():  # 02
+    metrics = Metrics()
+    connection = Connection("https://ocean.defichain.com/v0/mainnet/", None, metrics=metrics)
+    connection._session = FakeSession([FakeResponse({"data": "1.0"}), FakeResponse({"data": "2.0"})])
+    connection.get("address/df1qm73xefmxmu3ggfhk4h44dstjl74cyfj2wgaft5/balance")
+    connection.get("address/df1qhyy5wu4h8uvkyc4j7m0yfdvdd0j2w7j4kyeqk0/balance")
+
+    snapshot = metrics.get_snapshot()["ocean"]
+    assert list(snapshot) == ["address/:id/balance"]  # Addresses are not part of the name
+    assert snapshot["address/:id/balance"]["calls"] == 2
+    assert snapshot["address/:id/balance"]["responseBytes"] == 2 * len('{"data": "1.0"}')
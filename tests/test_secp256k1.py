@@ -0,0 +1,72 @@
+import hashlib
+import pytest
+
+from defichain import Wallet
+from defichain.networks import DefichainMainnet
+from defichain.libs import secp256k1
+from defichain.libs.ecc import Point, S256Point, G, N
+
+"""
+Consistency checks of the available secp256k1 backends
+"""
+
+MNEMONIC = "unusual onion shallow invite supply more bubble mistake over make bracket cry"
+PRIVATE_KEY = bytes.fromhex("56605e027fdb039e86fabdf3057b117fcd2c82ceaaa997a4a47afdf03ce9b155")
+BACKENDS = secp256k1.available_backends()
+
+
+@pytest.fixture
+def backend(request):
+    previous = secp256k1.get_backend()
+    yield secp256k1.set_backend(request.param)
+    secp256k1.set_backend(previous)
+
+
+def digests(count: int) -> [bytes]:
+    return [hashlib.sha256(i.to_bytes(4, "big")).digest() for i in range(count)]
+
+
+@pytest.mark.hdwallet
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+def test_backend_consistency(backend):  # 01
+    reference = secp256k1.PythonBackend()
+    public_key = reference.public_key(PRIVATE_KEY)
+
+    assert backend.public_key(PRIVATE_KEY) == public_key
+    assert backend.public_key(PRIVATE_KEY, compressed=False) == reference.public_key(PRIVATE_KEY, compressed=False)
+    assert backend.public_key_tweak_add(public_key, digests(1)[0]) == \
+           reference.public_key_tweak_add(public_key, digests(1)[0])
+
+    for digest in digests(20):
+        signature = backend.sign_digest(PRIVATE_KEY, digest)
+        assert signature == reference.sign_digest(PRIVATE_KEY, digest)
+        assert reference.verify_digest(public_key, signature, digest)
+        assert backend.verify_digest(public_key, signature, digest)
+    assert not backend.verify_digest(public_key, signature, bytes(32))
+
+
+@pytest.mark.hdwallet
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+def test_backend_wallet(backend):  # 02
+    wallet = Wallet(DefichainMainnet).from_mnemonic(MNEMONIC)
+    xpublic_key = wallet.root_xpublic_key()
+    wallet.from_index(5)
+
+    public_wallet = Wallet(DefichainMainnet).from_xpublic_key(xpublic_key)
+    public_wallet.from_index(5)
+    assert wallet.public_key() == public_wallet.public_key()
+    assert wallet.bech32_address() == public_wallet.bech32_address()
+
+
+@pytest.mark.hdwallet
+def test_ecc_multiplication():  # 03
+    point = 0x1129 * G
+    scalars = [1, 2, 15, 16, 17, N - 1, N + 5] + [int.from_bytes(digest, "big") for digest in digests(10)]
+    for scalar in scalars:
+        # fixed base table and wNAF against plain double and add
+        assert (scalar * G).sec() == Point.__rmul__(G, scalar % N).sec()
+        assert (scalar * point).sec() == Point.__rmul__(point, scalar % N).sec()
+    assert (N * G).x is None
+    assert (point + (N - 1) * point).x is None
+    assert (point + point).sec() == (2 * point).sec()
+    assert isinstance(G + point, S256Point)
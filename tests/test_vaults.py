@@ -0,0 +1,130 @@
+import time
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from defichain.vaults import VaultRiskEngine, BLOCKS_PER_YEAR
+
+"""
+Collateral ratios of many vaults with vaults in the format of the node and ocean
+"""
+
+
+class FakeNode:
+    class Loan:
+        def listcollateraltokens(self):
+            return [{"token": "DFI", "tokenId": "0", "factor": 1, "fixedIntervalPriceId": "DFI/USD"},
+                    {"token": "DUSD", "tokenId": "15", "factor": 0.99, "fixedIntervalPriceId": "DUSD/USD"}]
+
+        def listloantokens(self):
+            return [{"token": {"15": {"symbol": "DUSD"}}, "fixedIntervalPriceId": "DUSD/USD", "interest": 0},
+                    {"token": {"113": {"symbol": "TSLA"}}, "fixedIntervalPriceId": "TSLA/USD", "interest": 2}]
+
+        def listloanschemes(self):
+            return [{"id": "MIN150", "mincolratio": 150, "interestrate": 5},
+                    {"id": "MIN200", "mincolratio": 200, "interestrate": 3}]
+
+    class Oracles:
+        def __init__(self):
+            self.prices = [{"priceFeedId": "DFI/USD", "activePrice": 2, "nextPrice": 1.5, "isLive": True},
+                           {"priceFeedId": "TSLA/USD", "activePrice": 100, "nextPrice": 100, "isLive": True}]
+
+        def listfixedintervalprices(self, start=None, limit=100):
+            return self.prices
+
+    class Vault:
+        def __init__(self, vaults: [{}]):
+            self.vaults = vaults
+
+        def getvault(self, vaultId, verbose=False):
+            return {key: value for key, value in self.vaults[int(vaultId)].items() if key != "vaultId"}
+
+        def listvaults(self, verbose=False, start=None, including_start=None, limit=100):
+            index = 0 if start is None else [vault["vaultId"] for vault in self.vaults].index(start) + 1
+            return self.vaults[index:index + limit]
+
+    def __init__(self, vaults: [{}]):
+        self.loan = self.Loan()
+        self.oracles = self.Oracles()
+        self.vault = self.Vault(vaults)
+
+
+def node_vault(vaultId: str, scheme: str, collateral: [str], loans: [str], interest: [str] = (),
+               state: str = "active") -> {}:
+    return {"vaultId": vaultId, "loanSchemeId": scheme, "state": state, "collateralAmounts": list(collateral),
+            "loanAmounts": list(loans), "interestAmounts": list(interest)}
+
+
+@pytest.mark.mandatory
+def test_scan():  # 01
+    node = FakeNode([node_vault("a", "MIN150", ["300@DFI"], ["200@DUSD"]),
+                     node_vault("b", "MIN150", ["100@DFI", "100@DUSD"], ["1@TSLA"]),
+                     node_vault("c", "MIN200", ["100@DFI"], []),
+                     node_vault("d", "MIN150", ["1@DFI"], ["1@DUSD"], state="inLiquidation")])
+    engine = VaultRiskEngine.from_node(node)
+    assert engine.get_count() == 3  # Vaults in liquidation are not watched
+
+    vault = engine.get_vault("b")
+    assert vault["collateralValue"] == pytest.approx(100 * 2 + 100 * 0.99)
+    assert vault["collateralRatio"] == pytest.approx(299)
+    assert vault["nextCollateralRatio"] == pytest.approx(249)
+    assert engine.get_vault("a")["collateralRatio"] == pytest.approx(300)
+    assert engine.get_vault("c")["collateralRatio"] == numpy.inf  # No loans
+
+    assert engine.get_vaults_below(301) == ["b", "a"]
+    assert engine.get_vaults_below(301, next=True) == ["a", "b"]  # 225% and 249% at the next price
+    assert engine.get_liquidation_candidates(margin=80) == ["a"]
+
+    # Updated prices and vaults are taken into account by the next scan
+    engine.set_prices({"DFI": (0.9, 0.9)})
+    engine.update_vaults([{"vaultId": "e", "state": "ACTIVE", "loanScheme": {"id": "MIN150", "minColRatio": "150",
+                                                                             "interestRate": "5"},
+                           "collateralAmounts": [{"symbol": "DFI", "amount": "200"}],
+                           "loanAmounts": [{"symbol": "DUSD", "amount": "100"}], "interestAmounts": []}])
+    assert engine.get_liquidation_candidates() == ["a"]  # 135%
+    assert engine.get_vaults_below(181) == ["a", "e"]
+
+    # A vault with a token without live price is frozen
+    engine.set_prices({"TSLA": (100, 100, False)})
+    assert engine.get_vault("b")["frozen"] and not engine.get_vault("a")["frozen"]
+
+    engine.remove_vault("a")
+    assert engine.get_vault_ids() == ["e", "b", "c"] and engine.get_vault("e")["collateralRatio"] == 180
+
+
+@pytest.mark.mandatory
+def test_interest():  # 02
+    engine = VaultRiskEngine()
+    engine.set_loan_schemes({"MIN150": (150, 5)})
+    engine.set_loan_tokens({"DUSD": 0, "TSLA": 2})
+    engine.update_vaults([node_vault("a", "MIN150", [], ["110@DUSD", "1@TSLA"], ["10@DUSD"])])
+
+    # The interest is computed on the loan without the interest which is already accrued
+    engine.accrue_interest(BLOCKS_PER_YEAR)
+    engine.set_prices({"DUSD": (1, 1), "TSLA": (100, 100)})
+    assert engine.get_results()["loanValue"][0] == pytest.approx(110 + 100 * 0.05 + 100 * 1.07)
+
+
+@pytest.mark.mandatory
+def test_many_vaults():  # 03
+    vaults = [node_vault(str(i), "MIN150", [f"{100 + i % 500}@DFI", "10@DUSD"], [f"{50 + i % 70}@DUSD"])
+              for i in range(10000)]
+    engine = VaultRiskEngine.from_node(FakeNode(vaults))
+    assert engine.get_count() == 10000
+
+    start = time.perf_counter()
+    engine.accrue_interest()
+    engine.scan()
+    below = engine.get_vaults_below(200)
+    assert time.perf_counter() - start < 1
+
+    ratios = engine.get_results()["collateralRatio"]
+    expected = [i for i in range(10000) if (2 * (100 + i % 500) + 9.9) / (50 + i % 70) * 100 < 200]
+    assert sorted(below, key=int) == [str(i) for i in expected]
+    assert list(ratios[[engine.get_vault_ids().index(id) for id in below]]) == sorted(ratios[ratios < 200])
+
+    # Single vaults are reloaded without a full refresh
+    vaults[7]["loanAmounts"] = ["1000@DUSD"]
+    engine.refresh_vaults(["7"])
+    assert engine.get_count() == 10000 and engine.get_vaults_below(30) == ["7"]
@@ -0,0 +1,101 @@
+import random
+import time
+
+import pytest
+
+from defichain import Account, TxBuilder
+from defichain.exceptions.transactions import TxBuilderError
+from defichain.networks import DefichainMainnet
+from defichain.transactions.builder.coinselection import select_coins, select_branch_and_bound, select_knapsack, \
+    select_largest_first, select_consolidate
+from defichain.transactions.address import Address
+from defichain.transactions.constants import CoinSelection
+from defichain.transactions.rawtransactions import Transaction, TxP2WPKHInput, TxAddressOutput, estimate_fee
+from tests.util import TXID, PRIVATE_KEY, BECH32, DEFAULT, FakeSource, fake_unspent
+
+"""
+Selection of the inputs for the value and the fee of a transaction
+"""
+
+
+def unspent(*values: int) -> [{}]:
+    return [{"txid": str(i), "vout": 0, "value": value} for i, value in enumerate(values)]
+
+
+def values(selected: [{}]) -> [int]:
+    return sorted(entry["value"] for entry in selected)
+
+
+@pytest.mark.mandatory
+def test_strategies():  # 01
+    entries = unspent(110, 60, 40, 30, 20, 10, 5)
+
+    # Values without the fee for each input of 5: 105, 55, 35, 25, 15, 5 and the last one is never selected
+    assert values(select_largest_first(entries, 150, 5)) == [60, 110]
+    assert values(select_branch_and_bound(entries, 70, 5)) == [20, 60]
+    assert values(select_branch_and_bound(entries, 102, 5, costOfChange=5)) == [110]  # Fewer inputs
+    assert select_branch_and_bound(entries, 3, 5) is None
+    assert select_branch_and_bound(entries, 250, 5) is None
+
+    # Knapsack finds the closest subset of the smaller values or takes the smallest larger value
+    assert values(select_knapsack(entries, 88, 5, rng=random.Random(1))) == [40, 60]
+    assert values(select_knapsack(entries, 101, 5, rng=random.Random(1))) == [110]
+    assert values(select_knapsack(entries, 35, 5)) == [40]
+
+    # Small values are added while the fee is low
+    assert values(select_consolidate(entries, 102, 5, feePerByte=1)) == [10, 20, 30, 40, 60, 110]
+    assert values(select_consolidate(entries, 102, 5, feePerByte=1, maxInputs=3)) == [10, 20, 110]
+    assert values(select_consolidate(entries, 102, 5, feePerByte=2)) == [110]
+
+    # Callable strategies get the same arguments
+    assert select_coins(lambda entries, target, feePerInput, **kwargs: entries[:1], entries, 1, 1) == entries[:1]
+    with pytest.raises(TxBuilderError):
+        select_coins("smallestfirst", entries, 1, 1)
+
+
+@pytest.mark.mandatory
+def test_many_inputs():  # 02
+    # The size, fee and signing time depend on the value and not on the number of unspent outputs
+    unspentValues = [100000 + i for i in range(5000)] + [300000000]
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), FakeSource(unspentValues))
+
+    start = time.perf_counter()
+    tx = builder.utxo.send(1, DEFAULT)
+    assert time.perf_counter() - start < 1
+    assert len(tx.get_inputs()) == 1 and tx.get_inputs()[0].get_value() == 300000000
+    assert 0 < tx.get_outputs()[1].get_value() - 199999000 < 1000
+
+    # Small payments are paid exactly without change output
+    tx = builder.utxo.send(0.002, DEFAULT)
+    assert len(tx.get_inputs()) == 2 and len(tx.get_outputs()) == 1
+    assert 0 < tx.get_inputsValue() - 200000 < 500  # Fee
+
+    # Without a value all unspent outputs are used
+    assert len(builder.get_inputs_tx().get_inputs()) == 5001
+    assert builder.get_coinSelection() == CoinSelection.BRANCH_AND_BOUND
+
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), FakeSource([100000] * 5),
+                        coinSelection=CoinSelection.ALL)
+    assert len(builder.accounts.utxostoaccount(BECH32, 0.001).get_inputs()) == 5
+    with pytest.raises(TxBuilderError):
+        TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), None, coinSelection="smallestfirst")
+
+
+@pytest.mark.mandatory
+def test_address_types():  # 03
+    # Spending a P2SH output costs more than spending a P2WPKH output, the fee is calculated for each entry
+    value = 100000  # 0.001 DFI
+    base = estimate_fee(Transaction([], [TxAddressOutput(value, DEFAULT), TxAddressOutput(0, BECH32)]), 1) + 2
+    bech32Fee = estimate_fee(Transaction([TxP2WPKHInput(TXID, 0, BECH32, 0)], []), 1) - \
+        estimate_fee(Transaction([], []), 1)
+    p2sh = Address.from_address(DEFAULT).get_scriptPublicKey()
+    source = FakeSource({BECH32: [fake_unspent(TXID, 0, 1000), fake_unspent(TXID, 1, value + base + bech32Fee, p2sh)]})
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), source)
+
+    # With the fee of a P2WPKH input the P2SH output alone would pay the value and the fee exactly
+    tx = builder.utxo.send(0.001, DEFAULT)
+    assert len(tx.get_inputs()) == 2 and tx.get_outputs()[0].get_value() == value
+    assert tx.get_inputsValue() > tx.get_outputsValue()
+
+    # The strategies get the fee for each entry from a callable
+    assert values(select_largest_first(unspent(50, 40), 30, lambda entry: 25 if entry["value"] == 50 else 5)) == [40]
@@ -0,0 +1,184 @@
+import pytest
+
+from defichain.exceptions.transactions import DeserializeError
+from defichain.networks import DefichainMainnet
+from defichain.transactions.defitx import UtxosToAccount, AccountToAccount, Poolswap
+from defichain.transactions.rawtransactions import Transaction, TxInput, TxP2WPKHInput, TxP2SHInput, \
+    TxOutput, TxAddressOutput, TxMsgOutput, TxDefiOutput, TxCoinbaseInput, Block, BlockHeader, WitnessHash
+from defichain.transactions.rawtransactions.txoutput import TxCoinbaseOutput
+from defichain.transactions.utils import ByteReader, Calculate
+from tests.util import TXID, PRIVATE_KEY, BECH32, DEFAULT, LEGACY
+
+"""
+Deserialization of raw transactions and blocks from bytes
+"""
+
+
+def transactions() -> [Transaction]:
+    outputs = [TxAddressOutput(5000, BECH32), TxAddressOutput(7000, DEFAULT), TxAddressOutput(9000, LEGACY)]
+    txs = [Transaction([TxInput(TXID, 1)], outputs),
+           Transaction([TxP2SHInput(TXID, 0, BECH32, 50000), TxP2WPKHInput(TXID, 1, BECH32, 60000)], outputs)
+           .sign(DefichainMainnet, [PRIVATE_KEY]),
+           Transaction([TxP2WPKHInput(TXID, 2, BECH32, 100000)], [TxMsgOutput("Hello Defichain")])
+           .sign(DefichainMainnet, [PRIVATE_KEY])]
+    for defiTx in (UtxosToAccount(BECH32, 12345, 0), AccountToAccount(BECH32, {DEFAULT: ["6@0", "7@2"]}),
+                   Poolswap(BECH32, 0, 100000000, BECH32, 15, 123456789012)):
+        txs.append(Transaction([TxP2WPKHInput(TXID, 0, BECH32, 1000000)],
+                               [TxDefiOutput(0, defiTx), TxAddressOutput(900000, BECH32)])
+                   .sign(DefichainMainnet, [PRIVATE_KEY]))
+    return txs
+
+
+@pytest.mark.mandatory
+def test_bytereader():  # 01
+    reader = ByteReader.from_hex("04000000fd0301ff" + "01" * 8 + "0361626300")
+    assert reader.read_uint32() == 4
+    assert reader.read_compactSize() == 259
+    assert reader.read_compactSize() == int("01" * 8, 16)
+    assert reader.read_varBytes().tobytes() == b"abc"
+    assert reader.remaining() == 1
+    with pytest.raises(DeserializeError):
+        reader.read_uint32()
+    with pytest.raises(DeserializeError):
+        ByteReader.from_hex("zz")
+
+
+@pytest.mark.mandatory
+def test_deserialize_roundtrip():  # 02
+    for tx in transactions():
+        serialized = tx.serialize()
+        assert Transaction.deserialize(DefichainMainnet, serialized).serialize() == serialized
+        assert Transaction.from_bytes(DefichainMainnet, bytes.fromhex(serialized)).serialize() == serialized
+
+
+@pytest.mark.mandatory
+def test_deserialize_outputs():  # 03
+    tx = Transaction.from_bytes(DefichainMainnet, bytes.fromhex(transactions()[0].serialize()))
+    assert [output.get_address() for output in tx.get_outputs()] == [BECH32, DEFAULT, LEGACY]
+    assert [output.get_value() for output in tx.get_outputs()] == [5000, 7000, 9000]
+
+    tx = Transaction.from_bytes(DefichainMainnet, bytes.fromhex(transactions()[-1].serialize()))
+    assert isinstance(tx.get_outputs()[0].get_defiTx(), Poolswap)
+    assert tx.is_signed()
+
+
+@pytest.mark.mandatory
+def test_deserialize_truncated():  # 04
+    serialized = bytes.fromhex(transactions()[1].serialize())
+    with pytest.raises(DeserializeError):
+        Transaction.from_bytes(DefichainMainnet, serialized[:-10])
+    assert Transaction.deserialize(DefichainMainnet, serialized[:-10].hex()) is None
+
+
+@pytest.mark.mandatory
+def test_block():  # 05
+    coinbase = Transaction([TxCoinbaseInput("03a0252601")],
+                           [TxAddressOutput(200000000, BECH32), TxCoinbaseOutput("6a24aa21a9ed" + "11" * 32)])
+    undecodable = Transaction([TxInput(TXID, 3)], [TxOutput(0, "6a02ffff", 0)])  # message that is not ascii
+    txs = [coinbase.serialize()] + [tx.serialize() for tx in transactions()] + [undecodable.serialize()]
+    header = BlockHeader(536870912, "aa" * 32, "bb" * 32, 1700000000, 486604799, 2500000, 42, "cc" * 32, "30" * 65)
+    block = Block.deserialize(DefichainMainnet, header.serialize() + Calculate.write_compactSize(len(txs)) +
+                              "".join(txs))
+
+    assert block.get_hash() == header.get_hash() and block.get_height() == 2500000
+    assert len(block) == len(txs)
+    assert [bytes(raw).hex() for raw in block.iter_raw_transactions()] == txs
+
+    decoded = block.get_transactions(ignore_errors=True)
+    assert [tx.serialize() for tx in decoded[:-1]] == txs[:-1]
+    assert decoded[-1] is None
+    assert decoded[0].is_coinbase()
+    assert block.get_txids()[1] == decoded[1].get_hash()  # txid of a transaction without witness
+    with pytest.raises(DeserializeError):
+        block.get_transactions()
+    with pytest.raises(DeserializeError):
+        Block.deserialize(DefichainMainnet, block.serialize()[:-10]).get_txids()
+
+
+@pytest.mark.mandatory
+def test_serialization_cache():  # 06
+    tx = Transaction([TxP2WPKHInput(TXID, 0, BECH32, 100000)], [TxAddressOutput(5000, BECH32)])
+    serialized, txid, size = tx.serialize(), tx.get_txid(), tx.size()
+    assert tx.bytes() is tx.bytes()
+
+    # Changes of inputs, outputs and witnesses are part of the serialization
+    tx.get_outputs()[0].set_value(4000)
+    assert tx.serialize() != serialized and tx.get_txid() != txid and tx.size() == size
+    tx.add_output(TxAddressOutput(1000, DEFAULT))
+    assert tx.size() > size
+
+    tx.sign(DefichainMainnet, [PRIVATE_KEY])
+    signed = tx.serialize()
+    assert tx.is_signed() and tx.size() > size + 100
+
+    # Calculating the midstates for signing does not drop the cached serialization
+    cached, revision = tx.bytes(), tx._get_revision()
+    tx.get_bytes_hashPrevOuts(), tx.get_bytes_hashSequences(), tx.get_bytes_hashOutputs()
+    assert tx._get_revision() == revision and tx.bytes() is cached
+    tx.get_inputs()[0].get_witness().set_signature("30" * 71)
+    assert tx.serialize() != signed
+    assert Transaction.deserialize(DefichainMainnet, tx.serialize()).serialize() == tx.serialize()
+
+
+@pytest.mark.mandatory
+def test_deserialize_lockTime():  # 07
+    # The witnesses end after one stack per input, a lockTime starting with 0x02 or 0x00 is not a witness
+    txs = [Transaction([TxP2WPKHInput(TXID, 0, BECH32, 100000), TxP2SHInput(TXID, 1, BECH32, 50000)],
+                       [TxAddressOutput(90000, BECH32)], lockTime=lockTime).sign(DefichainMainnet, [PRIVATE_KEY])
+           for lockTime in (2, 0, 2500000)]
+    for tx in txs:
+        decoded = Transaction.from_reader(DefichainMainnet, ByteReader.from_hex(tx.serialize()))
+        assert decoded.serialize() == tx.serialize() and decoded.get_lockTime() == tx.get_lockTime()
+
+    # Transactions are read one after another from the same reader
+    reader = ByteReader.from_hex("".join(tx.serialize() for tx in txs))
+    assert [Transaction.from_reader(DefichainMainnet, reader).get_lockTime() for _ in txs] == [2, 0, 2500000]
+    assert reader.is_at_end()
+
+    header = BlockHeader(536870912, "aa" * 32, "bb" * 32, 1700000000, 486604799, 2500000, 42, "cc" * 32, "30" * 65)
+    block = Block.deserialize(DefichainMainnet, header.serialize() + Calculate.write_compactSize(len(txs)) +
+                              "".join(tx.serialize() for tx in txs))
+    assert [tx.serialize() for tx in block.get_transactions()] == [tx.serialize() for tx in txs]
+
+
+@pytest.mark.mandatory
+def test_midstates():  # 08
+    def inputs(*vouts: int) -> [TxP2WPKHInput]:
+        return [TxP2WPKHInput(TXID, vout, BECH32, 100000) for vout in vouts]
+
+    def midstates(tx: Transaction) -> (bytes, bytes, bytes):
+        return (Calculate.dHash256(b"".join(input.get_bytes_txid() + input.get_bytes_vout()
+                                            for input in tx.get_inputs())),
+                Calculate.dHash256(b"".join(input.get_bytes_sequence() for input in tx.get_inputs())),
+                Calculate.dHash256(b"".join(bytes(output) for output in tx.get_outputs())))
+
+    def cached(tx: Transaction) -> (bytes, bytes, bytes):
+        return tx.get_bytes_hashPrevOuts(), tx.get_bytes_hashSequences(), tx.get_bytes_hashOutputs()
+
+    # Adding and setting inputs and outputs drops the calculated midstates
+    tx = Transaction(inputs(0, 1), [TxAddressOutput(5000, BECH32)])
+    assert cached(tx) == midstates(tx)
+    tx.add_input(inputs(2)[0])
+    assert cached(tx) == midstates(tx)
+    tx.add_output(TxAddressOutput(1000, DEFAULT))
+    assert cached(tx) == midstates(tx)
+    tx.set_inputs(inputs(3, 4, 5))
+    assert cached(tx) == midstates(tx)
+    tx.set_outputs([TxAddressOutput(2000, LEGACY)])
+    assert cached(tx) == midstates(tx)
+
+    # Changing an input or output in place drops them as well
+    tx.get_outputs()[0].set_value(3000)
+    assert cached(tx) == midstates(tx)
+    tx.get_inputs()[0].set_vout(6)
+    assert cached(tx) == midstates(tx)
+    tx.get_inputs()[1].set_sequence("fffffffe")
+    assert cached(tx) == midstates(tx)
+    tx.get_inputs()[1].set_sequence("ffffffff")
+    fresh = Transaction([inputs(6)[0]] + inputs(4, 5), [TxAddressOutput(3000, LEGACY)])
+    assert WitnessHash(tx, tx.get_inputs()[1]).bytes_hash() == WitnessHash(fresh, fresh.get_inputs()[1]).bytes_hash()
+
+    # Signing with the midstates shared by all inputs gives the same transaction as signing a new one
+    tx.sign(DefichainMainnet, [PRIVATE_KEY])
+    fresh.sign(DefichainMainnet, [PRIVATE_KEY])
+    assert tx.serialize() == fresh.serialize() and cached(tx) == midstates(fresh)
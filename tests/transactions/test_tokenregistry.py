@@ -0,0 +1,118 @@
+import time
+
+import pytest
+
+from defichain import Ocean
+from defichain.exceptions.transactions import TokenError
+from defichain.networks import DefichainMainnet
+from defichain.transactions.constants import TokenTypes
+from defichain.transactions.utils import TokenRegistry, Token
+
+"""
+Index of the tokens of a network, refreshed from an ocean or node instance
+"""
+
+
+def token(id: int, symbol: str, isDAT: bool = True, isLPS: bool = False, isLoanToken: bool = False) -> {}:
+    return {"id": str(id), "symbol": symbol, "name": symbol, "isDAT": isDAT, "isLPS": isLPS,
+            "isLoanToken": isLoanToken}
+
+
+class StubTokens:
+    def __init__(self, tokens: [{}]):
+        self.tokens = tokens
+        self.calls = 0
+
+    def iter_list(self, size: int = 30):
+        self.calls += 1
+        if self.tokens is None:
+            raise Exception("Ocean is not available")
+        return iter(self.tokens)
+
+
+class StubOcean(Ocean):
+    def __init__(self, tokens: [{}]):
+        super().__init__()
+        self.tokens = StubTokens(tokens)
+
+
+@pytest.mark.mandatory
+def test_lookup():  # 01
+    registry = TokenRegistry(DefichainMainnet)
+    assert registry.get_token_by_id(0)["symbol"] == "DFI" and registry.get_token_by_id("15")["symbol"] == "DUSD"
+    assert registry.get_token_by_symbol("DUSD")["id"] == "15" and registry.get_token_by_symbol("UNKNOWN") is None
+    assert 0 in registry and "DUSD" in registry and "UNKNOWN" not in registry
+
+    # Tokens are ordered by id and filtered by type
+    tokens = registry.get_tokens()
+    assert len(tokens) == len(registry) and [int(t["id"]) for t in tokens] == sorted(int(t["id"]) for t in tokens)
+    assert all(t["isDAT"] and not t["isLPS"] for t in registry.get_tokens(TokenTypes.STANDARD))
+    assert all(t["isDAT"] and t["isLPS"] for t in registry.get_tokens(TokenTypes.LIQUIDITY))
+    assert all(t["isLoanToken"] for t in registry.get_tokens(TokenTypes.LOAN))
+    assert all(not t["isDAT"] for t in registry.get_tokens(TokenTypes.CUSTOM))
+    assert registry.get_token_by_symbol("DUSD") in registry.get_tokens(TokenTypes.LOAN)
+    with pytest.raises(TokenError):
+        registry.get_tokens("wrapped")
+
+    # Custom tokens with the same symbol as a DAT token do not replace it
+    custom = [t for t in registry.get_tokens(TokenTypes.CUSTOM) if t["symbol"] == "DFI"]
+    assert custom and registry.get_token_by_symbol("DFI")["id"] == "0"
+
+    # The token helpers use the registry of the network
+    assert Token.get_id_from_symbol(DefichainMainnet, "DUSD") == 15
+    assert Token.get_symbol_from_id(DefichainMainnet, 15) == "DUSD"
+    assert Token.checkAndConvert(DefichainMainnet, "DFI") == 0
+    assert TokenRegistry.get_registry(DefichainMainnet) is TokenRegistry.get_registry(DefichainMainnet)
+
+
+@pytest.mark.mandatory
+def test_add():  # 02
+    registry = TokenRegistry(DefichainMainnet)
+    size = len(registry)
+
+    registry.add(token(100000, "NEW", isDAT=False))
+    assert registry.get_token_by_id(100000)["symbol"] == "NEW" and len(registry) == size + 1
+
+    # A DAT token takes the symbol of a custom token, a new token with an existing id replaces the old one
+    registry.add_tokens([token(100001, "NEW"), token(0, "DFI", isLoanToken=True)])
+    assert registry.get_token_by_symbol("NEW")["id"] == "100001"
+    assert registry.get_token_by_id(0)["isLoanToken"] and len(registry) == size + 2
+
+    # Tokens with missing keys are not added
+    with pytest.raises(TokenError):
+        registry.add_tokens([token(100002, "OTHER"), {"id": 100003, "symbol": "BROKEN"}])
+    assert registry.get_token_by_id(100002) is None
+
+
+@pytest.mark.mandatory
+def test_refresh():  # 03
+    registry = TokenRegistry(DefichainMainnet)
+    with pytest.raises(TokenError):
+        registry.refresh()
+    with pytest.raises(TokenError):
+        registry.set_source(object())
+    with pytest.raises(TokenError):
+        registry.set_source(StubOcean([]), ttl=0)
+
+    # The registry is refreshed when the source is set and again on the next lookup after the ttl
+    ocean = StubOcean([token(100000, "NEW")])
+    registry.set_source(ocean, ttl=0.05)
+    assert ocean.tokens.calls == 1 and registry.get_token_by_symbol("NEW")["id"] == "100000"
+    ocean.tokens.tokens.append(token(100001, "NEWER"))
+    assert registry.get_token_by_symbol("NEWER") is None and ocean.tokens.calls == 1
+    time.sleep(0.06)
+    assert registry.get_token_by_symbol("NEWER")["id"] == "100001" and ocean.tokens.calls == 2
+
+    # If the source fails, the known tokens stay usable and the refresh is tried after another ttl
+    ocean.tokens.tokens = None
+    time.sleep(0.06)
+    assert registry.get_token_by_symbol("NEWER") is not None and ocean.tokens.calls == 3
+    assert registry.get_token_by_symbol("NEW") is not None and ocean.tokens.calls == 3
+
+    # Without a ttl the registry is only refreshed on request
+    ocean.tokens.tokens = [token(100002, "NEWEST")]
+    registry.set_source(ocean, refresh=False)
+    time.sleep(0.06)
+    assert registry.get_token_by_symbol("NEWEST") is None and ocean.tokens.calls == 3
+    registry.refresh()
+    assert registry.get_token_by_symbol("NEWEST") is not None and ocean.tokens.calls == 4
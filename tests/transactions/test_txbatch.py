@@ -0,0 +1,88 @@
+import pytest
+
+from defichain import Account, TxBuilder
+from defichain.exceptions.transactions import TxBuilderError
+from defichain.networks import DefichainMainnet
+from defichain.transactions.constants import MEMPOOL_ANCESTOR_LIMIT
+from defichain.transactions.remotedata import RemoteDataTracker
+from tests.util import PRIVATE_KEY, BECH32, DEFAULT, FakeSource
+
+"""
+Batches of transactions which are built one after another without waiting for their confirmation
+"""
+
+
+def outpoints(tx) -> [(str, int)]:
+    return [(input.get_txid(), input.get_vout()) for input in tx.get_inputs()]
+
+
+@pytest.mark.mandatory
+def test_chain():  # 01
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), FakeSource([1000000000, 500000000]))
+    batch = builder.batch()
+    for _ in range(30):
+        batch.accounts.accounttoaccount(BECH32, {DEFAULT: "1@0"})
+    txs, txids, tracker = batch.get_transactions(), batch.get_txids(), batch.get_tracker()
+    assert len(txs) == 30 and [tx.get_txid() for tx in txs] == txids
+
+    # Every transaction spends the change of the previous one until the chain reaches the ancestor limit
+    spent = [outpoint for tx in txs for outpoint in outpoints(tx)]
+    assert len(spent) == len(set(spent))
+    assert outpoints(txs[0]) == [(f"{0:064x}", 0)]
+    assert all(outpoints(txs[i]) == [(txids[i - 1], 1)] for i in range(1, MEMPOOL_ANCESTOR_LIMIT))
+    assert outpoints(txs[MEMPOOL_ANCESTOR_LIMIT]) == [(f"{1:064x}", 0)]
+    assert max(tracker.get_ancestor_count(txid) for txid in txids) == MEMPOOL_ANCESTOR_LIMIT
+
+    # Without a data source there is nothing to track
+    with pytest.raises(TxBuilderError):
+        TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), None).batch()
+
+
+@pytest.mark.mandatory
+def test_send():  # 02
+    source = FakeSource([1000000000], failAt=2)
+    tracker = RemoteDataTracker(source)
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), tracker)
+    batch = builder.batch()
+    assert batch.get_tracker() is tracker
+    for _ in range(4):
+        batch.utxo.send(1, DEFAULT)
+    txids = batch.get_txids()
+
+    # The failed transaction and the following ones are removed, their inputs can be spent again
+    with pytest.raises(Exception, match="txn-mempool-conflict"):
+        batch.send()
+    assert len(source.sent) == 2 and batch.get_txids() == txids[:2]
+    assert [(entry["txid"], entry["vout"]) for entry in tracker.get_unspent(BECH32)] == [(txids[1], 1)]
+
+    # The batch continues with the change of the last sent transaction
+    source.failAt = None
+    batch.utxo.send(1, DEFAULT)
+    assert outpoints(batch.get_transactions()[-1]) == [(txids[1], 1)]
+    assert batch.send() == batch.get_txids() and len(source.sent) == 3
+
+
+@pytest.mark.mandatory
+def test_discard():  # 03
+    tracker = RemoteDataTracker(FakeSource([1000000000]))
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), tracker)
+
+    # A batch which is not sent leaves no transactions in the shared tracker
+    with builder.batch() as batch:
+        for _ in range(3):
+            batch.utxo.send(1, DEFAULT)
+        txids = batch.get_txids()
+        assert all(tracker.get_ancestor_count(txid) > 0 for txid in txids)
+    assert batch.get_txids() == [] and all(tracker.get_ancestor_count(txid) == 0 for txid in txids)
+    tx = builder.utxo.send(1, DEFAULT)
+    assert outpoints(tx) == [(f"{0:064x}", 0)]
+    tracker.release(outpoints(tx))
+
+    # Sent transactions are kept
+    batch = builder.batch()
+    batch.utxo.send(1, DEFAULT)
+    sent = batch.send()
+    batch.utxo.send(1, DEFAULT)
+    batch.discard()
+    assert batch.get_txids() == sent and tracker.get_ancestor_count(sent[0]) == 1
+    assert [(entry["txid"], entry["vout"]) for entry in tracker.get_unspent(BECH32)] == [(sent[0], 1)]
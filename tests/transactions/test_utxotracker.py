@@ -0,0 +1,119 @@
+import pytest
+
+from defichain import Account, TxBuilder
+from defichain.networks import DefichainMainnet
+from defichain.transactions.rawtransactions import Transaction, TxP2WPKHInput, TxAddressOutput, Block, BlockHeader
+from defichain.transactions.remotedata import RemoteDataTracker
+from defichain.transactions.utils import Calculate
+from tests.util import TXID, PRIVATE_KEY, BECH32, DEFAULT, FakeSource, fake_unspent
+
+"""
+Local tracking of unspent outputs for transactions built one after another
+"""
+
+
+def block(*txs: Transaction) -> Block:
+    header = BlockHeader(536870912, "aa" * 32, "bb" * 32, 1700000000, 486604799, 2500000, 42, "cc" * 32, "30" * 65)
+    return Block.deserialize(DefichainMainnet, header.serialize() + Calculate.write_compactSize(len(txs)) +
+                             "".join(tx.serialize() for tx in txs))
+
+
+@pytest.mark.mandatory
+def test_chained_transactions():  # 01
+    source = FakeSource({BECH32: [fake_unspent(TXID, 0, 300000000)]})
+    tracker = RemoteDataTracker(source)
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), tracker)
+
+    # The inputs of a signed transaction are reserved until it is sent
+    first = builder.utxo.send(1, DEFAULT)
+    assert tracker.get_unspent(BECH32) == []
+
+    # The change of a sent transaction is spent by the next one without asking the source again
+    txid = builder.send_tx(first)
+    change = first.get_outputs()[1].get_value()
+    assert tracker.get_unspent(BECH32) == [{"txid": txid, "vout": 1, "value": change,
+                                            "scriptPubKey": first.get_outputs()[1].get_script(), "confirmed": False}]
+    second = builder.utxo.send(1, DEFAULT)
+    secondTxid = builder.send_tx(second)
+    assert source.calls == [BECH32]
+    assert second.get_inputs()[0].get_txid() == txid
+    assert tracker.get_ancestor_count(txid) == 1 and tracker.get_ancestor_count(secondTxid) == 2
+    assert tracker.get_balance(BECH32) == second.get_outputs()[1].get_value()
+
+    # A sync keeps unconfirmed outputs and leaves out outputs spent by unconfirmed transactions
+    tracker.sync()
+    assert [entry["txid"] for entry in tracker.get_unspent(BECH32)] == [secondTxid]
+
+    # Released or expired reservations can be spent again
+    third = builder.utxo.send(0.5, DEFAULT)
+    tracker.release([(secondTxid, 1)])
+    assert len(tracker.get_unspent(BECH32)) == 1
+    tracker.reserve([(secondTxid, 1)], timeout=0)
+    assert len(tracker.get_unspent(BECH32)) == 1
+    assert third.get_inputs()[0].get_txid() == secondTxid
+
+
+@pytest.mark.mandatory
+def test_blocks(tmp_path):  # 02
+    path = str(tmp_path / "utxo.json")
+    source = FakeSource({BECH32: [fake_unspent(TXID, 0, 100000), fake_unspent(TXID, 1, 200000)]})
+    tracker = RemoteDataTracker(source, path)
+    assert tracker.get_balance(BECH32) == 300000
+
+    # Own unconfirmed transaction and its child
+    own = Transaction([TxP2WPKHInput(TXID, 0, BECH32, 100000)], [TxAddressOutput(90000, BECH32)])
+    ownTxid = tracker.send_tx(own.sign(DefichainMainnet, [PRIVATE_KEY]).serialize())
+    child = Transaction([TxP2WPKHInput(ownTxid, 0, BECH32, 90000)], [TxAddressOutput(80000, BECH32)])
+    childTxid = tracker.send_tx(child.sign(DefichainMainnet, [PRIVATE_KEY]).serialize())
+    assert tracker.get_ancestor_count(childTxid) == 2
+
+    # The state is loaded again from the file
+    loaded = RemoteDataTracker(source, path)
+    assert loaded.get_unspent(BECH32) == tracker.get_unspent(BECH32) and source.calls == [BECH32]
+    assert loaded.get_ancestor_count(childTxid) == 2
+
+    # A confirmed transaction removes spent outputs, adds received ones and shortens the ancestors
+    received = Transaction([TxP2WPKHInput("11" * 32, 0, DEFAULT, 10)], [TxAddressOutput(5000, BECH32)])
+    tracker.apply_block(block(own, received))
+    assert tracker.get_ancestor_count(ownTxid) == 0 and tracker.get_ancestor_count(childTxid) == 1
+    assert {(entry["txid"], entry["confirmed"]) for entry in tracker.get_unspent(BECH32)} == \
+           {(TXID, True), (childTxid, False), (received.get_txid(), True)}
+
+    # A different transaction spending the same output drops the own one with its descendants
+    pending = Transaction([TxP2WPKHInput(TXID, 1, BECH32, 200000)], [TxAddressOutput(190000, BECH32)])
+    pendingTxid = tracker.send_tx(pending.sign(DefichainMainnet, [PRIVATE_KEY]).serialize())
+    conflict = Transaction([TxP2WPKHInput(TXID, 1, BECH32, 200000)], [TxAddressOutput(150000, DEFAULT)])
+    tracker.apply_block(block(conflict.sign(DefichainMainnet, [PRIVATE_KEY])))
+    assert tracker.get_ancestor_count(pendingTxid) == 0
+    assert pendingTxid not in [entry["txid"] for entry in tracker.get_unspent(BECH32)]
+    assert RemoteDataTracker(source, path).get_balance(BECH32) == 80000 + 5000
+
+
+@pytest.mark.mandatory
+def test_sync():  # 03
+    source = FakeSource({BECH32: [fake_unspent(TXID, 0, 500000000)]})
+    tracker = RemoteDataTracker(source)
+    builder = TxBuilder(BECH32, Account(DefichainMainnet, PRIVATE_KEY), tracker)
+    first = builder.utxo.send(1, DEFAULT)
+    firstTxid = builder.send_tx(first)
+    second = builder.utxo.send(1, DEFAULT)
+    secondTxid = builder.send_tx(second)
+    third = builder.utxo.send(1, DEFAULT)
+    thirdTxid = builder.send_tx(third)
+    assert tracker.get_ancestor_count(thirdTxid) == 3
+
+    def output(tx: Transaction, txid: str) -> {}:
+        return dict(fake_unspent(txid, 1, tx.get_outputs()[1].get_value()), scriptPubKey=tx.get_outputs()[1].get_script())
+
+    # The source returns the change of the first transaction, which is spent by the unconfirmed second one
+    source.unspent[BECH32] = [output(first, firstTxid)]
+    tracker.sync(BECH32)
+    assert tracker.get_ancestor_count(firstTxid) == 0 and tracker.get_ancestor_count(thirdTxid) == 2
+    assert [(entry["txid"], entry["confirmed"]) for entry in tracker.get_unspent(BECH32)] == [(thirdTxid, False)]
+
+    # The change of the last transaction confirms it with all of its ancestors
+    source.unspent[BECH32] = [output(third, thirdTxid)]
+    tracker.sync()
+    assert tracker.get_ancestor_count(secondTxid) == 0 and tracker.get_ancestor_count(thirdTxid) == 0
+    assert tracker.get_unspent(BECH32) == [dict(output(third, thirdTxid), confirmed=True)]
+    assert builder.utxo.send(1, DEFAULT).get_inputs()[0].get_txid() == thirdTxid
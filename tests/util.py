@@ -1,7 +1,23 @@
 from os import path
+import json
+import time
+
+from defichain import Wallet
+from defichain.networks import DefichainMainnet
+from defichain.transactions.rawtransactions import Block
+from defichain.transactions.remotedata.remotedata import RemoteData
 
 LENGTH_OF_TXID = 64
 
+# Wallet of the offline tests, which build and sign transactions without a node or ocean
+MNEMONIC = "unusual onion shallow invite supply more bubble mistake over make bracket cry"
+TXID = "5feceb66ffc86f38d952786c6d696c79c2dbc239dd4e91b46729d73a27fb57e9"
+
+wallet = Wallet(DefichainMainnet).from_mnemonic(MNEMONIC).from_path("m/1129/0/0/0")
+PRIVATE_KEY = wallet.private_key()
+BECH32, DEFAULT, LEGACY = wallet.bech32_address(), wallet.default_address(), wallet.legacy_address()
+SCRIPT = "001454e950c4d365a2d973fb6b07987e21a1b6214eb1"  # Script public key of BECH32
+
 
 def load_secrets_conf():
     # Check if file exists
@@ -15,3 +31,93 @@ def load_secrets_conf():
             "vault_address": VAULT_ADDRESS, "wallet_name": WALLET_NAME, "wallet_password": WALLET_PASSWORD}
 
     return json
+
+
+def fake_unspent(txid: str, vout: int, value: int, scriptPubKey: str = SCRIPT) -> {}:
+    return {"txid": txid, "vout": vout, "value": value, "scriptPubKey": scriptPubKey}
+
+
+class FakeSource(RemoteData):
+    # Data source with fixed unspent outputs, which records the requested addresses and the sent transactions.
+    # Values are unspent outputs of BECH32, sending fails for the transaction with the index failAt.
+    def __init__(self, unspent: "[int] | {str: [{}]}", failAt: int = None):
+        if not isinstance(unspent, dict):
+            unspent = {BECH32: [fake_unspent(f"{i:064x}", 0, value) for i, value in enumerate(unspent)]}
+        self.unspent = unspent
+        self.failAt = failAt
+        self.calls, self.sent = [], []
+
+    def get_unspent(self, address: str) -> [{}]:
+        self.calls.append(address)
+        return [dict(entry) for entry in self.unspent.get(address, [])]
+
+    def test_tx(self, hex: str, maxFeeRate: float = None) -> bool:
+        return True
+
+    def send_tx(self, hex: str, maxFeeRate: float = None) -> str:
+        if len(self.sent) == self.failAt:
+            raise Exception("txn-mempool-conflict")
+        self.sent.append(hex)
+        return Block.calculate_txid(bytes.fromhex(hex))
+
+
+class FakeResponse:
+    def __init__(self, body=None, status_code: int = 200):
+        self.status_code = status_code
+        self.text = json.dumps({} if body is None else body)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession:
+    # Replaces the requests session of a connection. Answers with the given responses in order or with the
+    # response of the handler for the url, given exceptions are raised. The urls and posted data are recorded.
+    def __init__(self, responses: [] = (), handler=None, delay: float = 0):
+        self.responses = list(responses)
+        self.handler = handler
+        self.delay = delay
+        self.urls, self.data = [], []
+
+    def _next(self, url, data=None):
+        time.sleep(self.delay)
+        self.urls.append(url)
+        self.data.append(data)
+        if self.handler is not None:
+            return self.handler(url)
+        response = self.responses.pop(0) if self.responses else FakeResponse()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        return self._next(url, data)
+
+    def get(self, url, timeout=None):
+        return self._next(url)
+
+
+class FakeAsyncResponse:
+    def __init__(self, response: FakeResponse):
+        self.status = response.status_code
+        self._text = response.text
+
+    async def __aenter__(self) -> "FakeAsyncResponse":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+    async def text(self) -> str:
+        return self._text
+
+
+class FakeAsyncSession(FakeSession):
+    # Replaces the aiohttp session of an async connection in the same way as FakeSession
+    closed = False
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        return FakeAsyncResponse(self._next(url, data))
+
+    def get(self, url, timeout=None):
+        return FakeAsyncResponse(self._next(url))